@@ -46,6 +46,32 @@ def parse_price(price_str: str) -> Optional[float]:
         return None
 
 
+def card_filters(
+    search: Optional[str] = None,
+    rarity: Optional[str] = None,
+    type_: Optional[str] = None,
+    color_identity: Optional[str] = None,
+    set_name: Optional[str] = None,
+    price_min: Optional[str] = None,
+    price_max: Optional[str] = None,
+    cmc: Optional[str] = None,
+) -> dict:
+    """Filters from list/stats query params, for the repository's filters= or filter_collection(**filters).
+
+    The frontend sends search="undefined" for an empty search box; that is no search.
+    """
+    return {
+        "search": search if search and search != "undefined" else None,
+        "rarity": rarity,
+        "type_": type_,
+        "color_identity": color_identity,
+        "set_name": set_name,
+        "price_min": price_min,
+        "price_max": price_max,
+        "cmc": cmc,
+    }
+
+
 def filter_collection(
     collection: list,
     search: Optional[str] = None,
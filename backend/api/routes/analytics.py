@@ -257,7 +257,7 @@ async def analytics_color_identity(
 ):
     """Count of cards per color identity for the filtered collection.
 
-    Postgres path: SQL GROUP BY + Python normalization of color identity strings.
+    Postgres path: SQL GROUP BY on the color identity bitmask.
     Sheets path: in-memory Counter.
     """
     key = _cache_key(
@@ -270,18 +270,10 @@ async def analytics_color_identity(
     try:
         repo = get_collection_repo()
         if repo is not None:
-            # SQL returns raw color_identity values; normalize in Python
+            # SQL groups on color_identity_mask and labels each group with its WUBRG string
             filters = _make_filters(search, rarity, type_filter, set_name, price_min, price_max, color_identity, cmc)
             rows = repo.get_cards_analytics(user_id=user_id, filters=filters, dimension="color_identity")
-            counter: Counter = Counter()
-            for r in rows:
-                normalized = _normalize_color_identity(r["label"])
-                counter[normalized] += r["count"]
-            result = sorted(
-                [{"color_identity": k, "count": v} for k, v in counter.items()],
-                key=lambda x: x["count"],
-                reverse=True,
-            )
+            result = [{"color_identity": r["label"], "count": r["count"]} for r in rows]
         else:
             cards = _filtered_collection(
                 search,
@@ -294,7 +286,7 @@ async def analytics_color_identity(
                 cmc=cmc,
                 user_id=user_id,
             )
-            counter = Counter()
+            counter: Counter = Counter()
             for c in cards:
                 identity = _normalize_color_identity(c.get("color_identity") or c.get("identity") or "")
                 counter[identity] += int(c.get("quantity") or 1)
@@ -11,7 +11,7 @@ from loguru import logger
 from pydantic import BaseModel
 
 from ..dependencies import clear_collection_cache, get_cached_collection, get_collection_repo, get_current_user_id
-from ..filters import filter_collection
+from ..filters import card_filters, filter_collection
 from ..main import limiter
 from ..services.card_image_service import get_card_image_path
 from ..services.scryfall_service import CardNotFoundError, resolve_card_by_name, suggest_card_names
@@ -64,9 +64,10 @@ class CardListResponse(BaseModel):
     """
 
     items: List[Card]
-    total: int
+    total: Optional[int] = None  # None in cursor mode (GET /api/stats/count returns it)
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Cursor mode: pass as ?cursor= for the next page; None on the last page
 
     class Config:
         from_attributes = True
@@ -141,7 +142,7 @@ async def suggest_cards(
     """
     if not q or len(q.strip()) < 2:
         return []
-    return suggest_card_names(q.strip(), user_id=user_id)
+    return await suggest_card_names(q.strip(), user_id=user_id)
 
 
 # ---------------------------------------------------------------------------
@@ -164,7 +165,7 @@ async def resolve_card(
         collection = get_cached_collection(user_id=user_id)
         name_lower = name.strip().lower()
         from_coll = next((c for c in collection if (c.get("name") or "").lower() == name_lower), None)
-        payload = resolve_card_by_name(name.strip(), from_collection=from_coll, user_id=user_id)
+        payload = await resolve_card_by_name(name.strip(), from_collection=from_coll, user_id=user_id)
         return Card(**{k: v for k, v in payload.items() if k in Card.model_fields})
     except CardNotFoundError:
         raise HTTPException(status_code=404, detail="Card not found")
@@ -175,7 +176,7 @@ async def resolve_card(
 # ---------------------------------------------------------------------------
 
 
-_ALLOWED_SORT_COLUMNS = {"name", "created_at", "price_eur", "quantity", "set_name", "rarity", "cmc"}
+_ALLOWED_SORT_COLUMNS = {"name", "created_at", "price_eur", "quantity", "set_name", "rarity", "cmc", "relevance"}
 
 
 @router.get("/", response_model=CardListResponse)
@@ -193,17 +194,23 @@ async def list_cards(
     price_max: Optional[str] = Query(default=None),
     sort_by: Optional[str] = Query(default="created_at"),
     sort_dir: Optional[str] = Query(default="desc"),
+    cursor: Optional[str] = Query(default=None),
     user_id: int = Depends(get_current_user_id),
 ):
     """
     List cards from collection with pagination, filters, and server-side sorting.
-    Returns paginated wrapper: { items, total, limit, offset }.
+    Returns paginated wrapper: { items, total, limit, offset, next_cursor }.
 
     Same filter semantics as GET /api/stats so list and stats stay in sync.
     type: substring match on type line (e.g. "Creature" matches "Creature — Elf").
     color_identity: comma-separated WUBRG (e.g. "W,U"); card must contain all listed colors.
-    sort_by: one of name, created_at, price_eur, quantity, set_name, rarity, cmc (default: created_at).
+    search: card name substring, or words in the name, type line or rules text (Postgres path).
+    sort_by: one of name, created_at, price_eur, quantity, set_name, rarity, cmc, relevance (default: created_at).
+      relevance orders search matches best first (exact name, name prefix, text rank).
     sort_dir: asc or desc (default: desc).
+    cursor: keyset pagination (Postgres only). Send an empty cursor for the first page, then the
+      returned next_cursor; every page costs the same however deep it is. offset is ignored and
+      total is not computed (GET /api/stats/count, cached). Not available with sort_by=relevance.
 
     Postgres path: SQL-level filtering, sorting, and pagination (no full collection load).
     Sheets path: cached collection + Python filtering (no server-side sorting).
@@ -225,19 +232,26 @@ async def list_cards(
         user_id,
     )
     try:
-        search_param = search if search and search != "undefined" else None
+        filters = card_filters(search, rarity, type_filter, color_identity, set_name, price_min, price_max)
         repo = get_collection_repo()
+        if cursor is not None and repo is None:
+            raise HTTPException(status_code=400, detail="Cursor pagination requires PostgreSQL (DATABASE_URL)")
         if repo is not None:
             # Postgres path: SQL-level filtering, sorting, and pagination
-            filters = {
-                "search": search_param,
-                "rarity": rarity,
-                "type_": type_filter,
-                "color_identity": color_identity,
-                "set_name": set_name,
-                "price_min": price_min,
-                "price_max": price_max,
-            }
+            if cursor is not None:
+                try:
+                    items, next_cursor = repo.get_cards_page(
+                        user_id=user_id,
+                        filters=filters,
+                        limit=limit,
+                        sort_by=resolved_sort_by,
+                        sort_dir=resolved_sort_dir,
+                        cursor=cursor or None,
+                    )
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                logger.info("Returning %s cards (cursor page, more: %s)", len(items), next_cursor is not None)
+                return CardListResponse(items=items, limit=limit, offset=0, next_cursor=next_cursor)
             items, total = repo.get_cards_filtered(
                 user_id=user_id,
                 filters=filters,
@@ -249,22 +263,15 @@ async def list_cards(
         else:
             # Sheets path: load all, filter in Python, slice
             collection = get_cached_collection(user_id=user_id)
-            filtered = filter_collection(
-                collection,
-                search=search_param,
-                rarity=rarity,
-                type_=type_filter,
-                color_identity=color_identity,
-                set_name=set_name,
-                price_min=price_min,
-                price_max=price_max,
-            )
+            filtered = filter_collection(collection, **filters)
             total = len(filtered)
             items = filtered[offset : offset + limit]
 
         logger.info("Returning %s cards (total: %s, offset: %s)", len(items), total, offset)
         return CardListResponse(items=items, total=total, limit=limit, offset=offset)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing cards: {e}")
 
@@ -11,6 +11,9 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from loguru import logger
 from pydantic import BaseModel
 
+from deckdex.config import PRICE_SOURCES
+from deckdex.storage.job_repository import JobRepository
+
 from ..dependencies import clear_collection_cache, get_collection_repo, get_current_user_id, get_job_repo
 from ..main import limiter
 from ..routes.stats import clear_stats_cache
@@ -23,6 +26,8 @@ router = APIRouter(prefix="/api", tags=["process"])
 _active_jobs: Dict[str, ProcessorService] = {}
 _job_results: Dict[str, Tuple[dict, float]] = {}  # job_id -> (result, completed_at_timestamp)
 _job_types: Dict[str, str] = {}  # job_id -> job_type
+# Worker-run jobs this process has seen complete and cleared its caches for (job_id -> seen_at timestamp)
+_settled_worker_jobs: Dict[str, float] = {}
 
 
 class JobResponse(BaseModel):
@@ -60,6 +65,13 @@ class ProcessRequest(BaseModel):
     scope: Optional[str] = "all"  # "all" | "new_only"
 
 
+class PriceUpdateRequest(BaseModel):
+    """Body for POST /prices/update"""
+
+    source: Optional[str] = "scryfall"  # "scryfall" | "catalog"
+    incremental: bool = False  # only stale cards, most valuable first, within the configured budgets
+
+
 @router.get("/jobs", response_model=List[JobListItem])
 async def list_jobs(user_id: int = Depends(get_current_user_id)):
     """
@@ -116,8 +128,8 @@ async def list_jobs(user_id: int = Depends(get_current_user_id)):
                 if not jid or jid in in_memory_ids:
                     continue
                 status = db_job.get("status", "")
-                # Always include running/pending; include completed only if recent
-                if status in ("running", "pending"):
+                # Always include queued/running/pending; include completed only if recent
+                if status in ("queued", "running", "pending"):
                     include = True
                 elif status in ("complete", "error", "cancelled"):
                     completed_str = db_job.get("completed_at")
@@ -136,7 +148,7 @@ async def list_jobs(user_id: int = Depends(get_current_user_id)):
                             job_id=jid,
                             status=status,
                             job_type=db_job.get("type", "unknown"),
-                            progress=db_job.get("result") or {},
+                            progress=_db_job_progress(db_job),
                             start_time=str(db_job.get("created_at") or ""),
                         )
                     )
@@ -167,6 +179,13 @@ async def trigger_process(
         scope = "all"
     logger.info(f"POST /api/process - limit={limit}, scope={scope}, user={user_id}")
 
+    from deckdex.config_loader import load_config
+
+    config = load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
+    job_queue = _job_queue(config)
+    if job_queue is not None:
+        return _enqueue(job_queue, user_id, "process", {"limit": limit, "scope": scope})
+
     # Check if another job of the same type is already running
     for job_id, service in _active_jobs.items():
         if service.status == "running" and _job_types.get(job_id) == "process":
@@ -179,9 +198,6 @@ async def trigger_process(
     _cleanup_old_jobs()
 
     # Build config with process_scope so processor runs only new/incomplete cards when requested
-    from deckdex.config_loader import load_config
-
-    config = load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
     config.process_scope = scope
 
     # Create new processor service with config
@@ -229,13 +245,30 @@ async def trigger_process(
 @router.post("/prices/update", response_model=JobResponse)
 @limiter.limit("5/minute")
 async def trigger_price_update(
-    request: Request, background_tasks: BackgroundTasks, user_id: int = Depends(get_current_user_id)
+    request: Request,
+    background_tasks: BackgroundTasks,
+    body: Optional[PriceUpdateRequest] = None,
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Trigger price update job.
+    Body: { "source": "scryfall" | "catalog", "incremental": bool }. source=catalog refreshes the user's
+    prices from the local catalog in one operation and only looks up cards without a catalog match on
+    Scryfall. incremental=true only checks cards whose price is older than processing.price_max_age_hours.
     Only one update_prices job at a time; full process can run in parallel.
     """
-    logger.info("POST /api/prices/update")
+    source = ((body.source if body else None) or "scryfall").strip().lower()
+    if source not in PRICE_SOURCES:
+        raise HTTPException(status_code=400, detail=f"source must be one of: {', '.join(PRICE_SOURCES)}")
+    incremental = bool(body and body.incremental)
+    logger.info(f"POST /api/prices/update - source={source}, incremental={incremental}, user={user_id}")
+
+    from deckdex.config_loader import load_config
+
+    config = load_config(profile="default")
+    job_queue = _job_queue(config)
+    if job_queue is not None:
+        return _enqueue(job_queue, user_id, "update_prices", {"source": source, "incremental": incremental})
 
     # Check if another update_prices job is already running
     for job_id, service in _active_jobs.items():
@@ -249,9 +282,6 @@ async def trigger_price_update(
     _cleanup_old_jobs()
 
     # Create processor with update_prices mode
-    from deckdex.config_loader import load_config
-
-    config = load_config(profile="default")
     config.update_prices = True
 
     service = ProcessorService(config=config, job_repo=get_job_repo(), user_id=user_id)
@@ -277,7 +307,7 @@ async def trigger_price_update(
 
     async def run_update():
         try:
-            result = await service.update_prices_async()
+            result = await service.update_prices_async(price_source=source, incremental=incremental)
             _job_results[job_id] = (result, time.monotonic())
             if result.get("status") == "success":
                 clear_collection_cache()
@@ -410,10 +440,11 @@ async def get_job_status(job_id: str, user_id: int = Depends(get_current_user_id
         try:
             db_job = job_repo.get_job(job_id)
             if db_job is not None:
+                settle_worker_job(job_id, db_job["status"])
                 return JobStatus(
                     job_id=job_id,
                     status=db_job["status"],
-                    progress=db_job.get("result") or {},
+                    progress=_db_job_progress(db_job),
                     start_time=db_job.get("created_at") or "",
                     job_type=db_job.get("type", "unknown"),
                 )
@@ -432,11 +463,23 @@ async def cancel_job(job_id: str, user_id: int = Depends(get_current_user_id)):
     Note: the underlying processor thread may continue until it finishes
     its current operation, but the job will be marked as cancelled and
     no further progress events will be emitted.
+
+    A queued worker job is cancelled at once ("cancelled"); a running one reports
+    "cancelling" until the worker stops at its next heartbeat.
     """
     logger.info(f"POST /api/jobs/{job_id}/cancel - user={user_id}")
 
     if job_id not in _active_jobs:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or already finished")
+        from deckdex.config_loader import load_config
+
+        job_queue = _job_queue(load_config(profile=os.getenv("DECKDEX_PROFILE", "default")))
+        status = job_queue.request_cancel(job_id, user_id) if job_queue is not None else None
+        if status is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found or already finished")
+        # A queued job is cancelled at once; a running one stops at the worker's next heartbeat
+        if status == "running":
+            return {"job_id": job_id, "status": "cancelling", "message": "Job cancellation requested"}
+        return {"job_id": job_id, "status": status, "message": "Job cancelled"}
 
     service = _active_jobs[job_id]
 
@@ -455,6 +498,47 @@ async def cancel_job(job_id: str, user_id: int = Depends(get_current_user_id)):
 _JOB_RESULT_TTL_SECONDS = 3600  # 1 hour
 
 
+def settle_worker_job(job_id: str, status: str) -> None:
+    """Clear this process's collection and stats caches the first time it sees a worker-run job complete.
+
+    Called by GET /api/jobs/{job_id} and the progress WebSocket relay, whichever notices first,
+    so caches are dropped even when nobody is watching the job.
+    """
+    if status != "complete" or job_id in _settled_worker_jobs:
+        return
+    _settled_worker_jobs[job_id] = time.monotonic()
+    clear_collection_cache()
+    clear_stats_cache()
+
+
+def _job_queue(config) -> Optional[JobRepository]:
+    """JobRepository to enqueue into when jobs.queue is enabled and Postgres is configured, else None."""
+    job_repo = get_job_repo()
+    if job_repo is None or not config.jobs.queue:
+        return None
+    return job_repo
+
+
+def _enqueue(job_queue: JobRepository, user_id: int, job_type: str, params: dict) -> JobResponse:
+    """Queue a job for the worker processes; 409 if the user already has one of this type queued or running."""
+    active_id = job_queue.get_active_job_id(user_id, job_type)
+    if active_id is not None:
+        logger.warning(f"{job_type} job already queued or running: {active_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Another {job_type} job is already queued or running (job_id: {active_id})"
+        )
+    job_id = job_queue.enqueue_job(user_id, job_type, params)
+    logger.info(f"Queued {job_type} job: {job_id}")
+    return JobResponse(job_id=job_id, status="queued", message="Job queued for a worker")
+
+
+def _db_job_progress(db_job: dict) -> dict:
+    """Progress of a Postgres job row: live progress while queued/running, else its result."""
+    if db_job.get("status") in ("queued", "running") and db_job.get("progress"):
+        return db_job["progress"]
+    return db_job.get("result") or {}
+
+
 def _cleanup_old_jobs():
     """Remove completed services from _active_jobs and evict expired results."""
     # Move completed services out of _active_jobs
@@ -470,3 +554,5 @@ def _cleanup_old_jobs():
     for jid in expired:
         del _job_results[jid]
         _job_types.pop(jid, None)
+    for jid in [jid for jid, seen_at in _settled_worker_jobs.items() if now - seen_at > _JOB_RESULT_TTL_SECONDS]:
+        del _settled_worker_jobs[jid]
@@ -11,7 +11,7 @@ from loguru import logger
 from pydantic import BaseModel
 
 from ..dependencies import get_cached_collection, get_collection_repo, get_current_user_id
-from ..filters import filter_collection, parse_price
+from ..filters import card_filters, filter_collection, parse_price
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
@@ -19,6 +19,14 @@ router = APIRouter(prefix="/api/stats", tags=["stats"])
 # Key is a tuple (search, rarity, type, set_name, price_min, price_max) for canonical lookup
 _stats_cache: dict[tuple, dict[str, Any]] = {}
 _STATS_TTL = 30  # seconds
+# Card counts for cursor-paginated lists, same keys and TTL (GET /api/cards does not count in cursor mode)
+_count_cache: dict[tuple, dict[str, Any]] = {}
+
+
+class CardCount(BaseModel):
+    """Number of cards (rows) matching the filters."""
+
+    total: int
 
 
 class Stats(BaseModel):
@@ -114,7 +122,10 @@ async def get_stats(
     For Postgres: uses a single SQL aggregation query (no full collection load).
     For Google Sheets: uses cached collection + Python aggregation.
     """
-    key = _cache_key(user_id, search, rarity, type_filter, set_name, price_min, price_max, color_identity, cmc)
+    filters = card_filters(search, rarity, type_filter, color_identity, set_name, price_min, price_max, cmc)
+    key = _cache_key(
+        user_id, filters["search"], rarity, type_filter, set_name, price_min, price_max, color_identity, cmc
+    )
     logger.info("GET /api/stats %s - user=%s", key, user_id)
 
     try:
@@ -129,16 +140,6 @@ async def get_stats(
         repo = get_collection_repo()
         if repo is not None:
             # Postgres path: single SQL aggregation query — no full collection load
-            filters = {
-                "search": search,
-                "rarity": rarity,
-                "type_": type_filter,
-                "color_identity": color_identity,
-                "set_name": set_name,
-                "price_min": price_min,
-                "price_max": price_max,
-                "cmc": cmc,
-            }
             agg = repo.get_cards_stats(user_id=user_id, filters=filters)
             stats = {
                 **agg,
@@ -147,18 +148,7 @@ async def get_stats(
         else:
             # Google Sheets path: in-memory aggregation
             collection = get_cached_collection(user_id=user_id)
-            filtered = filter_collection(
-                collection,
-                search=search,
-                rarity=rarity,
-                type_=type_filter,
-                color_identity=color_identity,
-                set_name=set_name,
-                price_min=price_min,
-                price_max=price_max,
-                cmc=cmc,
-            )
-            stats = calculate_stats(filtered)
+            stats = calculate_stats(filter_collection(collection, **filters))
 
         _stats_cache[key] = {"data": stats, "timestamp": now}
         logger.info("Stats: %s", stats)
@@ -175,7 +165,50 @@ async def get_stats(
         raise HTTPException(status_code=500, detail="Failed to calculate stats") from e
 
 
+@router.get("/count", response_model=CardCount)
+async def get_card_count(
+    search: Optional[str] = Query(default=None),
+    rarity: Optional[str] = Query(default=None),
+    type_filter: Optional[str] = Query(default=None, alias="type"),
+    set_name: Optional[str] = Query(default=None),
+    price_min: Optional[str] = Query(default=None),
+    price_max: Optional[str] = Query(default=None),
+    color_identity: Optional[str] = Query(default=None),
+    cmc: Optional[str] = Query(default=None),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Count the cards GET /api/cards returns for the same filters (its total in cursor mode).
+
+    Cached for 30 seconds per filter combination, like GET /api/stats.
+    """
+    filters = card_filters(search, rarity, type_filter, color_identity, set_name, price_min, price_max, cmc)
+    key = _cache_key(
+        user_id, filters["search"], rarity, type_filter, set_name, price_min, price_max, color_identity, cmc
+    )
+    try:
+        now = datetime.now()
+        entry = _count_cache.get(key)
+        if entry is not None and (now - entry["timestamp"]).total_seconds() < _STATS_TTL:
+            return entry["data"]
+
+        repo = get_collection_repo()
+        if repo is not None:
+            total = repo.count_cards(user_id=user_id, filters=filters)
+        else:
+            total = len(filter_collection(get_cached_collection(user_id=user_id), **filters))
+
+        data = {"total": total}
+        _count_cache[key] = {"data": data, "timestamp": now}
+        return data
+
+    except Exception as e:
+        logger.error("Error counting cards: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to count cards") from e
+
+
 def clear_stats_cache():
     """Clear all stats cache entries to force recalculation on next request."""
     _stats_cache.clear()
+    _count_cache.clear()
     logger.info("Stats cache cleared")
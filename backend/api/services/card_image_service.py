@@ -15,13 +15,18 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import requests
 from loguru import logger
 
 from deckdex.card_fetcher import CardFetcher
 from deckdex.config_loader import load_config
+from deckdex.scryfall_transport import get_transport
+from deckdex.single_flight import SingleFlight
 from deckdex.storage.image_store import ImageStore
 
+# Concurrent requests for the same card name (two users, or a grid loading duplicates)
+# share one Scryfall lookup and one image download.
+_image_flights = SingleFlight()
+
 
 def get_card_image(
     card_id: int,
@@ -89,7 +94,27 @@ def get_card_image(
             f"Image not found in local store for card '{name}'. Enable Scryfall in Settings to download images online."
         )
 
-    # 4) Fetch from Scryfall to get scryfall_id + image URL
+    # 4) Fetch from Scryfall (coalesced with concurrent requests for the same name)
+    fetched_scryfall_id, data, content_type = _image_flights.do(
+        name.lower(), lambda: _fetch_scryfall_image(name, image_store)
+    )
+
+    # 5) Persist scryfall_id to cards row (lazy)
+    if fetched_scryfall_id and fetched_scryfall_id != scryfall_id:
+        try:
+            repo.update_card_scryfall_id(card_id, fetched_scryfall_id)
+        except Exception as e:
+            logger.warning(f"Failed to persist scryfall_id for card_id={card_id}: {e}")
+
+    return data, content_type
+
+
+def _fetch_scryfall_image(name: str, image_store: ImageStore) -> Tuple[Optional[str], bytes, str]:
+    """Look *name* up on Scryfall and return (scryfall_id, image_bytes, content_type).
+
+    Reuses the stored image when the resolved scryfall_id is already in the
+    ImageStore; otherwise downloads the image and stores it.
+    """
     config = load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
     fetcher = CardFetcher(config.scryfall, config.openai)
 
@@ -101,7 +126,7 @@ def get_card_image(
         logger.warning(f"Scryfall lookup failed for '{name}': {e}")
         raise FileNotFoundError(f"Could not fetch image for card '{name}'") from e
 
-    fetched_scryfall_id = scryfall_card.get("id")
+    scryfall_id = scryfall_card.get("id")
 
     # Single-faced: image_uris at top level; double-faced: use first face
     image_uris = None
@@ -114,32 +139,21 @@ def get_card_image(
     if not image_url:
         raise FileNotFoundError(f"No image URL for card '{name}'")
 
-    logger.debug(
-        f"get_card_image: Scryfall fetch succeeded, fetched_scryfall_id={fetched_scryfall_id!r}, image_url={image_url!r}"
-    )
-
-    # 5) Persist scryfall_id to cards row (lazy)
-    if fetched_scryfall_id and fetched_scryfall_id != scryfall_id:
-        try:
-            repo.update_card_scryfall_id(card_id, fetched_scryfall_id)
-            scryfall_id = fetched_scryfall_id
-        except Exception as e:
-            logger.warning(f"Failed to persist scryfall_id for card_id={card_id}: {e}")
-            scryfall_id = fetched_scryfall_id
+    logger.debug(f"get_card_image: Scryfall fetch succeeded, scryfall_id={scryfall_id!r}, image_url={image_url!r}")
 
-    # 6) Check ImageStore again (race condition guard)
+    # Check ImageStore again: another card row may already have stored this printing
     if scryfall_id:
         try:
             cached = image_store.get(scryfall_id)
             if cached is not None:
-                return cached
+                return scryfall_id, cached[0], cached[1]
         except Exception as e:
             logger.warning(f"Failed to read image store (second check) for scryfall_id={scryfall_id}: {e}")
 
-    # 7) Download and store via ImageStore
+    # Download and store via ImageStore
     logger.debug("get_card_image: downloading image from Scryfall URL")
     try:
-        resp = requests.get(image_url, timeout=config.scryfall.timeout)
+        resp = get_transport(config.scryfall).get(image_url, timeout=config.scryfall.timeout)
         resp.raise_for_status()
         data = resp.content
     except Exception as e:
@@ -154,7 +168,7 @@ def get_card_image(
         except Exception as e:
             logger.warning(f"Failed to save image to store for scryfall_id={scryfall_id}: {e}")
 
-    return data, content_type
+    return scryfall_id, data, content_type
 
 
 def get_card_image_path(
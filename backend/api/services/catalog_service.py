@@ -24,8 +24,8 @@ _active_sync_job: Optional[CatalogSyncJob] = None
 
 
 def search(catalog_repo: CatalogRepository, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-    """Search catalog cards by name (case-insensitive contains)."""
-    return catalog_repo.search_by_name(query, limit=limit)
+    """Search catalog cards by name, type line and rules text, best matches first."""
+    return catalog_repo.search(query, limit=limit)
 
 
 def autocomplete(catalog_repo: CatalogRepository, query: str, limit: int = 20) -> List[str]:
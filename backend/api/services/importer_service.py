@@ -22,6 +22,8 @@ class ImporterService:
     Modes:
         merge  — upsert: add quantities to existing (user_id, name, set_id) rows.
         replace — delete all user's cards then bulk-insert.
+
+    Both modes write through the repository's bulk load (COPY on Postgres).
     """
 
     def __init__(
@@ -57,20 +59,23 @@ class ImporterService:
                 self._loop,
             )
 
+    @staticmethod
+    async def _fetch_from_scryfall(names: List[str], scryfall_config) -> List[Optional[Dict[str, Any]]]:
+        """Resolve names via /cards/collection, running the search cascade concurrently for the misses."""
+        from deckdex.async_card_fetcher import AsyncCardFetcher
+
+        async with AsyncCardFetcher(scryfall_config) as fetcher:
+            return await fetcher.search_cards_bulk(names)
+
     def _run_import(self, parsed_cards: List[ParsedCard]) -> Dict[str, Any]:
         """Runs in a thread: enrich cards then write to DB.
 
         Catalog-first: tries to enrich from the local catalog before falling
         back to Scryfall (only when the user has Scryfall enabled).
         """
-        from sqlalchemy import text
-
-        from deckdex.card_fetcher import CardFetcher
-
         from ..dependencies import get_catalog_repo, get_user_settings_repo
 
         config = load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
-        fetcher = CardFetcher(config.scryfall, config.openai)
 
         # Resolve catalog and user settings once at the start
         catalog_repo = get_catalog_repo()
@@ -85,28 +90,29 @@ class ImporterService:
         skipped = 0
         not_found: List[str] = []
         enriched_cards: List[Dict[str, Any]] = []
+        resolved: List[Optional[Dict[str, Any]]] = [None] * total
 
+        # 1. Try catalog first
         for i, pc in enumerate(parsed_cards):
             self._emit(i, total)
-            card_data = None
-
-            # 1. Try catalog first
             if catalog_repo is not None:
                 try:
                     results = catalog_repo.search_by_name(pc["name"], limit=1)
                     if results:
-                        card_data = results[0]
+                        resolved[i] = results[0]
                 except Exception:
                     pass
 
-            # 2. Scryfall fallback
-            if card_data is None and scryfall_enabled:
-                try:
-                    card_data = fetcher.search_card(pc["name"])
-                except Exception:
-                    pass
+        # 2. Scryfall fallback: all catalog misses at once, concurrently on an event loop of our own
+        missing = [i for i, card_data in enumerate(resolved) if card_data is None]
+        if missing and scryfall_enabled:
+            names = [parsed_cards[i]["name"] for i in missing]
+            for i, card_data in zip(missing, asyncio.run(self._fetch_from_scryfall(names, config.scryfall))):
+                resolved[i] = card_data
 
+        for pc, card_data in zip(parsed_cards, resolved):
             if card_data is not None:
+                card_data = dict(card_data)
                 card_data["quantity"] = pc["quantity"]
                 enriched_cards.append(card_data)
             else:
@@ -119,49 +125,8 @@ class ImporterService:
             imported = len(enriched_cards)
             skipped = len(not_found)
         else:
-            # merge: upsert per card
-            engine = self._repo._get_engine()
-            with engine.connect() as conn:
-                for card in enriched_cards:
-                    from deckdex.storage.repository import _card_to_row
-
-                    row = _card_to_row(card)
-                    name = row.get("name") or ""
-                    set_id = row.get("set_id") or ""
-                    qty = int(card.get("quantity") or 1)
-                    if not name:
-                        skipped += 1
-                        continue
-
-                    existing = conn.execute(
-                        text("""
-                            SELECT id, quantity FROM cards
-                            WHERE user_id = :uid AND name = :name AND COALESCE(set_id,'') = :set_id
-                            LIMIT 1
-                        """),
-                        {"uid": self._user_id, "name": name, "set_id": set_id},
-                    ).fetchone()
-
-                    if existing:
-                        conn.execute(
-                            text(
-                                "UPDATE cards SET quantity = quantity + :qty, updated_at = NOW() AT TIME ZONE 'utc' WHERE id = :id"
-                            ),
-                            {"qty": qty, "id": existing[0]},
-                        )
-                    else:
-                        cols = [k for k, v in row.items() if v is not None]
-                        cols.append("user_id")
-                        params = {k: row[k] for k in cols if k in row}
-                        params["user_id"] = self._user_id
-                        names_sql = ", ".join(cols)
-                        placeholders_sql = ", ".join(f":{k}" for k in cols)
-                        conn.execute(
-                            text(f"INSERT INTO cards ({names_sql}) VALUES ({placeholders_sql})"),
-                            params,
-                        )
-                    imported += 1
-                conn.commit()
+            # merge: add quantities to existing (name, set_id) rows, insert the rest
+            imported = self._repo.merge_all(enriched_cards, user_id=self._user_id)
             skipped = len(not_found)
 
         result = {
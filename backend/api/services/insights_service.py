@@ -19,7 +19,7 @@ from ..utils.color import (
     WUBRG_ORDER as _WUBRG_ORDER,
 )
 from ..utils.color import (
-    normalize_color_identity as _normalize_color_identity,
+    card_color_identity as _card_color_identity,
 )
 
 # ---------------------------------------------------------------------------
@@ -369,7 +369,7 @@ class InsightsService:
     def _insight_by_color(self) -> Dict[str, Any]:
         counter: Counter = Counter()
         for card in self.cards:
-            identity = _normalize_color_identity(card.get("color_identity") or card.get("colors") or "")
+            identity = _card_color_identity(card)
             # Split multi-color into individual color letters for counting
             colors_in_card = [ch for ch in identity if ch in _VALID_COLORS] or ["C"]
             for color in colors_in_card:
@@ -448,7 +448,7 @@ class InsightsService:
             p = _parse_price(card.get("price"))
             if p is None:
                 continue
-            identity = _normalize_color_identity(card.get("color_identity") or card.get("colors") or "")
+            identity = _card_color_identity(card)
             colors_in_card = [ch for ch in identity if ch in _VALID_COLORS] or ["C"]
             value_per_color = p / len(colors_in_card)
             for color in colors_in_card:
@@ -602,7 +602,7 @@ class InsightsService:
     def _insight_missing_colors(self) -> Dict[str, Any]:
         present_colors: set = set()
         for card in self.cards:
-            identity = _normalize_color_identity(card.get("color_identity") or card.get("colors") or "")
+            identity = _card_color_identity(card)
             for ch in identity:
                 if ch in _VALID_COLORS:
                     present_colors.add(ch)
@@ -611,7 +611,7 @@ class InsightsService:
             {
                 "label": _COLOR_DISPLAY.get(color, color),
                 "present": color in present_colors,
-                "detail": f"You have {sum(1 for c in self.cards if color in _normalize_color_identity(c.get('color_identity') or c.get('colors') or ''))} cards"
+                "detail": f"You have {sum(1 for c in self.cards if color in _card_color_identity(c))} cards"
                 if color in present_colors
                 else "No cards of this color",
             }
@@ -811,7 +811,7 @@ class InsightsSuggestionEngine:
         # Signal: missing colors → boost missing_colors
         present_colors: set = set()
         for card in self.cards:
-            identity = _normalize_color_identity(card.get("color_identity") or card.get("colors") or "")
+            identity = _card_color_identity(card)
             for ch in identity:
                 if ch in _VALID_COLORS:
                     present_colors.add(ch)
@@ -3,13 +3,12 @@ ProcessorService - Wrapper around MagicCardProcessor for API usage
 
 This service wraps the existing MagicCardProcessor to enable:
 - Async execution in thread pool
-- Progress callbacks for WebSocket updates via tqdm interception
+- Progress callbacks for WebSocket updates via the processor's progress sink
 - Job state management
 """
 
 import asyncio
 import os
-import re
 import sys
 import threading
 import uuid
@@ -32,12 +31,7 @@ from loguru import logger
 from deckdex.config import ProcessorConfig
 from deckdex.config_loader import load_config
 from deckdex.magic_card_processor import MagicCardProcessor
-
-
-class JobCancelledException(Exception):
-    """Raised inside the processor thread when cancellation is requested."""
-
-    pass
+from deckdex.progress import CallbackSink, CancelToken, JobCancelled, ProgressEvent
 
 
 @dataclass
@@ -53,69 +47,12 @@ class JobMetadata:
     error: Optional[str] = None
 
 
-class ProgressCapture:
-    """
-    Captures tqdm progress output by intercepting stderr/stdout writes.
-
-    MagicCardProcessor uses tqdm which writes to stderr. We intercept those
-    writes to extract current/total progress and emit WebSocket events.
-
-    Also serves as the cancellation mechanism: when the cancel_event is set,
-    the next write() call raises JobCancelledException, which propagates up
-    through tqdm.update() → the processor loop → aborting the job.
-    """
-
-    def __init__(self, original_stream, callback, cancel_event: Optional[threading.Event] = None):
-        self.original = original_stream
-        self.callback = callback
-        self.cancel_event = cancel_event
-        self._buffer = ""
-        # Match tqdm patterns like "  45%|███    | 450/1000 [00:30<00:35]"
-        self._tqdm_pattern = re.compile(r"(\d+)%\|.*?\|\s*(\d+)/(\d+)")
-
-    def write(self, text):
-        # Check for cancellation on every write — this is the injection point
-        # that aborts the processor from within its own thread
-        if self.cancel_event and self.cancel_event.is_set():
-            raise JobCancelledException("Job cancelled by user")
-
-        self.original.write(text)
-        self._buffer += text
-
-        # Try to extract tqdm progress
-        match = self._tqdm_pattern.search(self._buffer)
-        if match:
-            percentage = int(match.group(1))
-            current = int(match.group(2))
-            total = int(match.group(3))
-            self.callback(current, total, float(percentage))
-            self._buffer = ""
-
-        # Also check for "Cards not found:" messages for error tracking
-        if "Cards not found:" in text or "not found" in text.lower():
-            # Don't clear buffer for these
-            pass
-
-        # Keep buffer manageable
-        if len(self._buffer) > 4096:
-            self._buffer = self._buffer[-1024:]
-
-    def flush(self):
-        if self.cancel_event and self.cancel_event.is_set():
-            raise JobCancelledException("Job cancelled by user")
-        self.original.flush()
-
-    # Forward all other attributes to original stream
-    def __getattr__(self, name):
-        return getattr(self.original, name)
-
-
 class ProcessorService:
     """
     Wrapper service around MagicCardProcessor for API usage.
 
-    Provides async execution with progress callbacks without modifying
-    the core processor logic. Intercepts tqdm output to emit progress events.
+    Provides async execution with progress callbacks. Each job hands its processor
+    its own progress sink and cancellation token, so concurrent jobs stay apart.
     """
 
     def __init__(
@@ -124,6 +61,7 @@ class ProcessorService:
         progress_callback: Optional[Callable] = None,
         job_repo=None,
         user_id: Optional[int] = None,
+        job_id: Optional[str] = None,
     ):
         self.config = config or load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
         self.progress_callback = progress_callback
@@ -132,8 +70,8 @@ class ProcessorService:
         self._lock = threading.Lock()
         self._cancel_flag = threading.Event()
 
-        # Job metadata
-        self.job_id = str(uuid.uuid4())
+        # Job metadata (job_id is given when a worker runs a job already queued in the jobs table)
+        self.job_id = job_id or str(uuid.uuid4())
         self.start_time = datetime.now()
         self.status = "pending"
         self.progress_data = {"current": 0, "total": 0, "percentage": 0.0, "errors": []}
@@ -171,6 +109,60 @@ class ProcessorService:
             except Exception as e:
                 logger.warning(f"Failed to persist job end: {e}")
 
+    def _resume_checkpointing(self, job_type: str, scope: str) -> Optional[Callable[[Dict[str, Any]], None]]:
+        """Resume after the checkpoint of an unfinished previous run of this job, and return the
+        callback that stores this run's checkpoints (None when job_repo is None).
+
+        Counters in the stored checkpoint are cumulative across resumed runs.
+        """
+        if self._job_repo is None:
+            return None
+        base: Dict[str, Any] = {"scope": scope, "processed": 0, "updated": 0}
+        try:
+            previous = self._job_repo.get_resume_checkpoint(self._user_id, job_type, scope, exclude_job_id=self.job_id)
+            if previous and previous.get("last_card_id") is not None:
+                self.config.resume_after_id = previous["last_card_id"]
+                base.update(processed=previous.get("processed", 0), updated=previous.get("updated", 0))
+                # Carry the cursor over at once, so dying before the first batch loses nothing
+                self._job_repo.save_checkpoint(self.job_id, previous)
+                logger.info(f"Job {self.job_id} resumes after card id {previous['last_card_id']}")
+        except Exception as e:
+            logger.warning(f"Failed to load job checkpoint: {e}")
+
+        def save(checkpoint: Dict[str, Any]) -> None:
+            self._job_repo.save_checkpoint(
+                self.job_id,
+                {
+                    "scope": scope,
+                    "last_card_id": checkpoint["last_card_id"],
+                    "processed": base["processed"] + checkpoint["processed"],
+                    "updated": base["updated"] + checkpoint["updated"],
+                },
+            )
+
+        return save
+
+    @staticmethod
+    def _run_result(processor: MagicCardProcessor, status: str) -> Dict[str, Any]:
+        """Job result of a processor run that finished ("success") or was cancelled.
+
+        Price updates add their catalog refresh counts and the budget that stopped them, if any.
+        """
+        result: Dict[str, Any] = {"status": status}
+        if status == "cancelled":
+            result["message"] = "Job cancelled by user"
+        result.update(
+            error_count=getattr(processor, "error_count", 0),
+            not_found_cards=getattr(processor, "not_found_cards", [])[:20],
+            card_cache=processor.card_cache_stats(),
+            metrics=processor.metrics.as_dict(),
+        )
+        if getattr(processor, "catalog_price_stats", None) is not None:
+            result["catalog"] = processor.catalog_price_stats
+        if getattr(processor, "price_budget_stop", None) is not None:
+            result["budget_stop"] = processor.price_budget_stop
+        return result
+
     async def _emit_progress(self, event_type: str, data: Dict[str, Any]):
         """Emit progress event to callback if provided."""
         if self.progress_callback:
@@ -181,30 +173,32 @@ class ProcessorService:
             except Exception as e:
                 logger.error(f"Error in progress callback: {e}")
 
-    def _on_tqdm_progress(self, current: int, total: int, percentage: float):
-        """Called from tqdm capture thread when progress updates."""
+    def _new_processor(self) -> MagicCardProcessor:
+        """Processor for this job, reporting to _on_progress and stopped by cancel()."""
+        return MagicCardProcessor(
+            self.config, progress_sink=CallbackSink(self._on_progress), cancel_token=CancelToken(self._cancel_flag)
+        )
+
+    def _on_progress(self, event: ProgressEvent):
+        """Called from the processor thread with each (throttled) progress event."""
         # Skip if cancelled
         if self._cancel_flag.is_set():
             return
 
+        data = {
+            "phase": event.phase,
+            "current": event.current,
+            "total": event.total,
+            "percentage": event.percentage,
+            "error_count": event.errors,
+            "rate": event.rate,
+        }
         with self._lock:
-            self.progress_data["current"] = current
-            self.progress_data["total"] = total
-            self.progress_data["percentage"] = percentage
+            self.progress_data.update(data)
 
         # Schedule async callback on the event loop
         if self._loop and self.progress_callback:
-            asyncio.run_coroutine_threadsafe(
-                self._emit_progress(
-                    "progress",
-                    {
-                        "current": current,
-                        "total": total,
-                        "percentage": percentage,
-                    },
-                ),
-                self._loop,
-            )
+            asyncio.run_coroutine_threadsafe(self._emit_progress("progress", data), self._loop)
 
     def _add_error(self, card_name: str, error_message: str):
         """Add error to progress data thread-safely."""
@@ -217,6 +211,7 @@ class ProcessorService:
         """Process cards asynchronously with real-time progress tracking."""
         logger.info(f"Starting async card processing (job_id={self.job_id}, limit={limit})")
         self._persist_job_start("process")
+        save_checkpoint = self._resume_checkpointing("process", self.config.process_scope or "all")
 
         # Capture event loop for cross-thread progress callbacks
         self._loop = asyncio.get_event_loop()
@@ -225,39 +220,21 @@ class ProcessorService:
             self.status = "running"
 
         try:
-            processor = MagicCardProcessor(self.config)
+            processor = self._new_processor()
+            processor.checkpoint_callback = save_checkpoint
             executor = ThreadPoolExecutor(max_workers=1)
 
             def run_processor():
-                """Run processor in thread with tqdm interception and cancellation support."""
-                original_stderr = sys.stderr
-                original_stdout = sys.stdout
-                capture_err = ProgressCapture(original_stderr, self._on_tqdm_progress, self._cancel_flag)
-                capture_out = ProgressCapture(original_stdout, self._on_tqdm_progress, self._cancel_flag)
-
+                """Run processor in thread; cancel() stops it at the next batch boundary."""
                 try:
-                    sys.stderr = capture_err
-                    sys.stdout = capture_out
                     processor.process_card_data()
-                    return {
-                        "status": "success",
-                        "error_count": processor.error_count,
-                        "not_found_cards": processor.not_found_cards[:20],
-                    }
-                except JobCancelledException:
+                    return self._run_result(processor, "success")
+                except JobCancelled:
                     logger.info(f"Process cards job cancelled (job_id={self.job_id})")
-                    return {
-                        "status": "cancelled",
-                        "message": "Job cancelled by user",
-                        "error_count": getattr(processor, "error_count", 0),
-                        "not_found_cards": getattr(processor, "not_found_cards", [])[:20],
-                    }
+                    return self._run_result(processor, "cancelled")
                 except Exception as e:
                     logger.error(f"Processor error: {e}")
                     return {"status": "error", "error": str(e)}
-                finally:
-                    sys.stderr = original_stderr
-                    sys.stdout = original_stdout
 
             result = await self._loop.run_in_executor(executor, run_processor)
 
@@ -285,10 +262,23 @@ class ProcessorService:
             await self._emit_progress("complete", {"status": "error", "summary": {"status": "error", "error": str(e)}})
             raise
 
-    async def update_prices_async(self):
-        """Update prices asynchronously with real-time progress tracking."""
-        logger.info(f"Starting async price update (job_id={self.job_id})")
+    async def update_prices_async(self, price_source: Optional[str] = None, incremental: Optional[bool] = None):
+        """Update prices asynchronously with real-time progress tracking.
+
+        price_source overrides config.price_source: "catalog" refreshes from catalog_cards in one
+        operation and only looks up unmatched cards on Scryfall. incremental overrides
+        config.incremental_prices: only stale cards, most valuable first, within the price budgets.
+        """
+        if price_source is not None:
+            self.config.price_source = price_source
+        if incremental is not None:
+            self.config.incremental_prices = incremental
+        if self._user_id is not None:
+            self.config.user_id = self._user_id
+        logger.info(f"Starting async price update (job_id={self.job_id}, source={self.config.price_source})")
         self._persist_job_start("update_prices")
+        scope = self.config.price_source + (":incremental" if self.config.incremental_prices else "")
+        save_checkpoint = self._resume_checkpointing("update_prices", scope)
 
         # Capture event loop for cross-thread progress callbacks
         self._loop = asyncio.get_event_loop()
@@ -297,39 +287,21 @@ class ProcessorService:
             self.status = "running"
 
         try:
-            processor = MagicCardProcessor(self.config)
+            processor = self._new_processor()
+            processor.checkpoint_callback = save_checkpoint
             executor = ThreadPoolExecutor(max_workers=1)
 
             def run_update():
-                """Run price update in thread with tqdm interception and cancellation support."""
-                original_stderr = sys.stderr
-                original_stdout = sys.stdout
-                capture_err = ProgressCapture(original_stderr, self._on_tqdm_progress, self._cancel_flag)
-                capture_out = ProgressCapture(original_stdout, self._on_tqdm_progress, self._cancel_flag)
-
+                """Run price update in thread; cancel() stops it at the next batch boundary."""
                 try:
-                    sys.stderr = capture_err
-                    sys.stdout = capture_out
                     processor.process_card_data()
-                    return {
-                        "status": "success",
-                        "error_count": processor.error_count,
-                        "not_found_cards": processor.not_found_cards[:20],
-                    }
-                except JobCancelledException:
+                    return self._run_result(processor, "success")
+                except JobCancelled:
                     logger.info(f"Price update job cancelled (job_id={self.job_id})")
-                    return {
-                        "status": "cancelled",
-                        "message": "Job cancelled by user",
-                        "error_count": getattr(processor, "error_count", 0),
-                        "not_found_cards": getattr(processor, "not_found_cards", [])[:20],
-                    }
+                    return self._run_result(processor, "cancelled")
                 except Exception as e:
                     logger.error(f"Price update error: {e}")
                     return {"status": "error", "error": str(e)}
-                finally:
-                    sys.stderr = original_stderr
-                    sys.stdout = original_stdout
 
             result = await self._loop.run_in_executor(executor, run_update)
 
@@ -365,37 +337,19 @@ class ProcessorService:
             self.status = "running"
         self._persist_job_start("update_price")
         try:
-            processor = MagicCardProcessor(self.config)
+            processor = self._new_processor()
             executor = ThreadPoolExecutor(max_workers=1)
 
             def run_update():
-                original_stderr = sys.stderr
-                original_stdout = sys.stdout
-                capture_err = ProgressCapture(original_stderr, self._on_tqdm_progress, self._cancel_flag)
-                capture_out = ProgressCapture(original_stdout, self._on_tqdm_progress, self._cancel_flag)
                 try:
-                    sys.stderr = capture_err
-                    sys.stdout = capture_out
                     processor.update_prices_for_card_ids([card_id])
-                    return {
-                        "status": "success",
-                        "error_count": processor.error_count,
-                        "not_found_cards": processor.not_found_cards[:20],
-                    }
-                except JobCancelledException:
+                    return self._run_result(processor, "success")
+                except JobCancelled:
                     logger.info(f"Single-card price update job cancelled (job_id={self.job_id})")
-                    return {
-                        "status": "cancelled",
-                        "message": "Job cancelled by user",
-                        "error_count": getattr(processor, "error_count", 0),
-                        "not_found_cards": getattr(processor, "not_found_cards", [])[:20],
-                    }
+                    return self._run_result(processor, "cancelled")
                 except Exception as e:
                     logger.error(f"Single-card price update error: {e}")
                     return {"status": "error", "error": str(e)}
-                finally:
-                    sys.stderr = original_stderr
-                    sys.stdout = original_stdout
 
             result = await self._loop.run_in_executor(executor, run_update)
             with self._lock:
@@ -429,8 +383,8 @@ class ProcessorService:
         """
         Request cancellation and emit WebSocket complete event.
 
-        The underlying processor thread may continue running until its
-        current operation finishes, but the job is marked cancelled and
+        The underlying processor thread stops once its current batch
+        finishes (JobCancelled), but the job is marked cancelled at once and
         no further progress events will be emitted to WebSocket clients.
         """
         logger.info(f"Async cancellation requested for job_id={self.job_id}")
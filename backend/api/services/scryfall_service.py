@@ -15,13 +15,14 @@ if project_root not in sys.path:
 
 from loguru import logger
 
-from deckdex.card_fetcher import CardFetcher
+from deckdex.async_card_fetcher import AsyncCardFetcher
 from deckdex.config_loader import load_config
 
 
-def _get_fetcher() -> CardFetcher:
+def _get_fetcher() -> AsyncCardFetcher:
+    """Non-blocking fetcher for use inside async routes; close it with ``async with``."""
     config = load_config(profile=os.getenv("DECKDEX_PROFILE", "default"))
-    return CardFetcher(config.scryfall, config.openai)
+    return AsyncCardFetcher(config.scryfall)
 
 
 def _is_scryfall_enabled(user_id: int) -> bool:
@@ -42,7 +43,7 @@ def _get_catalog_repo():
     return get_catalog_repo()
 
 
-def suggest_card_names(q: str, user_id: Optional[int] = None) -> List[str]:
+async def suggest_card_names(q: str, user_id: Optional[int] = None) -> List[str]:
     """
     Return up to 20 card name suggestions.
 
@@ -69,8 +70,8 @@ def suggest_card_names(q: str, user_id: Optional[int] = None) -> List[str]:
     # 2. Scryfall fallback
     if user_id is not None and _is_scryfall_enabled(user_id):
         try:
-            fetcher = _get_fetcher()
-            return fetcher.autocomplete(q)
+            async with _get_fetcher() as fetcher:
+                return await fetcher.autocomplete(q)
         except Exception as e:
             logger.warning(f"Scryfall suggest failed for q={q!r}: {e}")
 
@@ -99,7 +100,7 @@ def _map_catalog_card(card: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def resolve_card_by_name(
+async def resolve_card_by_name(
     name: str,
     from_collection: Dict[str, Any] | None = None,
     user_id: Optional[int] = None,
@@ -132,8 +133,8 @@ def resolve_card_by_name(
     # Scryfall fallback
     if user_id is not None and _is_scryfall_enabled(user_id):
         try:
-            fetcher = _get_fetcher()
-            scryfall = fetcher.search_card(name)
+            async with _get_fetcher() as fetcher:
+                scryfall = await fetcher.search_card(name)
         except Exception as e:
             logger.warning(f"Scryfall resolve failed for {name!r}: {e}")
             raise CardNotFoundError(f"Card not found: {name}") from e
@@ -7,7 +7,9 @@ into canonical WUBRG letter strings.
 """
 
 import re
-from typing import Any
+from typing import Any, Dict
+
+from deckdex.colors import mask_to_identity
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -110,3 +112,21 @@ def normalize_color_identity(raw: Any) -> str:
     # Deduplicate and sort in WUBRG order
     unique = sorted(set(letters), key=lambda c: WUBRG_ORDER.index(c) if c in WUBRG_ORDER else 99)
     return "".join(unique) if unique else "C"
+
+
+# ---------------------------------------------------------------------------
+# Bitmasks
+# ---------------------------------------------------------------------------
+
+
+def card_color_identity(card: Dict[str, Any]) -> str:
+    """Canonical color identity of a card dict.
+
+    Postgres cards carry ``color_identity_mask``; a zero mask only comes from an empty
+    color_identity, so like cards without a mask (Google Sheets) those fall back to
+    parsing ``color_identity`` or ``colors``.
+    """
+    mask = card.get("color_identity_mask")
+    if mask:
+        return mask_to_identity(int(mask))
+    return normalize_color_identity(card.get("color_identity") or card.get("colors") or "")
@@ -3,8 +3,9 @@ WebSocket handler for real-time progress updates
 """
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
@@ -14,6 +15,9 @@ router = APIRouter()
 # Store active WebSocket connections per job_id
 _connections: Dict[str, Set[WebSocket]] = {}
 
+# How often a connection following a worker-run job re-reads its row in the jobs table
+_WORKER_JOB_POLL_SECONDS = 2.0
+
 
 class ConnectionManager:
     """
@@ -176,6 +180,8 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
     from ..dependencies import get_job_repo
     from ..routes.process import _active_jobs, _job_results
 
+    job_repo = None
+    db_job = None
     if job_id not in _active_jobs and job_id not in _job_results:
         job_repo = get_job_repo()
         if job_repo is not None:
@@ -183,8 +189,6 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
                 db_job = job_repo.get_job(job_id)
             except Exception:
                 db_job = None
-        else:
-            db_job = None
         if db_job is None:
             logger.warning(f"WebSocket connection rejected: job_id={job_id} not found")
             await websocket.close(code=4004, reason="Job not found")
@@ -207,6 +211,15 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
             result_data = result_tuple[0] if isinstance(result_tuple, tuple) else result_tuple
             job_status = result_data.get("status", "complete")
 
+        # Jobs run by a worker process: relay what the worker writes to the jobs table
+        relay_repo = None
+        if db_job is not None and (db_job["status"] == "queued" or db_job.get("worker_id")):
+            job_status = db_job["status"]
+            initial_progress = db_job.get("progress") or initial_progress
+            if job_status in ("queued", "running"):
+                relay_repo = job_repo
+        last_relayed = initial_progress
+
         await websocket.send_json(
             {"type": "connected", "job_id": job_id, "job_status": job_status, "timestamp": datetime.now().isoformat()}
         )
@@ -225,22 +238,33 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
         elif job_status in ("complete", "error"):
             # Job already finished - send complete event
             raw = _job_results.get(job_id)
+            if raw is None and db_job is not None:
+                raw = db_job.get("result")
             result = raw[0] if isinstance(raw, tuple) else (raw or {})
             await websocket.send_json(
                 {"type": "complete", "status": job_status, "summary": result, "timestamp": datetime.now().isoformat()}
             )
 
         # Keep connection alive and handle heartbeat
+        last_ping = time.monotonic()
         while True:
             try:
-                # Wait for messages from client (or timeout for heartbeat)
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
+                # Wait for messages from client (or timeout for heartbeat / worker job poll)
+                timeout = _WORKER_JOB_POLL_SECONDS if relay_repo is not None else 30.0
+                data = await asyncio.wait_for(websocket.receive_text(), timeout=timeout)
 
                 # Handle ping/pong if client sends messages
                 if data == "ping":
                     await websocket.send_json({"type": "pong", "timestamp": datetime.now().isoformat()})
 
             except asyncio.TimeoutError:
+                if relay_repo is not None:
+                    last_relayed = await _relay_worker_job(websocket, relay_repo, job_id, last_relayed)
+                    if last_relayed is None:
+                        relay_repo = None
+                    if time.monotonic() - last_ping < 30.0:
+                        continue
+                last_ping = time.monotonic()
                 # Send heartbeat ping
                 try:
                     await websocket.send_json({"type": "ping", "timestamp": datetime.now().isoformat()})
@@ -257,5 +281,48 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
         logger.info(f"WebSocket connection closed: job_id={job_id}")
 
 
+async def _relay_worker_job(websocket: WebSocket, job_repo, job_id: str, last_progress: dict) -> Optional[dict]:
+    """Send a worker-run job's new progress, or its complete event once it has finished.
+
+    Returns the progress sent last, or None when the job is over and relaying should stop.
+    """
+    try:
+        db_job = await asyncio.to_thread(job_repo.get_job, job_id)
+    except Exception as e:
+        logger.warning(f"Polling job {job_id} failed: {e}")
+        return last_progress
+    if db_job is None:
+        return None
+
+    status = db_job["status"]
+    if status in ("queued", "running"):
+        progress = db_job.get("progress") or {}
+        if progress and progress != last_progress:
+            await websocket.send_json(
+                {
+                    "type": "progress",
+                    "current": progress.get("current", 0),
+                    "total": progress.get("total", 0),
+                    "percentage": round(progress.get("percentage", 0.0), 2),
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+        return progress
+
+    # The worker changed the collection; drop this process's cached views of it (once per job)
+    from ..routes.process import settle_worker_job
+
+    settle_worker_job(job_id, status)
+    await websocket.send_json(
+        {
+            "type": "complete",
+            "status": status,
+            "summary": db_job.get("result") or {},
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+    return None
+
+
 # Export manager for use in processor service
 __all__ = ["manager", "router"]
@@ -0,0 +1,167 @@
+"""
+Job worker - runs queued process and price jobs outside the API process
+
+With jobs.queue enabled, POST /api/process and POST /api/prices/update only insert a
+'queued' row in the jobs table. Each worker claims queued rows one at a time
+(FOR UPDATE SKIP LOCKED), runs them through ProcessorService, and writes progress,
+heartbeats and the final result back to the row. Start more workers to run more jobs:
+
+    python -m backend.api.worker
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import sys
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+# Add project root to Python path to import deckdex package
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from loguru import logger
+
+from deckdex.config import PRICE_SOURCES
+from deckdex.config_loader import load_config
+from deckdex.storage.job_repository import JobRepository
+
+from .services.processor_service import ProcessorService
+
+# Job types the API enqueues when jobs.queue is enabled
+QUEUED_JOB_TYPES = ("process", "update_prices")
+
+
+class JobWorker:
+    """Claims queued jobs from Postgres and runs them one at a time."""
+
+    def __init__(
+        self,
+        job_repo: JobRepository,
+        profile: str = "default",
+        poll_interval: float = 2.0,
+        heartbeat_timeout: float = 300.0,
+        worker_id: Optional[str] = None,
+    ):
+        self._job_repo = job_repo
+        self._profile = profile
+        self._poll_interval = poll_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Stop after the current job (an idle worker exits at once)."""
+        self._stop.set()
+
+    def run_forever(self) -> None:
+        """Poll the queue until stop() is called."""
+        logger.info(f"Job worker {self.worker_id} started (poll_interval={self._poll_interval}s)")
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._stop.wait(self._poll_interval)
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    def run_once(self) -> bool:
+        """Claim and run one queued job. Returns False when the queue was empty (or unreachable)."""
+        try:
+            stale = self._job_repo.fail_stale_jobs(self._heartbeat_timeout)
+            if stale:
+                logger.warning(f"Marked {stale} job(s) of unresponsive workers as error")
+            job = self._job_repo.claim_next_job(self.worker_id)
+        except Exception as e:
+            logger.error(f"Job queue poll failed: {e}")
+            return False
+        if job is None:
+            return False
+        asyncio.run(self.run_job(job))
+        return True
+
+    def _build_service(self, job: Dict[str, Any]) -> ProcessorService:
+        config = load_config(profile=self._profile)
+        if job["type"] == "process":
+            config.process_scope = job["params"].get("scope") or "all"
+        else:
+            config.update_prices = True
+        return ProcessorService(config=config, job_repo=self._job_repo, user_id=job["user_id"], job_id=job["job_id"])
+
+    async def run_job(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a claimed job, sending heartbeats with its progress until it finishes."""
+        job_id, job_type, params = job["job_id"], job["type"], job["params"]
+        logger.info(f"Worker {self.worker_id} running {job_type} job {job_id} (params={params})")
+        if job_type not in QUEUED_JOB_TYPES:
+            self._job_repo.update_job_status(
+                job_id, "error", {"status": "error", "error": f"Unknown job type: {job_type}"}
+            )
+            return None
+
+        service = self._build_service(job)
+        heartbeat = asyncio.create_task(self._heartbeat(service))
+        try:
+            if job_type == "process":
+                return await service.process_cards_async(limit=params.get("limit"))
+            source = params.get("source") or "scryfall"
+            if source not in PRICE_SOURCES:
+                source = "scryfall"
+            return await service.update_prices_async(price_source=source, incremental=bool(params.get("incremental")))
+        except Exception as e:
+            # ProcessorService has already stored the error on the job row
+            logger.error(f"{job_type} job {job_id} failed: {e}")
+            return None
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, service: ProcessorService) -> None:
+        """Write the job's progress every poll interval and cancel it when the API asks to."""
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            progress = service.get_metadata().progress
+            try:
+                cancel_requested = await asyncio.to_thread(self._job_repo.heartbeat, service.job_id, progress)
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {service.job_id} failed: {e}")
+                continue
+            if cancel_requested and service.status == "running":
+                logger.info(f"Cancellation requested for job {service.job_id}")
+                service.cancel()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued DeckDex process and price jobs")
+    parser.add_argument("--profile", default=os.getenv("DECKDEX_PROFILE", "default"), help="Config profile")
+    parser.add_argument("--poll-interval", type=float, default=None, help="Override jobs.poll_interval")
+    parser.add_argument("--once", action="store_true", help="Run at most one queued job, then exit")
+    args = parser.parse_args(argv)
+
+    config = load_config(profile=args.profile)
+    url = config.database.url if config.database is not None else os.getenv("DATABASE_URL")
+    if not url or not str(url).strip().startswith("postgresql"):
+        logger.error("The job worker needs a PostgreSQL DATABASE_URL")
+        return 1
+
+    worker = JobWorker(
+        JobRepository(url),
+        profile=args.profile,
+        poll_interval=args.poll_interval or config.jobs.poll_interval,
+        heartbeat_timeout=config.jobs.heartbeat_timeout,
+    )
+    if args.once:
+        worker.run_once()
+        return 0
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: worker.stop())
+    worker.run_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
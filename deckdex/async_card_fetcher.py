@@ -0,0 +1,279 @@
+"""Asyncio counterpart of CardFetcher for code running on the web backend's event loop.
+
+Lookups are coroutines on an httpx.AsyncClient, so an import can keep hundreds
+of Scryfall requests in flight without tying up a thread per request. Two
+limits apply: a semaphore caps in-flight requests per fetcher
+(scryfall.max_concurrency), and every request draws from the same process-wide
+token bucket as the blocking CardFetcher, so mixing both never exceeds
+scryfall.requests_per_second.
+"""
+
+import asyncio
+import contextvars
+import re
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote_plus, urlsplit
+
+import httpx
+from loguru import logger
+
+from .card_fetcher import SEARCH_STRATEGIES, CardFetcher, CardIdentifier, is_client_error
+from .config import ScryfallConfig
+from .name_lookup_cache import NameLookupCache, get_name_lookup_cache
+from .rate_limiter import TokenBucket, parse_retry_after, retry_delay
+from .response_cache import CachedResponse, ResponseCache, cache_key, get_response_cache, revalidation_headers
+from .scryfall_transport import _DEFAULT_HEADERS, get_transport
+
+# Set when a lookup inside the current search_card task failed for a transient reason
+_transient_failure: contextvars.ContextVar[bool] = contextvars.ContextVar("transient_failure", default=False)
+
+
+class AsyncCardFetcher:
+    """Fetches card data from Scryfall API without blocking the event loop.
+
+    Use as an async context manager (or call aclose()) so the connection pool is released.
+    """
+
+    BASE_URL = CardFetcher.BASE_URL
+    COLLECTION_BATCH_SIZE = CardFetcher.COLLECTION_BATCH_SIZE
+
+    def __init__(
+        self,
+        scryfall_config: ScryfallConfig,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[TokenBucket] = None,
+    ):
+        """Initialize the AsyncCardFetcher.
+
+        Args:
+            scryfall_config: Configuration for Scryfall API
+            client: Optional pre-built httpx client (tests); one sized from the config is created otherwise
+            limiter: Optional token bucket; defaults to the shared Scryfall transport's bucket
+        """
+        self.BASE_URL = scryfall_config.base_url.rstrip("/")
+        self.max_retries = scryfall_config.max_retries
+        self.retry_delay = scryfall_config.retry_delay
+        self.timeout = scryfall_config.timeout
+        # The shared transport's bucket (and adaptive controller, so both kinds of traffic feed one AIMD loop)
+        self._controller = None
+        if limiter is None:
+            transport = get_transport(scryfall_config)
+            limiter, self._controller = transport.limiter, transport.controller
+        self._limiter = limiter
+        self._host = urlsplit(self.BASE_URL).netloc
+        self._semaphore = asyncio.Semaphore(scryfall_config.max_concurrency)
+        self._client = client or httpx.AsyncClient(
+            headers=_DEFAULT_HEADERS,
+            timeout=scryfall_config.timeout,
+            limits=httpx.Limits(
+                max_connections=scryfall_config.max_concurrency,
+                max_keepalive_connections=scryfall_config.pool_size,
+            ),
+        )
+        self._cache: Optional[ResponseCache] = None
+        if scryfall_config.cache_path:
+            max_bytes = int(scryfall_config.cache_max_mb * 1024 * 1024)
+            self._cache = get_response_cache(scryfall_config.cache_path, max_bytes)
+        self.cache_price_ttl = scryfall_config.cache_price_ttl
+        self.cache_oracle_ttl = scryfall_config.cache_oracle_ttl
+        self._names: Optional[NameLookupCache] = None
+        if scryfall_config.cache_path:
+            self._names = get_name_lookup_cache(scryfall_config.cache_path)
+        self.negative_cache_ttl = scryfall_config.negative_cache_ttl
+
+    async def __aenter__(self) -> "AsyncCardFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    _cache_ttl = CardFetcher._cache_ttl
+
+    async def _send(self, url: str, payload: Optional[Dict[str, Any]], headers: Dict[str, str]) -> httpx.Response:
+        """One rate-limited request, holding a concurrency slot for the limiter wait and the round trip.
+
+        Under adaptive control the slot also comes from the shared controller, which is told how the request went.
+        """
+        controller = self._controller
+        async with self._semaphore, controller.aslot() if controller is not None else nullcontext():
+            wait = self._limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started = time.monotonic()
+            try:
+                if payload is None:
+                    response = await self._client.get(url, headers=headers or None)
+                else:
+                    response = await self._client.post(url, json=payload, headers=headers or None)
+            except httpx.TransportError:
+                if controller is not None:
+                    controller.observe(None, None, host=self._host)
+                raise
+            if controller is not None:
+                controller.observe(
+                    time.monotonic() - started,
+                    response.status_code,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                    host=self._host,
+                )
+            return response
+
+    async def _make_request(self, url: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Scryfall API with retry logic (see CardFetcher._make_request).
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries.
+        """
+        key: Optional[str] = None
+        cached: Optional[CachedResponse] = None
+        headers: Dict[str, str] = {}
+        if self._cache is not None:
+            key = cache_key("GET" if payload is None else "POST", url, payload)
+            cached = self._cache.get(key)
+            if cached is not None and cached.is_fresh():
+                return cached.body
+            if payload is None:
+                headers = revalidation_headers(cached)
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._send(url, payload, headers)
+                if cached is not None and response.status_code == 304:
+                    self._cache.touch(key, self._cache_ttl(url))
+                    return cached.body
+                response.raise_for_status()
+                data = response.json()
+                if self._cache is not None:
+                    try:
+                        self._cache.put(
+                            key,
+                            data,
+                            self._cache_ttl(url),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                    except Exception as e:
+                        logger.debug(f"Scryfall response cache write failed for {url}: {e}")
+                return data
+            except httpx.HTTPError as e:
+                # A 404 (or any other client error except 429) will not change on retry
+                if is_client_error(e):
+                    raise
+                if attempt == self.max_retries - 1:
+                    _transient_failure.set(True)
+                    raise
+                await asyncio.sleep(retry_delay(self.retry_delay, attempt, e))
+
+    async def autocomplete(self, q: str) -> List[str]:
+        """Return up to 20 card names matching *q* (Scryfall autocomplete)."""
+        if not q or not (q := q.strip()):
+            return []
+        url = f"{self.BASE_URL}/cards/autocomplete?q={quote_plus(q)}"
+        try:
+            response = await self._make_request(url)
+            data = response.get("data") if isinstance(response.get("data"), list) else []
+            return data[:20]
+        except Exception:
+            return []
+
+    async def _named(self, mode: str, card_name: str) -> Optional[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/cards/named?{mode}={quote_plus(card_name)}"
+        try:
+            return await self._make_request(url)
+        except Exception:
+            return None
+
+    async def _search_query(self, query: str) -> Optional[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/cards/search?q={quote_plus(query)}"
+        try:
+            response = await self._make_request(url)
+            if response.get("data"):
+                return response["data"][0]
+            return None
+        except Exception:
+            return None
+
+    async def _run_strategy(self, strategy: str, card_name: str) -> Optional[Dict[str, Any]]:
+        if strategy in ("exact", "fuzzy"):
+            return await self._named(strategy, card_name)
+        if strategy == "phrase":
+            return await self._search_query(f'!"{card_name}"')
+        words = re.sub(r"[^\w\s]", "", card_name).strip().split()
+        if len(words) > 1:
+            return await self._search_query(" ".join(f"/{word}/i" for word in words))
+        return None
+
+    async def search_card(self, card_name: str) -> Dict[str, Any]:
+        """
+        Search for a card with the same cascade as CardFetcher.search_card:
+        exact name, fuzzy name, exact phrase search, then per-word regex search.
+        Shares CardFetcher's negative cache and remembered strategies.
+
+        Raises:
+            Exception: If the card cannot be found using any strategy.
+        """
+        if self._names is not None and self._names.is_known_missing(card_name):
+            raise Exception(f"Card not found: {card_name}")
+
+        preferred = self._names.strategy_for(card_name) if self._names is not None else None
+        order = list(SEARCH_STRATEGIES)
+        if preferred in order:
+            order.remove(preferred)
+            order.insert(0, preferred)
+
+        _transient_failure.set(False)
+        for strategy in order:
+            result = await self._run_strategy(strategy, card_name)
+            if result:
+                if self._names is not None and strategy != preferred:
+                    self._names.record_match(card_name, strategy)
+                return result
+
+        if self._names is not None and not _transient_failure.get():
+            self._names.record_miss(card_name, self.negative_cache_ttl)
+        raise Exception(f"Card not found: {card_name}")
+
+    async def _fetch_collection(self, identifiers: List[Dict[str, str]]) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        url = f"{self.BASE_URL}/cards/collection"
+        try:
+            response = await self._make_request(url, payload={"identifiers": identifiers})
+        except Exception as e:
+            logger.warning(f"Scryfall collection lookup failed for {len(identifiers)} identifiers: {e}")
+            return {}
+        return CardFetcher._match_collection(identifiers, response)
+
+    async def search_cards_bulk(
+        self, identifiers: Sequence[CardIdentifier], fallback: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve many cards via /cards/collection (75 per request, chunks fetched concurrently).
+
+        Same contract as CardFetcher.search_cards_bulk: results follow input order,
+        and with *fallback* the not-found names run the search_card cascade concurrently.
+        """
+        requested = [CardFetcher._collection_identifier(i) for i in identifiers]
+        keys = [CardFetcher._identifier_key(i) for i in requested]
+        unique: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        for key, ident in zip(keys, requested):
+            unique.setdefault(key, ident)
+        batch = list(unique.values())
+
+        resolved: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        chunks = [batch[i : i + self.COLLECTION_BATCH_SIZE] for i in range(0, len(batch), self.COLLECTION_BATCH_SIZE)]
+        for found in await asyncio.gather(*(self._fetch_collection(chunk) for chunk in chunks)):
+            resolved.update(found)
+
+        if fallback:
+            misses = [(key, ident["name"]) for key, ident in unique.items() if key not in resolved and "name" in ident]
+            results = await asyncio.gather(*(self.search_card(name) for _key, name in misses), return_exceptions=True)
+            for (key, _name), result in zip(misses, results):
+                if not isinstance(result, BaseException):
+                    resolved[key] = result
+
+        return [resolved.get(key) for key in keys]
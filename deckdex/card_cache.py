@@ -0,0 +1,140 @@
+"""In-memory card-data cache shared by every MagicCardProcessor in the process.
+
+Processors are short-lived (the web backend builds one per job), so a cache on
+the instance never survives long enough to pay off. This one lives at module
+level, is bounded by entry count and by the approximate JSON size of the
+cached card objects, expires entries after a TTL (card data carries prices),
+and keeps hit/miss/eviction counters for job summaries.
+
+Only successful lookups are stored: a None result may come from a timeout or
+a 5xx, and names that are definitively unknown are already remembered by the
+Scryfall negative cache (deckdex.name_lookup_cache).
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import ProcessingConfig
+
+
+def _key(name: str) -> str:
+    return " ".join((name or "").split()).lower()
+
+
+def _approx_size(value: Dict[str, Any]) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 4096
+
+
+class CardDataCache:
+    """Thread-safe LRU of card name -> Scryfall card object, bounded by count, bytes and age."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, card data); order is least -> most recently used
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def configure(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        """Apply new bounds (most recently loaded config wins), evicting if they shrank."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.ttl = ttl
+            self._evict()
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Cached card data for *name*, or None (counted as a miss) when absent or expired."""
+        key = _key(name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, name: str, data: Optional[Dict[str, Any]]) -> None:
+        """Store a successful lookup. None (failed lookups) is ignored."""
+        if not data or self.max_entries == 0:
+            return
+        key = _key(name)
+        size = _approx_size(data)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self._clock() + self.ttl, size, data)
+            self._bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _drop(self, key: str) -> None:
+        _expires, size, _data = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+
+_shared_cache: Optional[CardDataCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_card_cache(config: Optional[ProcessingConfig] = None) -> CardDataCache:
+    """Return the process-wide CardDataCache, creating it on first use.
+
+    When *config* is given its bounds are applied, so the most recently loaded
+    profile wins; cached entries are kept.
+    """
+    global _shared_cache
+    config = config or ProcessingConfig()
+    max_bytes = int(config.card_cache_max_mb * 1024 * 1024)
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = CardDataCache(config.card_cache_size, max_bytes, config.card_cache_ttl)
+        else:
+            _shared_cache.configure(config.card_cache_size, max_bytes, config.card_cache_ttl)
+        return _shared_cache
+
+
+def reset_card_cache() -> None:
+    """Drop the shared cache (used by tests)."""
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = None
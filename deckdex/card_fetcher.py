@@ -1,9 +1,10 @@
 import json
 import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import quote_plus
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote_plus, urlsplit
 
 import requests
 from dotenv import load_dotenv
@@ -19,12 +20,40 @@ from openai import (
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .config import OpenAIConfig, ScryfallConfig
+from .enrichment_cache import Analysis, EnrichmentCache, get_enrichment_cache
+from .metrics import RunMetrics
+from .name_lookup_cache import NameLookupCache, get_name_lookup_cache
+from .rate_limiter import retry_delay
+from .response_cache import CachedResponse, ResponseCache, cache_key, get_response_cache, revalidation_headers
+from .scryfall_transport import get_transport
+from .single_flight import SingleFlight
+
+# A card identifier for bulk lookups: a card name, a Scryfall id, a (set, collector_number)
+# pair, or a raw /cards/collection identifier dict.
+CardIdentifier = Union[str, Tuple[str, str], Dict[str, str]]
+
+# search_card strategies, in default order
+SEARCH_STRATEGIES = ("exact", "fuzzy", "phrase", "regex")
+
+
+def is_client_error(exc: Exception) -> bool:
+    """True for a 4xx answer other than 429: a definitive "no", not worth retrying."""
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status != 429
+
+
+# Identical requests in flight at the same time (duplicate rows, parallel jobs) share one HTTP call
+_inflight = SingleFlight()
+
+_SCRYFALL_ID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
 
 
 class CardFetcher:
     """Fetches card data from Scryfall API."""
 
     BASE_URL = "https://api.scryfall.com"
+    # Scryfall rejects /cards/collection requests with more than 75 identifiers.
+    COLLECTION_BATCH_SIZE = 75
 
     def __init__(self, scryfall_config: ScryfallConfig, openai_config: OpenAIConfig):
         """Initialize the CardFetcher.
@@ -34,32 +63,74 @@ class CardFetcher:
             openai_config: Configuration for OpenAI API
         """
         load_dotenv()
+        self.BASE_URL = scryfall_config.base_url.rstrip("/")
         self.max_retries = scryfall_config.max_retries
         self.retry_delay = scryfall_config.retry_delay
         self.timeout = scryfall_config.timeout
+        # Shared pooled session + process-wide rate limiter (all fetchers draw from the same bucket)
+        self._transport = get_transport(scryfall_config)
+        # Persistent response cache (SQLite); None when scryfall.cache_path is unset
+        self._cache: Optional[ResponseCache] = None
+        if scryfall_config.cache_path:
+            max_bytes = int(scryfall_config.cache_max_mb * 1024 * 1024)
+            self._cache = get_response_cache(scryfall_config.cache_path, max_bytes)
+        self.cache_price_ttl = scryfall_config.cache_price_ttl
+        self.cache_oracle_ttl = scryfall_config.cache_oracle_ttl
+        # Names no strategy could resolve, and which strategy resolved the rest (same SQLite file)
+        self._names: Optional[NameLookupCache] = None
+        if scryfall_config.cache_path:
+            self._names = get_name_lookup_cache(scryfall_config.cache_path)
+        self.negative_cache_ttl = scryfall_config.negative_cache_ttl
+        # Per-thread flag: did the current search_card hit a transient (non-4xx) failure?
+        self._lookup_state = threading.local()
+        # RunMetrics of the processor run using this fetcher (latencies, retries, cache hits); None = not recorded
+        self.metrics: Optional[RunMetrics] = None
 
         # Initialize OpenAI client if enabled and API key is present
         api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_max_tokens = openai_config.max_tokens
+        self.openai_max_completion_tokens = openai_config.max_completion_tokens
+        # Each card gets max_tokens of the completion, so a chunk must fit the model's output limit
+        self.openai_batch_size = max(
+            1, min(openai_config.batch_size, openai_config.max_completion_tokens // openai_config.max_tokens)
+        )
         if openai_config.enabled and api_key:
             self.openai_client = OpenAI(api_key=api_key)
             self.openai_model = openai_config.model
-            self.openai_max_tokens = openai_config.max_tokens
             self.openai_temperature = openai_config.temperature
             self.openai_max_retries = openai_config.max_retries
+            # Analyses are keyed by oracle_id + model, so every printing and later runs reuse them
+            self._enrichment: Optional[EnrichmentCache] = None
+            if openai_config.cache_path:
+                self._enrichment = get_enrichment_cache(openai_config.cache_path)
         else:
             self.openai_client = None
             self.openai_model = None
+            self._enrichment = None
             if openai_config.enabled and not api_key:
                 logger.warning("OpenAI enabled but OPENAI_API_KEY not found, card analysis will be disabled")
             else:
                 logger.info("OpenAI disabled in config, card analysis will be disabled")
 
-    def _make_request(self, url: str) -> Dict[str, Any]:
+    def _cache_ttl(self, url: str) -> float:
+        """Freshness window for a response: card objects carry daily prices, everything else is long-lived."""
+        path = urlsplit(url).path
+        if path.startswith("/cards/") and not path.startswith("/cards/autocomplete"):
+            return self.cache_price_ttl
+        return self.cache_oracle_ttl
+
+    def _make_request(self, url: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Make a request to the Scryfall API with retry logic.
 
+        Fresh responses are served from the persistent cache; expired ones are
+        revalidated with If-None-Match / If-Modified-Since when Scryfall sent validators.
+        Concurrent identical requests (from any CardFetcher in the process) are
+        coalesced: one goes out and every caller gets its result or its error.
+
         Args:
             url: The URL to request.
+            payload: JSON body; when given the request is sent as a POST instead of a GET.
 
         Returns:
             The JSON response from the API.
@@ -67,16 +138,77 @@ class CardFetcher:
         Raises:
             Exception: If the request fails after retries.
         """
+        flight_key = cache_key("GET" if payload is None else "POST", url, payload)
+        try:
+            return _inflight.do(flight_key, lambda: self._request_with_retries(url, payload))
+        except requests.exceptions.RequestException as e:
+            # Flag timeouts / 5xx for search_card in every thread that shared the failed call
+            if not is_client_error(e):
+                self._lookup_state.transient = True
+            raise
+
+    def _request_with_retries(self, url: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """One logical request: cache lookup / revalidation, then up to max_retries attempts."""
+        metrics = getattr(self, "metrics", None)
+        key: Optional[str] = None
+        cached: Optional[CachedResponse] = None
+        headers: Dict[str, str] = {}
+        if self._cache is not None:
+            key = cache_key("GET" if payload is None else "POST", url, payload)
+            cached = self._cache.get(key)
+            if cached is not None and cached.is_fresh():
+                if metrics is not None:
+                    metrics.count("response_cache_hits")
+                return cached.body
+            if payload is None:
+                headers = revalidation_headers(cached)
+
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, timeout=self.timeout)
+                kwargs: Dict[str, Any] = {"timeout": self.timeout}
+                if metrics is not None:
+                    kwargs["metrics"] = metrics
+                if headers:
+                    kwargs["headers"] = headers
+                if payload is None:
+                    response = self._transport.get(url, **kwargs)
+                else:
+                    response = self._transport.post(url, json=payload, **kwargs)
+                if cached is not None and response.status_code == 304:
+                    self._cache.touch(key, self._cache_ttl(url))
+                    if metrics is not None:
+                        metrics.count("revalidated")
+                    return cached.body
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                if self._cache is not None:
+                    self._store_response(key, url, data, response)
+                return data
             except requests.exceptions.RequestException as e:
+                # A 404 will not turn into a card on retry; only back off for 429, 5xx and network errors
+                if is_client_error(e):
+                    raise
                 if attempt == self.max_retries - 1:
                     # No registramos el error en el log, solo lo propagamos
                     raise
-                time.sleep(self.retry_delay * (2**attempt))
+                delay = retry_delay(self.retry_delay, attempt, e)
+                if metrics is not None:
+                    metrics.count("retries")
+                    metrics.add_time("retry_sleep", delay)
+                time.sleep(delay)
+
+    def _store_response(self, key: str, url: str, data: Dict[str, Any], response: requests.Response) -> None:
+        """Write a successful response to the cache; a cache failure never fails the lookup."""
+        try:
+            self._cache.put(
+                key,
+                data,
+                self._cache_ttl(url),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        except Exception as e:
+            logger.debug(f"Scryfall response cache write failed for {url}: {e}")
 
     def autocomplete(self, q: str) -> List[str]:
         """
@@ -150,10 +282,33 @@ class CardFetcher:
         except Exception:
             return None
 
+    def _run_strategy(self, strategy: str, card_name: str) -> Optional[Dict[str, Any]]:
+        """Run one search_card strategy; None when it finds nothing."""
+        # Estrategia 1: Búsqueda exacta
+        if strategy == "exact":
+            return self._exact_match_search(card_name)
+        # Estrategia 2: Búsqueda difusa
+        if strategy == "fuzzy":
+            return self._fuzzy_match_search(card_name)
+        # Estrategia 3: Búsqueda de frase exacta
+        if strategy == "phrase":
+            return self._search_query(f'!"{card_name}"')
+        # Estrategia 4: Búsqueda con expresión regular
+        # Eliminar caracteres especiales y construir una consulta más flexible
+        simplified_name = re.sub(r"[^\w\s]", "", card_name).strip()
+        words = simplified_name.split()
+        if len(words) > 1:
+            regex_query = " ".join([f"/{word}/i" for word in words])
+            return self._search_query(regex_query)
+        return None
+
     def search_card(self, card_name: str) -> Dict[str, Any]:
         """
         Search for a card using multiple strategies.
 
+        Names that recently failed every strategy are rejected without a request, and
+        a name that matched before starts with the strategy that matched it.
+
         Args:
             card_name: The name of the card to search for.
 
@@ -163,35 +318,151 @@ class CardFetcher:
         Raises:
             Exception: If the card cannot be found using any strategy.
         """
-        # Estrategia 1: Búsqueda exacta
-        result = self._exact_match_search(card_name)
-        if result:
-            return result
-
-        # Estrategia 2: Búsqueda difusa
-        result = self._fuzzy_match_search(card_name)
-        if result:
-            return result
-
-        # Estrategia 3: Búsqueda de frase exacta
-        result = self._search_query(f'!"{card_name}"')
-        if result:
-            return result
-
-        # Estrategia 4: Búsqueda con expresión regular
-        # Eliminar caracteres especiales y construir una consulta más flexible
-        simplified_name = re.sub(r"[^\w\s]", "", card_name).strip()
-        words = simplified_name.split()
-        if len(words) > 1:
-            regex_query = " ".join([f"/{word}/i" for word in words])
-            result = self._search_query(regex_query)
+        if self._names is not None and self._names.is_known_missing(card_name):
+            raise Exception(f"Card not found: {card_name}")
+
+        preferred = self._names.strategy_for(card_name) if self._names is not None else None
+        order = list(SEARCH_STRATEGIES)
+        if preferred in order:
+            order.remove(preferred)
+            order.insert(0, preferred)
+
+        self._lookup_state.transient = False
+        for strategy in order:
+            result = self._run_strategy(strategy, card_name)
             if result:
+                if self._names is not None and strategy != preferred:
+                    self._names.record_match(card_name, strategy)
                 return result
 
-        # Si llegamos aquí, no pudimos encontrar la carta
+        # Si llegamos aquí, no pudimos encontrar la carta. Only remember it when every
+        # strategy got a definitive answer; a timeout or 5xx says nothing about the name.
+        if self._names is not None and not getattr(self._lookup_state, "transient", False):
+            self._names.record_miss(card_name, self.negative_cache_ttl)
         # No registramos el error en el log, solo lo propagamos
         raise Exception(f"Card not found: {card_name}")
 
+    @staticmethod
+    def _collection_identifier(identifier: CardIdentifier) -> Dict[str, str]:
+        """Convert a name, Scryfall id or (set, collector_number) pair to a /cards/collection identifier."""
+        if isinstance(identifier, dict):
+            return dict(identifier)
+        if isinstance(identifier, (tuple, list)):
+            set_code, collector_number = identifier
+            return {"set": str(set_code).lower(), "collector_number": str(collector_number)}
+        value = str(identifier).strip()
+        if _SCRYFALL_ID_RE.match(value):
+            return {"id": value.lower()}
+        return {"name": value}
+
+    @staticmethod
+    def _identifier_key(identifier: Dict[str, str]) -> Tuple[str, ...]:
+        """Hashable key for an identifier dict, comparable with _card_keys()."""
+        if "id" in identifier:
+            return ("id", identifier["id"].lower())
+        if "set" in identifier and "collector_number" in identifier:
+            return ("set", identifier["set"].lower(), str(identifier["collector_number"]))
+        if "name" in identifier:
+            return ("name", identifier["name"].strip().lower())
+        return tuple(sorted((k, str(v).lower()) for k, v in identifier.items()))
+
+    @staticmethod
+    def _card_keys(card: Dict[str, Any]) -> List[Tuple[str, ...]]:
+        """Every identifier key a returned card can answer (id, set/number, full name and face names)."""
+        keys: List[Tuple[str, ...]] = []
+        if card.get("id"):
+            keys.append(("id", str(card["id"]).lower()))
+        if card.get("set") and card.get("collector_number"):
+            keys.append(("set", str(card["set"]).lower(), str(card["collector_number"])))
+        name = card.get("name") or ""
+        if name:
+            keys.append(("name", name.lower()))
+            for face in name.split(" // "):
+                keys.append(("name", face.strip().lower()))
+        for face in card.get("card_faces") or []:
+            if face.get("name"):
+                keys.append(("name", face["name"].lower()))
+        return keys
+
+    def _fetch_collection(self, identifiers: List[Dict[str, str]]) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        """
+        Resolve up to COLLECTION_BATCH_SIZE identifiers with one POST to /cards/collection.
+
+        Returns:
+            Mapping of identifier key to card data; identifiers Scryfall reports in
+            ``not_found`` (or that could not be matched) are absent.
+        """
+        url = f"{self.BASE_URL}/cards/collection"
+        response = self._make_request(url, payload={"identifiers": identifiers})
+        return self._match_collection(identifiers, response)
+
+    @classmethod
+    def _match_collection(
+        cls, identifiers: List[Dict[str, str]], response: Dict[str, Any]
+    ) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        """Pair the cards in a /cards/collection response with the identifiers that were sent."""
+        missing = {cls._identifier_key(i) for i in response.get("not_found") or []}
+        wanted = [cls._identifier_key(i) for i in identifiers]
+        pending = [k for k in wanted if k not in missing]
+
+        resolved: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        unmatched: List[Dict[str, Any]] = []
+        for card in response.get("data") or []:
+            hits = [k for k in cls._card_keys(card) if k in pending and k not in resolved]
+            if hits:
+                for key in hits:
+                    resolved[key] = card
+            else:
+                unmatched.append(card)
+        # Scryfall returns found cards in request order; use that for anything the keys could not
+        # pair up (e.g. a name sent with different accents or punctuation than the canonical one).
+        leftovers = [k for k in pending if k not in resolved]
+        if unmatched and len(unmatched) == len(leftovers):
+            resolved.update(zip(leftovers, unmatched))
+        return resolved
+
+    def search_cards_bulk(
+        self, identifiers: Sequence[CardIdentifier], fallback: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve many cards with Scryfall's /cards/collection endpoint, 75 identifiers per request.
+
+        Args:
+            identifiers: Card names, Scryfall ids, (set, collector_number) pairs or raw
+                collection identifier dicts. Duplicates are sent only once.
+            fallback: When True, names Scryfall reports as not found go through the
+                per-card search_card() cascade (fuzzy, phrase and regex search).
+
+        Returns:
+            Card data (or None when unresolved) for each identifier, in input order.
+        """
+        requested = [self._collection_identifier(i) for i in identifiers]
+        keys = [self._identifier_key(i) for i in requested]
+
+        unique: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        for key, ident in zip(keys, requested):
+            unique.setdefault(key, ident)
+        batch = list(unique.values())
+
+        resolved: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for start in range(0, len(batch), self.COLLECTION_BATCH_SIZE):
+            chunk = batch[start : start + self.COLLECTION_BATCH_SIZE]
+            try:
+                resolved.update(self._fetch_collection(chunk))
+            except Exception as e:
+                logger.warning(f"Scryfall collection lookup failed for {len(chunk)} identifiers: {e}")
+
+        if fallback:
+            for key, ident in unique.items():
+                if key in resolved or "name" not in ident:
+                    continue
+                try:
+                    resolved[key] = self.search_card(ident["name"])
+                except Exception:
+                    pass
+
+        return [resolved.get(key) for key in keys]
+
     def _validate_analysis(self, result: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
         """
         Validate and sanitize OpenAI analysis response.
@@ -209,11 +480,12 @@ class CardFetcher:
         if strategy and len(strategy) > 500:
             strategy = strategy[:500]
 
-        # Extract and validate tier
-        tier = result.get("tier", "").upper()
+        # Extract and validate tier; null, non-string or unknown tiers leave this card without one
+        raw_tier = result.get("tier")
+        tier = raw_tier.strip().upper() if isinstance(raw_tier, str) else None
         if tier not in ["S", "A", "B", "C", "D"]:
-            if tier:  # Only log if tier was present but invalid
-                logger.warning(f"Invalid tier '{tier}', defaulting to None")
+            if raw_tier:  # Only log if tier was present but invalid
+                logger.warning(f"Invalid tier {raw_tier!r}, defaulting to None")
             tier = None
 
         return strategy, tier
@@ -221,12 +493,13 @@ class CardFetcher:
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10), retry=retry_if_exception_type(RateLimitError)
     )
-    def _call_openai(self, messages: List[Dict[str, str]]) -> Any:
+    def _call_openai(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> Any:
         """
         Call OpenAI Chat Completions API with retry logic for rate limits.
 
         Args:
             messages: List of message dicts with role and content.
+            max_tokens: Completion budget; defaults to openai.max_tokens (one card).
 
         Returns:
             OpenAI response object.
@@ -235,93 +508,154 @@ class CardFetcher:
             model=self.openai_model,
             messages=messages,
             response_format={"type": "json_object"},
-            max_tokens=self.openai_max_tokens,
+            max_tokens=max_tokens or self.openai_max_tokens,
             temperature=self.openai_temperature,
         )
 
-    def get_card_info(self, card_name: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
-        """
-        Get card data and generate game strategy and tier using OpenAI Chat Completions API.
-
-        Uses JSON mode for structured output and includes granular error handling
-        with automatic retry logic for rate limits.
-
-        Args:
-            card_name: The name of the card.
-
-        Returns:
-            A tuple of (card_data, game_strategy, tier).
-            Returns (card_data, None, None) if OpenAI is disabled or on error.
-        """
-        card_data = self.search_card(card_name)
-
-        # Early return if OpenAI client is not initialized
-        if not self.openai_client:
-            return card_data, None, None
-
+    @staticmethod
+    def _card_text(card_data: Dict[str, Any]) -> str:
+        """Card fields the analysis prompt is built from."""
+        card_text = f"Name: {card_data.get('name')}\n"
+        card_text += f"Type: {card_data.get('type_line')}\n"
+        card_text += f"Text: {card_data.get('oracle_text')}\n"
+
+        if "power" in card_data and "toughness" in card_data:
+            card_text += f"Power/Toughness: {card_data.get('power')}/{card_data.get('toughness')}\n"
+
+        if "loyalty" in card_data:
+            card_text += f"Loyalty: {card_data.get('loyalty')}\n"
+        return card_text
+
+    @staticmethod
+    def _analysis_key(card_data: Dict[str, Any]) -> str:
+        """Reprints share an oracle_id; cards without one (rare) fall back to their name."""
+        return card_data.get("oracle_id") or f"name:{(card_data.get('name') or '').lower()}"
+
+    def _analysis_messages(self, cards: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """One structured prompt covering every card in *cards*, numbered from 1."""
+        system_message = {
+            "role": "system",
+            "content": (
+                "You are an expert Magic: The Gathering analyst. "
+                "Analyze cards and provide strategic insights. "
+                "Always respond with valid JSON containing a 'cards' list of objects "
+                "with 'id', 'strategy' and 'tier' fields."
+            ),
+        }
+        listing = "\n".join(f"[id {i}]\n{self._card_text(card)}" for i, card in enumerate(cards, start=1))
+        user_message = {
+            "role": "user",
+            "content": (
+                f"Analyze these MTG cards:\n\n{listing}\n"
+                f"For each card provide:\n"
+                f"1. strategy: Brief game strategy (2-3 sentences max)\n"
+                f"2. tier: Power level (S/A/B/C/D only)\n\n"
+                f'Return as JSON: {{"cards": [{{"id": <id>, "strategy": ..., "tier": ...}}]}}, one entry per card.'
+            ),
+        }
+        return [system_message, user_message]
+
+    def _parse_analyses(self, content: str, count: int) -> Dict[int, Analysis]:
+        """Validated (strategy, tier) per card id from a completion; ids that are missing or malformed are skipped."""
+        result = json.loads(content)
+        entries = result.get("cards") if isinstance(result, dict) else None
+        if not isinstance(entries, list):
+            # A single-card answer may come back unwrapped: {"strategy": ..., "tier": ...}
+            entries = [dict(result, id=1)] if count == 1 and isinstance(result, dict) else []
+        analyses: Dict[int, Analysis] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                card_id = int(entry.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= card_id <= count and card_id not in analyses:
+                analyses[card_id] = self._validate_analysis(entry)
+        return analyses
+
+    def _request_analyses(self, cards: List[Dict[str, Any]]) -> Dict[int, Analysis]:
+        """One completion for a chunk of cards. Errors are logged and leave the whole chunk unanalysed."""
         try:
-            # Build card text for analysis
-            card_text = f"Name: {card_data.get('name')}\n"
-            card_text += f"Type: {card_data.get('type_line')}\n"
-            card_text += f"Text: {card_data.get('oracle_text')}\n"
-
-            if "power" in card_data and "toughness" in card_data:
-                card_text += f"Power/Toughness: {card_data.get('power')}/{card_data.get('toughness')}\n"
-
-            if "loyalty" in card_data:
-                card_text += f"Loyalty: {card_data.get('loyalty')}\n"
-
-            # Create messages for Chat Completions API
-            system_message = {
-                "role": "system",
-                "content": (
-                    "You are an expert Magic: The Gathering analyst. "
-                    "Analyze cards and provide strategic insights. "
-                    "Always respond with valid JSON containing 'strategy' and 'tier' fields."
-                ),
-            }
-
-            user_message = {
-                "role": "user",
-                "content": (
-                    f"Analyze this MTG card:\n\n{card_text}\n\n"
-                    f"Provide:\n"
-                    f"1. strategy: Brief game strategy (2-3 sentences max)\n"
-                    f"2. tier: Power level (S/A/B/C/D only)\n\n"
-                    f"Return as JSON with keys 'strategy' and 'tier'."
-                ),
-            }
-
-            # Call OpenAI with retry logic (via decorator)
-            response = self._call_openai([system_message, user_message])
-
-            # Parse JSON response
-            result = json.loads(response.choices[0].message.content)
-
-            # Validate and extract strategy and tier
-            strategy, tier = self._validate_analysis(result)
-
-            return card_data, strategy, tier
-
+            # Call OpenAI with retry logic (via decorator); the budget grows with the chunk, up to the output limit
+            max_tokens = min(self.openai_max_tokens * len(cards), self.openai_max_completion_tokens)
+            response = self._call_openai(self._analysis_messages(cards), max_tokens=max_tokens)
+            return self._parse_analyses(response.choices[0].message.content, len(cards))
         except AuthenticationError as e:
             logger.critical(f"OpenAI authentication failed: {e}")
-            return card_data, None, None
         except RateLimitError as e:
             # This is caught after retries are exhausted
             logger.error(f"OpenAI rate limit exceeded after retries: {e}")
-            return card_data, None, None
         except BadRequestError as e:
             logger.error(f"OpenAI invalid request: {e}")
-            return card_data, None, None
         except APIConnectionError as e:
             logger.error(f"OpenAI connection error: {e}")
-            return card_data, None, None
         except APIError as e:
             logger.error(f"OpenAI API error: {e}")
-            return card_data, None, None
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse OpenAI JSON response: {e}")
-            return card_data, None, None
         except Exception as e:
             logger.error(f"Unexpected error during OpenAI analysis: {e}")
-            return card_data, None, None
+        return {}
+
+    def analyze_cards(self, cards: Sequence[Dict[str, Any]]) -> List[Analysis]:
+        """
+        Strategy and tier for each card, in input order.
+
+        Cards already analysed with the current model (by oracle_id) come from the
+        enrichment cache; the rest are deduplicated and sent openai.batch_size cards
+        per completion (fewer when that many would not fit openai.max_completion_tokens). Cards OpenAI could not analyse get (None, None).
+
+        Args:
+            cards: Scryfall card objects.
+
+        Returns:
+            A list of (strategy, tier) tuples aligned with *cards*.
+        """
+        if not self.openai_client:
+            return [(None, None)] * len(cards)
+
+        keys = [self._analysis_key(card) for card in cards]
+        analyses: Dict[str, Analysis] = {}
+        if self._enrichment is not None:
+            analyses.update(self._enrichment.get_many(keys, self.openai_model))
+
+        pending: Dict[str, Dict[str, Any]] = {}
+        for key, card in zip(keys, cards):
+            if key not in analyses:
+                pending.setdefault(key, card)
+        items = list(pending.items())
+        fresh: Dict[str, Analysis] = {}
+        for start in range(0, len(items), self.openai_batch_size):
+            chunk = items[start : start + self.openai_batch_size]
+            parsed = self._request_analyses([card for _key, card in chunk])
+            for card_id, (key, _card) in enumerate(chunk, start=1):
+                if card_id in parsed:
+                    fresh[key] = parsed[card_id]
+        analyses.update(fresh)
+
+        if self._enrichment is not None:
+            self._enrichment.put_many(
+                {k: v for k, v in fresh.items() if v != (None, None) and not k.startswith("name:")},
+                self.openai_model,
+            )
+        return [analyses.get(key, (None, None)) for key in keys]
+
+    def get_card_info(self, card_name: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """
+        Get card data and generate game strategy and tier using OpenAI Chat Completions API.
+
+        Uses JSON mode for structured output and includes granular error handling
+        with automatic retry logic for rate limits. To analyse many cards, use
+        analyze_cards, which batches them into few completions.
+
+        Args:
+            card_name: The name of the card.
+
+        Returns:
+            A tuple of (card_data, game_strategy, tier).
+            Returns (card_data, None, None) if OpenAI is disabled or on error.
+        """
+        card_data = self.search_card(card_name)
+        strategy, tier = self.analyze_cards([card_data])[0]
+        return card_data, strategy, tier
@@ -2,6 +2,9 @@
 
 from typing import Any, Dict, List, Optional
 
+# Full-text document of a printing; the same expression as idx_catalog_search (migration 021)
+_SEARCH_VECTOR = "card_search_vector(name, type_line, oracle_text)"
+
 
 class CatalogRepository:
     """PostgreSQL-backed repository for the global card catalog."""
@@ -24,21 +27,64 @@ class CatalogRepository:
     # ------------------------------------------------------------------
 
     def search_by_name(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Return catalog cards whose name contains *query* (case-insensitive)."""
+        """Return catalog cards whose name contains *query* (case-insensitive), best matches first.
+
+        Name resolution for the importer and resolvers: only names are matched
+        (idx_catalog_name_trgm). Exact names rank first, then names starting with *query*,
+        then trigram similarity.
+        """
         from sqlalchemy import text
 
         if not query or not query.strip():
             return []
+        query = query.strip()
         with self._engine().connect() as conn:
             rows = (
                 conn.execute(
                     text("""
                     SELECT * FROM catalog_cards
                     WHERE name ILIKE :pattern
-                    ORDER BY name
+                    ORDER BY lower(name) = lower(:query) DESC,
+                             name ILIKE :prefix DESC,
+                             similarity(name, :query) DESC,
+                             name
+                    LIMIT :lim
+                """),
+                    {"pattern": f"%{query}%", "prefix": f"{query}%", "query": query, "lim": limit},
+                )
+                .mappings()
+                .fetchall()
+            )
+            return [dict(r) for r in rows]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return catalog cards matching *query*, best matches first (catalog search endpoint).
+
+        A card matches when its name contains *query* (case-insensitive, idx_catalog_name_trgm)
+        or its name, type line or rules text contain the query's words (idx_catalog_search).
+        Exact names rank first, then names starting with *query*, then full-text rank and
+        trigram similarity of the name. Use search_by_name to resolve a card by name.
+        """
+        from sqlalchemy import text
+
+        if not query or not query.strip():
+            return []
+        query = query.strip()
+        with self._engine().connect() as conn:
+            rows = (
+                conn.execute(
+                    text(f"""
+                    SELECT * FROM catalog_cards
+                    WHERE name ILIKE :pattern
+                       OR {_SEARCH_VECTOR} @@ websearch_to_tsquery('english', :query)
+                    ORDER BY lower(name) = lower(:query) DESC,
+                             name ILIKE :prefix DESC,
+                             ts_rank({_SEARCH_VECTOR}, websearch_to_tsquery('english', :query)) DESC,
+                             similarity(name, :query) DESC,
+                             name
                     LIMIT :lim
                 """),
-                    {"pattern": f"%{query.strip()}%", "lim": limit},
+                    {"pattern": f"%{query}%", "prefix": f"{query}%", "query": query, "lim": limit},
                 )
                 .mappings()
                 .fetchall()
@@ -46,20 +92,23 @@ class CatalogRepository:
             return [dict(r) for r in rows]
 
     def autocomplete(self, query: str, limit: int = 20) -> List[str]:
-        """Return up to *limit* card names matching *query* prefix (case-insensitive)."""
+        """Return up to *limit* card names starting with *query* (case-insensitive), exact and shortest first."""
         from sqlalchemy import text
 
         if not query or len(query.strip()) < 2:
             return []
+        query = query.strip()
         with self._engine().connect() as conn:
+            # Prefix ILIKE is served by idx_catalog_name_trgm
             rows = conn.execute(
                 text("""
-                    SELECT DISTINCT name FROM catalog_cards
+                    SELECT name FROM catalog_cards
                     WHERE name ILIKE :pattern
-                    ORDER BY name
+                    GROUP BY name
+                    ORDER BY lower(name) = lower(:query) DESC, length(name), name
                     LIMIT :lim
                 """),
-                {"pattern": f"{query.strip()}%", "lim": limit},
+                {"pattern": f"{query}%", "query": query, "lim": limit},
             ).fetchall()
             return [r[0] for r in rows]
 
@@ -78,6 +127,57 @@ class CatalogRepository:
             )
             return dict(row) if row else None
 
+    def get_by_scryfall_ids(self, scryfall_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return catalog cards for many Scryfall UUIDs in one query, keyed by scryfall_id."""
+        from sqlalchemy import text
+
+        ids = sorted({sid for sid in scryfall_ids if sid})
+        if not ids:
+            return {}
+        with self._engine().connect() as conn:
+            rows = (
+                conn.execute(text("SELECT * FROM catalog_cards WHERE scryfall_id = ANY(:ids)"), {"ids": ids})
+                .mappings()
+                .fetchall()
+            )
+            return {r["scryfall_id"]: dict(r) for r in rows}
+
+    def get_by_names(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return one catalog printing per name for many names in one query, keyed by lower-cased name.
+
+        Names match the full card name or, for double-faced cards, the front face. When a
+        card has several printings, the newest one with an EUR price wins.
+        """
+        from sqlalchemy import text
+
+        keys = sorted({n.strip().lower() for n in names if n and n.strip()})
+        if not keys:
+            return {}
+        with self._engine().connect() as conn:
+            rows = (
+                conn.execute(
+                    text("""
+                    SELECT DISTINCT ON (lookup_key) *
+                    FROM (
+                        SELECT lower(name) AS lookup_key, * FROM catalog_cards
+                        WHERE lower(name) = ANY(:keys)
+                        UNION ALL
+                        SELECT lower(split_part(name, ' // ', 1)) AS lookup_key, * FROM catalog_cards
+                        WHERE position(' // ' in name) > 0 AND lower(split_part(name, ' // ', 1)) = ANY(:keys)
+                    ) matches
+                    ORDER BY lookup_key, (prices_eur IS NULL), release_date DESC NULLS LAST
+                """),
+                    {"keys": keys},
+                )
+                .mappings()
+                .fetchall()
+            )
+        result: Dict[str, Dict[str, Any]] = {}
+        for r in rows:
+            row = dict(r)
+            result[row.pop("lookup_key")] = row
+        return result
+
     # ------------------------------------------------------------------
     # Bulk write (used by sync job)
     # ------------------------------------------------------------------
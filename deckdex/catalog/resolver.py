@@ -0,0 +1,106 @@
+"""Catalog-first card resolution for MagicCardProcessor.
+
+The processor consumes Scryfall card objects. CatalogResolver answers a whole
+batch of lookups from catalog_cards with two queries (by scryfall_id, then by
+name) and returns rows reshaped into that format, so only catalog misses need
+to go to the network.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+def _split_list(value: Any) -> Optional[List[str]]:
+    """catalog_cards stores colors/keywords as "W,U"; Scryfall returns lists."""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return value
+    return [part for part in str(value).split(",") if part]
+
+
+def catalog_row_to_card_data(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a catalog_cards row back to the shape of a Scryfall card object."""
+    legalities = row.get("legalities")
+    if isinstance(legalities, str):
+        try:
+            legalities = json.loads(legalities)
+        except ValueError:
+            legalities = None
+    release_date = row.get("release_date")
+    if release_date is not None and hasattr(release_date, "isoformat"):
+        release_date = release_date.isoformat()
+    data = {
+        "id": row.get("scryfall_id"),
+        "oracle_id": row.get("oracle_id"),
+        "name": row.get("name"),
+        "type_line": row.get("type_line"),
+        "oracle_text": row.get("oracle_text"),
+        "mana_cost": row.get("mana_cost"),
+        "cmc": row.get("cmc"),
+        "colors": _split_list(row.get("colors")),
+        "color_identity": _split_list(row.get("color_identity")),
+        "keywords": _split_list(row.get("keywords")),
+        "power": row.get("power"),
+        "toughness": row.get("toughness"),
+        "rarity": row.get("rarity"),
+        "set": row.get("set_id"),
+        "set_name": row.get("set_name"),
+        "collector_number": row.get("collector_number"),
+        "released_at": release_date,
+        "edhrec_rank": row.get("edhrec_rank"),
+        "legalities": legalities,
+        "scryfall_uri": row.get("scryfall_uri"),
+        "prices": {
+            "eur": row.get("prices_eur"),
+            "usd": row.get("prices_usd"),
+            "usd_foil": row.get("prices_usd_foil"),
+        },
+    }
+    image_uris = {
+        size: row.get(f"image_uri_{size}") for size in ("small", "normal", "large") if row.get(f"image_uri_{size}")
+    }
+    if image_uris:
+        data["image_uris"] = image_uris
+    return data
+
+
+class CatalogResolver:
+    """Resolves batches of (name, scryfall_id) lookups against the local catalog."""
+
+    def __init__(self, catalog_repository):
+        self._repo = catalog_repository
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, lookups: Sequence[Tuple[str, Optional[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """Return Scryfall-shaped card data (or None on a miss) for each (name, scryfall_id), in order.
+
+        A known scryfall_id pins the exact printing; otherwise the name decides. Catalog
+        errors (e.g. the catalog tables were never migrated) count as misses for the batch.
+        """
+        if not lookups:
+            return []
+        try:
+            by_id = self._repo.get_by_scryfall_ids([sid for _name, sid in lookups if sid])
+            unresolved = [name for name, sid in lookups if not (sid and sid in by_id)]
+            by_name = self._repo.get_by_names(unresolved) if unresolved else {}
+        except Exception as e:
+            logger.warning(f"Catalog lookup failed, falling back to Scryfall for {len(lookups)} cards: {e}")
+            self.misses += len(lookups)
+            return [None] * len(lookups)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for name, sid in lookups:
+            row = by_id.get(sid) if sid else None
+            if row is None and name:
+                row = by_name.get(name.strip().lower())
+            if row is None:
+                self.misses += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                results.append(catalog_row_to_card_data(row))
+        return results
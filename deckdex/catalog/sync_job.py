@@ -4,14 +4,14 @@ import json
 import time
 from typing import Callable, Optional
 
-import requests
 from loguru import logger
 
 from deckdex.catalog.repository import CatalogRepository
+from deckdex.rate_limiter import retry_delay
+from deckdex.scryfall_transport import ScryfallTransport, get_transport
 from deckdex.storage.image_store import ImageStore
 
-# Scryfall TOS: at least 50-100ms between requests
-_IMAGE_DELAY_SECONDS = 0.1
+# Request pacing (Scryfall TOS: 50-100ms between requests) comes from the shared transport's rate limiter.
 _IMAGE_RETRIES = 3
 _UPSERT_BATCH_SIZE = 1000
 _IMAGE_BATCH_SIZE = 100
@@ -34,12 +34,14 @@ class CatalogSyncJob:
         bulk_data_url: str = "https://api.scryfall.com/bulk-data/default-cards",
         image_size: str = "normal",
         on_progress: Optional[ProgressCallback] = None,
+        transport: Optional[ScryfallTransport] = None,
     ):
         self._repo = catalog_repo
         self._store = image_store
         self._bulk_url = bulk_data_url
         self._image_size = image_size
         self._on_progress = on_progress
+        self._transport = transport or get_transport()
         self._cancelled = False
 
     def cancel(self):
@@ -92,7 +94,7 @@ class CatalogSyncJob:
         logger.info(f"Phase 1: downloading bulk data from {self._bulk_url}")
 
         # Step 1: get the download URI from the bulk-data endpoint
-        resp = requests.get(self._bulk_url, timeout=30)
+        resp = self._transport.get(self._bulk_url, timeout=30)
         resp.raise_for_status()
         meta = resp.json()
         download_uri = meta.get("download_uri")
@@ -101,7 +103,7 @@ class CatalogSyncJob:
 
         # Step 2: stream-download the actual JSON file
         logger.info(f"Downloading bulk file from {download_uri}")
-        resp = requests.get(download_uri, timeout=300, stream=True)
+        resp = self._transport.get(download_uri, timeout=300, stream=True)
         resp.raise_for_status()
 
         # Read the full JSON (typically ~200MB)
@@ -240,8 +242,6 @@ class CatalogSyncJob:
                 processed += 1
                 self._emit("images", total_downloaded, total_downloaded + total_pending - processed)
 
-                time.sleep(_IMAGE_DELAY_SECONDS)
-
             # Update cursor after each batch
             self._repo.update_sync_state(
                 last_image_cursor=cursor,
@@ -257,14 +257,14 @@ class CatalogSyncJob:
 
         for attempt in range(1, _IMAGE_RETRIES + 1):
             try:
-                resp = requests.get(url, timeout=15)
+                resp = self._transport.get(url, timeout=15)
                 resp.raise_for_status()
                 content_type = resp.headers.get("content-type", "image/jpeg")
                 self._store.put(scryfall_id, resp.content, content_type)
                 return True
             except Exception as e:
                 if attempt < _IMAGE_RETRIES:
-                    time.sleep(0.5 * attempt)
+                    time.sleep(retry_delay(0.25, attempt, e))
                 else:
                     logger.warning(f"Failed to download image {scryfall_id} after {_IMAGE_RETRIES} attempts: {e}")
         return False
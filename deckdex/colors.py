@@ -0,0 +1,20 @@
+"""Color bitmasks of the cards.color_identity_mask / colors_mask columns (migration 023).
+
+W=1, U=2, B=4, R=8, G=16; 0 is colorless.
+"""
+
+# Letter → bit, in canonical WUBRG order
+COLOR_BITS = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+
+
+def letters_to_mask(value: str) -> int:
+    """Bitmask of the WUBRG letters in a value such as "W,U" or "wu"; other characters are ignored."""
+    mask = 0
+    for letter in value.upper():
+        mask |= COLOR_BITS.get(letter, 0)
+    return mask
+
+
+def mask_to_identity(mask: int) -> str:
+    """Canonical WUBRG string for a bitmask ("WU", "BRG"), or "C" for colorless."""
+    return "".join(letter for letter, bit in COLOR_BITS.items() if mask & bit) or "C"
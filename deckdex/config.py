@@ -1,7 +1,10 @@
 """Configuration management for DeckDex MTG."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Tuple
+
+# Values accepted for ProcessorConfig.price_source
+PRICE_SOURCES = ("scryfall", "catalog")
 
 
 @dataclass
@@ -11,14 +14,27 @@ class ProcessingConfig:
     Attributes:
         batch_size: Number of cards to process per batch
         max_workers: Number of parallel ThreadPoolExecutor workers (1-10)
-        api_delay: Delay in seconds between API requests
+        api_delay: Legacy per-card delay. Scryfall pacing is now done by the shared
+            rate limiter (scryfall.requests_per_second); kept for config compatibility.
         write_buffer_batches: Number of batches to buffer before writing to sheets
+        card_cache_size: Card lookups kept in the process-wide card cache (0 disables it)
+        card_cache_max_mb: Approximate memory ceiling for the card cache
+        card_cache_ttl: Seconds a cached card (and its prices) is reused
+        price_max_age_hours: Incremental price refresh only checks cards whose price is older than this
+        price_time_budget: Seconds an incremental price refresh may run before it stops (0 = no limit)
+        price_request_budget: Scryfall requests an incremental price refresh may send (0 = no limit)
     """
 
     batch_size: int = 20
     max_workers: int = 4
     api_delay: float = 0.1
     write_buffer_batches: int = 3
+    card_cache_size: int = 20000
+    card_cache_max_mb: float = 64.0
+    card_cache_ttl: float = 3600.0
+    price_max_age_hours: float = 24.0
+    price_time_budget: float = 0.0
+    price_request_budget: int = 0
 
     def __post_init__(self):
         """Validate processing configuration parameters."""
@@ -30,6 +46,18 @@ class ProcessingConfig:
             raise ValueError("api_delay must be >= 0")
         if self.write_buffer_batches < 1:
             raise ValueError("write_buffer_batches must be >= 1")
+        if self.card_cache_size < 0:
+            raise ValueError("card_cache_size must be >= 0")
+        if self.card_cache_max_mb <= 0:
+            raise ValueError("card_cache_max_mb must be > 0")
+        if self.card_cache_ttl < 0:
+            raise ValueError("card_cache_ttl must be >= 0")
+        if self.price_max_age_hours < 0:
+            raise ValueError("price_max_age_hours must be >= 0")
+        if self.price_time_budget < 0:
+            raise ValueError("price_time_budget must be >= 0")
+        if self.price_request_budget < 0:
+            raise ValueError("price_request_budget must be >= 0")
 
 
 @dataclass
@@ -37,23 +65,84 @@ class ScryfallConfig:
     """Configuration for Scryfall API.
 
     Attributes:
+        base_url: Scryfall API root (point at a local stand-in for offline benchmarks)
         max_retries: Maximum retry attempts for failed requests
         retry_delay: Base delay in seconds between retries
         timeout: Request timeout in seconds
+        requests_per_second: Process-wide request ceiling shared by all workers (0 = unlimited)
+        burst: Token bucket capacity (requests that may go out back-to-back)
+        pool_size: Keep-alive connections kept in the shared HTTP session pool
+        max_concurrency: In-flight requests allowed per AsyncCardFetcher (backend event loop); with
+            adaptive, also the controller's concurrency ceiling and the minimum number of
+            processor fetch threads (see MagicCardProcessor._fetch_workers)
+        cache_path: SQLite file for the persistent response cache (None disables caching)
+        cache_max_mb: Size cap for the response cache; least recently used entries are evicted
+        cache_price_ttl: Seconds a card lookup stays fresh (card objects embed daily prices)
+        cache_oracle_ttl: Seconds other responses (autocomplete, catalogs) stay fresh
+        negative_cache_ttl: Seconds a name that failed every search strategy is not looked up again
+        adaptive: Let an AIMD controller tune in-flight requests (pool_size to start, up to
+            max_concurrency) and request rate (requests_per_second to start) from latency, 429s
+            and Retry-After, for the processor, importer, image fetches and catalog sync together
+        adaptive_min_rps: Lowest request rate the adaptive controller backs off to
+        adaptive_max_rps: Highest request rate the adaptive controller probes up to; never above
+            requests_per_second when that is set (see adaptive_rate_bounds)
+        latency_tolerance: Smoothed latency above this multiple of the best seen counts as congestion
     """
 
+    base_url: str = "https://api.scryfall.com"
     max_retries: int = 3
     retry_delay: float = 0.5
     timeout: float = 10.0
+    requests_per_second: float = 10.0
+    burst: int = 1
+    pool_size: int = 10
+    max_concurrency: int = 32
+    cache_path: Optional[str] = None
+    cache_max_mb: float = 256.0
+    cache_price_ttl: float = 12 * 3600.0
+    cache_oracle_ttl: float = 7 * 24 * 3600.0
+    negative_cache_ttl: float = 7 * 24 * 3600.0
+    adaptive: bool = False
+    adaptive_min_rps: float = 1.0
+    adaptive_max_rps: float = 20.0
+    latency_tolerance: float = 2.0
 
     def __post_init__(self):
         """Validate Scryfall configuration parameters."""
+        if not self.base_url.startswith(("http://", "https://")):
+            raise ValueError("base_url must be an http(s) URL")
         if self.max_retries < 1:
             raise ValueError("max_retries must be >= 1")
         if self.retry_delay < 0:
             raise ValueError("retry_delay must be >= 0")
         if self.timeout <= 0:
             raise ValueError("timeout must be > 0")
+        if self.requests_per_second < 0:
+            raise ValueError("requests_per_second must be >= 0")
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.cache_max_mb <= 0:
+            raise ValueError("cache_max_mb must be > 0")
+        if self.cache_price_ttl < 0 or self.cache_oracle_ttl < 0 or self.negative_cache_ttl < 0:
+            raise ValueError("cache TTLs must be >= 0")
+        if self.adaptive_min_rps <= 0:
+            raise ValueError("adaptive_min_rps must be > 0")
+        if self.adaptive_max_rps < self.adaptive_min_rps:
+            raise ValueError("adaptive_max_rps must be >= adaptive_min_rps")
+        if self.latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+
+    @property
+    def adaptive_rate_bounds(self) -> Tuple[float, float]:
+        """(min, max) request rate for the adaptive controller; requests_per_second stays the ceiling."""
+        high = self.adaptive_max_rps
+        if self.requests_per_second > 0:
+            high = min(high, self.requests_per_second)
+        return min(self.adaptive_min_rps, high), high
 
 
 @dataclass
@@ -109,9 +198,13 @@ class OpenAIConfig:
     Attributes:
         enabled: Enable OpenAI enrichment for game strategy and tier
         model: OpenAI model to use (e.g., gpt-3.5-turbo, gpt-4)
-        max_tokens: Maximum tokens per completion
+        max_tokens: Maximum completion tokens per analysed card
         temperature: Creativity level (0.0-1.0)
         max_retries: Maximum retry attempts for rate limits
+        batch_size: Cards analysed per completion request
+        max_completion_tokens: Output token limit of the model; a request never asks for more,
+            and batches are made smaller when batch_size * max_tokens would exceed it
+        cache_path: SQLite file caching analyses by oracle_id and model (None disables it)
     """
 
     enabled: bool = False
@@ -119,15 +212,22 @@ class OpenAIConfig:
     max_tokens: int = 150
     temperature: float = 0.7
     max_retries: int = 3
+    batch_size: int = 20
+    max_completion_tokens: int = 4096
+    cache_path: Optional[str] = None
 
     def __post_init__(self):
         """Validate OpenAI configuration parameters."""
         if self.max_tokens <= 0:
             raise ValueError("max_tokens must be > 0")
+        if self.max_completion_tokens < self.max_tokens:
+            raise ValueError("max_completion_tokens must be >= max_tokens")
         if not (0.0 <= self.temperature <= 1.0):
             raise ValueError("temperature must be between 0.0 and 1.0")
         if self.max_retries < 1:
             raise ValueError("max_retries must be >= 1")
+        if not (1 <= self.batch_size <= 50):
+            raise ValueError("batch_size must be between 1 and 50")
 
 
 @dataclass
@@ -138,17 +238,43 @@ class CatalogConfig:
         image_dir: Directory for storing card images (relative to project root or absolute).
         bulk_data_url: Scryfall bulk data API endpoint (returns JSON with download_uri).
         image_size: Which Scryfall image size to download (small, normal, large).
+        resolve_first: Resolve cards from catalog_cards before calling Scryfall when processing
+            or refreshing prices (card data and prices are as fresh as the last bulk sync).
     """
 
     image_dir: str = "data/images"
     bulk_data_url: str = "https://api.scryfall.com/bulk-data/default-cards"
     image_size: str = "normal"
+    resolve_first: bool = True
 
     def __post_init__(self):
         if self.image_size not in ("small", "normal", "large"):
             raise ValueError("image_size must be one of: small, normal, large")
 
 
+@dataclass
+class JobsConfig:
+    """Configuration for where the API runs process and price jobs.
+
+    Attributes:
+        queue: The API only enqueues jobs in the Postgres jobs table and worker processes
+            (python -m backend.api.worker) run them; False runs them inside the API process.
+        poll_interval: Seconds an idle worker waits before looking for queued jobs again.
+        heartbeat_timeout: Seconds without a heartbeat after which a worker's running job is
+            failed (its checkpoint is kept, so re-triggering it resumes).
+    """
+
+    queue: bool = False
+    poll_interval: float = 2.0
+    heartbeat_timeout: float = 300.0
+
+    def __post_init__(self):
+        if self.poll_interval <= 0:
+            raise ValueError("poll_interval must be > 0")
+        if self.heartbeat_timeout <= 0:
+            raise ValueError("heartbeat_timeout must be > 0")
+
+
 @dataclass
 class ProcessorConfig:
     """Main configuration container for MagicCardProcessor.
@@ -163,15 +289,24 @@ class ProcessorConfig:
         scryfall: Nested configuration for Scryfall API
         google_sheets: Nested configuration for Google Sheets API
         openai: Nested configuration for OpenAI API
+        jobs: Nested configuration for the API's job queue and workers
         credentials_path: Path to Google API credentials JSON file
         limit: Process only N cards (useful for testing)
         resume_from: Resume processing from row N (1-indexed)
         process_scope: When running full process: "all" or "new_only" (only cards with just name, no type_line).
+        price_source: Where update_prices gets prices on the Postgres path: "scryfall" (per-card lookups)
+            or "catalog" (one set-based refresh from catalog_cards; Scryfall only for unmatched cards).
+        incremental_prices: Postgres price update only checks stale cards (processing.price_max_age_hours),
+            most valuable and oldest first, and stops at the processing.price_*_budget limits.
+        user_id: Restrict Postgres price refreshes to one user's cards (API jobs); None = every card.
+        resume_after_id: Postgres jobs skip cards with id <= this (set from a job checkpoint).
     """
 
     # Behavioral flags
     update_prices: bool = False
     process_scope: Optional[str] = None  # "all" | "new_only"
+    price_source: str = "scryfall"  # "scryfall" | "catalog"
+    incremental_prices: bool = False
     dry_run: bool = False
     verbose: bool = False
 
@@ -181,6 +316,7 @@ class ProcessorConfig:
     google_sheets: GoogleSheetsConfig = field(default_factory=GoogleSheetsConfig)
     openai: OpenAIConfig = field(default_factory=OpenAIConfig)
     catalog: CatalogConfig = field(default_factory=CatalogConfig)
+    jobs: JobsConfig = field(default_factory=JobsConfig)
     database: Optional[DatabaseConfig] = field(default_factory=lambda: None)
 
     # Google Sheets credentials (not in YAML)
@@ -189,6 +325,8 @@ class ProcessorConfig:
     # Processing control
     limit: Optional[int] = None
     resume_from: Optional[int] = None
+    user_id: Optional[int] = None
+    resume_after_id: Optional[int] = None
 
     # Legacy properties for backwards compatibility (deprecated)
     @property
@@ -322,6 +460,10 @@ class ProcessorConfig:
             raise ValueError("limit must be > 0")
         if self.resume_from is not None and self.resume_from < 1:
             raise ValueError("resume_from must be >= 1")
+        if self.resume_after_id is not None and self.resume_after_id < 0:
+            raise ValueError("resume_after_id must be >= 0")
+        if self.price_source not in PRICE_SOURCES:
+            raise ValueError(f"price_source must be one of: {', '.join(PRICE_SOURCES)}")
 
 
 class ClientFactory:
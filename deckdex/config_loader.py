@@ -19,6 +19,7 @@ from .config import (
     CatalogConfig,
     DatabaseConfig,
     GoogleSheetsConfig,
+    JobsConfig,
     OpenAIConfig,
     ProcessingConfig,
     ProcessorConfig,
@@ -120,6 +121,7 @@ def apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
         "openai": ["api", "openai"],
         "database": ["database"],
         "catalog": ["catalog"],
+        "jobs": ["jobs"],
     }
 
     for env_key, env_value in os.environ.items():
@@ -187,6 +189,8 @@ def build_processor_config(
     verbose: bool = False,
     limit: Optional[int] = None,
     resume_from: Optional[int] = None,
+    price_source: str = "scryfall",
+    incremental_prices: bool = False,
 ) -> ProcessorConfig:
     """Build ProcessorConfig from merged sources.
 
@@ -204,6 +208,8 @@ def build_processor_config(
         verbose: Verbose logging flag
         limit: Limit number of cards to process
         resume_from: Resume from specific row
+        price_source: Price source for update_prices ("scryfall" or "catalog")
+        incremental_prices: Only refresh stale prices, most valuable first, within the price budgets
 
     Returns:
         ProcessorConfig instance with nested configurations
@@ -215,6 +221,7 @@ def build_processor_config(
     sheets_cfg = api_cfg.get("google_sheets", {})
     openai_cfg = api_cfg.get("openai", {})
     catalog_cfg = yaml_config.get("catalog", {})
+    jobs_cfg = yaml_config.get("jobs", {})
     database_cfg = yaml_config.get("database", {}).copy()
 
     # Database URL: YAML or DATABASE_URL env (standard name, no DECKDEX_ prefix)
@@ -228,6 +235,7 @@ def build_processor_config(
         sheets_cfg.update(cli_overrides.get("google_sheets", {}))
         openai_cfg.update(cli_overrides.get("openai", {}))
         catalog_cfg.update(cli_overrides.get("catalog", {}))
+        jobs_cfg.update(cli_overrides.get("jobs", {}))
         database_cfg.update(cli_overrides.get("database", {}))
 
     # Build nested config objects
@@ -236,6 +244,7 @@ def build_processor_config(
     google_sheets = GoogleSheetsConfig(**sheets_cfg)
     openai = OpenAIConfig(**openai_cfg)
     catalog = CatalogConfig(**catalog_cfg)
+    jobs = JobsConfig(**jobs_cfg)
     database = DatabaseConfig(**database_cfg) if database_cfg.get("url") else None
 
     # Build main config
@@ -245,6 +254,7 @@ def build_processor_config(
         google_sheets=google_sheets,
         openai=openai,
         catalog=catalog,
+        jobs=jobs,
         database=database,
         credentials_path=credentials_path,
         update_prices=update_prices,
@@ -252,6 +262,8 @@ def build_processor_config(
         verbose=verbose,
         limit=limit,
         resume_from=resume_from,
+        price_source=price_source,
+        incremental_prices=incremental_prices,
     )
 
 
@@ -274,6 +286,8 @@ def load_config(profile: str = "default", config_path: Optional[str] = None, **k
             - verbose: Verbose logging flag
             - limit: Limit number of cards
             - resume_from: Resume from row number
+            - price_source: Price source for update_prices ("scryfall" or "catalog")
+            - incremental_prices: Only refresh stale prices, most valuable first
 
     Returns:
         Fully configured ProcessorConfig instance
@@ -0,0 +1,90 @@
+"""Persistent cache of OpenAI strategy/tier analyses, keyed by oracle_id and model.
+
+Every printing of a card shares one oracle_id, so a reprint (or a later run)
+reuses the analysis instead of paying for another completion. The model is part
+of the key: switching openai.model re-analyses cards with the new model.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+# (strategy, tier)
+Analysis = Tuple[Optional[str], Optional[str]]
+
+
+class EnrichmentCache:
+    """oracle_id + model -> (strategy, tier), in one SQLite file."""
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS card_analysis (
+                oracle_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                strategy TEXT,
+                tier TEXT,
+                analysed_at REAL NOT NULL,
+                PRIMARY KEY (oracle_id, model)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, oracle_ids: Iterable[str], model: str) -> Dict[str, Analysis]:
+        """Cached analyses for the given oracle_ids (missing ids are simply absent)."""
+        ids = list(dict.fromkeys(oracle_ids))
+        found: Dict[str, Analysis] = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT oracle_id, strategy, tier FROM card_analysis WHERE model = ? AND oracle_id IN ({placeholders})",
+                    [model, *chunk],
+                )
+                for oracle_id, strategy, tier in rows:
+                    found[oracle_id] = (strategy, tier)
+        return found
+
+    def put_many(self, analyses: Dict[str, Analysis], model: str) -> None:
+        if not analyses:
+            return
+        now = self._clock()
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO card_analysis (oracle_id, model, strategy, tier, analysed_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (oracle_id, model) DO UPDATE SET
+                    strategy = excluded.strategy, tier = excluded.tier, analysed_at = excluded.analysed_at
+                """,
+                [(oracle_id, model, strategy, tier, now) for oracle_id, (strategy, tier) in analyses.items()],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Dict[str, EnrichmentCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_enrichment_cache(path: str) -> EnrichmentCache:
+    """Return the process-wide EnrichmentCache for *path*."""
+    key = os.path.abspath(path)
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = EnrichmentCache(path)
+        return cache
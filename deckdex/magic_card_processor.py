@@ -1,18 +1,24 @@
 import csv
 import os
 import random
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import gspread
 from loguru import logger
-from tqdm import tqdm
 
+from .card_cache import get_card_cache
 from .card_fetcher import CardFetcher
+from .catalog.repository import CatalogRepository
+from .catalog.resolver import CatalogResolver
 from .config import ClientFactory, ProcessorConfig
+from .metrics import RunMetrics
+from .pipeline import CommitWatermark, iter_completed, iter_ordered
+from .progress import CancelToken, PhaseProgress, ProgressSink, TqdmSink
 from .storage import get_collection_repository
 
 
@@ -29,25 +35,94 @@ class Colors:
     END = "\033[0m"
 
 
+class PriceBudget:
+    """Time and Scryfall request budget of one incremental price refresh.
+
+    Requests are this run's (RunMetrics "requests"), not the process-wide transport total.
+    Workers claim a batch with try_start() before looking it up and release it with finish();
+    until then an in-flight batch counts as one request, so concurrent workers cannot all pass
+    the check before any of their requests is counted.
+    """
+
+    def __init__(self, metrics: RunMetrics, time_budget: float = 0.0, request_budget: int = 0):
+        self.metrics = metrics
+        self.time_budget = time_budget
+        self.request_budget = request_budget
+        self.stop: Optional[str] = None  # "time" | "requests" once spent
+        self.batches = 0
+        self._requests_at_start = metrics.counter("requests")
+        self._started = time.monotonic()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _spent(self) -> Optional[str]:
+        """Lock held."""
+        if self.stop is None:
+            if self.time_budget and time.monotonic() - self._started >= self.time_budget:
+                self.stop = "time"
+            elif self.request_budget:
+                sent = self.metrics.counter("requests") - self._requests_at_start
+                if sent + self._in_flight >= self.request_budget:
+                    self.stop = "requests"
+        return self.stop
+
+    def check(self) -> Optional[str]:
+        """Why the budget is spent ("time" / "requests"), or None while it lasts."""
+        with self._lock:
+            return self._spent()
+
+    def try_start(self) -> bool:
+        """Claim one batch; False once the budget is spent."""
+        with self._lock:
+            if self._spent():
+                return False
+            self._in_flight += 1
+            self.batches += 1
+            return True
+
+    def finish(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
 class MagicCardProcessor:
-    def __init__(self, config: ProcessorConfig):
+    def __init__(
+        self,
+        config: ProcessorConfig,
+        progress_sink: Optional[ProgressSink] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ):
         """Initialize MagicCardProcessor with configuration.
 
         Args:
             config: ProcessorConfig instance with all configuration parameters
+            progress_sink: Receives typed progress events and status lines (default: terminal bars)
+            cancel_token: Cancelling it stops the running job at the next batch boundary (JobCancelled)
         """
         self.config = config
+        self.progress_sink = progress_sink or TqdmSink()
+        self.cancel_token = cancel_token or CancelToken()
         self.update_prices = config.update_prices
         self.dry_run = config.dry_run
 
         self._initialize_clients()
-        self._card_cache = {}
+        # Shared by every processor in the process; counters are reported relative to this job's start
+        self._card_cache = get_card_cache(config.processing)
+        self._card_cache_start = self._card_cache.stats()
         self.error_count = 0
         self.last_error_count = 0
         self.not_found_cards = []  # List to store names of cards not found
+        self.catalog_price_stats: Optional[Dict[str, int]] = None  # Set by update_prices_from_catalog
+        # Called with {"last_card_id", "processed", "updated"} whenever the committed prefix of a
+        # Postgres job advances (ProcessorService stores it on the job row)
+        self.checkpoint_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.price_budget_stop: Optional[str] = None  # "time" | "requests" when an incremental refresh ran out
+        self._openai_semaphore = threading.BoundedSemaphore(config.processing.max_workers)
+        self._start_metrics()
 
     def _initialize_clients(self) -> None:
         """Initialize card fetcher, optional collection repository (Postgres), and spreadsheet client (only when not using Postgres)."""
+        # CardFetcher paces requests through the shared Scryfall rate limiter, so batch workers never sleep per card.
         self.card_fetcher = CardFetcher(scryfall_config=self.config.scryfall, openai_config=self.config.openai)
         url = getattr(self.config.database, "url", None) if self.config.database else None
         if not url:
@@ -55,16 +130,39 @@ class MagicCardProcessor:
 
             url = os.getenv("DATABASE_URL")
         self.collection_repository = get_collection_repository(url) if url else None
+        # The catalog lives in the same database; consult it before going to Scryfall
+        self.catalog_resolver = None
+        if url and self.config.catalog.resolve_first:
+            self.catalog_resolver = CatalogResolver(CatalogRepository(url))
         # Only create spreadsheet client when not using Postgres (e.g. update_prices + repo never touches Sheets)
         self.spreadsheet_client = None
         if self.collection_repository is None:
             self.spreadsheet_client = ClientFactory.create_spreadsheet_client(self.config)
 
-    @lru_cache(maxsize=1000)
+    def _start_metrics(self) -> RunMetrics:
+        """Give the run that is starting fresh timers (the card fetcher reports into them too)."""
+        self.metrics = RunMetrics()
+        if getattr(self, "card_fetcher", None) is not None:
+            self.card_fetcher.metrics = self.metrics
+        return self.metrics
+
+    def _run_metrics(self) -> RunMetrics:
+        metrics = getattr(self, "metrics", None)
+        if metrics is None:
+            metrics = self.metrics = RunMetrics()
+        return metrics
+
     def _fetch_card_data(self, card_name: str) -> Optional[Dict[str, Any]]:
-        """Fetch card data with caching."""
+        """Fetch card data through the shared card cache (failed lookups are not cached)."""
+        cached = self._card_cache.get(card_name)
+        if cached is not None:
+            self._run_metrics().count("card_cache_hits")
+            return cached
         try:
-            return self.card_fetcher.search_card(card_name)
+            with self._run_metrics().timer("fetch"):
+                data = self.card_fetcher.search_card(card_name)
+            self._card_cache.put(card_name, data)
+            return data
         except Exception as e:
             # Check if it's a 404 error (card not found)
             if "404" in str(e) or "not found" in str(e).lower():
@@ -72,13 +170,85 @@ class MagicCardProcessor:
                 # Save the name of the card not found (limit to 100 to avoid excessive memory usage)
                 if len(self.not_found_cards) < 100:
                     self.not_found_cards.append(card_name)
-                # Show the error immediately
-                self._print_error_counter("search")
             else:
                 # Other type of error
                 self.error_count += 1
             return None
 
+    def _fetch_card_data_bulk(
+        self, card_names: List[str], scryfall_ids: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Resolve a batch of names with one /cards/collection lookup per 75 uncached names.
+
+        A card with a scryfall_id (parallel to *card_names*) is looked up, and cached, by that id,
+        so it resolves to its own printing rather than to whichever one its name finds.
+        Cards Scryfall reports as not found go through _fetch_card_data by name, so they still get
+        the fuzzy/search cascade and end up in not_found_cards when that fails too.
+        """
+        ids = scryfall_ids or [None] * len(card_names)
+        cache_keys = [scryfall_id or name for name, scryfall_id in zip(card_names, ids)]
+        results = [self._card_cache.get(key) for key in cache_keys]
+        missing = [i for i, data in enumerate(results) if data is None]
+        metrics = self._run_metrics()
+        metrics.count("card_cache_hits", len(card_names) - len(missing))
+        if missing:
+            identifiers = [{"id": ids[i]} if ids[i] else card_names[i] for i in missing]
+            with metrics.timer("fetch"):
+                found = self.card_fetcher.search_cards_bulk(identifiers, fallback=False)
+            for i, data in zip(missing, found):
+                if data is None:
+                    data = self._fetch_card_data(card_names[i])
+                else:
+                    self._card_cache.put(cache_keys[i], data)
+                results[i] = data
+        return results
+
+    def _analyze_cards(self, cards: List[Optional[Dict[str, Any]]]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """(game_strategy, tier) per resolved card; OpenAI sees the whole batch in few requests."""
+        if not self.config.openai.enabled:
+            return [(None, None)] * len(cards)
+        # Fetch threads may outnumber processing.max_workers under scryfall.adaptive; OpenAI does not
+        with self._openai_slots(), self._run_metrics().timer("openai"):
+            analyses = iter(self.card_fetcher.analyze_cards([data for data in cards if data]))
+        return [next(analyses) if data else (None, None) for data in cards]
+
+    def _openai_slots(self) -> threading.BoundedSemaphore:
+        """Caps concurrent OpenAI batches at processing.max_workers, however many fetch threads run."""
+        slots = getattr(self, "_openai_semaphore", None)
+        if slots is None:
+            slots = self._openai_semaphore = threading.BoundedSemaphore(self.config.processing.max_workers)
+        return slots
+
+    def _fetch_workers(self) -> int:
+        """Fetch threads per run: processing.max_workers, or with scryfall.adaptive enough threads for the
+        controller's concurrency ceiling (it decides how many of them are in a request at once)."""
+        scryfall = self.config.scryfall
+        if scryfall.adaptive:
+            return max(self.config.processing.max_workers, scryfall.max_concurrency)
+        return self.config.processing.max_workers
+
+    def card_cache_stats(self) -> Dict[str, int]:
+        """Card cache counters accumulated since this processor was created, plus its current size."""
+        stats = self._card_cache.stats()
+        for counter in ("hits", "misses", "evictions", "expirations"):
+            stats[counter] -= self._card_cache_start.get(counter, 0)
+        return stats
+
+    def _resolve_cards(self, lookups: List[Tuple[str, Optional[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """Resolve (name, scryfall_id) pairs: local catalog first, Scryfall only for catalog misses."""
+        if self.catalog_resolver is not None:
+            with self._run_metrics().timer("catalog"):
+                resolved = self.catalog_resolver.resolve(lookups)
+        else:
+            resolved = [None] * len(lookups)
+        missing = [i for i, data in enumerate(resolved) if data is None]
+        self._run_metrics().count("catalog_hits", len(lookups) - len(missing))
+        if missing:
+            fetched = self._fetch_card_data_bulk([lookups[i][0] for i in missing], [lookups[i][1] for i in missing])
+            for i, data in zip(missing, fetched):
+                resolved[i] = data
+        return resolved
+
     def _process_price(self, price: Optional[str]) -> str:
         """Process price value."""
         if not price:
@@ -100,40 +270,78 @@ class MagicCardProcessor:
             if new_price != current_price:
                 row_index = i + 2
                 updated_data.append((row_index, card_name, new_price))
-            time.sleep(self.config.processing.api_delay)
         return updated_data
 
     def _update_prices_batch_repo(
-        self, cards: List[Tuple[int, str, str]], start_idx: int, batch_size: int
-    ) -> List[Tuple[int, str, str]]:
+        self,
+        cards: List[Tuple[int, str, str, Optional[str]]],
+        start_idx: int,
+        batch_size: int,
+        budget: Optional["PriceBudget"] = None,
+    ) -> Optional[List[Tuple[int, str, str]]]:
         """
         Process a batch of cards for price updates (Repo path: card_id, name, new_price).
-        cards: list of (card_id, card_name, current_price_str).
-        Returns: list of (card_id, card_name, new_price) for changed prices.
+        cards: list of (card_id, card_name, current_price_str, scryfall_id); a stored scryfall_id
+        prices that printing rather than whichever one the name resolves to.
+        Returns: list of (card_id, card_name, new_price) for changed prices, or None when
+        *budget* ran out before the batch started (nothing was looked up).
         """
+        batch = cards[start_idx : start_idx + batch_size]
+        if budget is not None and not budget.try_start():
+            return None
+        try:
+            resolved = self._resolve_cards([(card_name, scryfall_id) for _id, card_name, _price, scryfall_id in batch])
+        finally:
+            if budget is not None:
+                budget.finish()
         updated_data = []
-        for i, (card_id, card_name, current_price) in enumerate(
-            cards[start_idx : start_idx + batch_size], start=start_idx
-        ):
-            data = self._fetch_card_data(card_name)
+        for (card_id, card_name, current_price, _scryfall_id), data in zip(batch, resolved):
             new_price_raw = data.get("prices", {}).get("eur") if data else None
             new_price = self._process_price(new_price_raw)
             if new_price != current_price:
                 updated_data.append((card_id, card_name, new_price))
-            time.sleep(self.config.processing.api_delay)
         return updated_data
 
-    def _print_error_counter(self, phase: str = "search") -> None:
-        """
-        Print the error counter with single-line refresh formatting.
+    def _progress_sink(self) -> ProgressSink:
+        sink = getattr(self, "progress_sink", None)
+        if sink is None:
+            sink = self.progress_sink = TqdmSink()
+        return sink
 
-        Args:
-            phase: Phase of the process (search or update)
+    @contextmanager
+    def _phase(self, phase: str, total: int) -> Iterator[PhaseProgress]:
+        """Report one phase of the job to the progress sink (cards not found ride along as errors).
+
+        The final event is sent even when the phase is cancelled or fails.
         """
-        if self.error_count > 0:
-            # Use carriage return to update the same line
-            error_msg = f"\r{Colors.BOLD}{Colors.RED}Cards not found: {self.error_count}{Colors.END}"
-            print(error_msg, end="", flush=True)
+        progress = PhaseProgress(
+            self._progress_sink(),
+            phase,
+            total,
+            cancel_token=getattr(self, "cancel_token", None),
+            errors=lambda: self.error_count,
+        )
+        progress.start()
+        try:
+            yield progress
+        finally:
+            self._run_metrics().add_cards(progress.current)
+            progress.close()
+
+    def _notify(self, text: str) -> None:
+        """Send a status line to the progress sink."""
+        self._progress_sink().message(text)
+
+    def _notify_not_found(self) -> None:
+        """Summarise the cards that were not found (up to 10 names)."""
+        if self.error_count == 0:
+            return
+        self._notify(f"{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
+        if self.not_found_cards:
+            cards_str = ", ".join(f"'{card}'" for card in self.not_found_cards[:10])
+            if len(self.not_found_cards) > 10:
+                cards_str += f" and {len(self.not_found_cards) - 10} more..."
+            self._notify(f"{Colors.YELLOW}Cards not found: {cards_str}{Colors.END}")
 
     def _save_failed_cards_csv(self) -> Optional[str]:
         """
@@ -190,37 +398,33 @@ class MagicCardProcessor:
         total_cards = len(cards)
         total_prices_updated = 0  # Track total updates for final summary
 
-        # Print an initial message for the error counter (will be updated in place)
-        print(f"{Colors.BOLD}Cards not found: 0{Colors.END}", end="", flush=True)
-
-        # Configure tqdm to show only the progress bar with time estimation
-        with tqdm(total=total_cards, desc="Verifying prices", unit="cards") as pbar:
-            with ThreadPoolExecutor(max_workers=self.config.processing.max_workers) as executor:
-                futures = []
-                for i in range(0, len(cards), self.config.processing.batch_size):
-                    futures.append(
-                        executor.submit(self._update_prices_batch, cards, i, self.config.processing.batch_size)
-                    )
-
-                for future in futures:
-                    batch_results = future.result()
+        batch_size = self.config.processing.batch_size
+        max_workers = self._fetch_workers()
+
+        with self._phase("verify_prices", total_cards) as progress:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Batches are written as they finish (not in submission order), with a bounded number in flight
+                for start, batch_results in iter_completed(
+                    executor,
+                    lambda i: self._update_prices_batch(cards, i, batch_size),
+                    progress.guard(range(0, total_cards, batch_size)),
+                    max_pending=2 * max_workers,
+                ):
                     pending_changes.extend(batch_results)
                     batches_processed += 1
 
-                    # Update the progress bar with the processed batch size
-                    pbar.update(min(self.config.processing.batch_size, total_cards - pbar.n))
-
                     # Check if we should write the buffered changes
                     if batches_processed >= self.config.processing.write_buffer_batches:
                         if pending_changes:
                             write_counter += 1
                             cards_in_buffer = batches_processed * self.config.processing.batch_size
-                            num_written = self._write_buffered_prices(pending_changes)
+                            with self._run_metrics().timer("db_write"):
+                                num_written = self._write_buffered_prices(pending_changes)
 
-                            # Print progress notification
+                            # Progress notification
                             if num_written > 0:
-                                print(
-                                    f"\n{Colors.GREEN}✓ Write #{write_counter} ({cards_in_buffer} cards): {num_written} updates{Colors.END}"
+                                self._notify(
+                                    f"{Colors.GREEN}✓ Write #{write_counter} ({cards_in_buffer} cards): {num_written} updates{Colors.END}"
                                 )
 
                             total_prices_updated += num_written
@@ -230,33 +434,30 @@ class MagicCardProcessor:
                             batches_processed = 0
 
                             # Rate limiting delay
-                            time.sleep(1.5)
+                            with self._run_metrics().timer("sleep"):
+                                time.sleep(1.5)
+
+                    progress.advance(min(batch_size, total_cards - start))
 
         # Ensure the error message is displayed at the end
         if self.error_count > 0:
-            print(f"\n{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
-            if self.not_found_cards:
-                # Show up to 10 cards not found at the end
-                display_cards = self.not_found_cards[:10]
-                cards_str = ", ".join([f"'{card}'" for card in display_cards])
-                if len(self.not_found_cards) > 10:
-                    cards_str += f" and {len(self.not_found_cards) - 10} more..."
-                print(f"{Colors.YELLOW}Cards not found: {cards_str}{Colors.END}")
+            self._notify_not_found()
 
             # Save failed cards to CSV
             csv_path = self._save_failed_cards_csv()
             if csv_path:
-                print(f"{Colors.CYAN}📄 Failed cards saved to: {csv_path}{Colors.END}")
+                self._notify(f"{Colors.CYAN}📄 Failed cards saved to: {csv_path}{Colors.END}")
 
         # Write remaining pending changes (partial buffer)
         if pending_changes:
             write_counter += 1
             cards_in_buffer = batches_processed * self.config.processing.batch_size
-            num_written = self._write_buffered_prices(pending_changes)
+            with self._run_metrics().timer("db_write"):
+                num_written = self._write_buffered_prices(pending_changes)
 
             if num_written > 0:
-                print(
-                    f"\n{Colors.GREEN}✓ Write #{write_counter} ({cards_in_buffer} cards): {num_written} updates{Colors.END}"
+                self._notify(
+                    f"{Colors.GREEN}✓ Write #{write_counter} ({cards_in_buffer} cards): {num_written} updates{Colors.END}"
                 )
 
             total_prices_updated += num_written
@@ -265,21 +466,66 @@ class MagicCardProcessor:
         if total_prices_updated == 0:
             logger.info("No price changes detected.")
         else:
-            print(
-                f"\n{Colors.BOLD}{Colors.GREEN}✅ Completed: {total_cards} cards verified, {total_prices_updated} prices updated{Colors.END}"
+            self._notify(
+                f"{Colors.BOLD}{Colors.GREEN}✅ Completed: {total_cards} cards verified, {total_prices_updated} prices updated{Colors.END}"
             )
-            print(f"{Colors.CYAN}💡 To resume from here: --resume-from {total_cards + 2}{Colors.END}")
+            self._notify(f"{Colors.CYAN}💡 To resume from here: --resume-from {total_cards + 2}{Colors.END}")
 
         logger.info(f"Price update completed in {datetime.now() - start_time}")
 
+    def _after_checkpoint(self, cards: List[Any], card_id: Callable[[Any], int]) -> List[Any]:
+        """Order repository cards by id and drop those at or before config.resume_after_id.
+
+        Id order is what makes a checkpoint's last_card_id a valid cursor.
+        """
+        cards = sorted(cards, key=card_id)
+        resume_after = self.config.resume_after_id
+        if resume_after is not None:
+            cards = [card for card in cards if card_id(card) > resume_after]
+            logger.info(f"Resuming after card id {resume_after}: {len(cards)} cards left")
+        return cards
+
+    def _report_checkpoint(self, last_card_id: int, processed: int, updated: int) -> None:
+        callback = getattr(self, "checkpoint_callback", None)
+        if callback is None:
+            return
+        try:
+            callback({"last_card_id": last_card_id, "processed": processed, "updated": updated})
+        except Exception as e:
+            # A lost checkpoint only costs re-work on resume; never fail the job for it
+            logger.warning(f"Failed to save checkpoint: {e}")
+
+    def _cards_for_price_update(self) -> List[Tuple[int, str, str, Optional[str]]]:
+        """Repository cards for a price update: all of them, or only stale ones in priority order when incremental."""
+        if self.config.incremental_prices:
+            return self.collection_repository.get_cards_for_price_update(
+                user_id=self.config.user_id, max_age_hours=self.config.processing.price_max_age_hours
+            )
+        return self.collection_repository.get_cards_for_price_update(user_id=self.config.user_id)
+
+    def _price_budget(self) -> Optional["PriceBudget"]:
+        """Budget of an incremental refresh (processing.price_time_budget / price_request_budget), else None."""
+        processing = self.config.processing
+        if not self.config.incremental_prices or not (processing.price_time_budget or processing.price_request_budget):
+            return None
+        return PriceBudget(self._run_metrics(), processing.price_time_budget, processing.price_request_budget)
+
+    def _price_batch_starts(self, total: int, batch_size: int, budget: Optional["PriceBudget"] = None) -> Iterator[int]:
+        """Batch offsets for update_prices_data_repo; stops once *budget* is spent."""
+        for start in range(0, total, batch_size):
+            if budget is not None and budget.check():
+                return
+            yield start
+
     def update_prices_for_card_ids(self, card_ids: List[int]) -> None:
         """
-        Update prices for a subset of cards by id. Builds (id, name, price) list via
+        Update prices for a subset of cards by id. Builds (id, name, price, scryfall_id) list via
         get_card_by_id and calls update_prices_data_repo. Skips ids for which the card is not found.
         """
         if not self.collection_repository:
             raise RuntimeError("collection_repository not set")
-        cards: List[Tuple[int, str, str]] = []
+        self._start_metrics()
+        cards: List[Tuple[int, str, str, Optional[str]]] = []
         for cid in card_ids:
             card = self.collection_repository.get_card_by_id(cid)
             if not card:
@@ -291,71 +537,178 @@ class MagicCardProcessor:
                 logger.warning(f"Card id {cid} has no name or english_name, skipping")
                 continue
             price_str = card.get("price") or card.get("price_eur") or ""
-            cards.append((cid, name_for_scryfall, price_str))
+            cards.append((cid, name_for_scryfall, price_str, card.get("scryfall_id")))
         if not cards:
             logger.info("No valid cards to update")
             return
         self.update_prices_data_repo(cards)
 
-    def update_prices_data_repo(self, cards: List[Tuple[int, str, str]]) -> None:
+    def update_prices_data_repo(self, cards: List[Tuple[int, str, str, Optional[str]]]) -> None:
         """
-        Update prices using the collection repository (Postgres). cards: list of (card_id, name, current_price_str).
+        Update prices using the collection repository (Postgres).
+        cards: list of (card_id, name, current_price_str, scryfall_id) as get_cards_for_price_update returns them.
         """
         if not self.collection_repository:
             raise RuntimeError("collection_repository not set")
         logger.info("Checking price updates from Scryfall API (Postgres)...")
+        incremental = self.config.incremental_prices
+        if not incremental:
+            # An incremental refresh keeps the repository's priority order; its staleness filter is the cursor
+            cards = self._after_checkpoint(cards, lambda card: card[0])
         start_time = datetime.now()
         self.error_count = 0
         self.last_error_count = 0
         self.not_found_cards = []
         total_cards = len(cards)
         total_prices_updated = 0
-        print(f"{Colors.BOLD}Cards not found: 0{Colors.END}", end="", flush=True)
-        with tqdm(total=total_cards, desc="Verifying prices", unit="cards") as pbar:
-            with ThreadPoolExecutor(max_workers=self.config.processing.max_workers) as executor:
-                futures = []
-                for i in range(0, len(cards), self.config.processing.batch_size):
-                    futures.append(
-                        executor.submit(
-                            self._update_prices_batch_repo,
-                            cards,
-                            i,
-                            self.config.processing.batch_size,
-                        )
-                    )
-                for future in futures:
-                    batch_results = future.result()
-                    for card_id, _name, new_price in batch_results:
-                        self.collection_repository.update(card_id, {"price_eur": new_price})
-                        try:
-                            price_val = float(str(new_price).replace(",", "."))
-                            self.collection_repository.record_price_history(card_id, price_val)
-                        except (ValueError, TypeError):
-                            pass  # Non-numeric price — skip history entry
-                        total_prices_updated += 1
-                    pbar.update(min(self.config.processing.batch_size, total_cards - pbar.n))
+        # Each batch is resolved with a single /cards/collection request, so size batches to what
+        # Scryfall accepts per request rather than to processing.batch_size.
+        batch_size = CardFetcher.COLLECTION_BATCH_SIZE
+        max_workers = self._fetch_workers()
+        watermark = CommitWatermark(batch_size, total_cards)
+        metrics = self._run_metrics()
+        # Checked before each batch is handed out and again by the worker before it looks anything
+        # up, so batches queued ahead of the budget running out are dropped, not fetched
+        budget = self._price_budget()
+        self.price_budget_stop = None
+        with self._phase("verify_prices", total_cards) as progress:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Fetch workers feed this (writer) thread as batches complete; a slow batch blocks nobody
+                for start, batch_results in iter_completed(
+                    executor,
+                    lambda i: self._update_prices_batch_repo(cards, i, batch_size, budget),
+                    progress.guard(self._price_batch_starts(total_cards, batch_size, budget)),
+                    max_pending=2 * max_workers,
+                ):
+                    if batch_results is None:
+                        continue
+                    with metrics.timer("db_write"):
+                        if batch_results:
+                            # One statement and one transaction per batch (price, last_price_update, price_history)
+                            self.collection_repository.bulk_update_prices(
+                                [(card_id, new_price) for card_id, _name, new_price in batch_results]
+                            )
+                            total_prices_updated += len(batch_results)
+                        changed = {card_id for card_id, _name, _price in batch_results}
+                        unchanged = [card[0] for card in cards[start : start + batch_size] if card[0] not in changed]
+                        if unchanged:
+                            # Verified but unchanged prices are fresh too (incremental refreshes select on this)
+                            self.collection_repository.mark_prices_checked(unchanged)
+                    committed = watermark.commit(start)
+                    if committed is not None and not incremental:
+                        self._report_checkpoint(cards[committed - 1][0], committed, total_prices_updated)
+                    progress.advance(min(batch_size, total_cards - start))
+        if budget is not None and budget.stop:
+            self.price_budget_stop = budget.stop
+            logger.info(f"Price refresh stopped by its {budget.stop} budget ({budget.batches} batches looked up)")
         if self.error_count > 0:
-            print(f"\n{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
+            self._notify(f"{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
         if total_prices_updated > 0:
-            print(
-                f"\n{Colors.BOLD}{Colors.GREEN}✅ Completed: {total_cards} cards verified, {total_prices_updated} prices updated{Colors.END}"
+            self._notify(
+                f"{Colors.BOLD}{Colors.GREEN}✅ Completed: {total_cards} cards verified, {total_prices_updated} prices updated{Colors.END}"
             )
         logger.info(f"Price update (Postgres) completed in {datetime.now() - start_time}")
 
+    def _process_cards_batch_repo(self, cards: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """Resolve and enrich one batch of repository cards; returns (card_id, fields) for cards with new data."""
+        batch = [c for c in cards if c.get("id") is not None and (c.get("name") or c.get("english_name"))]
+        resolved = self._resolve_cards(
+            [(card.get("name") or card.get("english_name"), card.get("scryfall_id")) for card in batch]
+        )
+        analyses = self._analyze_cards(resolved)
+        updates = []
+        for card, data, (game_strategy, tier) in zip(batch, resolved, analyses):
+            if data:
+                update = self._card_update_fields(data, game_strategy, tier)
+                if update:
+                    updates.append((card["id"], update))
+        return updates
+
+    def _card_update_fields(
+        self, data: Dict[str, Any], game_strategy: Optional[str], tier: Optional[str]
+    ) -> Dict[str, Any]:
+        """Map Scryfall card data (plus the OpenAI analysis) to the card columns to update; None values are left out."""
+        price_eur = self._process_price(data.get("prices", {}).get("eur"))
+        cmc_val = data.get("cmc")
+        if cmc_val is not None and str(cmc_val).strip() in ("", "N/A"):
+            cmc_val = None
+        elif cmc_val is not None:
+            try:
+                cmc_val = float(cmc_val)
+            except (TypeError, ValueError):
+                cmc_val = None
+        update = {
+            "type_line": data.get("type_line"),
+            "description": data.get("oracle_text"),
+            "keywords": str(data.get("keywords")) if data.get("keywords") is not None else None,
+            "mana_cost": data.get("mana_cost"),
+            "cmc": cmc_val,
+            "colors": str(data.get("colors")) if data.get("colors") is not None else None,
+            "color_identity": str(data.get("color_identity")) if data.get("color_identity") is not None else None,
+            "power": data.get("power"),
+            "toughness": data.get("toughness"),
+            "rarity": data.get("rarity"),
+            "price_eur": price_eur,
+            "release_date": data.get("released_at"),
+            "set_id": data.get("set"),
+            "set_name": data.get("set_name"),
+            "set_number": data.get("collector_number"),
+            "edhrec_rank": str(data.get("edhrec_rank")) if data.get("edhrec_rank") is not None else None,
+            "game_strategy": game_strategy,
+            "tier": tier,
+        }
+        return {k: v for k, v in update.items() if v is not None}
+
+    def update_prices_from_catalog(self) -> Dict[str, Any]:
+        """Refresh prices from catalog_cards in one set-based repository operation; only the
+        cards the catalog could not match go through the Scryfall price update."""
+        if not self.collection_repository:
+            raise RuntimeError("collection_repository not set")
+        user_id = self.config.user_id
+        metrics = self._run_metrics()
+        with metrics.timer("load_cards"):
+            cards = self._cards_for_price_update()
+        with metrics.timer("db_write"):
+            refreshed = self.collection_repository.refresh_prices_from_catalog(user_id=user_id)
+        matched = set(refreshed["matched_ids"])
+        metrics.count("catalog_hits", len(matched))
+        metrics.add_cards(len(matched))
+        remaining = [card for card in cards if card[0] not in matched]
+        self.catalog_price_stats = {
+            "matched": len(matched),
+            "updated": refreshed["updated"],
+            "history_rows": refreshed["history_rows"],
+            "scryfall_lookups": len(remaining),
+        }
+        logger.info(
+            f"Catalog price refresh: {len(matched)} matched, {refreshed['updated']} updated, "
+            f"{len(remaining)} left for Scryfall"
+        )
+        self._notify(
+            f"{Colors.BOLD}{Colors.GREEN}✅ Catalog: {len(matched)} cards matched, "
+            f"{refreshed['updated']} prices updated{Colors.END}"
+        )
+        if remaining:
+            self.update_prices_data_repo(remaining)
+        return self.catalog_price_stats
+
     def process_cards_repo(self) -> None:
         """
         Full card processing against Postgres: read cards (all or only new/incomplete),
-        fetch fresh data from Scryfall (and optional OpenAI), update each card in the repository.
+        fetch fresh data from Scryfall (and optional OpenAI) on the worker pool, and write
+        each batch to the repository with one bulk update.
         """
         if not self.collection_repository:
             raise RuntimeError("collection_repository not set")
         only_incomplete = getattr(self.config, "process_scope", None) == "new_only"
+        with self._run_metrics().timer("load_cards"):
+            if only_incomplete:
+                cards = self.collection_repository.get_cards_for_process(only_incomplete=True)
+            else:
+                cards = self.collection_repository.get_all_cards()
         if only_incomplete:
-            cards = self.collection_repository.get_cards_for_process(only_incomplete=True)
             logger.info(f"Processing only new/incomplete cards (with only name): {len(cards)} cards")
-        else:
-            all_cards = self.collection_repository.get_all_cards()
-            cards = [c for c in all_cards if c.get("id") is not None]
+        cards = self._after_checkpoint([c for c in cards if c.get("id") is not None], lambda card: card["id"])
         if self.config.limit is not None:
             cards = cards[: self.config.limit]
             logger.info(f"Limiting processing to {self.config.limit} cards")
@@ -365,69 +718,28 @@ class MagicCardProcessor:
         self.error_count = 0
         self.last_error_count = 0
         self.not_found_cards = []
-        print(f"{Colors.BOLD}Cards not found counter: {self.error_count}{Colors.END}")
+        cards_updated = 0
         total = len(cards)
-        with tqdm(total=total, desc="Processing cards", unit="cards") as pbar:
-            for i in range(0, len(cards), self.config.processing.batch_size):
-                batch = cards[i : i + self.config.processing.batch_size]
-                for card in batch:
-                    card_id = card.get("id")
-                    name = card.get("name") or card.get("english_name")
-                    if not name or card_id is None:
-                        pbar.update(1)
-                        continue
-                    data = self._fetch_card_data(name)
-                    if self.config.openai.enabled and data:
-                        data, game_strategy, tier = self.card_fetcher.get_card_info(data.get("name"))
-                    else:
-                        game_strategy, tier = None, None
-                    if data:
-                        price_eur = self._process_price(data.get("prices", {}).get("eur"))
-                        cmc_val = data.get("cmc")
-                        if cmc_val is not None and str(cmc_val).strip() in ("", "N/A"):
-                            cmc_val = None
-                        elif cmc_val is not None:
-                            try:
-                                cmc_val = float(cmc_val)
-                            except (TypeError, ValueError):
-                                cmc_val = None
-                        update = {
-                            "type_line": data.get("type_line"),
-                            "description": data.get("oracle_text"),
-                            "keywords": str(data.get("keywords")) if data.get("keywords") is not None else None,
-                            "mana_cost": data.get("mana_cost"),
-                            "cmc": cmc_val,
-                            "colors": str(data.get("colors")) if data.get("colors") is not None else None,
-                            "color_identity": str(data.get("color_identity"))
-                            if data.get("color_identity") is not None
-                            else None,
-                            "power": data.get("power"),
-                            "toughness": data.get("toughness"),
-                            "rarity": data.get("rarity"),
-                            "price_eur": price_eur,
-                            "release_date": data.get("released_at"),
-                            "set_id": data.get("set"),
-                            "set_name": data.get("set_name"),
-                            "set_number": data.get("collector_number"),
-                            "edhrec_rank": str(data.get("edhrec_rank"))
-                            if data.get("edhrec_rank") is not None
-                            else None,
-                            "game_strategy": game_strategy,
-                            "tier": tier,
-                        }
-                        update = {k: v for k, v in update.items() if v is not None}
-                        if update:
-                            self.collection_repository.update(card_id, update)
-                    time.sleep(self.config.processing.api_delay)
-                    pbar.update(1)
-        if self.error_count > 0:
-            print(f"\n{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
-            if self.not_found_cards:
-                display_cards = self.not_found_cards[:10]
-                cards_str = ", ".join(f"'{c}'" for c in display_cards)
-                if len(self.not_found_cards) > 10:
-                    cards_str += f" and {len(self.not_found_cards) - 10} more..."
-                print(f"{Colors.YELLOW}Cards not found: {cards_str}{Colors.END}")
+        batch_size = self.config.processing.batch_size
+        max_workers = self._fetch_workers()
+        with self._phase("process_cards", total) as progress:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Workers fetch and enrich; this thread commits one batch at a time, in input order,
+                # so everything before the last committed batch is done (resume_from stays exact)
+                for start, updates in iter_ordered(
+                    executor,
+                    lambda i: self._process_cards_batch_repo(cards[i : i + batch_size]),
+                    progress.guard(range(0, total, batch_size)),
+                    max_pending=2 * max_workers,
+                ):
+                    if updates:
+                        with self._run_metrics().timer("db_write"):
+                            self.collection_repository.bulk_update(updates)
+                        cards_updated += len(updates)
+                    committed = min(start + batch_size, total)
+                    self._report_checkpoint(cards[committed - 1]["id"], committed, cards_updated)
+                    progress.advance(min(batch_size, total - start))
+        self._notify_not_found()
         logger.info("Card processing (Postgres) completed successfully")
 
     def _get_price_column_index(self) -> int:
@@ -535,7 +847,8 @@ class MagicCardProcessor:
                         logger.warning(
                             f"API quota exceeded. Retrying in {delay:.2f} seconds... (Attempt {attempt + 1}/{max_retries})"
                         )
-                        time.sleep(delay)
+                        with self._run_metrics().timer("sleep"):
+                            time.sleep(delay)
                     else:
                         logger.error(f"Failed to update prices after {max_retries} attempts: {e}")
                         raise
@@ -546,15 +859,10 @@ class MagicCardProcessor:
     def _process_card_batch(self, cards: List[List[str]], start_idx: int) -> List[List[Any]]:
         """Process a batch of cards."""
         card_data = []
+        fetched = [self._fetch_card_data(card[0]) for card in cards]
+        analyses = self._analyze_cards(fetched)
 
-        for card in cards:
-            data = self._fetch_card_data(card[0])
-
-            if self.config.openai.enabled and data:
-                data, game_strategy, tier = self.card_fetcher.get_card_info(data.get("name"))
-            else:
-                game_strategy, tier = None, None
-
+        for card, data, (game_strategy, tier) in zip(cards, fetched, analyses):
             if data:
                 cell_values = [
                     card[0],
@@ -582,7 +890,6 @@ class MagicCardProcessor:
                 cell_values = [card[0]] + ["N/A"] * 19
 
             card_data.append(cell_values)
-            time.sleep(self.config.processing.api_delay)
 
         return card_data
 
@@ -593,9 +900,6 @@ class MagicCardProcessor:
         self.last_error_count = 0
         self.not_found_cards = []
 
-        # Print an initial message for the error counter
-        print(f"{Colors.BOLD}Cards not found counter: {self.error_count}{Colors.END}")
-
         row_index_to_start = self.spreadsheet_client.get_empty_row_index_to_start(2)
         cards = [card for i, card in enumerate(cards, start=1) if i >= row_index_to_start]
 
@@ -609,9 +913,8 @@ class MagicCardProcessor:
             cards = cards[self.config.resume_from - row_index_to_start :]
             logger.info(f"Resuming from row {self.config.resume_from}")
 
-        # Configure tqdm to show only the progress bar with time estimation
-        with tqdm(total=len(cards), desc="Processing cards", unit="cards") as pbar:
-            for i in range(0, len(cards), self.config.processing.batch_size):
+        with self._phase("process_cards", len(cards)) as progress:
+            for i in progress.guard(range(0, len(cards), self.config.processing.batch_size)):
                 batch = cards[i : i + self.config.processing.batch_size]
                 card_data = self._process_card_batch(batch, i)
 
@@ -619,44 +922,40 @@ class MagicCardProcessor:
                     range_start = gspread.utils.rowcol_to_a1(row_index_to_start + i, 1)
                     range_end = gspread.utils.rowcol_to_a1(row_index_to_start + i + len(card_data), len(card_data[0]))
                     try:
-                        self._update_sheet_with_retry(f"{range_start}:{range_end}", card_data)
+                        with self._run_metrics().timer("db_write"):
+                            self._update_sheet_with_retry(f"{range_start}:{range_end}", card_data)
                     except Exception:
                         # If there's an error updating, increment the counter
                         self.error_count += len(card_data)
 
-                # Update the progress bar
-                pbar.update(len(batch))
-
-                # No need to update here as _fetch_card_data already shows errors
+                progress.advance(len(batch))
 
         # Ensure the error message is displayed at the end
-        if self.error_count > 0:
-            print(f"\n{Colors.BOLD}{Colors.RED}Total cards not found: {self.error_count}{Colors.END}")
-            if self.not_found_cards:
-                # Show up to 10 cards not found at the end
-                display_cards = self.not_found_cards[:10]
-                cards_str = ", ".join([f"'{card}'" for card in display_cards])
-                if len(self.not_found_cards) > 10:
-                    cards_str += f" and {len(self.not_found_cards) - 10} more..."
-                print(f"{Colors.YELLOW}Cards not found: {cards_str}{Colors.END}")
+        self._notify_not_found()
 
         logger.info("Card processing completed successfully")
 
     def process_card_data(self) -> None:
         """Main processing method. Uses collection repository (Postgres) when configured; else Spreadsheet."""
+        metrics = self._start_metrics()
         try:
             if self.update_prices:
-                if self.collection_repository:
-                    cards = self.collection_repository.get_cards_for_price_update()
+                if self.collection_repository and self.config.price_source == "catalog":
+                    self.update_prices_from_catalog()
+                elif self.collection_repository:
+                    with metrics.timer("load_cards"):
+                        cards = self._cards_for_price_update()
                     self.update_prices_data_repo(cards)
                 else:
-                    cards = self.spreadsheet_client.get_all_cards_prices()
+                    with metrics.timer("load_cards"):
+                        cards = self.spreadsheet_client.get_all_cards_prices()
                     self.update_prices_data(cards)
             else:
                 if self.collection_repository:
                     self.process_cards_repo()
                 else:
-                    cards = self.spreadsheet_client.get_cards()
+                    with metrics.timer("load_cards"):
+                        cards = self.spreadsheet_client.get_cards()
                     self.process_cards(cards)
         except Exception as e:
             logger.error(f"Error processing card data: {e}")
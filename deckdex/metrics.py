@@ -0,0 +1,122 @@
+"""Per-run timing instrumentation for the batch processors.
+
+MagicCardProcessor gives each run a RunMetrics. Worker threads and the writer loop add
+time spent per phase (Scryfall fetches, OpenAI, repository writes, sleeps), event counters
+(retries, cache hits) and the latency of every Scryfall round trip, so a slow run can be
+attributed to its cause. as_dict() goes into the API job result; summary_lines() is the
+CLI's closing report. Phase times are summed over threads, so parallel phases can add up
+to more than the run's wall time.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+# Upper bounds (seconds) of the fetch latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RunMetrics:
+    """Thread-safe phase timers, counters and a Scryfall latency histogram for one run."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._phases: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self._counters: Dict[str, int] = {}
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latencies = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self.cards = 0
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._phases.setdefault(phase, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the block to *phase* (also when the block raises)."""
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.add_time(phase, self._clock() - started)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        if n:
+            with self._lock:
+                self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def counter(self, counter: str) -> int:
+        with self._lock:
+            return self._counters.get(counter, 0)
+
+    def add_cards(self, n: int) -> None:
+        """Cards the run has finished (drives cards/sec)."""
+        with self._lock:
+            self.cards += n
+
+    def observe_fetch(self, seconds: float) -> None:
+        """Record one Scryfall round trip (rate limiter wait excluded)."""
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+        with self._lock:
+            self._buckets[index] += 1
+            self._latencies += 1
+            self._latency_total += seconds
+            self._latency_max = max(self._latency_max, seconds)
+
+    def _percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of round trips (lock held)."""
+        target = fraction * self._latencies
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self._buckets):
+            seen += n
+            if seen >= target:
+                return bound
+        return self._latency_max
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable snapshot (stored in the job result)."""
+        with self._lock:
+            elapsed = self._clock() - self._started
+            labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+            return {
+                "elapsed": round(elapsed, 3),
+                "cards": self.cards,
+                "cards_per_sec": round(self.cards / elapsed, 2) if elapsed > 0 else 0.0,
+                "phases": {
+                    name: {"seconds": round(seconds, 3), "calls": calls}
+                    for name, (seconds, calls) in sorted(self._phases.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+                "fetch_latency": {
+                    "count": self._latencies,
+                    "mean": round(self._latency_total / self._latencies, 4) if self._latencies else 0.0,
+                    "p50": self._percentile(0.5) if self._latencies else 0.0,
+                    "p95": self._percentile(0.95) if self._latencies else 0.0,
+                    "max": round(self._latency_max, 4),
+                    "buckets": dict(zip(labels, self._buckets)),
+                },
+            }
+
+    def summary_lines(self) -> List[str]:
+        """Human-readable report for the end of a CLI run."""
+        data = self.as_dict()
+        latency = data["fetch_latency"]
+        lines = [f"Run time {data['elapsed']:.1f}s, {data['cards']} cards ({data['cards_per_sec']} cards/s)"]
+        for name, phase in data["phases"].items():
+            lines.append(f"  {name:<16} {phase['seconds']:>9.2f}s  ({phase['calls']} calls)")
+        if latency["count"]:
+            lines.append(
+                f"  Scryfall latency: {latency['count']} requests, mean {latency['mean'] * 1000:.0f}ms, "
+                f"p50 <= {latency['p50'] * 1000:.0f}ms, p95 <= {latency['p95'] * 1000:.0f}ms, "
+                f"max {latency['max'] * 1000:.0f}ms"
+            )
+        if data["counters"]:
+            lines.append("  " + ", ".join(f"{name}: {n}" for name, n in data["counters"].items()))
+        return lines
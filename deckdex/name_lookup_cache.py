@@ -0,0 +1,127 @@
+"""Persistent memory of how card names resolve through the search_card cascade.
+
+Two things are remembered per normalized name:
+
+* names that no strategy could resolve (typos, tokens, localized names), with an
+  expiry so they are retried eventually, e.g. after a new set is released;
+* which strategy (exact, fuzzy, phrase, regex) matched the name last time, so the
+  next lookup starts there instead of replaying the strategies that failed.
+
+Stored in the same SQLite file as the response cache (scryfall.cache_path).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+def _normalize(name: str) -> str:
+    return " ".join((name or "").split()).lower()
+
+
+class NameLookupCache:
+    """Negative results and matching strategies for card names, in one SQLite file."""
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS name_not_found (
+                name_key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                failed_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                failures INTEGER NOT NULL DEFAULT 1
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS name_strategy (
+                name_key TEXT PRIMARY KEY,
+                strategy TEXT NOT NULL,
+                matched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def is_known_missing(self, name: str) -> bool:
+        """True if *name* failed every strategy recently and has not expired yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at FROM name_not_found WHERE name_key = ?", (_normalize(name),)
+            ).fetchone()
+        return row is not None and row[0] > self._clock()
+
+    def record_miss(self, name: str, ttl: float) -> None:
+        """Remember that no strategy resolved *name* for the next *ttl* seconds."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO name_not_found (name_key, name, failed_at, expires_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (name_key) DO UPDATE SET
+                    failed_at = excluded.failed_at,
+                    expires_at = excluded.expires_at,
+                    failures = name_not_found.failures + 1
+                """,
+                (_normalize(name), name, now, now + ttl),
+            )
+            self._conn.commit()
+
+    def record_match(self, name: str, strategy: str) -> None:
+        """Remember the strategy that resolved *name* (and forget any earlier miss)."""
+        key = _normalize(name)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO name_strategy (name_key, strategy, matched_at) VALUES (?, ?, ?)
+                ON CONFLICT (name_key) DO UPDATE SET strategy = excluded.strategy, matched_at = excluded.matched_at
+                """,
+                (key, strategy, self._clock()),
+            )
+            self._conn.execute("DELETE FROM name_not_found WHERE name_key = ?", (key,))
+            self._conn.commit()
+
+    def strategy_for(self, name: str) -> Optional[str]:
+        """Strategy that matched *name* last time, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT strategy FROM name_strategy WHERE name_key = ?", (_normalize(name),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def strategy_counts(self) -> Dict[str, int]:
+        """Number of remembered names per matching strategy, plus the live negative entries."""
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT strategy, COUNT(*) FROM name_strategy GROUP BY strategy"))
+            counts["not_found"] = self._conn.execute(
+                "SELECT COUNT(*) FROM name_not_found WHERE expires_at > ?", (self._clock(),)
+            ).fetchone()[0]
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Dict[str, NameLookupCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_name_lookup_cache(path: str) -> NameLookupCache:
+    """Return the process-wide NameLookupCache for *path*."""
+    key = os.path.abspath(path)
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = NameLookupCache(path)
+        return cache
@@ -0,0 +1,104 @@
+"""Bounded, completion-ordered work pipeline for the batch processors.
+
+The processors used to submit every batch up front and then read the futures
+in submission order. A single slow batch (say one stuck in Scryfall retries)
+then held back the writes and the progress of every batch behind it, and all
+finished results stayed in memory until it was their turn.
+
+iter_completed keeps at most max_pending batches submitted, pulls new work from
+a lazy producer only as results are consumed, and yields each result as soon
+as it finishes, so the caller (the writer stage) applies it immediately.
+iter_ordered has the same bounds but yields in submission order, for writers
+that must commit a prefix of the input (so an index-based resume stays exact).
+CommitWatermark lets a completion-order writer report such a prefix anyway.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_completed(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T], max_pending: int
+) -> Iterator[Tuple[T, R]]:
+    """Run fn(item) on *executor* for each item and yield (item, result) in completion order.
+
+    At most *max_pending* calls are submitted at any time; *items* is consumed
+    lazily. An exception raised by fn propagates from the iterator when its
+    result is reached.
+    """
+    if max_pending < 1:
+        raise ValueError("max_pending must be >= 1")
+    source = iter(items)
+    pending: Dict[Future, T] = {}
+
+    def fill() -> None:
+        while len(pending) < max_pending:
+            try:
+                item = next(source)
+            except StopIteration:
+                return
+            pending[executor.submit(fn, item)] = item
+
+    fill()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            yield item, future.result()
+        fill()
+
+
+def iter_ordered(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T], max_pending: int
+) -> Iterator[Tuple[T, R]]:
+    """Like iter_completed, but yield (item, result) in the order of *items*.
+
+    Later calls keep running while an earlier one is outstanding, up to
+    *max_pending* in total.
+    """
+    if max_pending < 1:
+        raise ValueError("max_pending must be >= 1")
+    source = iter(items)
+    pending: Deque[Tuple[T, Future]] = deque()
+
+    def fill() -> None:
+        while len(pending) < max_pending:
+            try:
+                item = next(source)
+            except StopIteration:
+                return
+            pending.append((item, executor.submit(fn, item)))
+
+    fill()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+        fill()
+
+
+class CommitWatermark:
+    """Tracks committed batches (by start offset) and the end of the contiguous committed prefix.
+
+    With completion-order writes a later batch can land before an earlier one; a
+    checkpoint may only cover items up to the first batch that is still missing.
+    """
+
+    def __init__(self, batch_size: int, total: int):
+        self.batch_size = batch_size
+        self.total = total
+        self.end = 0
+        self._committed: Set[int] = set()
+
+    def commit(self, start: int) -> Optional[int]:
+        """Record the batch starting at *start*; returns the new prefix end if it advanced, else None."""
+        self._committed.add(start)
+        advanced = False
+        while self.end in self._committed:
+            self._committed.discard(self.end)
+            self.end = min(self.end + self.batch_size, self.total)
+            advanced = True
+        return self.end if advanced else None
@@ -0,0 +1,180 @@
+"""Structured progress reporting and cooperative cancellation for the batch processors.
+
+MagicCardProcessor reports each phase of a job (e.g. "verify_prices", "process_cards")
+to a ProgressSink as typed ProgressEvents, at most once per min_interval plus a final
+event, and stops at the next batch boundary once its CancelToken is cancelled. The CLI
+renders events with TqdmSink; the API forwards them to WebSocket clients through a
+CallbackSink. Nothing reads or replaces sys.stdout/sys.stderr, so concurrent jobs in
+one process keep their progress and cancellation apart.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from loguru import logger
+from tqdm import tqdm
+
+T = TypeVar("T")
+
+# Seconds between two progress events of the same phase (the final event is always sent)
+DEFAULT_MIN_INTERVAL = 0.5
+
+PHASE_LABELS = {
+    "verify_prices": "Verifying prices",
+    "process_cards": "Processing cards",
+}
+
+
+class JobCancelled(Exception):
+    """Raised in the processor thread when its CancelToken has been cancelled."""
+
+
+class CancelToken:
+    """Cancellation flag shared between whoever runs a job and the processor running it."""
+
+    def __init__(self, event: Optional[threading.Event] = None):
+        self._event = event or threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelled("Job cancelled by user")
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Progress of one processor phase."""
+
+    phase: str
+    current: int
+    total: int
+    errors: int = 0  # cards not found so far
+    elapsed: float = 0.0  # seconds since the phase started
+    done: bool = False
+
+    @property
+    def percentage(self) -> float:
+        return round(100.0 * self.current / self.total, 1) if self.total else 100.0
+
+    @property
+    def rate(self) -> float:
+        """Cards per second since the phase started."""
+        return round(self.current / self.elapsed, 2) if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {**asdict(self), "percentage": self.percentage, "rate": self.rate}
+
+
+class ProgressSink:
+    """Receives a processor's progress. Every hook is optional; the base class ignores everything."""
+
+    def on_progress(self, event: ProgressEvent) -> None:
+        """A phase advanced (throttled), or finished when event.done is set."""
+
+    def message(self, text: str) -> None:
+        """A human-readable status line (write summaries, cards not found)."""
+
+
+class CallbackSink(ProgressSink):
+    """Forwards events to a callback and status lines to the log (API jobs)."""
+
+    def __init__(self, callback: Callable[[ProgressEvent], None]):
+        self._callback = callback
+
+    def on_progress(self, event: ProgressEvent) -> None:
+        self._callback(event)
+
+    def message(self, text: str) -> None:
+        logger.info(text.strip())
+
+
+class TqdmSink(ProgressSink):
+    """Terminal progress bars for the CLI: one tqdm bar per phase, cards not found as its postfix."""
+
+    def __init__(self) -> None:
+        self._bars: Dict[str, tqdm] = {}
+
+    def on_progress(self, event: ProgressEvent) -> None:
+        bar = self._bars.get(event.phase)
+        if bar is None:
+            bar = tqdm(total=event.total, desc=PHASE_LABELS.get(event.phase, event.phase), unit="cards")
+            self._bars[event.phase] = bar
+        bar.set_postfix_str(f"not found: {event.errors}", refresh=False)
+        bar.update(event.current - bar.n)
+        if event.done:
+            bar.close()
+            del self._bars[event.phase]
+
+    def message(self, text: str) -> None:
+        tqdm.write(text)
+
+
+class PhaseProgress:
+    """Counts the cards of one phase and reports them to a sink at a throttled cadence.
+
+    Only the thread that drives the phase (the processors' writer loop) calls advance().
+    """
+
+    def __init__(
+        self,
+        sink: ProgressSink,
+        phase: str,
+        total: int,
+        cancel_token: Optional[CancelToken] = None,
+        errors: Callable[[], int] = lambda: 0,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ):
+        self.sink = sink
+        self.phase = phase
+        self.total = total
+        self.current = 0
+        self._cancel_token = cancel_token
+        self._errors = errors
+        self._min_interval = min_interval
+        self._started = time.monotonic()
+        self._last_emit: Optional[float] = None
+
+    def check(self) -> None:
+        """Raise JobCancelled when the job has been cancelled."""
+        if self._cancel_token is not None:
+            self._cancel_token.raise_if_cancelled()
+
+    def guard(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield *items*, checking for cancellation before each (stops handing out new batches)."""
+        for item in items:
+            self.check()
+            yield item
+
+    def start(self) -> None:
+        self._emit(time.monotonic(), done=False)
+
+    def advance(self, n: int) -> None:
+        self.current += n
+        now = time.monotonic()
+        if self._last_emit is None or now - self._last_emit >= self._min_interval:
+            self._emit(now, done=False)
+        self.check()
+
+    def close(self) -> None:
+        self._emit(time.monotonic(), done=True)
+
+    def _emit(self, now: float, done: bool) -> None:
+        self._last_emit = now
+        self.sink.on_progress(
+            ProgressEvent(
+                phase=self.phase,
+                current=self.current,
+                total=self.total,
+                errors=self._errors(),
+                elapsed=round(now - self._started, 3),
+                done=done,
+            )
+        )
@@ -0,0 +1,273 @@
+"""Rate limiting primitives shared by every component that talks to Scryfall."""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. A caller
+    reserves a token and is told how long to wait before using it; the balance may
+    go negative, so concurrent callers queue up behind each other instead of
+    racing. Because the lock is never held while sleeping, the same bucket can be
+    drawn from by worker threads (``acquire``) and by coroutines (``reserve`` plus
+    ``asyncio.sleep``). A rate of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Change the refill rate (and optionally the burst capacity) without losing queued debt."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+            if capacity is not None:
+                self.capacity = float(capacity)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take *tokens* from the bucket and return the seconds the caller must wait before proceeding."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the calling thread until *tokens* are available. Returns the time slept."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+def parse_retry_after(value: Optional[str], clock: Callable[[], float] = time.time) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date); None when absent or invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - clock())
+
+
+def retry_delay(base: float, attempt: int, exc: Exception) -> float:
+    """Exponential backoff for *attempt*, stretched to the Retry-After sent with the failed response."""
+    response = getattr(exc, "response", None)
+    retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+    return max(retry_after or 0.0, base * (2**attempt))
+
+
+class AdaptiveController:
+    """AIMD controller for Scryfall traffic: in-flight concurrency plus request spacing.
+
+    Every request holds a slot (enter/exit, or the slot()/aslot() context managers)
+    and reports its outcome through observe(). Successes at normal latency grow the
+    concurrency limit and the token bucket's rate additively, by roughly one slot and
+    ``rate_step`` requests per second each round trip; a 429, a 5xx, a network error
+    or latency above ``latency_tolerance`` times the best latency seen for that host
+    halves both (at most once per ``decrease_interval``, so one burst of throttled
+    responses counts as one signal). A Retry-After header also pauses every new
+    request until it has passed. The limits never leave [min, max].
+    """
+
+    def __init__(
+        self,
+        limiter: TokenBucket,
+        min_rate: float = 1.0,
+        max_rate: float = 20.0,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        initial_concurrency: Optional[int] = None,
+        rate_step: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        decrease_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limiter = limiter
+        self._clock = clock
+        self._cond = threading.Condition()
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(max_concurrency, min_concurrency)
+        self.rate_step = rate_step
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.decrease_interval = decrease_interval
+        start = initial_concurrency if initial_concurrency is not None else self.max_concurrency
+        self._limit = float(min(max(start, self.min_concurrency), self.max_concurrency))
+        self._rate = min(max(limiter.rate or self.max_rate, self.min_rate), self.max_rate)
+        self.limiter.set_rate(self._rate)
+        self.in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        # host -> [smoothed latency, best smoothed latency seen]
+        self._latency: Dict[str, List[float]] = {}
+        self.throttled = 0
+        self.decreases = 0
+
+    @property
+    def concurrency(self) -> int:
+        return int(self._limit)
+
+    def set_rate_bounds(self, min_rate: float, max_rate: float) -> None:
+        """Move the rate limits, pulling the current rate inside them (the learnt rate is kept otherwise)."""
+        with self._cond:
+            self.min_rate = min_rate
+            self.max_rate = max(max_rate, min_rate)
+            rate = min(max(self._rate, self.min_rate), self.max_rate)
+            if rate != self._rate:
+                self._rate = rate
+                self.limiter.set_rate(rate)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limits and counters (for logs and job results)."""
+        with self._cond:
+            return {
+                "concurrency": int(self._limit),
+                "rate": round(self._rate, 2),
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+                "decreases": self.decreases,
+            }
+
+    def _try_enter(self) -> float:
+        """Take a slot and return 0, or return how long to wait before trying again (lock held)."""
+        paused = self._paused_until - self._clock()
+        if paused > 0:
+            return paused
+        if self.in_flight < int(self._limit):
+            self.in_flight += 1
+            return 0.0
+        return 0.05
+
+    def enter(self) -> None:
+        """Block the calling thread until a request slot is free (and no Retry-After pause is active)."""
+        with self._cond:
+            while True:
+                wait = self._try_enter()
+                if wait <= 0:
+                    return
+                self._cond.wait(wait)
+
+    async def enter_async(self) -> None:
+        """Coroutine version of enter(); waits with asyncio.sleep instead of blocking the loop."""
+        while True:
+            with self._cond:
+                wait = self._try_enter()
+            if wait <= 0:
+                return
+            await asyncio.sleep(min(wait, 0.05))
+
+    def exit(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.enter()
+        try:
+            yield
+        finally:
+            self.exit()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        await self.enter_async()
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def observe(
+        self,
+        latency: Optional[float],
+        status: Optional[int],
+        retry_after: Optional[float] = None,
+        host: str = "",
+    ) -> None:
+        """Feed back one finished request: its round-trip time, HTTP status (None for a network
+        error) and Retry-After seconds, if the response carried one."""
+        with self._cond:
+            now = self._clock()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if status is None or status == 429 or status >= 500:
+                if status == 429:
+                    self.throttled += 1
+                self._decrease(now)
+                return
+            if latency is None:
+                return
+            stats = self._latency.get(host)
+            if stats is None:
+                stats = self._latency[host] = [latency, latency]
+            else:
+                stats[0] = 0.8 * stats[0] + 0.2 * latency
+                # Let the baseline creep up slowly, so a permanently slower network is re-learnt
+                stats[1] = min(stats[1] * 1.001, stats[0])
+            if stats[0] > stats[1] * self.latency_tolerance:
+                self._decrease(now)
+            else:
+                self._increase()
+
+    def _increase(self) -> None:
+        grew = int(self._limit)
+        self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+        rate = min(self.max_rate, self._rate + self.rate_step / max(self._rate, 1.0))
+        if rate != self._rate:
+            self._rate = rate
+            self.limiter.set_rate(rate)
+        if int(self._limit) > grew:
+            self._cond.notify()
+
+    def _decrease(self, now: float) -> None:
+        if now - self._last_decrease < self.decrease_interval:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self._limit = max(float(self.min_concurrency), self._limit * self.backoff)
+        self._rate = max(self.min_rate, self._rate * self.backoff)
+        self.limiter.set_rate(self._rate)
+        logger.debug(f"Scryfall traffic backed off to {int(self._limit)} in flight, {self._rate:.1f} req/s")
@@ -0,0 +1,213 @@
+"""Persistent cache for Scryfall JSON responses.
+
+CardFetcher consults the cache before every request. Fresh entries are served
+without touching the network; expired entries that carry an ETag or
+Last-Modified header are revalidated with a conditional GET, so a 304 costs a
+round trip but no body. The default backend is a single SQLite file that
+survives process restarts and is shared by every thread pointing at the same
+path.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+@dataclass
+class CachedResponse:
+    """One cached response body plus the validators needed to revalidate it."""
+
+    body: Any
+    stored_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+def cache_key(method: str, url: str, payload: Optional[Dict[str, Any]] = None) -> str:
+    """Normalize a request into a cache key.
+
+    Scheme and host are lower-cased and query parameters sorted, so the same
+    lookup built in a different order hits the same entry. POST bodies are
+    folded in as a hash of their canonical JSON.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+    key = f"{method.upper()} {normalized}"
+    if payload is not None:
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+        key = f"{key} {digest}"
+    return key
+
+
+def revalidation_headers(cached: Optional[CachedResponse]) -> Dict[str, str]:
+    """Conditional request headers for an expired entry (empty when there is nothing to revalidate)."""
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+class ResponseCache(ABC):
+    """Storage backend for cached Scryfall responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for *key* (fresh or not), or None."""
+
+    @abstractmethod
+    def put(
+        self,
+        key: str,
+        body: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store *body* under *key*, fresh for *ttl* seconds."""
+
+    @abstractmethod
+    def touch(self, key: str, ttl: float) -> None:
+        """Mark an entry fresh for another *ttl* seconds (after a 304)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class SQLiteResponseCache(ResponseCache):
+    """ResponseCache stored in one SQLite file, evicting least recently used entries past max_bytes."""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, clock=time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at, expires_at, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (self._clock(), key))
+            self._conn.commit()
+        body, stored_at, expires_at, etag, last_modified = row
+        return CachedResponse(json.loads(body), stored_at, expires_at, etag, last_modified)
+
+    def put(
+        self,
+        key: str,
+        body: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        encoded = json.dumps(body, separators=(",", ":"))
+        size = len(encoded.encode())
+        if size > self.max_bytes:
+            return
+        now = self._clock()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, body, etag, last_modified, stored_at, expires_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, encoded, etag, last_modified, now, now + ttl, now, size),
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the file is back under 90% of max_bytes."""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def touch(self, key: str, ttl: float) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now + ttl, now, key),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_caches: Dict[Tuple[str, int], SQLiteResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_response_cache(path: str, max_bytes: int) -> SQLiteResponseCache:
+    """Return the process-wide cache for *path*, opening the SQLite file on first use."""
+    key = (os.path.abspath(path), max_bytes)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = SQLiteResponseCache(path, max_bytes=max_bytes)
+        return cache
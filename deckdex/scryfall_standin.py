@@ -0,0 +1,371 @@
+"""Local stand-in for the Scryfall API, for offline tests and fetch-pipeline benchmarks.
+
+Serves the endpoints deckdex uses (/cards/named, /cards/search,
+/cards/autocomplete, /cards/collection and the default-cards bulk data) from
+an in-memory card set: either a recorded fixture (any Scryfall bulk-data or
+card-list JSON file) or synthetic cards. Latency, 429 responses and server
+errors can be injected to see how the pipeline behaves when Scryfall does.
+
+Point a profile at it with scryfall.base_url (or DECKDEX_SCRYFALL_BASE_URL).
+
+Usage:
+  python -m deckdex.scryfall_standin --cards 5000 --port 8765 --latency 0.05
+  python -m deckdex.scryfall_standin --fixture default-cards.json --rate-limit-ratio 0.02
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Scryfall pages search results at 175 cards
+_SEARCH_PAGE_SIZE = 175
+_REGEX_TERM_RE = re.compile(r"^/(.+)/i$")
+
+_ADJECTIVES = ["Ancient", "Blazing", "Silent", "Verdant", "Hollow", "Gilded", "Feral", "Radiant", "Grim", "Storm"]
+_NOUNS = ["Dragon", "Archivist", "Colossus", "Wisp", "Bargain", "Tithe", "Sentinel", "Rebuke", "Growth", "Oracle"]
+_COLORS = ["W", "U", "B", "R", "G"]
+_RARITIES = ["common", "uncommon", "rare", "mythic"]
+
+
+@dataclass
+class StandinOptions:
+    """Fault and latency injection for the stand-in.
+
+    Attributes:
+        latency: Seconds added before every response
+        jitter: Extra random delay, uniform in [0, jitter] seconds
+        rate_limit_ratio: Fraction of requests answered with 429 Too Many Requests
+        error_ratio: Fraction of requests answered with 500 Internal Server Error
+        seed: Seed for the injection RNG (reproducible runs)
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_ratio: float = 0.0
+    error_ratio: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency < 0 or self.jitter < 0:
+            raise ValueError("latency and jitter must be >= 0")
+        if not (0 <= self.rate_limit_ratio <= 1) or not (0 <= self.error_ratio <= 1):
+            raise ValueError("rate_limit_ratio and error_ratio must be between 0 and 1")
+
+
+def synthetic_cards(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate *count* Scryfall-shaped card objects with unique multi-word names and EUR prices."""
+    rng = random.Random(seed)
+    cards = []
+    for i in range(count):
+        color = rng.choice(_COLORS)
+        cmc = rng.randint(0, 7)
+        eur = round(rng.uniform(0.05, 40.0), 2)
+        cards.append(
+            {
+                "object": "card",
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "oracle_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "name": f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {i + 1}",
+                "type_line": "Creature — Synthetic",
+                "oracle_text": "Flying",
+                "mana_cost": "{" + str(cmc) + "}{" + color + "}" if cmc else "{" + color + "}",
+                "cmc": float(cmc + 1),
+                "colors": [color],
+                "color_identity": [color],
+                "keywords": ["Flying"],
+                "power": str(rng.randint(0, 6)),
+                "toughness": str(rng.randint(1, 6)),
+                "rarity": rng.choice(_RARITIES),
+                "set": "syn",
+                "set_name": "Synthetic",
+                "collector_number": str(i + 1),
+                "released_at": "2024-01-01",
+                "edhrec_rank": rng.randint(1, 30000),
+                "legalities": {"commander": "legal"},
+                "prices": {"eur": f"{eur:.2f}", "usd": f"{eur * 1.1:.2f}", "usd_foil": None},
+            }
+        )
+    return cards
+
+
+def load_fixture(path: str) -> List[Dict[str, Any]]:
+    """Load recorded cards: a bulk-data array, or a Scryfall list object ({"data": [...]})."""
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    if isinstance(payload, dict):
+        payload = payload.get("data") or []
+    return [card for card in payload if isinstance(card, dict) and card.get("name")]
+
+
+class CardStore:
+    """In-memory indexes answering the Scryfall lookups the stand-in serves."""
+
+    def __init__(self, cards: Iterable[Dict[str, Any]]):
+        self.cards: List[Dict[str, Any]] = list(cards)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_print: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for card in self.cards:
+            if card.get("id"):
+                self._by_id[str(card["id"]).lower()] = card
+            name = card["name"].lower()
+            self._by_name.setdefault(name, card)
+            if " // " in name:
+                self._by_name.setdefault(name.split(" // ")[0], card)
+            if card.get("set") and card.get("collector_number"):
+                self._by_print[(card["set"].lower(), str(card["collector_number"]).lower())] = card
+
+    def named_exact(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._by_name.get(name.strip().lower())
+
+    def named_fuzzy(self, name: str) -> Optional[Dict[str, Any]]:
+        """Exact match, else the first card whose name contains every word of *name*."""
+        card = self.named_exact(name)
+        if card is not None:
+            return card
+        words = name.lower().split()
+        if not words:
+            return None
+        for key, card in self._by_name.items():
+            if all(word in key for word in words):
+                return card
+        return None
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Subset of Scryfall syntax: !"exact name", /regex/i terms, otherwise name substrings."""
+        query = query.strip()
+        if query.startswith('!"') and query.endswith('"'):
+            card = self.named_exact(query[2:-1])
+            return [card] if card else []
+        terms = query.split()
+        patterns = []
+        for term in terms:
+            match = _REGEX_TERM_RE.match(term)
+            try:
+                patterns.append(re.compile(match.group(1) if match else re.escape(term), re.IGNORECASE))
+            except re.error:
+                return []
+        return [card for card in self.cards if all(p.search(card["name"]) for p in patterns)]
+
+    def autocomplete(self, q: str) -> List[str]:
+        q = q.strip().lower()
+        if len(q) < 2:
+            return []
+        return [card["name"] for card in self.cards if card["name"].lower().startswith(q)][:20]
+
+    def collection(self, identifiers: List[Dict[str, str]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        found, not_found = [], []
+        for ident in identifiers:
+            card = None
+            if "id" in ident:
+                card = self._by_id.get(str(ident["id"]).lower())
+            elif "set" in ident and "collector_number" in ident:
+                card = self._by_print.get((ident["set"].lower(), str(ident["collector_number"]).lower()))
+            elif "name" in ident:
+                card = self.named_exact(ident["name"])
+            if card is None:
+                not_found.append(ident)
+            else:
+                found.append(card)
+        return found, not_found
+
+
+class ScryfallStandin:
+    """Threaded HTTP server answering Scryfall requests from a CardStore.
+
+    Use as a context manager, or call start() / stop(). base_url is valid after start().
+    """
+
+    def __init__(
+        self,
+        store: CardStore,
+        options: Optional[StandinOptions] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.store = store
+        self.options = options or StandinOptions()
+        self._rng = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ScryfallStandin":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="scryfall-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ScryfallStandin":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _injected_status(self) -> Optional[int]:
+        """429 / 500 according to the configured ratios, else None."""
+        if not (self.options.rate_limit_ratio or self.options.error_ratio):
+            return None
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.options.rate_limit_ratio:
+            return 429
+        if roll < self.options.rate_limit_ratio + self.options.error_ratio:
+            return 500
+        return None
+
+    def _delay(self) -> None:
+        delay = self.options.latency
+        if self.options.jitter:
+            with self._lock:
+                delay += self._rng.uniform(0, self.options.jitter)
+        if delay:
+            time.sleep(delay)
+
+    def route(self, method: str, path: str, query: Dict[str, str], body: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        """Answer one request: (status, JSON payload)."""
+        store = self.store
+        if method == "GET" and path == "/cards/named":
+            if "exact" in query:
+                card = store.named_exact(query["exact"])
+            else:
+                card = store.named_fuzzy(query.get("fuzzy", ""))
+            return (200, card) if card else (404, _error("not_found", "No cards found matching that name."))
+        if method == "GET" and path == "/cards/search":
+            cards = store.search(query.get("q", ""))
+            if not cards:
+                return 404, _error("not_found", "Your query didn't match any cards.")
+            page = cards[:_SEARCH_PAGE_SIZE]
+            return 200, {
+                "object": "list",
+                "total_cards": len(cards),
+                "has_more": len(cards) > len(page),
+                "data": page,
+            }
+        if method == "GET" and path == "/cards/autocomplete":
+            data = store.autocomplete(query.get("q", ""))
+            return 200, {"object": "catalog", "total_values": len(data), "data": data}
+        if method == "POST" and path == "/cards/collection":
+            identifiers = (body or {}).get("identifiers") or []
+            if len(identifiers) > 75:
+                return 422, _error("bad_request", "Too many identifiers (maximum 75).")
+            found, not_found = store.collection(identifiers)
+            return 200, {"object": "list", "not_found": not_found, "data": found}
+        if method == "GET" and path == "/bulk-data/default-cards":
+            return 200, {
+                "object": "bulk_data",
+                "type": "default_cards",
+                "download_uri": f"{self.base_url}/bulk/default-cards.json",
+                "size": len(store.cards),
+            }
+        if method == "GET" and path == "/bulk/default-cards.json":
+            return 200, store.cards
+        return 404, _error("not_found", f"Unknown endpoint {method} {path}")
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self, method: str) -> None:
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                body = None
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    try:
+                        body = json.loads(self.rfile.read(length))
+                    except ValueError:
+                        body = None
+                standin._delay()
+                status = standin._injected_status()
+                if status == 429:
+                    payload = _error("rate_limited", "Too many requests.")
+                elif status == 500:
+                    payload = _error("internal_error", "Injected server error.")
+                else:
+                    status, payload = standin.route(method, parts.path, query, body)
+                with standin._lock:
+                    standin.requests[parts.path] += 1
+                    standin.statuses[status] += 1
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _error(code: str, details: str) -> Dict[str, Any]:
+    return {"object": "error", "code": code, "details": details}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a local Scryfall stand-in")
+    parser.add_argument("--fixture", help="Scryfall bulk-data / card list JSON to serve (default: synthetic cards)")
+    parser.add_argument("--cards", type=int, default=5000, help="Synthetic cards to generate without --fixture")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, up to this many seconds")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--error-ratio", type=float, default=0.0, help="Fraction of requests answered 500")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    cards = load_fixture(args.fixture) if args.fixture else synthetic_cards(args.cards, seed=args.seed or 0)
+    options = StandinOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        seed=args.seed,
+    )
+    standin = ScryfallStandin(CardStore(cards), options, host=args.host, port=args.port)
+    print(f"Scryfall stand-in serving {len(cards)} cards at {standin.base_url} (Ctrl+C to stop)")
+    try:
+        standin._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Shared HTTP transport for Scryfall: pooled keep-alive session plus a process-wide rate limit.
+
+Every CardFetcher, the importer, the card image service and the catalog sync job go
+through the same ScryfallTransport, so TLS connections are reused across lookups and
+the combined request rate of all worker threads stays at the configured ceiling.
+With scryfall.adaptive the transport also owns the AdaptiveController that tunes that
+ceiling and the number of requests in flight from what Scryfall answers.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import ScryfallConfig
+from .metrics import RunMetrics
+from .rate_limiter import AdaptiveController, TokenBucket, parse_retry_after
+
+# Scryfall asks API clients to identify themselves and to send an Accept header.
+_DEFAULT_HEADERS = {
+    "User-Agent": "DeckDexMTG/0.1",
+    "Accept": "application/json;q=0.9,*/*;q=0.8",
+}
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """Create a requests.Session whose connection pool can hold *pool_size* keep-alive connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(_DEFAULT_HEADERS)
+    return session
+
+
+class ScryfallTransport:
+    """Thread-safe HTTP client: one pooled session, one token bucket.
+
+    Each call to request() draws one token from the limiter before touching the
+    network, so retries and image downloads count against the same budget as
+    card lookups.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ScryfallConfig] = None,
+        session: Optional[requests.Session] = None,
+        limiter: Optional[TokenBucket] = None,
+    ):
+        config = config or ScryfallConfig()
+        self.timeout = config.timeout
+        self.session = session or _build_session(config.pool_size)
+        self.limiter = limiter or TokenBucket(config.requests_per_second, capacity=config.burst)
+        self.controller: Optional[AdaptiveController] = _build_controller(config, self.limiter)
+
+    def configure(self, config: ScryfallConfig) -> None:
+        """Apply the rate settings of *config* to the shared limiter (pool size is fixed at creation).
+
+        While adaptive control stays on, the controller keeps the rate it has learnt and only its
+        bounds follow the new config (clamped to the new requests_per_second ceiling); burst
+        always applies.
+        """
+        if config.adaptive and self.controller is not None:
+            if self.limiter.capacity != config.burst:
+                self.limiter.set_rate(self.limiter.rate, capacity=config.burst)
+            self.controller.set_rate_bounds(*config.adaptive_rate_bounds)
+            self.controller.max_concurrency = config.max_concurrency
+            self.controller.latency_tolerance = config.latency_tolerance
+        else:
+            if self.limiter.rate != config.requests_per_second or self.limiter.capacity != config.burst:
+                self.limiter.set_rate(config.requests_per_second, capacity=config.burst)
+            self.controller = _build_controller(config, self.limiter)
+        self.timeout = config.timeout
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send one rate-limited request through the pooled session.
+
+        Under adaptive control the request also holds a concurrency slot, and its latency,
+        status and Retry-After are reported back (streamed bulk downloads only count errors).
+        A RunMetrics passed as ``metrics`` counts the request ("requests") and gets the time
+        spent waiting for the limiter ("rate_limit_wait") and the round-trip latency.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        metrics: Optional[RunMetrics] = kwargs.pop("metrics", None)
+        called = time.monotonic()
+        controller = self.controller
+        if controller is None:
+            self.limiter.acquire()
+            started = time.monotonic()
+            if metrics is not None:
+                metrics.count("requests")
+                metrics.add_time("rate_limit_wait", started - called)
+            response = self.session.request(method, url, **kwargs)
+            if metrics is not None:
+                metrics.observe_fetch(time.monotonic() - started)
+            return response
+
+        host = urlsplit(url).netloc
+        with controller.slot():
+            self.limiter.acquire()
+            started = time.monotonic()
+            if metrics is not None:
+                metrics.count("requests")
+                metrics.add_time("rate_limit_wait", started - called)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException:
+                controller.observe(None, None, host=host)
+                raise
+            latency = None if kwargs.get("stream") else time.monotonic() - started
+            if metrics is not None and latency is not None:
+                metrics.observe_fetch(latency)
+            controller.observe(
+                latency, response.status_code, parse_retry_after(response.headers.get("Retry-After")), host=host
+            )
+            return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _build_controller(config: ScryfallConfig, limiter: TokenBucket) -> Optional[AdaptiveController]:
+    """AdaptiveController for *config*, or None when scryfall.adaptive is off."""
+    if not config.adaptive:
+        return None
+    min_rate, max_rate = config.adaptive_rate_bounds
+    return AdaptiveController(
+        limiter,
+        min_rate=min_rate,
+        max_rate=max_rate,
+        max_concurrency=config.max_concurrency,
+        initial_concurrency=min(config.pool_size, config.max_concurrency),
+        latency_tolerance=config.latency_tolerance,
+    )
+
+
+_shared_transport: Optional[ScryfallTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport(config: Optional[ScryfallConfig] = None) -> ScryfallTransport:
+    """Return the process-wide ScryfallTransport, creating it on first use.
+
+    When *config* is given, its rate settings are applied to the shared limiter so
+    the most recently loaded profile wins; the pooled session is always reused.
+    """
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = ScryfallTransport(config)
+        elif config is not None:
+            _shared_transport.configure(config)
+        return _shared_transport
+
+
+def reset_transport() -> None:
+    """Close and drop the shared transport (used by tests and after fork)."""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is not None:
+            _shared_transport.close()
+        _shared_transport = None
@@ -0,0 +1,79 @@
+"""COPY-based bulk loading for Postgres.
+
+copy_into_staging() streams rows into a temporary table with one COPY ... FROM STDIN
+instead of one INSERT per row. Callers then move the staged rows into the real table
+with set-based SQL on the same connection and commit; the staging table is dropped on
+commit (see PostgresCollectionRepository.replace_all and merge_all).
+"""
+
+from typing import Any, Iterable, Iterator, Sequence
+
+# Staging column holding each row's position in the input, so INSERT ... SELECT can keep it
+LOAD_ORDER = "load_order"
+
+# COPY text format: tab-separated fields, \N for NULL, backslash escapes for separators
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_field(value: Any) -> str:
+    """One field in COPY text format."""
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class CopyStream:
+    """Read-only file object that renders rows in COPY text format as the driver reads them,
+    so a large batch is never held in memory as one string."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._lines: Iterator[str] = ("\t".join(copy_field(v) for v in row) + "\n" for row in rows)
+        self._buffer = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        buffered = len(self._buffer)
+        while size < 0 or buffered < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            parts.append(line)
+            buffered += len(line)
+            self.rows += 1
+        data = "".join(parts)
+        if size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def copy_into_staging(
+    conn,
+    source_table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    staging: str,
+) -> int:
+    """Create temp table *staging* with *source_table*'s types for *columns* (plus load_order)
+    and COPY *rows* into it. Returns the number of rows copied.
+
+    conn is a SQLAlchemy Connection on psycopg2; the COPY runs in its open transaction.
+    Table and column names are interpolated and must come from code, never from input.
+    """
+    from sqlalchemy import text
+
+    column_list = ", ".join(columns)
+    conn.execute(
+        text(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list}, 0::BIGINT AS {LOAD_ORDER} FROM {source_table} WITH NO DATA"
+        )
+    )
+    stream = CopyStream((*row, position) for position, row in enumerate(rows))
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {staging} ({column_list}, {LOAD_ORDER}) FROM STDIN", stream)
+    finally:
+        cursor.close()
+    return stream.rows
@@ -77,6 +77,48 @@ class JobRepository:
             conn.commit()
         logger.debug(f"Job {job_id} updated: status={status}")
 
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """Store the job's resume cursor (last committed card id plus counters)."""
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            conn.execute(
+                text("UPDATE jobs SET checkpoint = CAST(:checkpoint AS jsonb) WHERE id = CAST(:id AS uuid)"),
+                {"id": job_id, "checkpoint": json.dumps(checkpoint)},
+            )
+            conn.commit()
+
+    def get_resume_checkpoint(
+        self, user_id: Optional[int], job_type: str, scope: str, exclude_job_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Checkpoint of the user's latest job of this type, if that job did not complete and ran with the same scope.
+
+        A completed run (or one without a checkpoint) means the next job starts from the beginning.
+        """
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    SELECT status, checkpoint
+                    FROM jobs
+                    WHERE user_id IS NOT DISTINCT FROM :user_id
+                      AND type = :type
+                      AND id IS DISTINCT FROM CAST(:exclude AS uuid)
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                """),
+                {"user_id": user_id, "type": job_type, "exclude": exclude_job_id},
+            ).fetchone()
+        if row is None or row[0] == "complete" or not row[1]:
+            return None
+        checkpoint = row[1]
+        if checkpoint.get("scope") != scope:
+            return None
+        return checkpoint
+
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Return a single job row by UUID, or None if not found."""
         from sqlalchemy import text
@@ -86,7 +128,8 @@ class JobRepository:
             row = (
                 conn.execute(
                     text("""
-                        SELECT id, user_id, type, status, created_at, completed_at, result
+                        SELECT id, user_id, type, status, created_at, completed_at, result, checkpoint,
+                               progress, worker_id
                         FROM jobs
                         WHERE id = CAST(:id AS uuid)
                     """),
@@ -105,10 +148,17 @@ class JobRepository:
             "created_at": row["created_at"].isoformat() if row["created_at"] else None,
             "completed_at": row["completed_at"].isoformat() if row["completed_at"] else None,
             "result": row["result"],
+            "checkpoint": row["checkpoint"],
+            "progress": row["progress"],
+            "worker_id": row["worker_id"],
         }
 
     def mark_orphans_as_error(self, message: str = "Server restarted while job was running") -> int:
-        """Mark all running jobs as error. Returns count of affected rows."""
+        """Mark all running jobs run by the API process as error. Returns count of affected rows.
+
+        Jobs claimed by a worker process are left alone (see fail_stale_jobs). Their checkpoints
+        are kept, so re-triggering the same job resumes where it stopped.
+        """
         from sqlalchemy import text
 
         engine = self._get_engine()
@@ -120,13 +170,164 @@ class JobRepository:
                     SET status = 'error',
                         completed_at = NOW() AT TIME ZONE 'utc',
                         result = CAST(:result AS jsonb)
-                    WHERE status = 'running'
+                    WHERE status = 'running' AND worker_id IS NULL
                 """),
                 {"result": result_payload},
             )
             conn.commit()
         return result.rowcount
 
+    # ------------------------------------------------------------------
+    # Queue (jobs.queue): the API enqueues, worker processes claim and run
+    # ------------------------------------------------------------------
+
+    def enqueue_job(self, user_id: Optional[int], job_type: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Insert a job row with status='queued' for a worker to claim. Returns the job UUID."""
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    INSERT INTO jobs (user_id, type, status, params)
+                    VALUES (:user_id, :type, 'queued', CAST(:params AS jsonb))
+                    RETURNING id
+                """),
+                {"user_id": user_id, "type": job_type, "params": json.dumps(params or {})},
+            ).fetchone()
+            conn.commit()
+        return str(row[0])
+
+    def get_active_job_id(self, user_id: Optional[int], job_type: str) -> Optional[str]:
+        """Id of the user's queued or running job of this type, or None."""
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    SELECT id FROM jobs
+                    WHERE user_id IS NOT DISTINCT FROM :user_id
+                      AND type = :type
+                      AND status IN ('queued', 'running')
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                """),
+                {"user_id": user_id, "type": job_type},
+            ).fetchone()
+        return str(row[0]) if row else None
+
+    def claim_next_job(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to 'running' for this worker and return it.
+
+        FOR UPDATE SKIP LOCKED lets any number of workers poll at once: each queued row is
+        claimed by exactly one of them and nobody waits on another worker's lock.
+        """
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = (
+                conn.execute(
+                    text("""
+                        UPDATE jobs
+                        SET status = 'running',
+                            worker_id = :worker_id,
+                            started_at = NOW() AT TIME ZONE 'utc',
+                            heartbeat_at = NOW() AT TIME ZONE 'utc'
+                        WHERE id = (
+                            SELECT id FROM jobs
+                            WHERE status = 'queued'
+                            ORDER BY created_at
+                            LIMIT 1
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING id, user_id, type, params
+                    """),
+                    {"worker_id": worker_id},
+                )
+                .mappings()
+                .fetchone()
+            )
+            conn.commit()
+        if row is None:
+            return None
+        return {
+            "job_id": str(row["id"]),
+            "user_id": row["user_id"],
+            "type": row["type"],
+            "params": row["params"] or {},
+        }
+
+    def heartbeat(self, job_id: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """Refresh the job's heartbeat (and progress, when given). Returns True if cancellation was requested."""
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    UPDATE jobs
+                    SET heartbeat_at = NOW() AT TIME ZONE 'utc',
+                        progress = COALESCE(CAST(:progress AS jsonb), progress)
+                    WHERE id = CAST(:id AS uuid)
+                    RETURNING cancel_requested
+                """),
+                {"id": job_id, "progress": json.dumps(progress) if progress is not None else None},
+            ).fetchone()
+            conn.commit()
+        return bool(row and row[0])
+
+    def request_cancel(self, job_id: str, user_id: Optional[int]) -> Optional[str]:
+        """Ask the worker running this job to stop; a job still queued is cancelled at once.
+
+        Returns the job's status after the request, or None if the user has no such queued or running job.
+        """
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    UPDATE jobs
+                    SET cancel_requested = TRUE,
+                        status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE status END,
+                        completed_at = CASE WHEN status = 'queued' THEN NOW() AT TIME ZONE 'utc'
+                                            ELSE completed_at END
+                    WHERE id = CAST(:id AS uuid)
+                      AND user_id IS NOT DISTINCT FROM :user_id
+                      AND status IN ('queued', 'running')
+                    RETURNING status
+                """),
+                {"id": job_id, "user_id": user_id},
+            ).fetchone()
+            conn.commit()
+        return row[0] if row else None
+
+    def fail_stale_jobs(self, heartbeat_timeout: float, message: str = "Worker stopped sending heartbeats") -> int:
+        """Mark worker-run jobs whose heartbeat is older than heartbeat_timeout seconds as error.
+
+        Returns count of affected rows. Checkpoints are kept, so re-triggering the job resumes.
+        """
+        from sqlalchemy import text
+
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            result = conn.execute(
+                text("""
+                    UPDATE jobs
+                    SET status = 'error',
+                        completed_at = NOW() AT TIME ZONE 'utc',
+                        result = CAST(:result AS jsonb)
+                    WHERE status = 'running'
+                      AND worker_id IS NOT NULL
+                      AND heartbeat_at < (NOW() AT TIME ZONE 'utc') - make_interval(secs => :timeout)
+                """),
+                {"result": json.dumps({"error": message}), "timeout": heartbeat_timeout},
+            )
+            conn.commit()
+        return result.rowcount
+
     def get_job_history(self, user_id: int, limit: int = 50) -> List[Dict[str, Any]]:
         """Return recent jobs for a user, ordered by created_at DESC."""
         from sqlalchemy import text
@@ -1,10 +1,16 @@
 """Collection repository: abstract interface and Postgres implementation."""
 
+import base64
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
+from ..colors import letters_to_mask, mask_to_identity
+from .bulk_load import LOAD_ORDER, copy_into_staging
+
 
 def _is_incomplete_card(card: Dict[str, Any]) -> bool:
     """True if card looks like 'new added' with only name (missing type_line / main Scryfall fields)."""
@@ -35,6 +41,8 @@ def _row_to_card(row: Dict[str, Any]) -> Dict[str, Any]:
         "cmc": row.get("cmc"),
         "colors": row.get("colors"),
         "color_identity": row.get("color_identity"),
+        "colors_mask": row.get("colors_mask"),
+        "color_identity_mask": row.get("color_identity_mask"),
         "power": row.get("power"),
         "toughness": row.get("toughness"),
         "rarity": row.get("rarity"),
@@ -44,6 +52,7 @@ def _row_to_card(row: Dict[str, Any]) -> Dict[str, Any]:
         "set_name": row.get("set_name"),
         "number": row.get("set_number"),
         "edhrec_rank": row.get("edhrec_rank"),
+        "scryfall_id": row.get("scryfall_id"),
         "game_strategy": row.get("game_strategy"),
         "tier": row.get("tier"),
         "created_at": _serialize_created_at(row.get("created_at")),
@@ -67,6 +76,83 @@ def _safe_cmc(value: Any) -> Optional[float]:
         return None
 
 
+def _price_to_float(value: Any) -> Optional[float]:
+    """Parse a stored price string ("1,50", "1.50") for price_history; None for "N/A" / empty."""
+    try:
+        return float(str(value).replace(",", "."))
+    except (TypeError, ValueError):
+        return None
+
+
+# Full-text document of a card; the same expression as idx_cards_search (migration 021)
+_SEARCH_VECTOR = "card_search_vector(name, type_line, description)"
+
+# Columns a card update may set, and API field names that map to a different column
+_UPDATABLE_COLUMNS = frozenset(
+    (
+        "name",
+        "english_name",
+        "type_line",
+        "description",
+        "keywords",
+        "mana_cost",
+        "cmc",
+        "colors",
+        "color_identity",
+        "power",
+        "toughness",
+        "rarity",
+        "set_id",
+        "set_name",
+        "set_number",
+        "release_date",
+        "edhrec_rank",
+        "scryfall_uri",
+        "price_eur",
+        "price_usd",
+        "price_usd_foil",
+        "game_strategy",
+        "tier",
+    )
+)
+_UPDATE_FIELD_MAP = {"type": "type_line", "number": "set_number", "price": "price_eur"}
+
+
+def _update_columns(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Map update fields (API or DB names) to the DB columns they set; unknown fields are dropped."""
+    updates = {}
+    for k, v in fields.items():
+        col = _UPDATE_FIELD_MAP.get(k, k)
+        if col in _UPDATABLE_COLUMNS:
+            if col == "cmc":
+                v = _safe_cmc(v)
+            updates[col] = v
+    return updates
+
+
+def _encode_cursor(sort_by: str, sort_dir: str, value: Any, card_id: int) -> str:
+    """Opaque keyset cursor: the sort it belongs to plus the (sort value, id) of the last row served."""
+    if isinstance(value, Decimal):
+        value = str(value)
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_by, "d": sort_dir, "v": value, "id": card_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, sort_dir: str) -> Tuple[Any, int]:
+    """(sort value, id) from a cursor; ValueError if it is malformed or was issued for another sort."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        value, card_id = data["v"], int(data["id"])
+        issued_for = (data["s"], data["d"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if issued_for != (sort_by, sort_dir):
+        raise ValueError("Cursor was issued for a different sort order")
+    return value, card_id
+
+
 def _card_to_row(card: Dict[str, Any]) -> Dict[str, Any]:
     """Map API-style card dict to DB columns (type_line, set_number, price_eur). CMC normalized for double precision."""
     return {
@@ -97,6 +183,10 @@ def _card_to_row(card: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Columns bulk loads write, in _card_to_row order
+_CARD_ROW_COLUMNS = tuple(_card_to_row({}))
+
+
 class CollectionRepository(ABC):
     """Abstract interface for card collection storage."""
 
@@ -115,8 +205,16 @@ class CollectionRepository(ABC):
         return [c for c in cards if c.get("id") is not None and _is_incomplete_card(c)]
 
     @abstractmethod
-    def get_cards_for_price_update(self, user_id: Optional[int] = None) -> List[tuple]:
-        """Return list of (card_id, name_for_scryfall, current_price_str). If user_id provided, filter by that user."""
+    def get_cards_for_price_update(
+        self, user_id: Optional[int] = None, max_age_hours: Optional[float] = None
+    ) -> List[tuple]:
+        """Return list of (card_id, name_for_scryfall, current_price_str, scryfall_id). If user_id provided, filter by that user.
+
+        scryfall_id is the card's stored printing (None when unknown), so it is priced from that printing.
+
+        With max_age_hours, only cards whose price was last checked longer ago (or never) are returned,
+        never-checked cards first, then by current value (highest first) and age (oldest first).
+        """
         pass
 
     @abstractmethod
@@ -144,6 +242,31 @@ class CollectionRepository(ABC):
         """Replace entire collection with given cards (delete all, insert all). Return count inserted. If user_id provided, replace only user's cards."""
         pass
 
+    def merge_all(self, cards: List[Dict[str, Any]], user_id: Optional[int] = None) -> int:
+        """Add cards to the collection, adding quantities to existing (name, set_id) rows. Return count merged.
+
+        This default reads the collection once, then calls update() or create() per card (cards
+        without a name are skipped); the Postgres repository merges the whole batch set-based.
+        """
+        existing: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for card in self.get_all_cards(user_id=user_id):
+            existing.setdefault((card.get("name") or "", card.get("set_id") or ""), card)
+        merged = 0
+        for card in cards:
+            row = _card_to_row(card)
+            if not row.get("name"):
+                continue
+            key = (row["name"], row.get("set_id") or "")
+            quantity = int(card.get("quantity") or 1)
+            current = existing.get(key)
+            if current is not None:
+                current["quantity"] = int(current.get("quantity") or 1) + quantity
+                self.update(current["id"], {"quantity": current["quantity"]}, user_id=user_id)
+            else:
+                existing[key] = self.create({**card, "quantity": quantity}, user_id=user_id)
+            merged += 1
+        return merged
+
     def get_cards_filtered(
         self,
         user_id: Optional[int],
@@ -172,6 +295,10 @@ class CollectionRepository(ABC):
         all_cards = self.get_all_cards(user_id=user_id)
         return all_cards[offset : offset + limit], len(all_cards)
 
+    def count_cards(self, user_id: Optional[int], filters: Optional[Dict[str, Any]] = None) -> int:
+        """Number of cards (rows, not copies) matching filters; same filter semantics as get_cards_filtered."""
+        return self.get_cards_filtered(user_id, filters, limit=1)[1]
+
     def get_cards_stats(
         self,
         user_id: Optional[int],
@@ -200,7 +327,8 @@ class CollectionRepository(ABC):
         Args:
             user_id: Filter cards by this user.
             filters: Same filter dict as get_cards_filtered.
-            dimension: One of 'rarity', 'color_identity', 'set_name', 'cmc'.
+            dimension: One of 'rarity', 'color_identity', 'set_name', 'cmc'. Color identity
+                labels are canonical WUBRG strings ("WU", "C" for colorless).
             limit: Max rows to return (for top-N use cases).
 
         Returns:
@@ -269,6 +397,42 @@ class CollectionRepository(ABC):
         """Insert a price observation into price_history. No-op for non-Postgres repos."""
         pass
 
+    def bulk_update(self, updates: Sequence[Tuple[int, Dict[str, Any]]]) -> int:
+        """Apply (card_id, fields) updates for many cards. Returns how many cards were updated.
+
+        This default calls update() per card; the Postgres repository writes the
+        whole batch in one transaction.
+        """
+        return sum(1 for card_id, fields in updates if self.update(card_id, fields) is not None)
+
+    def bulk_update_prices(self, changes: Sequence[Tuple[int, str]], source: str = "scryfall") -> int:
+        """Set price_eur for many cards and record numeric prices in price_history.
+
+        changes: (card_id, price_eur) pairs, price_eur as stored on the card ("1,50" or "N/A").
+        Returns the number of cards updated. This default applies the changes one by one;
+        the Postgres repository writes the whole batch in one transaction.
+        """
+        updated = 0
+        for card_id, price in changes:
+            if self.update(card_id, {"price_eur": price}) is not None:
+                updated += 1
+            price_val = _price_to_float(price)
+            if price_val is not None:
+                self.record_price_history(card_id, price_val, source=source)
+        return updated
+
+    def mark_prices_checked(self, card_ids: Sequence[int]) -> int:
+        """Stamp last_price_update on cards whose price was verified unchanged. No-op for non-Postgres repos."""
+        return 0
+
+    def refresh_prices_from_catalog(self, user_id: Optional[int] = None, source: str = "catalog") -> Dict[str, Any]:
+        """Copy prices from catalog_cards onto matching cards and record price_history for changes.
+
+        Returns {"matched_ids": [...], "updated": n, "history_rows": n}. Without a catalog
+        (non-Postgres repos) nothing matches, so callers fall back to Scryfall for every card.
+        """
+        return {"matched_ids": [], "updated": 0, "history_rows": 0}
+
     def get_price_history(
         self,
         card_id: int,
@@ -390,20 +554,35 @@ class PostgresCollectionRepository(CollectionRepository):
                 )
             return [_row_to_card(dict(r)) for r in rows]
 
-    def get_cards_for_price_update(self, user_id: Optional[int] = None) -> List[tuple]:
-        """Return (card_id, name_for_scryfall, current_price_str). Uses english_name for Scryfall when set, else name."""
+    def get_cards_for_price_update(
+        self, user_id: Optional[int] = None, max_age_hours: Optional[float] = None
+    ) -> List[tuple]:
+        """Return (card_id, name_for_scryfall, current_price_str, scryfall_id). Uses english_name for Scryfall when set, else name."""
         from sqlalchemy import text
 
         engine = self._get_engine()
         with engine.connect() as conn:
             where_clause = "WHERE name IS NOT NULL AND name != ''"
+            params: Dict[str, Any] = {}
             if user_id is not None:
                 where_clause += " AND user_id = :user_id"
+                params["user_id"] = user_id
+            order_clause = ""
+            if max_age_hours is not None:
+                # Served by idx_cards_price_refresh (user_id, last_price_update)
+                where_clause += (
+                    " AND (last_price_update IS NULL"
+                    " OR last_price_update < NOW() AT TIME ZONE 'utc' - make_interval(secs => :max_age_secs))"
+                )
+                params["max_age_secs"] = max_age_hours * 3600
+                order_clause = (
+                    " ORDER BY last_price_update IS NOT NULL, price_eur_value DESC NULLS LAST, last_price_update, id"
+                )
             rows = conn.execute(
-                text(f"SELECT id, name, english_name, price_eur FROM cards {where_clause}"),
-                {"user_id": user_id} if user_id is not None else {},
+                text(f"SELECT id, name, english_name, price_eur, scryfall_id FROM cards {where_clause}{order_clause}"),
+                params,
             ).fetchall()
-            return [(r[0], (r[2] or r[1]) or "", r[3] or "") for r in rows]
+            return [(r[0], (r[2] or r[1]) or "", r[3] or "", r[4]) for r in rows]
 
     def get_card_by_id(self, id: int, user_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         from sqlalchemy import text
@@ -448,39 +627,7 @@ class PostgresCollectionRepository(CollectionRepository):
     def update(self, id: int, fields: Dict[str, Any], user_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         from sqlalchemy import text
 
-        # Map API field names to DB columns
-        col_map = {"type": "type_line", "number": "set_number", "price": "price_eur"}
-        updates = {}
-        for k, v in fields.items():
-            col = col_map.get(k, k)
-            if col in (
-                "name",
-                "english_name",
-                "type_line",
-                "description",
-                "keywords",
-                "mana_cost",
-                "cmc",
-                "colors",
-                "color_identity",
-                "power",
-                "toughness",
-                "rarity",
-                "set_id",
-                "set_name",
-                "set_number",
-                "release_date",
-                "edhrec_rank",
-                "scryfall_uri",
-                "price_eur",
-                "price_usd",
-                "price_usd_foil",
-                "game_strategy",
-                "tier",
-            ):
-                if col == "cmc":
-                    v = _safe_cmc(v)
-                updates[col] = v
+        updates = _update_columns(fields)
         if not updates:
             return self.get_card_by_id(id, user_id=user_id)
         set_clause = ", ".join(f"{c} = :{c}" for c in updates)
@@ -517,34 +664,90 @@ class PostgresCollectionRepository(CollectionRepository):
             conn.commit()
             return result.rowcount > 0
 
+    def _stage_cards(self, conn, cards: List[Dict[str, Any]], skip_unnamed: bool = False) -> int:
+        """COPY cards (as _card_to_row columns) into the cards_staging temp table; returns rows staged."""
+        rows = (_card_to_row(card) for card in cards)
+        if skip_unnamed:
+            rows = (row for row in rows if row["name"])
+        values = ([(row[col] or "") if col == "name" else row[col] for col in _CARD_ROW_COLUMNS] for row in rows)
+        return copy_into_staging(conn, "cards", _CARD_ROW_COLUMNS, values, staging="cards_staging")
+
     def replace_all(self, cards: List[Dict[str, Any]], user_id: Optional[int] = None) -> int:
+        """COPY the cards into a staging table, then delete and INSERT ... SELECT in one transaction."""
         from sqlalchemy import text
 
+        columns = ", ".join(_CARD_ROW_COLUMNS)
+        owner_col, owner_val = (", user_id", ", :user_id") if user_id is not None else ("", "")
         engine = self._get_engine()
         with engine.connect() as conn:
+            count = self._stage_cards(conn, cards)
             if user_id is not None:
                 conn.execute(text("DELETE FROM cards WHERE user_id = :user_id"), {"user_id": user_id})
             else:
                 conn.execute(text("DELETE FROM cards"))
-            count = 0
-            for card in cards:
-                row = _card_to_row(card)
-                row["name"] = row["name"] or ""
-                cols = [k for k, v in row.items() if v is not None]
-                if user_id is not None:
-                    cols.append("user_id")
-                vals = [row[k] for k in cols[:-1]] + ([user_id] if user_id is not None else [])
-                placeholders = ", ".join(f":{k}" for k in cols)
-                names = ", ".join(cols)
-                params = {k: row[k] for k in cols if k in row}
-                if user_id is not None:
-                    params["user_id"] = user_id
-                conn.execute(text(f"INSERT INTO cards ({names}) VALUES ({placeholders})"), params)
-                count += 1
+            conn.execute(
+                text(
+                    f"INSERT INTO cards ({columns}{owner_col}) "
+                    f"SELECT {columns}{owner_val} FROM cards_staging ORDER BY {LOAD_ORDER}"
+                ),
+                {"user_id": user_id},
+            )
             conn.commit()
         logger.info(f"Replaced collection with {count} cards")
         return count
 
+    def merge_all(self, cards: List[Dict[str, Any]], user_id: Optional[int] = None) -> int:
+        """Add cards to the collection, grouping by (name, set_id) like migration 009.
+
+        Cards are COPYed into a staging table and merged with set-based SQL in one transaction:
+        a (name, set_id) already in the collection gets the incoming quantity added to it, the
+        rest are inserted (incoming duplicates summed into one row). Cards without a name are
+        skipped. Returns the number of incoming cards merged.
+        """
+        from sqlalchemy import text
+
+        columns = ", ".join(_CARD_ROW_COLUMNS)
+        fields = ", ".join(col for col in _CARD_ROW_COLUMNS if col != "quantity")
+        owner_col, owner_val = (", user_id", ", :user_id") if user_id is not None else ("", "")
+        scope = "WHERE user_id = :user_id" if user_id is not None else ""
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            count = self._stage_cards(conn, cards, skip_unnamed=True)
+            conn.execute(
+                text(f"""
+                    WITH incoming AS (
+                        SELECT DISTINCT ON (name, COALESCE(set_id, '')) {fields}, {LOAD_ORDER},
+                               SUM(quantity) OVER (PARTITION BY name, COALESCE(set_id, '')) AS quantity
+                        FROM cards_staging
+                        ORDER BY name, COALESCE(set_id, ''), {LOAD_ORDER}
+                    ),
+                    existing AS (
+                        SELECT DISTINCT ON (name, COALESCE(set_id, '')) id, name, COALESCE(set_id, '') AS set_key
+                        FROM cards
+                        {scope}
+                        ORDER BY name, COALESCE(set_id, ''), id
+                    ),
+                    merged AS (
+                        UPDATE cards AS c
+                        SET quantity = c.quantity + i.quantity, updated_at = NOW() AT TIME ZONE 'utc'
+                        FROM incoming i
+                        JOIN existing e ON e.name = i.name AND e.set_key = COALESCE(i.set_id, '')
+                        WHERE c.id = e.id
+                    )
+                    INSERT INTO cards ({columns}{owner_col})
+                    SELECT {columns}{owner_val}
+                    FROM incoming i
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM existing e WHERE e.name = i.name AND e.set_key = COALESCE(i.set_id, '')
+                    )
+                    ORDER BY {LOAD_ORDER}
+                """),
+                {"user_id": user_id},
+            )
+            conn.commit()
+        logger.info(f"Merged {count} cards into collection")
+        return count
+
     def _build_filter_clauses(
         self,
         filters: Optional[Dict[str, Any]],
@@ -566,8 +769,12 @@ class PostgresCollectionRepository(CollectionRepository):
         if filters:
             search = filters.get("search")
             if search and str(search).strip():
-                conditions.append("LOWER(name) LIKE :search")
-                params["search"] = f"%{search.strip().lower()}%"
+                # Name substring (idx_cards_name_trgm) or words in name / type line / rules text (idx_cards_search)
+                conditions.append(
+                    f"(name ILIKE :search OR {_SEARCH_VECTOR} @@ websearch_to_tsquery('english', :search_query))"
+                )
+                params["search"] = f"%{search.strip()}%"
+                params["search_query"] = search.strip()
 
             rarity = filters.get("rarity")
             if rarity and str(rarity).strip():
@@ -576,8 +783,8 @@ class PostgresCollectionRepository(CollectionRepository):
 
             type_ = filters.get("type_")
             if type_ and str(type_).strip():
-                conditions.append("LOWER(type_line) LIKE :type_")
-                params["type_"] = f"%{type_.strip().lower()}%"
+                conditions.append("type_line ILIKE :type_")
+                params["type_"] = f"%{type_.strip()}%"
 
             set_name = filters.get("set_name")
             if set_name and str(set_name).strip():
@@ -599,13 +806,12 @@ class PostgresCollectionRepository(CollectionRepository):
                     except (ValueError, TypeError):
                         pass
 
+            # price_eur_value is the numeric form of price_eur (NULL for "N/A"); idx_cards_user_price serves ranges
             price_min = filters.get("price_min")
             if price_min and str(price_min).strip():
                 try:
                     params["price_min"] = float(str(price_min).replace(",", "."))
-                    conditions.append(
-                        r"CASE WHEN price_eur ~ '^[0-9]+\.?[0-9]*$' THEN CAST(price_eur AS numeric) ELSE NULL END >= :price_min"
-                    )
+                    conditions.append("price_eur_value >= :price_min")
                 except (ValueError, TypeError):
                     pass
 
@@ -613,20 +819,17 @@ class PostgresCollectionRepository(CollectionRepository):
             if price_max and str(price_max).strip():
                 try:
                     params["price_max"] = float(str(price_max).replace(",", "."))
-                    conditions.append(
-                        r"CASE WHEN price_eur ~ '^[0-9]+\.?[0-9]*$' THEN CAST(price_eur AS numeric) ELSE NULL END <= :price_max"
-                    )
+                    conditions.append("price_eur_value <= :price_max")
                 except (ValueError, TypeError):
                     pass
 
             color_identity = filters.get("color_identity")
             if color_identity and str(color_identity).strip():
-                # Extract WUBRG letters from filter string, then match via LIKE
-                raw = str(color_identity).strip().upper().replace(",", "").replace(" ", "")
-                letters = [ch for ch in raw if ch in "WUBRG"]
-                for letter in letters:
-                    conditions.append(f"color_identity LIKE :ci_{letter}")
-                    params[f"ci_{letter}"] = f"%{letter}%"
+                # Card identity must contain every listed WUBRG letter: a superset test on the mask
+                mask = letters_to_mask(str(color_identity))
+                if mask:
+                    conditions.append("color_identity_mask & :ci_mask = :ci_mask")
+                    params["ci_mask"] = mask
 
         where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
         return where, params
@@ -636,7 +839,7 @@ class PostgresCollectionRepository(CollectionRepository):
     _SORT_COLUMN_MAP: Dict[str, str] = {
         "name": "name",
         "created_at": "created_at",
-        "price_eur": "price_eur",
+        "price_eur": "price_eur_value",
         "quantity": "quantity",
         "set_name": "set_name",
         "rarity": "rarity",
@@ -656,6 +859,8 @@ class PostgresCollectionRepository(CollectionRepository):
 
         Uses COUNT(*) OVER() window function so total and rows come from a single query.
         Sort column is whitelisted to prevent SQL injection; unknown columns fall back to created_at.
+        sort_by="relevance" ranks search matches (exact name, name prefix, full-text rank, name
+        similarity); without a search it falls back to created_at.
         """
         from sqlalchemy import text
 
@@ -664,12 +869,20 @@ class PostgresCollectionRepository(CollectionRepository):
         params["limit"] = limit
         params["offset"] = offset
 
-        # Resolve and validate sort column — whitelist prevents SQL injection
-        col = self._SORT_COLUMN_MAP.get(sort_by, "created_at")
         direction = "ASC" if sort_dir == "asc" else "DESC"
-        # Push NULLs to the end regardless of direction for consistent UX
-        nulls = "NULLS LAST"
-        order_clause = f"ORDER BY {col} {direction} {nulls}, id {direction}"
+        if sort_by == "relevance" and "search_query" in params:
+            params["search_prefix"] = f"{params['search_query']}%"
+            order_clause = (
+                "ORDER BY lower(name) = lower(:search_query) DESC, name ILIKE :search_prefix DESC,"
+                f" ts_rank({_SEARCH_VECTOR}, websearch_to_tsquery('english', :search_query)) DESC,"
+                " similarity(name, :search_query) DESC, id DESC"
+            )
+        else:
+            # Resolve and validate sort column — whitelist prevents SQL injection
+            col = self._SORT_COLUMN_MAP.get(sort_by, "created_at")
+            # Push NULLs to the end regardless of direction for consistent UX
+            nulls = "NULLS LAST"
+            order_clause = f"ORDER BY {col} {direction} {nulls}, id {direction}"
 
         sql = f"""
             SELECT COUNT(*) OVER() AS total_count, *
@@ -686,6 +899,78 @@ class PostgresCollectionRepository(CollectionRepository):
         cards = [_row_to_card({k: v for k, v in r.items() if k != "total_count"}) for r in rows]
         return cards, total
 
+    def get_cards_page(
+        self,
+        user_id: Optional[int],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        sort_by: str = "created_at",
+        sort_dir: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Keyset-paginated cards: (cards, next_cursor), next_cursor None on the last page.
+
+        Rows are ordered like get_cards_filtered ((sort column, id), NULLs last) and each page
+        starts right after the (sort value, id) in *cursor*, so it is an index range scan that
+        costs the same on every page; nothing is counted (see count_cards). Raises ValueError
+        for a malformed cursor, one issued for another sort, or sort_by="relevance".
+        """
+        from sqlalchemy import text
+
+        if sort_by == "relevance":
+            raise ValueError("Cursor pagination does not support sort_by=relevance")
+        if sort_by not in self._SORT_COLUMN_MAP:
+            sort_by = "created_at"
+        sort_dir = "asc" if sort_dir == "asc" else "desc"
+        col = self._SORT_COLUMN_MAP[sort_by]
+        direction, op = ("ASC", ">") if sort_dir == "asc" else ("DESC", "<")
+
+        where, params = self._build_filter_clauses(filters, user_id)
+        after_value: Any = None
+        keyset = None
+        if cursor:
+            after_value, params["after_id"] = _decode_cursor(cursor, sort_by, sort_dir)
+            if after_value is None:
+                # The previous page ended inside the trailing NULLs
+                keyset = f"{col} IS NULL AND id {op} :after_id"
+            else:
+                # Row comparison only (no OR), so the page is an index range scan
+                keyset = f"({col}, id) {op} (:after_value, :after_id)"
+                params["after_value"] = after_value
+
+        def fetch(conn, condition: Optional[str], count: int) -> List[Any]:
+            clause = where
+            if condition:
+                clause = f"{where} AND {condition}" if where else f"WHERE {condition}"
+            sql = f"""
+                SELECT *
+                FROM cards
+                {clause}
+                ORDER BY {col} {direction} NULLS LAST, id {direction}
+                LIMIT :limit
+            """
+            return list(conn.execute(text(sql), {**params, "limit": count}).mappings().fetchall())
+
+        # One extra row tells whether there is a next page
+        with self._get_engine().connect() as conn:
+            rows = fetch(conn, keyset, limit + 1)
+            if cursor and after_value is not None and len(rows) <= limit:
+                # A row comparison never matches NULL keys; they sort last, so the page continues there
+                rows += fetch(conn, f"{col} IS NULL", limit + 1 - len(rows))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(sort_by, sort_dir, last[col], last["id"])
+        return [_row_to_card(dict(r)) for r in rows], next_cursor
+
+    def count_cards(self, user_id: Optional[int], filters: Optional[Dict[str, Any]] = None) -> int:
+        from sqlalchemy import text
+
+        where, params = self._build_filter_clauses(filters, user_id)
+        with self._get_engine().connect() as conn:
+            return int(conn.execute(text(f"SELECT COUNT(*) FROM cards {where}"), params).scalar() or 0)
+
     def get_cards_stats(
         self,
         user_id: Optional[int],
@@ -696,17 +981,16 @@ class PostgresCollectionRepository(CollectionRepository):
 
         engine = self._get_engine()
         where, params = self._build_filter_clauses(filters, user_id)
-        # Use NULLIF to skip non-numeric price values like 'N/A' before casting
-        safe_price = r"CASE WHEN price_eur ~ '^[0-9]+\.?[0-9]*$' THEN CAST(price_eur AS numeric) ELSE NULL END"
+        # price_eur_value is NULL for non-numeric prices like 'N/A', so SUM skips them
         sql = f"""
             SELECT
                 COALESCE(SUM(quantity), 0)::bigint AS total_cards,
-                COALESCE(SUM({safe_price} * quantity), 0.0) AS total_value,
-                CASE
-                    WHEN SUM(CASE WHEN {safe_price} IS NOT NULL THEN quantity ELSE 0 END) > 0
-                    THEN SUM({safe_price} * quantity) / SUM(CASE WHEN {safe_price} IS NOT NULL THEN quantity ELSE 0 END)
-                    ELSE 0.0
-                END AS average_price
+                COALESCE(SUM(price_eur_value * quantity), 0.0) AS total_value,
+                COALESCE(
+                    SUM(price_eur_value * quantity)
+                    / NULLIF(SUM(quantity) FILTER (WHERE price_eur_value IS NOT NULL), 0),
+                    0.0
+                ) AS average_price
             FROM cards
             {where}
         """
@@ -737,7 +1021,9 @@ class PostgresCollectionRepository(CollectionRepository):
         if dimension not in supported:
             return []
 
-        if dimension == "cmc":
+        if dimension == "color_identity":
+            label_expr = "color_identity_mask"
+        elif dimension == "cmc":
             label_expr = """
                 CASE
                     WHEN cmc IS NULL THEN 'Unknown'
@@ -746,7 +1032,7 @@ class PostgresCollectionRepository(CollectionRepository):
                 END
             """
         else:
-            col = dimension  # rarity, color_identity, or set_name
+            col = dimension  # rarity or set_name
             label_expr = f"COALESCE(NULLIF(TRIM({col}), ''), 'Unknown')"
 
         params["limit"] = limit
@@ -760,6 +1046,8 @@ class PostgresCollectionRepository(CollectionRepository):
         """
         with engine.connect() as conn:
             rows = conn.execute(text(sql), params).fetchall()
+        if dimension == "color_identity":
+            return [{"label": mask_to_identity(r[0] or 0), "count": int(r[1] or 0)} for r in rows]
         return [{"label": r[0], "count": int(r[1] or 0)} for r in rows]
 
     def get_type_line_data(
@@ -888,6 +1176,160 @@ class PostgresCollectionRepository(CollectionRepository):
             )
             conn.commit()
 
+    def bulk_update(self, updates: Sequence[Tuple[int, Dict[str, Any]]]) -> int:
+        """All updates on one connection and one commit; rows that set the same columns share one executemany."""
+        from sqlalchemy import text
+
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for card_id, fields in updates:
+            row = _update_columns(fields)
+            if row:
+                row["id"] = card_id
+                groups.setdefault(tuple(sorted(row)), []).append(row)
+        if not groups:
+            return 0
+        updated = 0
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            for columns, rows in groups.items():
+                set_clause = ", ".join(f"{c} = :{c}" for c in columns if c != "id")
+                result = conn.execute(
+                    text(f"UPDATE cards SET {set_clause}, updated_at = NOW() AT TIME ZONE 'utc' WHERE id = :id"),
+                    rows,
+                )
+                # Some drivers report -1 for executemany; count the submitted rows then
+                updated += result.rowcount if result.rowcount >= 0 else len(rows)
+            conn.commit()
+        return updated
+
+    def bulk_update_prices(self, changes: Sequence[Tuple[int, str]], source: str = "scryfall") -> int:
+        """One UPDATE for every card's price_eur / last_price_update and one INSERT into
+        price_history, in a single transaction. When a card id repeats, the last price wins."""
+        from sqlalchemy import text
+
+        latest = dict(changes)
+        if not latest:
+            return 0
+        ids = list(latest)
+        history = [(card_id, _price_to_float(price)) for card_id, price in latest.items()]
+        history = [(card_id, price) for card_id, price in history if price is not None]
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            result = conn.execute(
+                text("""
+                    UPDATE cards AS c
+                    SET price_eur = v.price_eur,
+                        last_price_update = NOW() AT TIME ZONE 'utc',
+                        updated_at = NOW() AT TIME ZONE 'utc'
+                    FROM unnest(CAST(:ids AS BIGINT[]), CAST(:prices AS TEXT[])) AS v(id, price_eur)
+                    WHERE c.id = v.id
+                """),
+                {"ids": ids, "prices": [latest[card_id] for card_id in ids]},
+            )
+            updated = result.rowcount
+            if history:
+                # Join on cards so a card deleted mid-job does not abort the batch on the FK
+                conn.execute(
+                    text("""
+                        INSERT INTO price_history (card_id, price, source, currency)
+                        SELECT v.card_id, v.price, :source, 'eur'
+                        FROM unnest(CAST(:card_ids AS BIGINT[]), CAST(:prices AS NUMERIC[])) AS v(card_id, price)
+                        JOIN cards c ON c.id = v.card_id
+                    """),
+                    {
+                        "card_ids": [card_id for card_id, _price in history],
+                        "prices": [price for _card_id, price in history],
+                        "source": source,
+                    },
+                )
+            conn.commit()
+        return updated
+
+    def mark_prices_checked(self, card_ids: Sequence[int]) -> int:
+        from sqlalchemy import text
+
+        ids = list(dict.fromkeys(card_ids))
+        if not ids:
+            return 0
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            result = conn.execute(
+                text("UPDATE cards SET last_price_update = NOW() AT TIME ZONE 'utc' WHERE id = ANY(:ids)"),
+                {"ids": ids},
+            )
+            conn.commit()
+        return result.rowcount
+
+    def refresh_prices_from_catalog(self, user_id: Optional[int] = None, source: str = "catalog") -> Dict[str, Any]:
+        """Set-based price refresh from catalog_cards in one statement (one transaction).
+
+        A card matches its printing by scryfall_id; cards without one match by name (front face
+        for double-faced cards) within their set, preferring the same collector number. Only rows
+        whose prices change are written, and those with a numeric EUR change get a price_history row.
+        """
+        from sqlalchemy import text
+
+        scope = " AND c.user_id = :user_id" if user_id is not None else ""
+        params: Dict[str, Any] = {"source": source}
+        if user_id is not None:
+            params["user_id"] = user_id
+        engine = self._get_engine()
+        with engine.connect() as conn:
+            row = conn.execute(
+                text(f"""
+                    WITH candidates AS (
+                        SELECT c.id, 0 AS rank, c.price_eur AS old_eur,
+                               cc.prices_eur, cc.prices_usd, cc.prices_usd_foil
+                        FROM cards c
+                        JOIN catalog_cards cc ON cc.scryfall_id = c.scryfall_id
+                        WHERE TRUE{scope}
+                        UNION ALL
+                        SELECT c.id, CASE WHEN cc.collector_number = c.set_number THEN 1 ELSE 2 END,
+                               c.price_eur, cc.prices_eur, cc.prices_usd, cc.prices_usd_foil
+                        FROM cards c
+                        JOIN catalog_cards cc
+                          ON cc.set_id = c.set_id
+                         AND lower(COALESCE(NULLIF(c.english_name, ''), c.name))
+                             IN (lower(cc.name), lower(split_part(cc.name, ' // ', 1)))
+                        WHERE c.scryfall_id IS NULL{scope}
+                    ),
+                    best AS (
+                        SELECT DISTINCT ON (id) id, old_eur, prices_eur AS raw_eur,
+                               COALESCE(replace(prices_eur, '.', ','), 'N/A') AS price_eur,
+                               prices_usd, prices_usd_foil
+                        FROM candidates
+                        ORDER BY id, rank
+                    ),
+                    changed AS (
+                        UPDATE cards c
+                        SET price_eur = b.price_eur,
+                            price_usd = b.prices_usd,
+                            price_usd_foil = b.prices_usd_foil,
+                            last_price_update = NOW() AT TIME ZONE 'utc',
+                            updated_at = NOW() AT TIME ZONE 'utc'
+                        FROM best b
+                        WHERE c.id = b.id
+                          AND (c.price_eur IS DISTINCT FROM b.price_eur
+                               OR c.price_usd IS DISTINCT FROM b.prices_usd
+                               OR c.price_usd_foil IS DISTINCT FROM b.prices_usd_foil)
+                        RETURNING c.id, b.old_eur, b.price_eur, b.raw_eur
+                    ),
+                    history AS (
+                        INSERT INTO price_history (card_id, price, source, currency)
+                        SELECT id, CAST(raw_eur AS NUMERIC), :source, 'eur'
+                        FROM changed
+                        WHERE price_eur IS DISTINCT FROM old_eur AND raw_eur ~ '^[0-9]+(\\.[0-9]+)?$'
+                        RETURNING 1
+                    )
+                    SELECT (SELECT array_agg(id) FROM best),
+                           (SELECT count(*) FROM changed),
+                           (SELECT count(*) FROM history)
+                """),
+                params,
+            ).fetchone()
+            conn.commit()
+        return {"matched_ids": list(row[0] or []), "updated": int(row[1]), "history_rows": int(row[2])}
+
     def get_price_history(
         self,
         card_id: int,
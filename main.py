@@ -1,7 +1,7 @@
 import argparse
 import sys
 
-from deckdex.config import ProcessorConfig
+from deckdex.config import PRICE_SOURCES, ProcessorConfig
 from deckdex.config_loader import load_config
 from deckdex.logger_config import configure_logging
 from deckdex.magic_card_processor import MagicCardProcessor
@@ -21,11 +21,20 @@ def display_config(config: ProcessorConfig):
     print(f"  max_workers: {config.processing.max_workers}")
     print(f"  api_delay: {config.processing.api_delay}s")
     print(f"  write_buffer_batches: {config.processing.write_buffer_batches}")
+    print(f"  card_cache_size: {config.processing.card_cache_size}")
+    print(f"  price_max_age_hours: {config.processing.price_max_age_hours}")
+    print(f"  price_time_budget: {config.processing.price_time_budget}s")
+    print(f"  price_request_budget: {config.processing.price_request_budget}")
 
     print("\n## API: Scryfall")
     print(f"  max_retries: {config.scryfall.max_retries}")
     print(f"  retry_delay: {config.scryfall.retry_delay}s")
     print(f"  timeout: {config.scryfall.timeout}s")
+    print(f"  requests_per_second: {config.scryfall.requests_per_second}")
+    print(f"  burst: {config.scryfall.burst}")
+    print(f"  pool_size: {config.scryfall.pool_size}")
+    print(f"  max_concurrency: {config.scryfall.max_concurrency}")
+    print(f"  cache_path: {config.scryfall.cache_path or 'disabled'}")
 
     print("\n## API: Google Sheets")
     print(f"  batch_size: {config.google_sheets.batch_size}")
@@ -40,9 +49,12 @@ def display_config(config: ProcessorConfig):
     print(f"  max_tokens: {config.openai.max_tokens}")
     print(f"  temperature: {config.openai.temperature}")
     print(f"  max_retries: {config.openai.max_retries}")
+    print(f"  batch_size: {config.openai.batch_size}")
 
     print("\n## Behavioral Flags")
     print(f"  update_prices: {config.update_prices}")
+    print(f"  price_source: {config.price_source}")
+    print(f"  incremental_prices: {config.incremental_prices}")
     print(f"  dry_run: {config.dry_run}")
     print(f"  verbose: {config.verbose}")
 
@@ -151,6 +163,21 @@ Configuration priority (low to high):
         action="store_true",
         help="Update all prices in the Google Sheet",
     )
+    parser.add_argument(
+        "--price-source",
+        dest="price_source",
+        choices=PRICE_SOURCES,
+        default="scryfall",
+        help="With --update_prices on Postgres: 'catalog' refreshes prices from the local catalog in one "
+        "operation and only looks up unmatched cards on Scryfall (default: scryfall)",
+    )
+    parser.add_argument(
+        "--incremental",
+        dest="incremental_prices",
+        action="store_true",
+        help="With --update_prices on Postgres: only refresh stale prices (processing.price_max_age_hours), "
+        "most valuable first, within processing.price_time_budget / price_request_budget",
+    )
     parser.add_argument(
         "--dry-run",
         dest="dry_run",
@@ -222,7 +249,7 @@ Configuration priority (low to high):
         help="Resume processing from row N (1-indexed)",
     )
 
-    parser.set_defaults(use_openai=False, update_prices=False)
+    parser.set_defaults(use_openai=False, update_prices=False, incremental_prices=False)
 
     return parser.parse_args()
 
@@ -290,6 +317,8 @@ def main():
             verbose=args.verbose,
             limit=args.limit,
             resume_from=args.resume_from,
+            price_source=args.price_source,
+            incremental_prices=args.incremental_prices,
         )
     except ValueError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
@@ -308,6 +337,8 @@ def main():
     processor = MagicCardProcessor(config)
     processor.process_card_data()
 
+    print("\n" + "\n".join(processor.metrics.summary_lines()))
+
     # Display dry-run summary if applicable
     if config.dry_run and hasattr(processor.spreadsheet_client, "display_summary"):
         processor.spreadsheet_client.display_summary()
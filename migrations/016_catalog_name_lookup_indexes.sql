@@ -0,0 +1,9 @@
+-- DeckDex MTG: catalog batch-lookup indexes
+-- MagicCardProcessor resolves whole batches of collection names against catalog_cards
+-- with lower(name) = ANY(...). The second index covers double-faced cards, which the
+-- collection usually stores under their front-face name ("Delver of Secrets" for
+-- "Delver of Secrets // Insectile Aberration").
+
+CREATE INDEX IF NOT EXISTS idx_catalog_lower_name ON catalog_cards (lower(name));
+
+CREATE INDEX IF NOT EXISTS idx_catalog_lower_front_face ON catalog_cards (lower(split_part(name, ' // ', 1)));
@@ -0,0 +1,8 @@
+-- DeckDex MTG: durable job checkpoints
+-- Process and price jobs store their cursor (last committed card id plus counters) at each
+-- batch commit. A re-triggered job of the same type, scope and user resumes after that card
+-- when the previous run did not complete.
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS checkpoint JSONB;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_user_type_created ON jobs (user_id, type, created_at DESC);
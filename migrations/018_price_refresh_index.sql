@@ -0,0 +1,5 @@
+-- DeckDex MTG: incremental price refresh index
+-- Incremental price updates select a user's cards whose last_price_update is NULL or older
+-- than processing.price_max_age_hours; this keeps that selection an index range scan.
+
+CREATE INDEX IF NOT EXISTS idx_cards_price_refresh ON cards (user_id, last_price_update NULLS FIRST);
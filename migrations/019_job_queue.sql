@@ -0,0 +1,14 @@
+-- DeckDex MTG: jobs table as a work queue
+-- With jobs.queue enabled the API inserts process/price jobs as 'queued' rows (params holds the
+-- request) and worker processes (python -m backend.api.worker) claim them with
+-- FOR UPDATE SKIP LOCKED, write progress and heartbeats back, and poll cancel_requested.
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS params JSONB;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS progress JSONB;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS worker_id VARCHAR(128);
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS started_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS cancel_requested BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_queued ON jobs (created_at) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_jobs_worker_running ON jobs (heartbeat_at) WHERE status = 'running' AND worker_id IS NOT NULL;
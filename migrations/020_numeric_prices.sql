@@ -0,0 +1,15 @@
+-- DeckDex MTG: numeric card prices
+-- price_eur stays the display string ("1,50", "1.50" or "N/A"). price_eur_value is its numeric
+-- value, computed by Postgres on every write (and for existing rows when the column is added),
+-- so price filters, sorts and stats compare numbers and can use an index.
+
+ALTER TABLE cards ADD COLUMN IF NOT EXISTS price_eur_value NUMERIC(12, 2)
+    GENERATED ALWAYS AS (
+        CASE WHEN price_eur ~ '^[0-9]+([.,][0-9]+)?$'
+             THEN CAST(replace(price_eur, ',', '.') AS NUMERIC(12, 2))
+        END
+    ) STORED;
+
+-- Price range filters and price sorts within one user's collection; ordered like a price-sorted
+-- cursor page (sort column, then id, NULLs last) so keyset pagination (022) can use it too
+CREATE INDEX IF NOT EXISTS idx_cards_user_price ON cards (user_id, price_eur_value DESC NULLS LAST, id DESC);
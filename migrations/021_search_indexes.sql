@@ -0,0 +1,25 @@
+-- DeckDex MTG: indexed search for the collection and the catalog
+-- Substring search on names and type lines ("name ILIKE '%bolt%'") is served by pg_trgm GIN
+-- indexes. Word search over name, type line and rules text is served by a GIN index on
+-- card_search_vector(), which the repositories call with the same arguments so the planner
+-- matches the index expression. Names weigh most (A), then type line (B), then rules text (C).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION card_search_vector(name TEXT, type_line TEXT, rules_text TEXT)
+RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$
+    SELECT setweight(to_tsvector('english', COALESCE(name, '')), 'A')
+        || setweight(to_tsvector('english', COALESCE(type_line, '')), 'B')
+        || setweight(to_tsvector('english', COALESCE(rules_text, '')), 'C')
+$$;
+
+-- Collection (cards.description holds the oracle text)
+CREATE INDEX IF NOT EXISTS idx_cards_name_trgm ON cards USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_cards_type_line_trgm ON cards USING gin (type_line gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_cards_search ON cards USING gin (card_search_vector(name, type_line, description));
+
+-- Catalog (every printing)
+CREATE INDEX IF NOT EXISTS idx_catalog_name_trgm ON catalog_cards USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_catalog_search ON catalog_cards USING gin (card_search_vector(name, type_line, oracle_text));
@@ -0,0 +1,11 @@
+-- DeckDex MTG: keyset pagination indexes for GET /api/cards
+-- Cursor pages are ordered by (sort column, id) with NULLs last and start right after the
+-- previous page's last row. These indexes match that order for the gallery's common sorts
+-- within one user's collection, so every page is an index range scan of `limit` rows.
+-- Other sort columns and directions still work, with a top-N sort instead.
+-- Price pages use idx_cards_user_price (020), which already has this shape.
+
+CREATE INDEX IF NOT EXISTS idx_cards_keyset_created ON cards (user_id, created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_cards_keyset_name ON cards (user_id, name, id);
+CREATE INDEX IF NOT EXISTS idx_cards_keyset_set_name ON cards (user_id, set_name, id);
+CREATE INDEX IF NOT EXISTS idx_cards_keyset_cmc ON cards (user_id, cmc, id);
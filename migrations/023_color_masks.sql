@@ -0,0 +1,30 @@
+-- DeckDex MTG: color identity and colors as 5-bit masks
+-- colors / color_identity stay the text Scryfall gave us ("W,U", "['W', 'U']" or full names).
+-- color_mask() parses any of those into W=1, U=2, B=4, R=8, G=16 (0 = colorless), and the
+-- generated columns below keep the masks in step with every write (and backfill existing rows
+-- when they are added). Color filters become bitwise predicates and grouping is on a small int.
+
+CREATE OR REPLACE FUNCTION color_mask(raw TEXT)
+RETURNS SMALLINT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$
+    SELECT COALESCE(bit_or(CASE letter
+                               WHEN 'W' THEN 1 WHEN 'U' THEN 2 WHEN 'B' THEN 4
+                               WHEN 'R' THEN 8 WHEN 'G' THEN 16
+                           END), 0)::SMALLINT
+    FROM regexp_split_to_table(upper(COALESCE(raw, '')), '[^A-Z]+') AS token
+    CROSS JOIN LATERAL regexp_split_to_table(
+        CASE token
+            WHEN 'WHITE' THEN 'W' WHEN 'BLUE' THEN 'U' WHEN 'BLACK' THEN 'B'
+            WHEN 'RED' THEN 'R' WHEN 'GREEN' THEN 'G'
+            ELSE CASE WHEN token ~ '^[WUBRG]+$' THEN token ELSE '' END
+        END, '') AS letter
+$$;
+
+ALTER TABLE cards ADD COLUMN IF NOT EXISTS color_identity_mask SMALLINT
+    GENERATED ALWAYS AS (color_mask(color_identity)) STORED;
+ALTER TABLE cards ADD COLUMN IF NOT EXISTS colors_mask SMALLINT
+    GENERATED ALWAYS AS (color_mask(colors)) STORED;
+
+-- Color identity filters and GROUP BY within one user's collection
+CREATE INDEX IF NOT EXISTS idx_cards_user_color_identity ON cards (user_id, color_identity_mask);
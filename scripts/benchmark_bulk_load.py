@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark collection bulk writes against a real Postgres database.
+
+Replaces a scratch user's collection with synthetic cards twice, once with the
+previous row-by-row INSERT loop and once with PostgresCollectionRepository.replace_all
+(COPY into a staging table + set-based swap), then times merge_all on the same cards.
+Reports seconds and cards/sec for each. The scratch user and its cards are removed
+afterwards; nothing else in the database is touched.
+
+Usage (from repo root, with migrations applied):
+  DATABASE_URL=postgresql://... python scripts/benchmark_bulk_load.py
+  python scripts/benchmark_bulk_load.py --database-url postgresql://... --cards 50000 --json
+  python scripts/benchmark_bulk_load.py --skip-loop   # the loop takes minutes at 50k cards
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+from deckdex.scryfall_standin import synthetic_cards  # noqa: E402
+from deckdex.storage.repository import PostgresCollectionRepository, _card_to_row  # noqa: E402
+
+BENCH_EMAIL = "bench-bulk-load@deckdex.local"
+
+
+def _collection_cards(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Synthetic Scryfall cards in the API shape replace_all takes."""
+    cards = []
+    for card in synthetic_cards(count, seed=seed):
+        cards.append(
+            {
+                "name": card["name"],
+                "type": card["type_line"],
+                "description": card.get("oracle_text"),
+                "keywords": ", ".join(card.get("keywords") or []),
+                "mana_cost": card.get("mana_cost"),
+                "cmc": card.get("cmc"),
+                "colors": ",".join(card.get("colors") or []),
+                "color_identity": ",".join(card.get("color_identity") or []),
+                "power": card.get("power"),
+                "toughness": card.get("toughness"),
+                "rarity": card.get("rarity"),
+                "set_id": card.get("set"),
+                "set_name": card.get("set_name"),
+                "number": card.get("collector_number"),
+                "release_date": card.get("released_at"),
+                "edhrec_rank": card.get("edhrec_rank"),
+                "price": card["prices"].get("eur"),
+                "quantity": 1,
+            }
+        )
+    return cards
+
+
+def insert_loop(repo: PostgresCollectionRepository, cards: List[Dict[str, Any]], user_id: int) -> int:
+    """The replace_all this benchmark compares against: one INSERT per card."""
+    from sqlalchemy import text
+
+    with repo._get_engine().connect() as conn:
+        conn.execute(text("DELETE FROM cards WHERE user_id = :user_id"), {"user_id": user_id})
+        for card in cards:
+            row = _card_to_row(card)
+            row["name"] = row["name"] or ""
+            cols = [k for k, v in row.items() if v is not None] + ["user_id"]
+            params = {k: row[k] for k in cols if k in row}
+            params["user_id"] = user_id
+            conn.execute(
+                text(f"INSERT INTO cards ({', '.join(cols)}) VALUES ({', '.join(f':{k}' for k in cols)})"),
+                params,
+            )
+        conn.commit()
+    return len(cards)
+
+
+def _timed(name: str, fn: Callable[[], int]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    written = fn()
+    elapsed = time.perf_counter() - started
+    return {
+        "method": name,
+        "cards": written,
+        "seconds": round(elapsed, 3),
+        "cards_per_sec": round(written / elapsed, 1) if elapsed else None,
+    }
+
+
+def _bench_user(repo: PostgresCollectionRepository) -> int:
+    from sqlalchemy import text
+
+    with repo._get_engine().connect() as conn:
+        conn.execute(
+            text("""
+                INSERT INTO users (google_id, email, display_name)
+                VALUES ('__bench_bulk_load__', :email, 'Bulk load benchmark')
+                ON CONFLICT (email) DO NOTHING
+            """),
+            {"email": BENCH_EMAIL},
+        )
+        user_id = conn.execute(text("SELECT id FROM users WHERE email = :email"), {"email": BENCH_EMAIL}).scalar()
+        conn.commit()
+    return int(user_id)
+
+
+def _drop_bench_user(repo: PostgresCollectionRepository, user_id: int) -> None:
+    from sqlalchemy import text
+
+    with repo._get_engine().connect() as conn:
+        conn.execute(text("DELETE FROM cards WHERE user_id = :user_id"), {"user_id": user_id})
+        conn.execute(text("DELETE FROM users WHERE id = :user_id"), {"user_id": user_id})
+        conn.commit()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the INSERT loop against the COPY bulk load")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Defaults to $DATABASE_URL")
+    parser.add_argument("--cards", type=int, default=10000, help="Cards in the benchmark collection")
+    parser.add_argument("--skip-loop", action="store_true", help="Only time the COPY paths")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.database_url or not args.database_url.startswith("postgresql"):
+        parser.error("a postgresql:// database URL is required (--database-url or DATABASE_URL)")
+
+    repo = PostgresCollectionRepository(args.database_url)
+    cards = _collection_cards(args.cards, args.seed)
+    user_id = _bench_user(repo)
+    results = []
+    try:
+        if not args.skip_loop:
+            results.append(_timed("insert loop", lambda: insert_loop(repo, cards, user_id)))
+        results.append(_timed("copy replace_all", lambda: repo.replace_all(cards, user_id=user_id)))
+        results.append(_timed("copy merge_all", lambda: repo.merge_all(cards, user_id=user_id)))
+    finally:
+        _drop_bench_user(repo, user_id)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print()
+        for r in results:
+            print(f"{r['method']:>16}: {r['cards']} cards in {r['seconds']}s = {r['cards_per_sec']} cards/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
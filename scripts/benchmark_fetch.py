@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark the card fetch pipelines against the local Scryfall stand-in (no network, no database).
+
+Runs MagicCardProcessor's price update and full processing against an in-memory
+collection, with Scryfall served by deckdex.scryfall_standin, and reports
+cards/sec plus p50/p99 HTTP latency per pipeline.
+
+Usage (from repo root):
+  python scripts/benchmark_fetch.py
+  python scripts/benchmark_fetch.py --cards 2000 --latency 0.03 --jitter 0.02 --rate-limit-ratio 0.01
+  python scripts/benchmark_fetch.py --pipeline price --rps 10 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+from deckdex.card_cache import reset_card_cache  # noqa: E402
+from deckdex.config import ProcessingConfig, ProcessorConfig, ScryfallConfig  # noqa: E402
+from deckdex.magic_card_processor import MagicCardProcessor  # noqa: E402
+from deckdex.scryfall_standin import (  # noqa: E402
+    CardStore,
+    ScryfallStandin,
+    StandinOptions,
+    load_fixture,
+    synthetic_cards,
+)
+from deckdex.scryfall_transport import get_transport, reset_transport  # noqa: E402
+
+
+class MemoryCollection:
+    """The slice of CollectionRepository the pipelines use, kept in memory."""
+
+    def __init__(self, names: List[str]):
+        self.cards = [{"id": i + 1, "name": name, "price": None} for i, name in enumerate(names)]
+        self.updates = 0
+        self.history_rows = 0
+
+    def get_all_cards(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        return list(self.cards)
+
+    def get_cards_for_process(self, only_incomplete: bool = False, user_id: Optional[int] = None):
+        return list(self.cards)
+
+    def update(self, id: int, fields: Dict[str, Any], user_id: Optional[int] = None) -> None:
+        self.updates += 1
+
+    def record_price_history(self, card_id: int, price: float, *args, **kwargs) -> None:
+        self.history_rows += 1
+
+    def bulk_update(self, updates: Sequence[Tuple[int, Dict[str, Any]]]) -> int:
+        self.updates += len(updates)
+        return len(updates)
+
+    def mark_prices_checked(self, card_ids: Sequence[int]) -> int:
+        return len(card_ids)
+
+    def bulk_update_prices(self, changes: Sequence[Tuple[int, str]], source: str = "scryfall") -> int:
+        self.updates += len(changes)
+        self.history_rows += sum(1 for _card_id, price in changes if price != "N/A")
+        return len(changes)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _workload(store: CardStore, count: int, miss_ratio: float, seed: int) -> List[str]:
+    """Collection card names: random catalog names, with a share of typos that run the full search cascade."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        name = rng.choice(store.cards)["name"]
+        if rng.random() < miss_ratio:
+            name = f"{name}zz"
+        names.append(name)
+    return names
+
+
+def run_pipeline(pipeline: str, names: List[str], scryfall: ScryfallConfig, max_workers: int) -> Dict[str, Any]:
+    """Run one pipeline over *names* and return throughput / latency figures."""
+    reset_card_cache()
+    config = ProcessorConfig(
+        dry_run=True,
+        update_prices=pipeline == "price",
+        processing=ProcessingConfig(max_workers=max_workers),
+        scryfall=scryfall,
+    )
+    processor = MagicCardProcessor(config)
+    collection = MemoryCollection(names)
+    processor.collection_repository = collection
+    processor.catalog_resolver = None
+
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    def record(response, *args, **kwargs):
+        latencies.append(response.elapsed.total_seconds())
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    hooks = get_transport(scryfall).session.hooks["response"]
+    hooks.append(record)
+    started = time.perf_counter()
+    try:
+        if pipeline == "price":
+            processor.update_prices_data_repo([(c["id"], c["name"], "") for c in collection.cards])
+        else:
+            processor.process_cards_repo()
+    finally:
+        elapsed = time.perf_counter() - started
+        hooks.remove(record)
+
+    return {
+        "pipeline": pipeline,
+        "cards": len(names),
+        "seconds": round(elapsed, 3),
+        "cards_per_sec": round(len(names) / elapsed, 1) if elapsed else None,
+        "requests": len(latencies),
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "latency_p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "statuses": statuses,
+        "not_found": processor.error_count,
+        "repository_updates": collection.updates,
+        "card_cache": processor.card_cache_stats(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark card fetch pipelines against a local Scryfall stand-in")
+    parser.add_argument("--pipeline", choices=["price", "process", "all"], default="all")
+    parser.add_argument("--cards", type=int, default=1000, help="Cards in the benchmark collection")
+    parser.add_argument("--catalog", type=int, default=5000, help="Synthetic cards served by the stand-in")
+    parser.add_argument("--fixture", help="Serve a recorded Scryfall bulk-data / card list JSON instead")
+    parser.add_argument("--miss-ratio", type=float, default=0.02, help="Share of collection names that do not exist")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stand-in latency per response (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Extra random stand-in latency (seconds)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Share of requests answered 429")
+    parser.add_argument("--error-ratio", type=float, default=0.0, help="Share of requests answered 500")
+    parser.add_argument("--rps", type=float, default=0.0, help="scryfall.requests_per_second (0 = unlimited)")
+    parser.add_argument("--workers", type=int, default=4, help="processing.max_workers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    cards = load_fixture(args.fixture) if args.fixture else synthetic_cards(args.catalog, seed=args.seed)
+    store = CardStore(cards)
+    options = StandinOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        seed=args.seed,
+    )
+    names = _workload(store, args.cards, args.miss_ratio, args.seed)
+    pipelines = ["price", "process"] if args.pipeline == "all" else [args.pipeline]
+
+    # Keep the run hermetic: no database, no persistent response cache, no OpenAI
+    os.environ.pop("DATABASE_URL", None)
+    results = []
+    with ScryfallStandin(store, options) as standin:
+        scryfall = ScryfallConfig(base_url=standin.base_url, requests_per_second=args.rps, retry_delay=0.05)
+        reset_transport()
+        for pipeline in pipelines:
+            results.append(run_pipeline(pipeline, names, scryfall, args.workers))
+    reset_transport()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print()
+        for r in results:
+            print(
+                f"{r['pipeline']:>8}: {r['cards']} cards in {r['seconds']}s = {r['cards_per_sec']} cards/s | "
+                f"{r['requests']} requests, p50 {r['latency_p50_ms']} ms, p99 {r['latency_p99_ms']} ms | "
+                f"statuses {r['statuses']} | not found {r['not_found']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -200,6 +200,82 @@ class TestCardsColorFilter(unittest.TestCase):
         self.assertNotIn("Black Lotus", names)
 
 
+# ---------------------------------------------------------------------------
+# Cards — cursor (keyset) pagination and the cached count
+# ---------------------------------------------------------------------------
+class TestCardsCursorPagination(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_current_user_id] = lambda: 1
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_current_user_id, None)
+
+    def test_cursor_mode_returns_next_cursor_without_total(self):
+        repo = MagicMock()
+        repo.get_cards_page.return_value = ([{"id": 1, "name": "Opt"}], "next-page")
+        with patch("backend.api.routes.cards.get_collection_repo", return_value=repo):
+            response = self.client.get("/api/cards?cursor=&limit=1&sort_by=name&sort_dir=asc")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["next_cursor"], "next-page")
+        self.assertIsNone(data["total"])
+        kwargs = repo.get_cards_page.call_args.kwargs
+        self.assertEqual((kwargs["cursor"], kwargs["sort_by"], kwargs["limit"]), (None, "name", 1))
+        repo.get_cards_filtered.assert_not_called()
+
+    def test_invalid_cursor_is_400(self):
+        repo = MagicMock()
+        repo.get_cards_page.side_effect = ValueError("Invalid cursor")
+        with patch("backend.api.routes.cards.get_collection_repo", return_value=repo):
+            response = self.client.get("/api/cards?cursor=garbage")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_requires_postgres(self):
+        with patch("backend.api.routes.cards.get_collection_repo", return_value=None):
+            response = self.client.get("/api/cards?cursor=")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_count_is_cached_per_filter_combination(self):
+        from backend.api.routes.stats import clear_stats_cache
+
+        clear_stats_cache()
+        repo = MagicMock()
+        repo.count_cards.return_value = 42
+        with patch("backend.api.routes.stats.get_collection_repo", return_value=repo):
+            first = self.client.get("/api/stats/count?rarity=rare")
+            second = self.client.get("/api/stats/count?rarity=rare")
+
+        self.assertEqual(first.json(), {"total": 42})
+        self.assertEqual(second.json(), {"total": 42})
+        repo.count_cards.assert_called_once()
+        clear_stats_cache()
+
+    def test_count_treats_undefined_search_like_list(self):
+        """The count behind a cursor-paged list must use the list's filters, "undefined" search included."""
+        from backend.api.routes.stats import clear_stats_cache
+
+        clear_stats_cache()
+        repo = MagicMock()
+        repo.count_cards.return_value = 3
+        repo.get_cards_page.return_value = ([], None)
+        with patch("backend.api.routes.stats.get_collection_repo", return_value=repo):
+            response = self.client.get("/api/stats/count?search=undefined&rarity=rare")
+        with patch("backend.api.routes.cards.get_collection_repo", return_value=repo):
+            self.client.get("/api/cards?cursor=&search=undefined&rarity=rare")
+
+        self.assertEqual(response.json(), {"total": 3})
+        count_filters = repo.count_cards.call_args.kwargs["filters"]
+        self.assertIsNone(count_filters["search"])
+        self.assertEqual(count_filters, repo.get_cards_page.call_args.kwargs["filters"])
+        clear_stats_cache()
+
+
 # ---------------------------------------------------------------------------
 # Type-specific fixture cards
 # ---------------------------------------------------------------------------
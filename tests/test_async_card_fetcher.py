@@ -0,0 +1,142 @@
+"""Tests for AsyncCardFetcher: httpx-based lookups, bounded concurrency and the shared rate limit."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import httpx
+
+from deckdex.async_card_fetcher import AsyncCardFetcher
+from deckdex.config import ScryfallConfig
+from deckdex.scryfall_transport import get_transport, reset_transport
+
+
+def _fetcher(handler, limiter=None, **config):
+    config.setdefault("retry_delay", 0)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    limiter = limiter or MagicMock(reserve=MagicMock(return_value=0.0))
+    return AsyncCardFetcher(ScryfallConfig(**config), client=client, limiter=limiter)
+
+
+class TestAsyncCardFetcher(unittest.IsolatedAsyncioTestCase):
+    async def test_search_card_cascades_to_fuzzy(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.params)
+            if "exact" in request.url.params:
+                return httpx.Response(404, json={"object": "error"})
+            return httpx.Response(200, json={"name": "Lightning Bolt"})
+
+        async with _fetcher(handler) as fetcher:
+            card = await fetcher.search_card("lightnig bolt")
+
+        self.assertEqual(card, {"name": "Lightning Bolt"})
+        self.assertEqual([list(p.keys()) for p in seen], [["exact"], ["fuzzy"]])
+
+    async def test_search_card_not_found_raises(self):
+        async with _fetcher(lambda request: httpx.Response(404, json={})) as fetcher:
+            with self.assertRaises(Exception) as ctx:
+                await fetcher.search_card("Nope")
+        self.assertIn("Card not found", str(ctx.exception))
+
+    async def test_definitive_miss_is_cached(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(404, json={})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            async with _fetcher(handler, cache_path=os.path.join(tmp, "scryfall.sqlite")) as fetcher:
+                for _ in range(2):
+                    with self.assertRaises(Exception):
+                        await fetcher.search_card("Nope")
+                fetcher._cache.close()
+                fetcher._names.close()
+
+        # exact, fuzzy, phrase for the first lookup; the second is answered from the negative cache
+        self.assertEqual(len(calls), 3)
+
+    async def test_autocomplete(self):
+        async with _fetcher(lambda request: httpx.Response(200, json={"data": ["Opt", "Optimus"]})) as fetcher:
+            self.assertEqual(await fetcher.autocomplete("op"), ["Opt", "Optimus"])
+            self.assertEqual(await fetcher.autocomplete("  "), [])
+
+    async def test_retries_server_errors(self):
+        responses = [httpx.Response(503), httpx.Response(200, json={"name": "Opt"})]
+
+        async with _fetcher(lambda request: responses.pop(0), max_retries=2) as fetcher:
+            self.assertEqual(
+                await fetcher._make_request(f"{AsyncCardFetcher.BASE_URL}/cards/named?exact=Opt"), {"name": "Opt"}
+            )
+
+    async def test_bulk_chunks_and_falls_back_for_not_found(self):
+        posted = []
+
+        def handler(request):
+            if request.url.path == "/cards/collection":
+                identifiers = json.loads(request.content)["identifiers"]
+                posted.append(len(identifiers))
+                found = [{"name": i["name"]} for i in identifiers if i["name"] != "Typo"]
+                return httpx.Response(200, json={"data": found, "not_found": [{"name": "Typo"}]})
+            if request.url.params.get("fuzzy") == "Typo":
+                return httpx.Response(200, json={"name": "Fixed"})
+            return httpx.Response(404, json={})
+
+        names = [f"Card {i}" for i in range(100)] + ["Typo"]
+        async with _fetcher(handler) as fetcher:
+            result = await fetcher.search_cards_bulk(names)
+
+        self.assertEqual(sorted(posted), [26, 75])
+        self.assertEqual(result[0], {"name": "Card 0"})
+        self.assertEqual(result[-1], {"name": "Fixed"})
+
+    async def test_semaphore_bounds_in_flight_requests(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"name": "x"})
+
+        async with _fetcher(handler, max_concurrency=3) as fetcher:
+            urls = [f"{AsyncCardFetcher.BASE_URL}/cards/named?exact=c{i}" for i in range(12)]
+            await asyncio.gather(*(fetcher._make_request(u) for u in urls))
+
+        self.assertEqual(peak, 3)
+
+    async def test_every_request_draws_from_limiter(self):
+        limiter = MagicMock(reserve=MagicMock(return_value=0.0))
+        async with _fetcher(lambda request: httpx.Response(200, json={}), limiter=limiter) as fetcher:
+            for i in range(4):
+                await fetcher._make_request(f"{AsyncCardFetcher.BASE_URL}/cards/named?exact=c{i}")
+        self.assertEqual(limiter.reserve.call_count, 4)
+
+
+class TestAsyncCardFetcherSharedLimiter(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+
+    def tearDown(self):
+        reset_transport()
+
+    def test_defaults_to_the_shared_transport_bucket(self):
+        fetcher = AsyncCardFetcher(ScryfallConfig())
+        self.assertIs(fetcher._limiter, get_transport().limiter)
+        asyncio.run(fetcher.aclose())
+
+    def test_max_concurrency_validation(self):
+        with self.assertRaises(ValueError):
+            ScryfallConfig(max_concurrency=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for the COPY bulk load: text-format rendering and staging table setup."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from deckdex.storage.bulk_load import CopyStream, copy_field, copy_into_staging
+
+
+class TestCopyFormat(unittest.TestCase):
+    def test_fields_escape_separators_and_null(self):
+        self.assertEqual(copy_field(None), "\\N")
+        self.assertEqual(copy_field(""), "")
+        self.assertEqual(copy_field("a\tb\nc\\d\r"), "a\\tb\\nc\\\\d\\r")
+        self.assertEqual(copy_field(1.5), "1.5")
+
+    def test_stream_renders_rows_lazily_in_chunks(self):
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield (f"card {i}", None, i)
+
+        stream = CopyStream(rows())
+        first = stream.read(16)
+        self.assertEqual(first, "card 0\t\\N\t0\ncard")
+        self.assertLess(len(consumed), 5)
+
+        rest = []
+        while chunk := stream.read(64):
+            rest.append(chunk)
+        lines = (first + "".join(rest)).splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertEqual(lines[-1], "card 99\t\\N\t99")
+        self.assertEqual(stream.rows, 100)
+
+    def test_read_all(self):
+        self.assertEqual(CopyStream([("a", 1), ("b", 2)]).read(), "a\t1\nb\t2\n")
+
+
+class TestCopyIntoStaging(unittest.TestCase):
+    def test_creates_temp_table_and_copies_with_load_order(self):
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, stream: copied.append(stream.read())
+
+        count = copy_into_staging(conn, "cards", ["name", "quantity"], [("Opt", 2), ("Shock", None)], "staging")
+
+        self.assertEqual(count, 2)
+        create_sql = str(conn.execute.call_args[0][0])
+        self.assertIn("CREATE TEMP TABLE staging ON COMMIT DROP AS", create_sql)
+        self.assertIn("SELECT name, quantity, 0::BIGINT AS load_order FROM cards WITH NO DATA", create_sql)
+        copy_sql = cursor.copy_expert.call_args[0][0]
+        self.assertEqual(copy_sql, "COPY staging (name, quantity, load_order) FROM STDIN")
+        self.assertEqual(copied, ["Opt\t2\t0\nShock\t\\N\t1\n"])
+        cursor.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the process-wide card-data cache used by MagicCardProcessor."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from deckdex.card_cache import CardDataCache, get_card_cache, reset_card_cache
+from deckdex.config import ProcessingConfig
+
+
+class TestCardDataCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = CardDataCache(max_entries=2, max_bytes=1 << 20, ttl=60, clock=lambda: self.now)
+
+    def test_hit_miss_counters_and_name_normalization(self):
+        self.cache.put("Lightning Bolt", {"name": "Lightning Bolt"})
+        self.assertEqual(self.cache.get(" lightning  BOLT"), {"name": "Lightning Bolt"})
+        self.assertIsNone(self.cache.get("Opt"))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_failed_lookups_are_not_cached(self):
+        self.cache.put("Opt", None)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("a", {"name": "a"})
+        self.cache.put("b", {"name": "b"})
+        self.cache.get("a")
+        self.cache.put("c", {"name": "c"})
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_byte_bound_evicts(self):
+        cache = CardDataCache(max_entries=100, max_bytes=300, ttl=60)
+        for i in range(5):
+            cache.put(f"card {i}", {"name": f"card {i}", "oracle_text": "x" * 100})
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 300)
+        self.assertEqual(stats["entries"] + stats["evictions"], 5)
+
+    def test_entries_expire_after_ttl(self):
+        self.cache.put("Opt", {"name": "Opt"})
+        self.now = 61
+        self.assertIsNone(self.cache.get("Opt"))
+        self.assertEqual(self.cache.stats()["expirations"], 1)
+
+
+class TestSharedCardCache(unittest.TestCase):
+    def setUp(self):
+        reset_card_cache()
+
+    def tearDown(self):
+        reset_card_cache()
+
+    def test_processors_share_one_cache(self):
+        from deckdex.magic_card_processor import MagicCardProcessor
+
+        def processor():
+            proc = MagicCardProcessor.__new__(MagicCardProcessor)
+            proc._card_cache = get_card_cache(ProcessingConfig())
+            proc._card_cache_start = proc._card_cache.stats()
+            proc.card_fetcher = MagicMock()
+            proc.card_fetcher.search_card.return_value = {"name": "Opt"}
+            return proc
+
+        first = processor()
+        first._fetch_card_data("Opt")
+        second = processor()
+        self.assertEqual(second._fetch_card_data("Opt"), {"name": "Opt"})
+
+        second.card_fetcher.search_card.assert_not_called()
+        self.assertEqual(second.card_cache_stats()["hits"], 1)
+        self.assertEqual(second.card_cache_stats()["misses"], 0)
+
+    def test_config_validation(self):
+        with self.assertRaises(ValueError):
+            ProcessingConfig(card_cache_size=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,6 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -346,5 +349,190 @@ class TestCardFetcherUrlEncoding(unittest.TestCase):
         mock_make_request.assert_called_once_with(expected_url)
 
 
+class TestCardFetcherBulk(unittest.TestCase):
+    def setUp(self):
+        """Set up the test environment."""
+        self.card_fetcher = CardFetcher(
+            scryfall_config=ScryfallConfig(),
+            openai_config=OpenAIConfig(),
+        )
+
+    @patch.object(CardFetcher, "_make_request")
+    def test_identifier_kinds_are_translated(self, mock_make_request):
+        """Names, Scryfall ids and (set, collector_number) pairs map to collection identifiers."""
+        scryfall_id = "56ebc372-aabd-4174-a943-c7bf59e5028d"
+        mock_make_request.return_value = {
+            "data": [
+                {"id": "a1", "name": "Opt", "set": "xln", "collector_number": "65"},
+                {"id": scryfall_id, "name": "Counterspell", "set": "mh2", "collector_number": "267"},
+                {"id": "b2", "name": "Lightning Bolt", "set": "lea", "collector_number": "161"},
+            ],
+            "not_found": [],
+        }
+
+        result = self.card_fetcher.search_cards_bulk(["Opt", scryfall_id, ("LEA", 161)])
+
+        mock_make_request.assert_called_once_with(
+            f"{CardFetcher.BASE_URL}/cards/collection",
+            payload={
+                "identifiers": [
+                    {"name": "Opt"},
+                    {"id": scryfall_id},
+                    {"set": "lea", "collector_number": "161"},
+                ]
+            },
+        )
+        self.assertEqual([c["name"] for c in result], ["Opt", "Counterspell", "Lightning Bolt"])
+
+    @patch.object(CardFetcher, "_make_request")
+    def test_chunks_of_75_and_duplicates_sent_once(self, mock_make_request):
+        """Identifiers are deduplicated and split into requests of at most 75."""
+        names = [f"Card {i}" for i in range(80)]
+        mock_make_request.side_effect = lambda url, payload: {
+            "data": [{"name": i["name"]} for i in payload["identifiers"]],
+            "not_found": [],
+        }
+
+        result = self.card_fetcher.search_cards_bulk(names + ["card 3"])
+
+        sizes = [len(c.kwargs["payload"]["identifiers"]) for c in mock_make_request.call_args_list]
+        self.assertEqual(sizes, [75, 5])
+        self.assertEqual(len(result), 81)
+        self.assertEqual(result[-1], {"name": "Card 3"})
+
+    @patch.object(CardFetcher, "search_card")
+    @patch.object(CardFetcher, "_make_request")
+    def test_not_found_falls_back_to_cascade(self, mock_make_request, mock_search_card):
+        """Only names in not_found go through search_card; the rest come from the bulk response."""
+        mock_make_request.return_value = {
+            "data": [{"name": "Opt"}],
+            "not_found": [{"name": "Lightnig Bolt"}],
+        }
+        mock_search_card.return_value = {"name": "Lightning Bolt"}
+
+        result = self.card_fetcher.search_cards_bulk(["Opt", "Lightnig Bolt"])
+
+        mock_search_card.assert_called_once_with("Lightnig Bolt")
+        self.assertEqual(result, [{"name": "Opt"}, {"name": "Lightning Bolt"}])
+
+    @patch.object(CardFetcher, "search_card")
+    @patch.object(CardFetcher, "_make_request")
+    def test_no_fallback_leaves_not_found_as_none(self, mock_make_request, mock_search_card):
+        mock_make_request.return_value = {"data": [], "not_found": [{"name": "Nope"}]}
+
+        result = self.card_fetcher.search_cards_bulk(["Nope"], fallback=False)
+
+        mock_search_card.assert_not_called()
+        self.assertEqual(result, [None])
+
+    @patch.object(CardFetcher, "_make_request")
+    def test_double_faced_card_matches_front_face_name(self, mock_make_request):
+        mock_make_request.return_value = {
+            "data": [{"name": "Delver of Secrets // Insectile Aberration"}],
+            "not_found": [],
+        }
+
+        result = self.card_fetcher.search_cards_bulk(["Delver of Secrets"], fallback=False)
+
+        self.assertEqual(result[0]["name"], "Delver of Secrets // Insectile Aberration")
+
+    @patch.object(CardFetcher, "search_card")
+    @patch.object(CardFetcher, "_make_request")
+    def test_request_failure_falls_back_per_card(self, mock_make_request, mock_search_card):
+        mock_make_request.side_effect = Exception("503 Service Unavailable")
+        mock_search_card.return_value = {"name": "Opt"}
+
+        result = self.card_fetcher.search_cards_bulk(["Opt"])
+
+        self.assertEqual(result, [{"name": "Opt"}])
+
+
+def _completion(payload):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+class TestCardFetcherBatchedAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.openai_config = OpenAIConfig(batch_size=2, cache_path=os.path.join(self.tmp.name, "openai.sqlite"))
+        self.card_fetcher = self._fetcher()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fetcher(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}), patch("deckdex.card_fetcher.OpenAI"):
+            fetcher = CardFetcher(ScryfallConfig(), OpenAIConfig(**{**vars(self.openai_config), "enabled": True}))
+        return fetcher
+
+    @patch.object(CardFetcher, "_call_openai")
+    def test_cards_are_packed_per_request_and_reprints_deduplicated(self, mock_call_openai):
+        mock_call_openai.side_effect = [
+            _completion({"cards": [{"id": 1, "strategy": "Burn.", "tier": "a"}, {"id": 2, "strategy": "Draw."}]}),
+            _completion({"cards": [{"id": 1, "strategy": "Ramp.", "tier": "B"}]}),
+        ]
+        cards = [
+            {"oracle_id": "o-bolt", "name": "Lightning Bolt"},
+            {"oracle_id": "o-opt", "name": "Opt"},
+            {"oracle_id": "o-bolt", "name": "Lightning Bolt"},
+            {"oracle_id": "o-growth", "name": "Rampant Growth"},
+        ]
+
+        result = self.card_fetcher.analyze_cards(cards)
+
+        self.assertEqual(result, [("Burn.", "A"), ("Draw.", None), ("Burn.", "A"), ("Ramp.", "B")])
+        self.assertEqual(mock_call_openai.call_count, 2)
+        prompt = mock_call_openai.call_args_list[0].args[0][1]["content"]
+        self.assertIn("[id 2]", prompt)
+
+    @patch.object(CardFetcher, "_call_openai")
+    def test_missing_entries_are_not_cached(self, mock_call_openai):
+        mock_call_openai.return_value = _completion({"cards": [{"id": 2, "strategy": "Draw.", "tier": "C"}]})
+        cards = [{"oracle_id": "o-bolt", "name": "Lightning Bolt"}, {"oracle_id": "o-opt", "name": "Opt"}]
+
+        self.assertEqual(self.card_fetcher.analyze_cards(cards), [(None, None), ("Draw.", "C")])
+        self.assertEqual(
+            self.card_fetcher._enrichment.get_many(["o-bolt", "o-opt"], self.card_fetcher.openai_model),
+            {"o-opt": ("Draw.", "C")},
+        )
+
+    @patch.object(CardFetcher, "_call_openai")
+    def test_cached_analysis_is_reused_by_later_fetchers(self, mock_call_openai):
+        mock_call_openai.return_value = _completion({"cards": [{"id": 1, "strategy": "Burn.", "tier": "A"}]})
+        self.card_fetcher.analyze_cards([{"oracle_id": "o-bolt", "name": "Lightning Bolt", "set": "lea"}])
+
+        later = self._fetcher()
+        result = later.analyze_cards([{"oracle_id": "o-bolt", "name": "Lightning Bolt", "set": "m10"}])
+
+        self.assertEqual(result, [("Burn.", "A")])
+        mock_call_openai.assert_called_once()
+
+    @patch.object(CardFetcher, "_call_openai")
+    def test_bad_tier_only_drops_that_cards_tier(self, mock_call_openai):
+        mock_call_openai.return_value = _completion(
+            {"cards": [{"id": 1, "strategy": "Burn.", "tier": None}, {"id": 2, "strategy": "Draw.", "tier": 3}]}
+        )
+        cards = [{"oracle_id": "o-bolt", "name": "Lightning Bolt"}, {"oracle_id": "o-opt", "name": "Opt"}]
+
+        self.assertEqual(self.card_fetcher.analyze_cards(cards), [("Burn.", None), ("Draw.", None)])
+
+    @patch.object(CardFetcher, "_call_openai")
+    def test_chunks_fit_the_completion_limit(self, mock_call_openai):
+        self.openai_config = OpenAIConfig(batch_size=20, max_tokens=150, max_completion_tokens=400)
+        fetcher = self._fetcher()
+        mock_call_openai.return_value = _completion({"cards": []})
+
+        fetcher.analyze_cards([{"oracle_id": f"o-{i}", "name": f"Card {i}"} for i in range(5)])
+
+        self.assertEqual([c.kwargs["max_tokens"] for c in mock_call_openai.call_args_list], [300, 300, 150])
+
+    def test_disabled_openai_returns_empty_analyses(self):
+        fetcher = CardFetcher(ScryfallConfig(), OpenAIConfig())
+        self.assertEqual(fetcher.analyze_cards([{"name": "Opt"}]), [(None, None)])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,36 @@ class TestSearchByName(unittest.TestCase):
         self.assertEqual(params["pattern"], "%Lightning%")
         self.assertEqual(params["lim"], 10)
 
+    def test_matches_names_only(self):
+        repo = _make_repo()
+        mock_conn = MagicMock()
+        repo._eng.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        repo._eng.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = []
+
+        repo.search_by_name("  lightning bolt ")
+
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        self.assertNotIn("card_search_vector", sql)
+        self.assertNotIn("tsquery", sql)
+        self.assertLess(sql.index("lower(name) = lower(:query)"), sql.index("similarity(name, :query)"))
+        self.assertEqual(params["pattern"], "%lightning bolt%")
+
+    def test_search_uses_trigram_and_full_text_with_ranking(self):
+        repo = _make_repo()
+        mock_conn = MagicMock()
+        repo._eng.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        repo._eng.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = []
+
+        repo.search("  lightning bolt ")
+
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        self.assertIn("card_search_vector(name, type_line, oracle_text) @@ websearch_to_tsquery", sql)
+        self.assertLess(sql.index("lower(name) = lower(:query)"), sql.index("ts_rank("))
+        self.assertEqual(params["query"], "lightning bolt")
+        self.assertEqual(params["prefix"], "lightning bolt%")
+
     def test_empty_query_returns_empty(self):
         repo = _make_repo()
         self.assertEqual(repo.search_by_name(""), [])
@@ -111,6 +141,49 @@ class TestAutocomplete(unittest.TestCase):
         self.assertEqual(params["lim"], 5)
 
 
+class TestBatchLookups(unittest.TestCase):
+    """Test CatalogRepository.get_by_names() / get_by_scryfall_ids()."""
+
+    def _conn(self, repo, rows):
+        mock_conn = MagicMock()
+        repo._eng.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        repo._eng.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = rows
+        return mock_conn
+
+    def test_get_by_names_single_query_keyed_by_lower_name(self):
+        repo = _make_repo()
+        mock_conn = self._conn(
+            repo,
+            [
+                {"lookup_key": "opt", "name": "Opt", "scryfall_id": "a"},
+                {"lookup_key": "delver of secrets", "name": "Delver of Secrets // Insectile Aberration"},
+            ],
+        )
+
+        result = repo.get_by_names(["Opt", " opt ", "Delver of Secrets"])
+
+        self.assertEqual(mock_conn.execute.call_count, 1)
+        params = mock_conn.execute.call_args[0][1]
+        self.assertEqual(params["keys"], ["delver of secrets", "opt"])
+        self.assertEqual(result["opt"], {"name": "Opt", "scryfall_id": "a"})
+        self.assertIn("delver of secrets", result)
+
+    def test_get_by_names_empty_skips_query(self):
+        repo = _make_repo()
+        self.assertEqual(repo.get_by_names(["", "  "]), {})
+        repo._eng.connect.assert_not_called()
+
+    def test_get_by_scryfall_ids(self):
+        repo = _make_repo()
+        mock_conn = self._conn(repo, [{"scryfall_id": "a", "name": "Opt"}])
+
+        result = repo.get_by_scryfall_ids(["a", None, "a"])
+
+        self.assertEqual(mock_conn.execute.call_args[0][1], {"ids": ["a"]})
+        self.assertEqual(result, {"a": {"scryfall_id": "a", "name": "Opt"}})
+
+
 class TestUpsertCards(unittest.TestCase):
     """Test CatalogRepository.upsert_cards()."""
 
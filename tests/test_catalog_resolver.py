@@ -0,0 +1,204 @@
+"""Tests for catalog-first card resolution (CatalogResolver and MagicCardProcessor._resolve_cards)."""
+
+import contextlib
+import io
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from deckdex.catalog.resolver import CatalogResolver, catalog_row_to_card_data
+
+_BOLT_ROW = {
+    "scryfall_id": "bolt-id",
+    "oracle_id": "bolt-oracle",
+    "name": "Lightning Bolt",
+    "type_line": "Instant",
+    "oracle_text": "Lightning Bolt deals 3 damage to any target.",
+    "mana_cost": "{R}",
+    "cmc": 1.0,
+    "colors": "R",
+    "color_identity": "R",
+    "keywords": "",
+    "rarity": "common",
+    "set_id": "lea",
+    "set_name": "Limited Edition Alpha",
+    "collector_number": "161",
+    "release_date": "1993-08-05",
+    "prices_eur": "1.50",
+    "prices_usd": "2.00",
+    "legalities": '{"modern": "legal"}',
+    "image_uri_normal": "https://img/bolt.jpg",
+}
+
+
+class TestCatalogRowToCardData(unittest.TestCase):
+    def test_maps_to_scryfall_shape(self):
+        data = catalog_row_to_card_data(_BOLT_ROW)
+        self.assertEqual(data["id"], "bolt-id")
+        self.assertEqual(data["prices"]["eur"], "1.50")
+        self.assertEqual(data["colors"], ["R"])
+        self.assertEqual(data["keywords"], [])
+        self.assertEqual(data["set"], "lea")
+        self.assertEqual(data["released_at"], "1993-08-05")
+        self.assertEqual(data["legalities"], {"modern": "legal"})
+        self.assertEqual(data["image_uris"], {"normal": "https://img/bolt.jpg"})
+
+
+class TestCatalogResolver(unittest.TestCase):
+    def test_scryfall_id_first_then_name(self):
+        repo = MagicMock()
+        repo.get_by_scryfall_ids.return_value = {"bolt-id": _BOLT_ROW}
+        repo.get_by_names.return_value = {"opt": {"name": "Opt", "scryfall_id": "opt-id"}}
+        resolver = CatalogResolver(repo)
+
+        result = resolver.resolve([("Lightning Bolt", "bolt-id"), ("Opt", None), ("Unknown", None)])
+
+        repo.get_by_scryfall_ids.assert_called_once_with(["bolt-id"])
+        repo.get_by_names.assert_called_once_with(["Opt", "Unknown"])
+        self.assertEqual(result[0]["id"], "bolt-id")
+        self.assertEqual(result[1]["name"], "Opt")
+        self.assertIsNone(result[2])
+        self.assertEqual((resolver.hits, resolver.misses), (2, 1))
+
+    def test_catalog_error_counts_as_miss(self):
+        repo = MagicMock()
+        repo.get_by_scryfall_ids.side_effect = Exception('relation "catalog_cards" does not exist')
+        resolver = CatalogResolver(repo)
+        self.assertEqual(resolver.resolve([("Opt", None)]), [None])
+        self.assertEqual(resolver.misses, 1)
+
+
+class TestProcessorCatalogFirst(unittest.TestCase):
+    def _processor(self, resolver):
+        from deckdex.card_cache import CardDataCache
+        from deckdex.config import ProcessingConfig, ProcessorConfig
+        from deckdex.magic_card_processor import MagicCardProcessor
+
+        proc = MagicCardProcessor.__new__(MagicCardProcessor)
+        proc.config = ProcessorConfig(processing=ProcessingConfig(batch_size=10, max_workers=1))
+        proc._card_cache = CardDataCache(max_entries=100, max_bytes=1 << 20, ttl=60)
+        proc._card_cache_start = {}
+        proc.error_count = 0
+        proc.last_error_count = 0
+        proc.not_found_cards = []
+        proc.card_fetcher = MagicMock()
+        proc.card_fetcher.search_cards_bulk.side_effect = lambda names, fallback=True: [
+            {"name": n, "prices": {"eur": "9.00"}} for n in names
+        ]
+        proc.catalog_resolver = resolver
+        proc.collection_repository = MagicMock()
+        return proc
+
+    def test_only_catalog_misses_reach_scryfall(self):
+        repo = MagicMock()
+        repo.get_by_scryfall_ids.return_value = {}
+        repo.get_by_names.return_value = {"lightning bolt": _BOLT_ROW}
+        proc = self._processor(CatalogResolver(repo))
+
+        result = proc._resolve_cards([("Lightning Bolt", None), ("Missing Card", None)])
+
+        proc.card_fetcher.search_cards_bulk.assert_called_once_with(["Missing Card"], fallback=False)
+        self.assertEqual(result[0]["prices"]["eur"], "1.50")
+        self.assertEqual(result[1]["prices"]["eur"], "9.00")
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_process_cards_repo_fully_from_catalog(self):
+        repo = MagicMock()
+        repo.get_by_scryfall_ids.return_value = {"bolt-id": _BOLT_ROW}
+        repo.get_by_names.return_value = {}
+        proc = self._processor(CatalogResolver(repo))
+        proc.collection_repository.get_all_cards.return_value = [
+            {"id": 1, "name": "Lightning Bolt", "scryfall_id": "bolt-id"}
+        ]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.process_cards_repo()
+
+        proc.card_fetcher.search_cards_bulk.assert_not_called()
+        ((card_id, update),) = proc.collection_repository.bulk_update.call_args[0][0]
+        self.assertEqual(card_id, 1)
+        self.assertEqual(update["type_line"], "Instant")
+        self.assertEqual(update["price_eur"], "1,50")
+        self.assertEqual(update["set_number"], "161")
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_price_update_uses_stored_printing(self):
+        repo = MagicMock()
+        repo.get_by_scryfall_ids.return_value = {"bolt-id": _BOLT_ROW}
+        repo.get_by_names.return_value = {
+            "lightning bolt": {**_BOLT_ROW, "scryfall_id": "m10-bolt", "prices_eur": "0.30"}
+        }
+        proc = self._processor(CatalogResolver(repo))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.update_prices_data_repo([(1, "Lightning Bolt", "", "bolt-id"), (2, "Lightning Bolt", "", None)])
+
+        repo.get_by_scryfall_ids.assert_called_once_with(["bolt-id"])
+        proc.card_fetcher.search_cards_bulk.assert_not_called()
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(1, "1,50"), (2, "0,30")])
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_catalog_miss_with_stored_printing_is_fetched_by_id(self):
+        proc = self._processor(None)
+        proc.card_fetcher.search_cards_bulk.side_effect = lambda idents, fallback=True: [
+            {"id": "bolt-id", "prices": {"eur": "1.50"}} if ident == {"id": "bolt-id"} else None for ident in idents
+        ]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.update_prices_data_repo([(1, "Lightning Bolt", "", "bolt-id")])
+
+        proc.card_fetcher.search_cards_bulk.assert_called_once_with([{"id": "bolt-id"}], fallback=False)
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(1, "1,50")])
+        # Cached under the printing, not the name another printing could be priced from
+        self.assertIsNotNone(proc._card_cache.get("bolt-id"))
+        self.assertIsNone(proc._card_cache.get("Lightning Bolt"))
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_process_cards_repo_runs_batches_in_parallel_and_commits_in_order(self):
+        proc = self._processor(None)
+        proc.config.processing.batch_size = 2
+        proc.config.processing.max_workers = 3
+        proc.collection_repository.get_all_cards.return_value = [{"id": i, "name": f"Card {i}"} for i in range(6)]
+        later_batch_started = threading.Event()
+
+        def bulk(names, fallback=True):
+            if "Card 0" in names:
+                # The first batch only resolves once a later batch has run alongside it
+                self.assertTrue(later_batch_started.wait(5))
+            else:
+                later_batch_started.set()
+            return [{"name": n, "rarity": "common"} for n in names]
+
+        proc.card_fetcher.search_cards_bulk.side_effect = bulk
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.process_cards_repo()
+
+        batches = [c.args[0] for c in proc.collection_repository.bulk_update.call_args_list]
+        self.assertEqual([[card_id for card_id, _fields in b] for b in batches], [[0, 1], [2, 3], [4, 5]])
+        proc.collection_repository.update.assert_not_called()
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_process_cards_repo_resumes_after_checkpoint_and_reports_progress(self):
+        proc = self._processor(None)
+        proc.config.processing.batch_size = 2
+        proc.config.resume_after_id = 2
+        proc.collection_repository.get_all_cards.return_value = [
+            {"id": i, "name": f"Card {i}"} for i in (5, 1, 4, 3, 2)
+        ]
+        checkpoints = []
+        proc.checkpoint_callback = checkpoints.append
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.process_cards_repo()
+
+        names = [c.args[0] for c in proc.card_fetcher.search_cards_bulk.call_args_list]
+        self.assertEqual(names, [["Card 3", "Card 4"], ["Card 5"]])
+        self.assertEqual(
+            checkpoints,
+            [{"last_card_id": 4, "processed": 2, "updated": 2}, {"last_card_id": 5, "processed": 3, "updated": 3}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,7 +29,7 @@ class TestCatalogSearch(unittest.TestCase):
     @patch("backend.api.routes.catalog_routes._get_catalog_repo")
     def test_search_returns_200_with_results(self, mock_get_repo):
         mock_repo = MagicMock()
-        mock_repo.search_by_name.return_value = SAMPLE_CARDS
+        mock_repo.search.return_value = SAMPLE_CARDS
         mock_get_repo.return_value = mock_repo
 
         response = client.get("/api/catalog/search?q=bolt")
@@ -41,7 +41,7 @@ class TestCatalogSearch(unittest.TestCase):
     @patch("backend.api.routes.catalog_routes._get_catalog_repo")
     def test_search_empty_results(self, mock_get_repo):
         mock_repo = MagicMock()
-        mock_repo.search_by_name.return_value = []
+        mock_repo.search.return_value = []
         mock_get_repo.return_value = mock_repo
 
         response = client.get("/api/catalog/search?q=nonexistent")
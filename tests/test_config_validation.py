@@ -47,6 +47,13 @@ class TestProcessingConfig(unittest.TestCase):
             ProcessingConfig(write_buffer_batches=0)
         self.assertIn("write_buffer_batches must be >= 1", str(context.exception))
 
+    def test_invalid_price_refresh_budgets(self):
+        """Test that the incremental price refresh settings reject negative values."""
+        for field in ("price_max_age_hours", "price_time_budget", "price_request_budget"):
+            with self.assertRaises(ValueError) as context:
+                ProcessingConfig(**{field: -1})
+            self.assertIn(f"{field} must be >= 0", str(context.exception))
+
 
 class TestScryfallConfig(unittest.TestCase):
     """Test ScryfallConfig validation."""
@@ -183,6 +190,13 @@ class TestProcessorConfig(unittest.TestCase):
             ProcessorConfig(resume_from=0)
         self.assertIn("resume_from must be >= 1", str(context.exception))
 
+    def test_price_source_validation(self):
+        """Test that price_source only accepts known sources."""
+        self.assertEqual(ProcessorConfig(price_source="catalog").price_source, "catalog")
+        with self.assertRaises(ValueError) as context:
+            ProcessorConfig(price_source="cardmarket")
+        self.assertIn("price_source must be one of", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 """Integration tests for external-apis settings routes and CardFetcher bug regression."""
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
@@ -95,10 +95,10 @@ class TestPutExternalApisSettings(unittest.TestCase):
 
 
 class TestCardFetcherBugRegression(unittest.TestCase):
-    """Regression test: CardFetcher must receive (config.scryfall, config.openai)."""
+    """Regression test: the importer's Scryfall fetcher must receive config.scryfall."""
 
     def test_importer_creates_cardfetcher_with_correct_args(self):
-        """Verify CardFetcher is instantiated with config.scryfall and config.openai."""
+        """Verify AsyncCardFetcher is instantiated with config.scryfall for catalog misses."""
         from backend.api.services.importer_service import ImporterService
 
         mock_repo = MagicMock()
@@ -110,24 +110,26 @@ class TestCardFetcherBugRegression(unittest.TestCase):
         mock_config.openai = MagicMock(name="openai_config")
 
         mock_catalog_repo = MagicMock()
-        mock_catalog_repo.search_by_name.return_value = [{"name": "TestCard", "type_line": "Creature"}]
+        mock_catalog_repo.search_by_name.return_value = []
 
         mock_settings_repo = MagicMock()
         mock_settings_repo.get_external_apis_settings.return_value = {"scryfall_enabled": True}
 
-        # CardFetcher is imported inside _run_import via `from deckdex.card_fetcher import CardFetcher`
-        # so we patch at the source module
+        # AsyncCardFetcher is imported lazily inside the importer, so we patch at the source module
         with (
             patch("backend.api.services.importer_service.load_config", return_value=mock_config),
-            patch("deckdex.card_fetcher.CardFetcher") as MockCardFetcher,
+            patch("deckdex.async_card_fetcher.AsyncCardFetcher") as MockCardFetcher,
             patch("backend.api.dependencies.get_catalog_repo", return_value=mock_catalog_repo),
             patch("backend.api.dependencies.get_user_settings_repo", return_value=mock_settings_repo),
         ):
+            fetcher = MockCardFetcher.return_value.__aenter__.return_value
+            fetcher.search_cards_bulk = AsyncMock(return_value=[{"name": "TestCard", "type_line": "Creature"}])
             parsed_cards = [{"name": "TestCard", "quantity": 1}]
-            service._run_import(parsed_cards)
+            result = service._run_import(parsed_cards)
 
-            # Verify CardFetcher was called with config.scryfall and config.openai
-            MockCardFetcher.assert_called_once_with(mock_config.scryfall, mock_config.openai)
+            MockCardFetcher.assert_called_once_with(mock_config.scryfall)
+            fetcher.search_cards_bulk.assert_awaited_once_with(["TestCard"])
+            self.assertEqual(result["not_found"], [])
 
 
 if __name__ == "__main__":
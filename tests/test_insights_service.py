@@ -19,10 +19,12 @@ from backend.api.services.insights_service import (
     INSIGHTS_CATALOG,
     InsightsService,
     InsightsSuggestionEngine,
-    _normalize_color_identity,
     _parse_date,
     _parse_price,
 )
+from backend.api.utils.color import card_color_identity
+from backend.api.utils.color import normalize_color_identity as _normalize_color_identity
+from deckdex.colors import letters_to_mask, mask_to_identity
 
 # ---------------------------------------------------------------------------
 # Shared sample data
@@ -106,6 +108,34 @@ SAMPLE_CARDS = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Color identity bitmasks
+# ---------------------------------------------------------------------------
+
+
+def test_color_mask_round_trips_letters():
+    for raw in ("W,U", "U,W", "wu"):
+        assert letters_to_mask(raw) == 3
+        assert mask_to_identity(letters_to_mask(raw)) == "WU"
+    assert letters_to_mask("") == 0
+    assert mask_to_identity(0) == "C"
+    assert mask_to_identity(31) == "WUBRG"
+
+
+def test_card_color_identity_prefers_stored_mask():
+    assert card_color_identity({"color_identity": "R", "color_identity_mask": 24}) == "RG"
+    assert card_color_identity({"colors": "['Black']"}) == "B"
+    # An empty color_identity gives a zero mask; colors still decide, as before the masks
+    assert card_color_identity({"color_identity": "", "colors": "U", "color_identity_mask": 0}) == "U"
+    assert card_color_identity({"color_identity": "", "color_identity_mask": 0}) == "C"
+
+
+def test_by_color_uses_mask_from_postgres_cards():
+    cards = [_make_card(name="A", color_identity=None, color_identity_mask=12)]
+    items = InsightsService(cards=cards).execute("by_color")["data"]["items"]
+    assert {item["color"]: item["count"] for item in items} == {"B": 1, "R": 1}
+
+
 # ---------------------------------------------------------------------------
 # _normalize_color_identity
 # ---------------------------------------------------------------------------
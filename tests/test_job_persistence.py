@@ -55,6 +55,9 @@ class TestJobRepositoryGetJob(unittest.TestCase):
             "created_at": dt,
             "completed_at": dt,
             "result": {"status": "success"},
+            "checkpoint": None,
+            "progress": None,
+            "worker_id": None,
         }
         row_mock = MagicMock()
         row_mock.__getitem__ = lambda self, key: row[key]
@@ -447,6 +450,7 @@ class TestProcessorServiceSingleCardPersist(unittest.IsolatedAsyncioTestCase):
             patch.object(service, "_persist_job_start") as mock_start,
             patch.object(service, "_persist_job_end") as mock_end,
             patch.object(service, "_emit_progress", new_callable=AsyncMock),
+            patch("backend.api.services.processor_service.MagicCardProcessor"),
             patch("asyncio.get_event_loop") as mock_get_loop,
         ):
             mock_loop = MagicMock()
@@ -466,6 +470,90 @@ class TestProcessorServiceSingleCardPersist(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(end_args[0], "error")
 
 
+# ---------------------------------------------------------------------------
+# Job checkpoints — JobRepository and ProcessorService resume
+# ---------------------------------------------------------------------------
+
+
+def _checkpoint_repo(row=None):
+    from deckdex.storage.job_repository import JobRepository
+
+    repo = JobRepository.__new__(JobRepository)
+    repo._url = ""
+    mock_conn = MagicMock()
+    mock_conn.execute.return_value.fetchone.return_value = row
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value.__enter__ = lambda s, *a: mock_conn
+    mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+    repo._eng = mock_engine
+    return repo, mock_conn
+
+
+class TestJobRepositoryCheckpoints(unittest.TestCase):
+    def test_save_checkpoint_writes_json_and_commits(self):
+        repo, conn = _checkpoint_repo()
+
+        repo.save_checkpoint("job-1", {"scope": "all", "last_card_id": 42})
+
+        params = conn.execute.call_args[0][1]
+        self.assertEqual(params["id"], "job-1")
+        self.assertIn('"last_card_id": 42', params["checkpoint"])
+        conn.commit.assert_called_once()
+
+    def test_unfinished_job_with_same_scope_is_resumable(self):
+        checkpoint = {"scope": "all", "last_card_id": 42, "processed": 100, "updated": 7}
+        repo, conn = _checkpoint_repo(("error", checkpoint))
+
+        result = repo.get_resume_checkpoint(1, "process", "all", exclude_job_id="job-2")
+
+        self.assertEqual(result, checkpoint)
+        params = conn.execute.call_args[0][1]
+        self.assertEqual(params, {"user_id": 1, "type": "process", "exclude": "job-2"})
+
+    def test_completed_job_or_other_scope_is_not_resumed(self):
+        checkpoint = {"scope": "all", "last_card_id": 42}
+        repo, _conn = _checkpoint_repo(("complete", checkpoint))
+        self.assertIsNone(repo.get_resume_checkpoint(1, "process", "all"))
+
+        repo, _conn = _checkpoint_repo(("error", checkpoint))
+        self.assertIsNone(repo.get_resume_checkpoint(1, "process", "new_only"))
+
+
+class TestProcessorServiceResume(unittest.TestCase):
+    def _make_service(self, previous):
+        from backend.api.services.processor_service import ProcessorService
+        from deckdex.config import ProcessorConfig
+
+        job_repo = MagicMock()
+        job_repo.get_resume_checkpoint.return_value = previous
+        return ProcessorService(config=ProcessorConfig(), job_repo=job_repo, user_id=1)
+
+    def test_resumes_after_previous_checkpoint_with_cumulative_counters(self):
+        previous = {"scope": "all", "last_card_id": 42, "processed": 100, "updated": 7}
+        service = self._make_service(previous)
+
+        save = service._resume_checkpointing("process", "all")
+        save({"last_card_id": 60, "processed": 20, "updated": 3})
+
+        self.assertEqual(service.config.resume_after_id, 42)
+        saved = [c.args for c in service._job_repo.save_checkpoint.call_args_list]
+        self.assertEqual(saved[0], (service.job_id, previous))
+        self.assertEqual(
+            saved[1], (service.job_id, {"scope": "all", "last_card_id": 60, "processed": 120, "updated": 10})
+        )
+
+    def test_fresh_start_without_checkpoint(self):
+        service = self._make_service(None)
+
+        save = service._resume_checkpointing("update_prices", "scryfall")
+        save({"last_card_id": 5, "processed": 5, "updated": 1})
+
+        self.assertIsNone(service.config.resume_after_id)
+        service._job_repo.save_checkpoint.assert_called_once_with(
+            service.job_id, {"scope": "scryfall", "last_card_id": 5, "processed": 5, "updated": 1}
+        )
+
+
 # ---------------------------------------------------------------------------
 # Startup event cleans up both orphaned jobs and orphaned catalog syncs
 # ---------------------------------------------------------------------------
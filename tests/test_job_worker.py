@@ -0,0 +1,177 @@
+"""
+Tests for the Postgres job queue: JobRepository queue methods, the JobWorker loop,
+and the process/price routes enqueueing when jobs.queue is enabled.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_current_user_id
+from backend.api.main import app
+from deckdex.config import ProcessorConfig
+
+
+def _repo_with_conn():
+    from deckdex.storage.job_repository import JobRepository
+
+    repo = JobRepository.__new__(JobRepository)
+    repo._url = ""
+    mock_conn = MagicMock()
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value.__enter__ = lambda s, *a: mock_conn
+    mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+    repo._eng = mock_engine
+    return repo, mock_conn
+
+
+class TestJobRepositoryQueue(unittest.TestCase):
+    def test_claim_next_job_skips_locked_rows_and_returns_params(self):
+        repo, conn = _repo_with_conn()
+        conn.execute.return_value.mappings.return_value.fetchone.return_value = {
+            "id": "job-1",
+            "user_id": 3,
+            "type": "update_prices",
+            "params": {"source": "catalog"},
+        }
+
+        job = repo.claim_next_job("worker-a")
+
+        sql = str(conn.execute.call_args[0][0])
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertEqual(conn.execute.call_args[0][1], {"worker_id": "worker-a"})
+        self.assertEqual(
+            job, {"job_id": "job-1", "user_id": 3, "type": "update_prices", "params": {"source": "catalog"}}
+        )
+        conn.commit.assert_called_once()
+
+    def test_claim_next_job_returns_none_on_empty_queue(self):
+        repo, conn = _repo_with_conn()
+        conn.execute.return_value.mappings.return_value.fetchone.return_value = None
+
+        self.assertIsNone(repo.claim_next_job("worker-a"))
+
+    def test_heartbeat_reports_cancel_request(self):
+        repo, conn = _repo_with_conn()
+        conn.execute.return_value.fetchone.return_value = (True,)
+
+        self.assertTrue(repo.heartbeat("job-1", {"current": 5, "total": 10}))
+        self.assertIn('"current": 5', conn.execute.call_args[0][1]["progress"])
+
+    def test_request_cancel_returns_none_for_unknown_job(self):
+        repo, conn = _repo_with_conn()
+        conn.execute.return_value.fetchone.return_value = None
+
+        self.assertIsNone(repo.request_cancel("job-1", 1))
+
+
+class TestJobWorker(unittest.TestCase):
+    def _worker(self, job):
+        from backend.api.worker import JobWorker
+
+        job_repo = MagicMock()
+        job_repo.fail_stale_jobs.return_value = 0
+        job_repo.claim_next_job.return_value = job
+        return JobWorker(job_repo, poll_interval=0.01, worker_id="worker-a"), job_repo
+
+    def test_idle_when_queue_is_empty(self):
+        worker, job_repo = self._worker(None)
+
+        self.assertFalse(worker.run_once())
+        job_repo.claim_next_job.assert_called_once_with("worker-a")
+
+    @patch("backend.api.worker.load_config", return_value=ProcessorConfig())
+    @patch("backend.api.worker.ProcessorService")
+    def test_runs_claimed_price_job_under_its_job_id(self, mock_service_class, _load_config):
+        job = {"job_id": "job-1", "user_id": 3, "type": "update_prices", "params": {"source": "catalog"}}
+        worker, job_repo = self._worker(job)
+        service = mock_service_class.return_value
+        service.update_prices_async = AsyncMock(return_value={"status": "success"})
+
+        self.assertTrue(worker.run_once())
+
+        kwargs = mock_service_class.call_args.kwargs
+        self.assertEqual((kwargs["job_id"], kwargs["user_id"]), ("job-1", 3))
+        self.assertTrue(kwargs["config"].update_prices)
+        service.update_prices_async.assert_awaited_once_with(price_source="catalog", incremental=False)
+
+    def test_unknown_job_type_is_failed(self):
+        job = {"job_id": "job-1", "user_id": 3, "type": "import", "params": {}}
+        worker, job_repo = self._worker(job)
+
+        worker.run_once()
+
+        self.assertEqual(job_repo.update_job_status.call_args[0][:2], ("job-1", "error"))
+
+
+class TestQueuedRoutes(unittest.TestCase):
+    def setUp(self):
+        app.dependency_overrides[get_current_user_id] = lambda: 1
+        self.client = TestClient(app)
+        config = ProcessorConfig()
+        config.jobs.queue = True
+        self.job_repo = MagicMock()
+        self.job_repo.get_active_job_id.return_value = None
+        self.job_repo.enqueue_job.return_value = "job-queued"
+        self.patches = [
+            patch("deckdex.config_loader.load_config", return_value=config),
+            patch("backend.api.routes.process.get_job_repo", return_value=self.job_repo),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        app.dependency_overrides.pop(get_current_user_id, None)
+
+    @patch("backend.api.routes.process.ProcessorService")
+    def test_price_update_is_enqueued_not_run(self, mock_service_class):
+        response = self.client.post("/api/prices/update", json={"source": "catalog", "incremental": True})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "queued")
+        self.job_repo.enqueue_job.assert_called_once_with(
+            1, "update_prices", {"source": "catalog", "incremental": True}
+        )
+        mock_service_class.assert_not_called()
+
+    def test_conflicts_with_queued_or_running_job(self):
+        self.job_repo.get_active_job_id.return_value = "job-old"
+
+        response = self.client.post("/api/process", json={"scope": "new_only"})
+
+        self.assertEqual(response.status_code, 409)
+        self.job_repo.enqueue_job.assert_not_called()
+
+    def test_cancel_is_recorded_on_the_job_row(self):
+        self.job_repo.request_cancel.return_value = "running"
+
+        response = self.client.post("/api/jobs/job-queued/cancel")
+
+        self.assertEqual(response.status_code, 200)
+        self.job_repo.request_cancel.assert_called_once_with("job-queued", 1)
+        # The worker only stops at its next heartbeat
+        self.assertEqual(response.json()["status"], "cancelling")
+
+    def test_cancelling_a_queued_job_is_immediate(self):
+        self.job_repo.request_cancel.return_value = "cancelled"
+
+        response = self.client.post("/api/jobs/job-queued/cancel")
+
+        self.assertEqual(response.json()["status"], "cancelled")
+
+    def test_status_poll_clears_caches_once_when_worker_job_completes(self):
+        self.job_repo.get_job.return_value = {"status": "complete", "result": {"updated": 3}, "type": "update_prices"}
+
+        with (
+            patch("backend.api.routes.process.clear_collection_cache") as clear_collection,
+            patch("backend.api.routes.process.clear_stats_cache") as clear_stats,
+        ):
+            first = self.client.get("/api/jobs/job-finished")
+            self.client.get("/api/jobs/job-finished")
+
+        self.assertEqual(first.json()["status"], "complete")
+        clear_collection.assert_called_once()
+        clear_stats.assert_called_once()
@@ -0,0 +1,121 @@
+"""
+Tests for RunMetrics and the per-phase instrumentation of MagicCardProcessor runs.
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from deckdex.metrics import RunMetrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRunMetrics(unittest.TestCase):
+    def test_timer_accumulates_seconds_and_calls(self):
+        clock = FakeClock()
+        metrics = RunMetrics(clock=clock)
+        for _ in range(2):
+            with metrics.timer("db_write"):
+                clock.now += 0.5
+
+        phase = metrics.as_dict()["phases"]["db_write"]
+        self.assertEqual(phase, {"seconds": 1.0, "calls": 2})
+
+    def test_timer_records_time_when_block_raises(self):
+        clock = FakeClock()
+        metrics = RunMetrics(clock=clock)
+        with self.assertRaises(RuntimeError):
+            with metrics.timer("fetch"):
+                clock.now += 2
+                raise RuntimeError("boom")
+
+        self.assertEqual(metrics.as_dict()["phases"]["fetch"]["seconds"], 2.0)
+
+    def test_fetch_latency_histogram(self):
+        metrics = RunMetrics()
+        for latency in [0.03] * 8 + [0.3, 7.0]:
+            metrics.observe_fetch(latency)
+
+        latency = metrics.as_dict()["fetch_latency"]
+        self.assertEqual(latency["count"], 10)
+        self.assertEqual(latency["p50"], 0.05)
+        self.assertEqual(latency["p95"], 7.0)  # lands in the open-ended bucket: reported as the max
+        self.assertEqual(latency["max"], 7.0)
+        self.assertEqual(latency["buckets"]["<=0.05s"], 8)
+        self.assertEqual(latency["buckets"][">5.0s"], 1)
+
+    def test_cards_per_sec_and_counters_are_json_serialisable(self):
+        clock = FakeClock()
+        metrics = RunMetrics(clock=clock)
+        metrics.add_cards(50)
+        metrics.count("retries", 2)
+        metrics.count("catalog_hits", 0)
+        clock.now = 10.0
+
+        data = json.loads(json.dumps(metrics.as_dict()))
+        self.assertEqual(data["cards_per_sec"], 5.0)
+        self.assertEqual(data["counters"], {"retries": 2})
+
+    def test_summary_lines(self):
+        metrics = RunMetrics()
+        metrics.add_time("fetch", 1.25)
+        metrics.observe_fetch(0.2)
+        metrics.count("retries")
+
+        text = "\n".join(metrics.summary_lines())
+        self.assertIn("fetch", text)
+        self.assertIn("Scryfall latency: 1 requests", text)
+        self.assertIn("retries: 1", text)
+
+
+class TestProcessorMetrics(unittest.TestCase):
+    def test_repo_price_update_records_phases_and_cards(self):
+        from tests.test_price_update_progress import _make_processor
+
+        proc = _make_processor(use_repo=True)
+        proc._fetch_card_data = lambda name: {"prices": {"eur": "2.00"}}
+        proc.collection_repository.get_cards_for_price_update.return_value = [
+            (1, "A", "1,00", None),
+            (2, "B", "2,00", None),
+        ]
+
+        proc.process_card_data()
+
+        data = proc.metrics.as_dict()
+        self.assertEqual(data["cards"], 2)
+        self.assertIn("load_cards", data["phases"])
+        self.assertIn("fetch", data["phases"])
+        self.assertEqual(data["phases"]["db_write"]["calls"], 1)
+        self.assertIs(proc.card_fetcher.metrics, proc.metrics)
+
+    def test_card_fetcher_counts_retries_and_passes_metrics_to_transport(self):
+        import requests
+
+        from deckdex.card_fetcher import CardFetcher
+
+        fetcher = CardFetcher.__new__(CardFetcher)
+        fetcher._cache = None
+        fetcher.max_retries = 2
+        fetcher.retry_delay = 0
+        fetcher.timeout = 5
+        fetcher.metrics = RunMetrics()
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"name": "Opt"}
+        fetcher._transport = MagicMock()
+        fetcher._transport.get.side_effect = [requests.exceptions.ConnectionError("reset"), ok]
+
+        self.assertEqual(fetcher._request_with_retries("https://api.scryfall.com/cards/named", None), {"name": "Opt"})
+
+        self.assertEqual(fetcher.metrics.as_dict()["counters"], {"retries": 1})
+        self.assertIs(fetcher._transport.get.call_args.kwargs["metrics"], fetcher.metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for the negative-result / matching-strategy cache behind CardFetcher.search_card."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from deckdex.card_fetcher import CardFetcher
+from deckdex.config import OpenAIConfig, ScryfallConfig
+from deckdex.name_lookup_cache import NameLookupCache
+from deckdex.scryfall_transport import reset_transport
+
+
+def _status(code, body=None):
+    response = MagicMock()
+    response.status_code = code
+    response.headers = {}
+    response.json.return_value = body or {}
+    if code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestNameLookupCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = 1000.0
+        self.cache = NameLookupCache(os.path.join(self.tmp.name, "names.sqlite"), clock=lambda: self.now)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_miss_expires_after_ttl(self):
+        self.cache.record_miss("Lightnig Bolt", ttl=60)
+        self.assertTrue(self.cache.is_known_missing("  lightnig   BOLT "))
+        self.now += 61
+        self.assertFalse(self.cache.is_known_missing("Lightnig Bolt"))
+
+    def test_match_records_strategy_and_clears_miss(self):
+        self.cache.record_miss("Opt", ttl=60)
+        self.cache.record_match("Opt", "fuzzy")
+        self.assertFalse(self.cache.is_known_missing("Opt"))
+        self.assertEqual(self.cache.strategy_for("opt"), "fuzzy")
+        self.assertEqual(self.cache.strategy_counts(), {"fuzzy": 1, "not_found": 0})
+
+
+class TestCardFetcherNegativeCache(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+        self.tmp = tempfile.TemporaryDirectory()
+        config = ScryfallConfig(cache_path=os.path.join(self.tmp.name, "scryfall.sqlite"), retry_delay=0)
+        self.fetcher = CardFetcher(config, OpenAIConfig())
+
+    def tearDown(self):
+        self.fetcher._cache.close()
+        self.fetcher._names.close()
+        reset_transport()
+        self.tmp.cleanup()
+
+    def test_definitive_miss_skips_the_cascade_next_time(self):
+        with patch.object(self.fetcher._transport, "get", return_value=_status(404)) as mock_get:
+            with self.assertRaises(Exception):
+                self.fetcher.search_card("Not A Card")
+            calls = mock_get.call_count
+            with self.assertRaisesRegex(Exception, "Card not found"):
+                self.fetcher.search_card("not a card")
+        # 404s are not retried, and the second lookup never reaches the network
+        self.assertEqual(calls, 4)
+        self.assertEqual(mock_get.call_count, calls)
+
+    def test_transient_failure_is_not_remembered(self):
+        with patch.object(self.fetcher._transport, "get", side_effect=requests.exceptions.ConnectionError()):
+            with self.assertRaises(Exception):
+                self.fetcher.search_card("Opt")
+        self.assertFalse(self.fetcher._names.is_known_missing("Opt"))
+
+    def test_remembered_strategy_is_tried_first(self):
+        self.fetcher._names.record_match("lightnig bolt", "fuzzy")
+        with (
+            patch.object(CardFetcher, "_exact_match_search") as mock_exact,
+            patch.object(CardFetcher, "_fuzzy_match_search", return_value={"name": "Lightning Bolt"}),
+        ):
+            self.assertEqual(self.fetcher.search_card("lightnig bolt"), {"name": "Lightning Bolt"})
+        mock_exact.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
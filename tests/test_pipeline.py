@@ -0,0 +1,114 @@
+"""Tests for the bounded batch pipelines (completion-ordered and submission-ordered)."""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from deckdex.pipeline import CommitWatermark, iter_completed, iter_ordered
+
+
+class TestIterCompleted(unittest.TestCase):
+    def test_results_follow_completion_not_submission_order(self):
+        first_may_finish = threading.Event()
+
+        def work(i):
+            if i == 0:
+                first_may_finish.wait(5)
+            return i * 10
+
+        order = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for item, result in iter_completed(executor, work, range(3), max_pending=2):
+                order.append((item, result))
+                if item == 2:
+                    first_may_finish.set()
+
+        self.assertEqual(order[-1], (0, 0))
+        self.assertEqual(sorted(order), [(0, 0), (1, 10), (2, 20)])
+
+    def test_in_flight_work_is_bounded(self):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def work(i):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            with lock:
+                in_flight -= 1
+            return i
+
+        produced = []
+
+        def items():
+            for i in range(50):
+                produced.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            consumed = 0
+            for _item, _result in iter_completed(executor, work, items(), max_pending=3):
+                consumed += 1
+                # The producer never runs more than max_pending items ahead of the consumer
+                self.assertLessEqual(len(produced) - consumed, 3)
+
+        self.assertLessEqual(peak, 3)
+        self.assertEqual(consumed, 50)
+
+    def test_worker_exception_propagates(self):
+        def work(i):
+            raise RuntimeError("batch failed")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(RuntimeError):
+                list(iter_completed(executor, work, [1], max_pending=1))
+
+
+class TestIterOrdered(unittest.TestCase):
+    def test_results_follow_submission_order_while_later_work_runs(self):
+        later_done = threading.Event()
+
+        def work(i):
+            if i == 0:
+                # Only finishes once a later item has run concurrently
+                self.assertTrue(later_done.wait(5))
+            else:
+                later_done.set()
+            return i * 10
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            order = list(iter_ordered(executor, work, range(4), max_pending=2))
+
+        self.assertEqual(order, [(0, 0), (1, 10), (2, 20), (3, 30)])
+
+    def test_producer_is_bounded(self):
+        produced = []
+
+        def items():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for consumed, _pair in enumerate(iter_ordered(executor, lambda i: i, items(), max_pending=3), start=1):
+                self.assertLessEqual(len(produced) - consumed, 3)
+
+    def test_rejects_non_positive_bound(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                next(iter_ordered(executor, lambda i: i, [1], max_pending=0))
+
+
+class TestCommitWatermark(unittest.TestCase):
+    def test_prefix_only_advances_over_contiguous_batches(self):
+        watermark = CommitWatermark(batch_size=10, total=35)
+        self.assertIsNone(watermark.commit(10))
+        self.assertIsNone(watermark.commit(30))
+        self.assertEqual(watermark.commit(0), 20)
+        self.assertEqual(watermark.commit(20), 35)
+        self.assertEqual(watermark.end, 35)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock
 
-from deckdex.storage.repository import CollectionRepository, PostgresCollectionRepository
+from deckdex.storage.repository import CollectionRepository, PostgresCollectionRepository, _encode_cursor
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -96,6 +96,49 @@ class TestBaseClassDefaults:
         result = repo.get_price_history(card_id=1)
         assert result == []
 
+    def test_merge_all_adds_quantities_through_update_and_create(self):
+        """Base CollectionRepository.merge_all works for any repository, one card at a time."""
+
+        class MemoryRepo(CollectionRepository):
+            def __init__(self):
+                self.cards = [{"id": 1, "name": "Opt", "set_id": "xln", "quantity": 2}]
+
+            def get_all_cards(self, user_id=None):
+                return [dict(c) for c in self.cards]
+
+            def get_cards_for_price_update(self, user_id=None):
+                return []
+
+            def get_card_by_id(self, id, user_id=None):
+                return None
+
+            def create(self, card, user_id=None):
+                card = dict(card, id=len(self.cards) + 1)
+                self.cards.append(card)
+                return card
+
+            def update(self, id, fields, user_id=None):
+                card = next(c for c in self.cards if c["id"] == id)
+                card.update(fields)
+                return card
+
+            def delete(self, id, user_id=None):
+                return False
+
+            def replace_all(self, cards, user_id=None):
+                return 0
+
+        repo = MemoryRepo()
+        cards = [
+            {"name": "Opt", "set_id": "xln", "quantity": 3},
+            {"name": ""},
+            {"name": "Shock", "set_id": "m19"},
+            {"name": "Shock", "set_id": "m19", "quantity": 2},
+        ]
+
+        assert repo.merge_all(cards, user_id=7) == 3
+        assert [(c["name"], c["quantity"]) for c in repo.cards] == [("Opt", 5), ("Shock", 3)]
+
 
 # ---------------------------------------------------------------------------
 # PostgresCollectionRepository — record_price_history
@@ -253,3 +296,428 @@ class TestGetPriceHistory:
 
         assert isinstance(result[0]["recorded_at"], str)
         assert "2026-03-01" in result[0]["recorded_at"]
+
+
+# ---------------------------------------------------------------------------
+# bulk_update_prices
+# ---------------------------------------------------------------------------
+
+
+class TestBulkUpdatePrices:
+    def test_one_connection_one_commit(self):
+        """bulk_update_prices writes prices and history in one transaction."""
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.rowcount = 2
+
+        updated = repo.bulk_update_prices([(1, "1,50"), (2, "0,25")])
+
+        assert updated == 2
+        mock_engine.connect.assert_called_once()
+        assert mock_conn.execute.call_count == 2
+        mock_conn.commit.assert_called_once()
+        update_params = mock_conn.execute.call_args_list[0][0][1]
+        assert update_params == {"ids": [1, 2], "prices": ["1,50", "0,25"]}
+        assert "last_price_update" in str(mock_conn.execute.call_args_list[0][0][0])
+        history_params = mock_conn.execute.call_args_list[1][0][1]
+        assert history_params["card_ids"] == [1, 2]
+        assert history_params["prices"] == [1.5, 0.25]
+        assert history_params["source"] == "scryfall"
+
+    def test_non_numeric_prices_skip_history(self):
+        """N/A prices update the card but add no price_history row."""
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+
+        repo.bulk_update_prices([(3, "N/A")])
+
+        assert mock_conn.execute.call_count == 1
+        mock_conn.commit.assert_called_once()
+
+    def test_repeated_card_id_keeps_last_price(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+
+        repo.bulk_update_prices([(1, "1,00"), (1, "2,00")])
+
+        assert mock_conn.execute.call_args_list[0][0][1] == {"ids": [1], "prices": ["2,00"]}
+
+    def test_empty_batch_does_not_connect(self):
+        repo = _make_postgres_repo()
+        mock_engine, _mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+
+        assert repo.bulk_update_prices([]) == 0
+        mock_engine.connect.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# bulk_update
+# ---------------------------------------------------------------------------
+
+
+class TestBulkUpdate:
+    def test_groups_rows_by_columns_in_one_transaction(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.rowcount = 1
+
+        repo.bulk_update(
+            [
+                (1, {"type": "Instant", "cmc": "1"}),
+                (2, {"type_line": "Sorcery", "cmc": 2}),
+                (3, {"rarity": "rare", "not_a_column": "x"}),
+            ]
+        )
+
+        mock_engine.connect.assert_called_once()
+        mock_conn.commit.assert_called_once()
+        assert mock_conn.execute.call_count == 2
+        first_rows = mock_conn.execute.call_args_list[0][0][1]
+        assert first_rows == [
+            {"type_line": "Instant", "cmc": 1.0, "id": 1},
+            {"type_line": "Sorcery", "cmc": 2.0, "id": 2},
+        ]
+        assert mock_conn.execute.call_args_list[1][0][1] == [{"rarity": "rare", "id": 3}]
+
+    def test_no_updatable_fields_does_not_connect(self):
+        repo = _make_postgres_repo()
+        mock_engine, _mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+
+        assert repo.bulk_update([(1, {"unknown": 1})]) == 0
+        mock_engine.connect.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# refresh_prices_from_catalog
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshPricesFromCatalog:
+    def test_single_statement_scoped_to_user(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.fetchone.return_value = ([4, 9], 1, 1)
+
+        result = repo.refresh_prices_from_catalog(user_id=3)
+
+        assert result == {"matched_ids": [4, 9], "updated": 1, "history_rows": 1}
+        mock_conn.execute.assert_called_once()
+        mock_conn.commit.assert_called_once()
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        assert params == {"source": "catalog", "user_id": 3}
+        assert "c.user_id = :user_id" in sql
+        assert "INSERT INTO price_history" in sql
+
+    def test_no_matches(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.fetchone.return_value = (None, 0, 0)
+
+        result = repo.refresh_prices_from_catalog()
+
+        assert result == {"matched_ids": [], "updated": 0, "history_rows": 0}
+        assert ":user_id" not in str(mock_conn.execute.call_args[0][0])
+
+
+class TestIncrementalPriceSelection:
+    def test_stale_cards_ordered_by_staleness_then_value(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.fetchall.return_value = [(7, "Opt", None, "0,10", "opt-id")]
+
+        cards = repo.get_cards_for_price_update(user_id=3, max_age_hours=2)
+
+        assert cards == [(7, "Opt", "0,10", "opt-id")]
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        assert params == {"user_id": 3, "max_age_secs": 7200}
+        assert "last_price_update IS NULL" in sql
+        assert sql.index("last_price_update IS NOT NULL") < sql.index("DESC NULLS LAST")
+
+    def test_full_refresh_has_no_staleness_filter(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.fetchall.return_value = []
+
+        repo.get_cards_for_price_update()
+
+        assert "max_age_secs" not in str(mock_conn.execute.call_args[0][0])
+        assert "ORDER BY" not in str(mock_conn.execute.call_args[0][0])
+
+    def test_mark_prices_checked_stamps_in_one_statement(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.rowcount = 2
+
+        assert repo.mark_prices_checked([4, 9, 4]) == 2
+        mock_conn.execute.assert_called_once()
+        assert mock_conn.execute.call_args[0][1] == {"ids": [4, 9]}
+        mock_conn.commit.assert_called_once()
+
+    def test_mark_prices_checked_empty_does_not_connect(self):
+        repo = _make_postgres_repo()
+        mock_engine, _mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+
+        assert repo.mark_prices_checked([]) == 0
+        mock_engine.connect.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Numeric price column (price_eur_value)
+# ---------------------------------------------------------------------------
+
+
+class TestNumericPriceQueries:
+    def test_price_range_filters_compare_numeric_column(self):
+        repo = _make_postgres_repo()
+
+        where, params = repo._build_filter_clauses({"price_min": "1,5", "price_max": "10"}, user_id=3)
+
+        assert "price_eur_value >= :price_min" in where
+        assert "price_eur_value <= :price_max" in where
+        assert "~" not in where
+        assert params == {"user_id": 3, "price_min": 1.5, "price_max": 10.0}
+
+    def test_price_sort_uses_numeric_column(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = []
+
+        repo.get_cards_filtered(user_id=3, sort_by="price_eur", sort_dir="asc")
+
+        assert "ORDER BY price_eur_value ASC NULLS LAST, id ASC" in str(mock_conn.execute.call_args[0][0])
+
+    def test_stats_aggregate_numeric_column(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.mappings.return_value.fetchone.return_value = {
+            "total_cards": 4,
+            "total_value": Decimal("7.50"),
+            "average_price": Decimal("2.50"),
+        }
+
+        stats = repo.get_cards_stats(user_id=3)
+
+        assert stats == {"total_cards": 4, "total_value": 7.5, "average_price": 2.5}
+        sql = str(mock_conn.execute.call_args[0][0])
+        assert "SUM(price_eur_value * quantity)" in sql
+        assert "price_eur ~" not in sql
+
+
+class TestCollectionSearch:
+    def test_search_matches_name_substring_or_full_text(self):
+        repo = _make_postgres_repo()
+
+        where, params = repo._build_filter_clauses({"search": " bolt ", "type_": "Instant"}, user_id=3)
+
+        assert "name ILIKE :search" in where
+        assert "card_search_vector(name, type_line, description) @@ websearch_to_tsquery" in where
+        assert "type_line ILIKE :type_" in where
+        assert params["search"] == "%bolt%"
+        assert params["search_query"] == "bolt"
+
+    def test_relevance_sort_ranks_search_matches(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = []
+
+        repo.get_cards_filtered(user_id=3, filters={"search": "bolt"}, sort_by="relevance")
+
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        assert "ORDER BY lower(name) = lower(:search_query) DESC" in sql
+        assert params["search_prefix"] == "bolt%"
+
+    def test_relevance_sort_without_search_falls_back_to_created_at(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = []
+
+        repo.get_cards_filtered(user_id=3, sort_by="relevance")
+
+        assert "ORDER BY created_at DESC NULLS LAST, id DESC" in str(mock_conn.execute.call_args[0][0])
+
+
+class TestKeysetPagination:
+    def _repo(self, rows):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = rows
+        return repo, mock_conn
+
+    def test_first_page_fetches_one_extra_row_and_returns_cursor(self):
+        created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        rows = [{"id": 9, "name": "A", "created_at": created}, {"id": 8, "name": "B", "created_at": created}]
+        repo, mock_conn = self._repo(rows)
+
+        cards, cursor = repo.get_cards_page(user_id=3, limit=1)
+
+        assert [c["id"] for c in cards] == [9]
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        assert "ORDER BY created_at DESC NULLS LAST, id DESC" in sql
+        assert "OFFSET" not in sql and "COUNT" not in sql
+        assert params["limit"] == 2
+
+        repo, mock_conn = self._repo([])
+        assert repo.get_cards_page(user_id=3, limit=1, cursor=cursor) == ([], None)
+        sql, params = str(mock_conn.execute.call_args_list[0][0][0]), mock_conn.execute.call_args_list[0][0][1]
+        assert "(created_at, id) < (:after_value, :after_id)" in sql
+        assert " OR " not in sql
+        assert params["after_value"] == created.isoformat()
+        assert params["after_id"] == 9
+
+    def test_pages_across_null_keys(self):
+        created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        repo, mock_conn = self._repo([])
+        key_rows = MagicMock()
+        key_rows.mappings.return_value.fetchall.return_value = [{"id": 9, "created_at": created}]
+        null_rows = MagicMock()
+        null_rows.mappings.return_value.fetchall.return_value = [
+            {"id": 8, "created_at": None},
+            {"id": 7, "created_at": None},
+        ]
+        first = _encode_cursor("created_at", "desc", datetime(2024, 1, 3, tzinfo=timezone.utc), 10)
+        mock_conn.execute.side_effect = [key_rows, null_rows]
+
+        cards, cursor = repo.get_cards_page(user_id=3, limit=2, cursor=first)
+
+        assert [c["id"] for c in cards] == [9, 8]
+        (key_sql, key_params), (null_sql, null_params) = [c[0] for c in mock_conn.execute.call_args_list]
+        assert "(created_at, id) < (:after_value, :after_id)" in str(key_sql)
+        assert "IS NULL" not in str(key_sql)
+        assert key_params["limit"] == 3
+        assert "AND created_at IS NULL" in str(null_sql)
+        assert null_params["limit"] == 2
+
+        # The next page stays in the NULL tail and never re-reads the keyed rows
+        mock_conn.execute.side_effect = None
+        mock_conn.execute.return_value.mappings.return_value.fetchall.return_value = [{"id": 7, "created_at": None}]
+        cards, cursor = repo.get_cards_page(user_id=3, limit=2, cursor=cursor)
+
+        assert [c["id"] for c in cards] == [7] and cursor is None
+        assert mock_conn.execute.call_count == 3
+        sql, params = str(mock_conn.execute.call_args[0][0]), mock_conn.execute.call_args[0][1]
+        assert "created_at IS NULL AND id < :after_id" in sql
+        assert params["after_id"] == 8
+
+    def test_cursor_inside_trailing_nulls(self):
+        repo, _conn = self._repo([{"id": 5, "cmc": None}, {"id": 4, "cmc": None}])
+        _cards, cursor = repo.get_cards_page(user_id=3, limit=1, sort_by="cmc", sort_dir="asc")
+
+        repo, mock_conn = self._repo([])
+        repo.get_cards_page(user_id=3, limit=1, sort_by="cmc", sort_dir="asc", cursor=cursor)
+
+        sql = str(mock_conn.execute.call_args[0][0])
+        assert "cmc IS NULL AND id > :after_id" in sql
+
+    def test_cursor_from_another_sort_is_rejected(self):
+        repo, _conn = self._repo([{"id": 2, "name": "A"}, {"id": 1, "name": "B"}])
+        _cards, cursor = repo.get_cards_page(user_id=3, limit=1, sort_by="name", sort_dir="asc")
+
+        for kwargs in ({"sort_by": "name", "sort_dir": "desc"}, {"sort_by": "relevance"}):
+            try:
+                repo.get_cards_page(user_id=3, cursor=cursor, **kwargs)
+            except ValueError:
+                continue
+            raise AssertionError(f"cursor accepted for {kwargs}")
+        try:
+            repo.get_cards_page(user_id=3, cursor="not-a-cursor")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("malformed cursor accepted")
+
+    def test_count_cards_uses_filters(self):
+        repo, mock_conn = self._repo([])
+        mock_conn.execute.return_value.scalar.return_value = 7
+
+        assert repo.count_cards(user_id=3, filters={"rarity": "rare"}) == 7
+        assert "SELECT COUNT(*) FROM cards WHERE user_id = :user_id AND LOWER(rarity) = :rarity" in str(
+            mock_conn.execute.call_args[0][0]
+        )
+
+
+class TestColorIdentityMask:
+    def test_filter_is_a_superset_test_on_the_mask(self):
+        repo = _make_postgres_repo()
+        where, params = repo._build_filter_clauses({"color_identity": "W, u"}, user_id=3)
+
+        assert "color_identity_mask & :ci_mask = :ci_mask" in where
+        assert "LIKE" not in where
+        assert params["ci_mask"] == 3
+
+    def test_filter_without_colors_is_ignored(self):
+        repo = _make_postgres_repo()
+        where, params = repo._build_filter_clauses({"color_identity": "x"}, user_id=3)
+
+        assert "ci_mask" not in where and "ci_mask" not in params
+
+    def test_analytics_groups_on_the_mask(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        mock_conn.execute.return_value.fetchall.return_value = [(3, 5), (0, 2), (31, 1)]
+
+        rows = repo.get_cards_analytics(user_id=3, dimension="color_identity")
+
+        assert rows == [{"label": "WU", "count": 5}, {"label": "C", "count": 2}, {"label": "WUBRG", "count": 1}]
+        sql = str(mock_conn.execute.call_args[0][0])
+        assert "SELECT color_identity_mask AS label" in sql
+
+
+class TestBulkLoad:
+    def _repo(self):
+        repo = _make_postgres_repo()
+        mock_engine, mock_conn = _make_mock_engine()
+        repo._eng = mock_engine
+        copied = []
+        cursor = mock_conn.connection.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, stream: copied.append(stream.read())
+        return repo, mock_conn, copied
+
+    def test_replace_all_copies_then_swaps_in_one_transaction(self):
+        repo, mock_conn, copied = self._repo()
+        cards = [{"name": "Opt", "price": "0,25", "quantity": 2}, {"name": None, "type": "Land"}]
+
+        assert repo.replace_all(cards, user_id=7) == 2
+
+        statements = [str(c[0][0]) for c in mock_conn.execute.call_args_list]
+        assert "CREATE TEMP TABLE cards_staging" in statements[0]
+        assert statements[1] == "DELETE FROM cards WHERE user_id = :user_id"
+        assert "INSERT INTO cards (name, english_name" in statements[2]
+        assert ", user_id) SELECT name, english_name" in statements[2]
+        assert statements[2].endswith("FROM cards_staging ORDER BY load_order")
+        assert not any("VALUES" in s for s in statements)
+        mock_conn.commit.assert_called_once()
+        lines = copied[0].splitlines()
+        assert lines[0].startswith("Opt\t\\N\t")
+        assert lines[1].startswith("\t\\N\tLand\t")  # missing name is stored as ""
+
+    def test_merge_all_skips_unnamed_and_merges_set_based(self):
+        repo, mock_conn, copied = self._repo()
+        cards = [{"name": "Opt", "set_id": "xln"}, {"name": ""}, {"name": "Opt", "set_id": "xln", "quantity": 3}]
+
+        assert repo.merge_all(cards, user_id=7) == 2
+
+        assert len(copied[0].splitlines()) == 2
+        sql = str(mock_conn.execute.call_args_list[-1][0][0])
+        assert "SUM(quantity) OVER (PARTITION BY name, COALESCE(set_id, ''))" in sql
+        assert "SET quantity = c.quantity + i.quantity" in sql
+        assert "WHERE user_id = :user_id" in sql
+        assert "WHERE NOT EXISTS" in sql
+        mock_conn.commit.assert_called_once()
@@ -19,6 +19,7 @@ def _make_processor(batch_size=2, write_buffer_batches=2, use_repo=False):
     use_repo=True simulates Postgres path (collection_repository set).
     use_repo=False simulates Google Sheets path (spreadsheet_client set).
     """
+    from deckdex.card_cache import CardDataCache
     from deckdex.config import ProcessingConfig, ProcessorConfig
     from deckdex.magic_card_processor import MagicCardProcessor
 
@@ -33,10 +34,16 @@ def _make_processor(batch_size=2, write_buffer_batches=2, use_repo=False):
     )
     proc.update_prices = True
     proc.dry_run = False
-    proc._card_cache = {}
+    proc._card_cache = CardDataCache(max_entries=100, max_bytes=1 << 20, ttl=60)
+    proc._card_cache_start = {}
     proc.error_count = 0
     proc.last_error_count = 0
     proc.not_found_cards = []
+    # Bulk /cards/collection lookups report every card as not found, so per-card
+    # _fetch_card_data (patched in the tests) decides prices.
+    proc.card_fetcher = MagicMock()
+    proc.catalog_resolver = None
+    proc.card_fetcher.search_cards_bulk.side_effect = lambda names, fallback=True: [None] * len(names)
     if use_repo:
         proc.collection_repository = MagicMock()
         proc.spreadsheet_client = None
@@ -181,7 +188,7 @@ class TestResumePriceUpdatePostgresPath(unittest.TestCase):
         """Resume from card 4: only Card E and Card F are fetched (not the first 4)."""
         proc = _make_processor(batch_size=2, write_buffer_batches=2, use_repo=True)
         # Simulate: cards 0-3 already processed; resume with only the remaining 2
-        remaining_cards = [(5, "Card E", "0,50"), (6, "Card F", "0,50")]
+        remaining_cards = [(5, "Card E", "0,50", None), (6, "Card F", "0,50", None)]
         with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "2.00"}}) as mock_fetch:
             with contextlib.redirect_stdout(io.StringIO()):
                 proc.update_prices_data_repo(remaining_cards)
@@ -194,45 +201,289 @@ class TestResumePriceUpdatePostgresPath(unittest.TestCase):
         proc = _make_processor(batch_size=2, write_buffer_batches=2, use_repo=True)
         # current_price "1,00" == processed price "1,00" from Scryfall "1.00"
         cards = [
-            (1, "Card A", "1,00"),
-            (2, "Card B", "1,00"),
-            (3, "Card C", "1,00"),
+            (1, "Card A", "1,00", None),
+            (2, "Card B", "1,00", None),
+            (3, "Card C", "1,00", None),
         ]
         with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "1.00"}}):
             with contextlib.redirect_stdout(io.StringIO()):
                 proc.update_prices_data_repo(cards)
-        proc.collection_repository.update.assert_not_called()
-        proc.collection_repository.record_price_history.assert_not_called()
+        proc.collection_repository.bulk_update_prices.assert_not_called()
 
     @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
     def test_price_history_recorded_for_numeric_price(self):
-        """When price changes to a numeric value, record_price_history is called with the float value."""
+        """Changed prices are written through one bulk_update_prices call per batch."""
         proc = _make_processor(batch_size=2, write_buffer_batches=2, use_repo=True)
         # current_price empty string, Scryfall returns 1.50 => new_price = "1,50"
         cards = [
-            (1, "Card A", ""),
-            (2, "Card B", ""),
+            (1, "Card A", "", None),
+            (2, "Card B", "", None),
         ]
         with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "1.50"}}):
             with contextlib.redirect_stdout(io.StringIO()):
                 proc.update_prices_data_repo(cards)
-        # record_price_history should have been called with float 1.5
-        calls = proc.collection_repository.record_price_history.call_args_list
-        self.assertEqual(len(calls), 2)
-        for c in calls:
-            price_arg = c[0][1]
-            self.assertAlmostEqual(price_arg, 1.5)
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(1, "1,50"), (2, "1,50")])
+        proc.collection_repository.update.assert_not_called()
 
     @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
     def test_price_history_skipped_for_na_price(self):
-        """When Scryfall returns None price (N/A), record_price_history is never called."""
+        """A price that becomes N/A is still written; the repository skips its history row."""
         proc = _make_processor(batch_size=1, write_buffer_batches=1, use_repo=True)
-        cards = [(1, "Card A", "0,50")]
+        cards = [(1, "Card A", "0,50", None)]
         # None price => _process_price returns "N/A"
         with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": None}}):
             with contextlib.redirect_stdout(io.StringIO()):
                 proc.update_prices_data_repo(cards)
-        proc.collection_repository.record_price_history.assert_not_called()
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(1, "N/A")])
+
+
+class TestBulkPriceResolutionPostgresPath(unittest.TestCase):
+    """update_prices_data_repo resolves cards through CardFetcher.search_cards_bulk."""
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_bulk_hits_skip_per_card_lookup(self):
+        proc = _make_processor(batch_size=2, write_buffer_batches=2, use_repo=True)
+        proc.card_fetcher.search_cards_bulk.side_effect = lambda names, fallback=True: [
+            None if n == "Card B" else {"prices": {"eur": "3.00"}} for n in names
+        ]
+        cards = [(1, "Card A", "0,50", None), (2, "Card B", "0,50", None), (3, "Card C", "3,00", None)]
+        with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "1.00"}}) as mock_fetch:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+        mock_fetch.assert_called_once_with("Card B")
+        proc.card_fetcher.search_cards_bulk.assert_called_once_with(["Card A", "Card B", "Card C"], fallback=False)
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(1, "3,00"), (2, "1,00")])
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_batches_sized_to_collection_limit(self):
+        from deckdex.card_fetcher import CardFetcher
+
+        proc = _make_processor(batch_size=2, write_buffer_batches=2, use_repo=True)
+        proc.card_fetcher.search_cards_bulk.side_effect = lambda names, fallback=True: [
+            {"prices": {"eur": "1.00"}} for _ in names
+        ]
+        cards = [(i, f"Card {i}", "1,00", None) for i in range(CardFetcher.COLLECTION_BATCH_SIZE + 5)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            proc.update_prices_data_repo(cards)
+        sizes = [len(c[0][0]) for c in proc.card_fetcher.search_cards_bulk.call_args_list]
+        self.assertEqual(sizes, [CardFetcher.COLLECTION_BATCH_SIZE, 5])
+
+
+class TestStreamingPriceUpdatePostgresPath(unittest.TestCase):
+    """update_prices_data_repo writes batches as they complete."""
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_slow_batch_does_not_block_later_writes(self):
+        from deckdex.card_fetcher import CardFetcher
+
+        proc = _make_processor(use_repo=True)
+        proc.config.processing.max_workers = 2
+        size = CardFetcher.COLLECTION_BATCH_SIZE
+        cards = [(i, f"Card {i}", "", None) for i in range(size + 1)]
+        second_batch_written = threading.Event()
+
+        def resolve(card_names, scryfall_ids=None):
+            if "Card 0" in card_names:
+                # The first batch only finishes once the second one has been written
+                self.assertTrue(second_batch_written.wait(5))
+            return [{"prices": {"eur": "1.00"}} for _ in card_names]
+
+        def bulk_update(changes):
+            if (size, "1,00") in changes:
+                second_batch_written.set()
+
+        proc.collection_repository.bulk_update_prices.side_effect = bulk_update
+        with patch.object(proc, "_fetch_card_data_bulk", side_effect=resolve):
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+
+        batches = [c.args[0] for c in proc.collection_repository.bulk_update_prices.call_args_list]
+        self.assertEqual(batches[0], [(size, "1,00")])
+        written = [card_id for batch in batches for card_id, _price in batch]
+        self.assertEqual(sorted(written), list(range(size + 1)))
+
+
+class TestPriceUpdateCheckpoints(unittest.TestCase):
+    """update_prices_data_repo resumes after a checkpoint and reports only committed prefixes."""
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_resume_after_id_skips_committed_cards(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.resume_after_id = 2
+        cards = [(3, "Card C", "", None), (1, "Card A", "", None), (2, "Card B", "", None)]
+        with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "1.00"}}) as mock_fetch:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+        mock_fetch.assert_called_once_with("Card C")
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_checkpoint_waits_for_earlier_batches(self):
+        from deckdex.card_fetcher import CardFetcher
+
+        proc = _make_processor(use_repo=True)
+        proc.config.processing.max_workers = 2
+        size = CardFetcher.COLLECTION_BATCH_SIZE
+        cards = [(i, f"Card {i}", "", None) for i in range(1, size + 2)]
+        second_batch_written = threading.Event()
+        checkpoints = []
+        proc.checkpoint_callback = checkpoints.append
+
+        def resolve(card_names, scryfall_ids=None):
+            if "Card 1" in card_names:
+                self.assertTrue(second_batch_written.wait(5))
+            return [{"prices": {"eur": "1.00"}} for _ in card_names]
+
+        proc.collection_repository.bulk_update_prices.side_effect = lambda changes: (
+            second_batch_written.set() if (size + 1, "1,00") in changes else None
+        )
+        with patch.object(proc, "_fetch_card_data_bulk", side_effect=resolve):
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+
+        # The second batch landed first, but the cursor only moves once the first one is in
+        self.assertEqual(checkpoints, [{"last_card_id": size + 1, "processed": size + 1, "updated": size + 1}])
+
+
+class TestCatalogPriceRefresh(unittest.TestCase):
+    """update_prices_from_catalog refreshes from the catalog and only looks up unmatched cards."""
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_only_unmatched_cards_reach_scryfall(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.price_source = "catalog"
+        proc.config.user_id = 7
+        repo = proc.collection_repository
+        repo.get_cards_for_price_update.return_value = [
+            (1, "Opt", "0,10", None),
+            (2, "Homebrew", "", None),
+            (3, "Shock", "", None),
+        ]
+        repo.refresh_prices_from_catalog.return_value = {"matched_ids": [1, 3], "updated": 1, "history_rows": 1}
+
+        with patch.object(proc, "update_prices_data_repo") as mock_network:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.process_card_data()
+
+        repo.get_cards_for_price_update.assert_called_once_with(user_id=7)
+        repo.refresh_prices_from_catalog.assert_called_once_with(user_id=7)
+        mock_network.assert_called_once_with([(2, "Homebrew", "", None)])
+        self.assertEqual(
+            proc.catalog_price_stats, {"matched": 2, "updated": 1, "history_rows": 1, "scryfall_lookups": 1}
+        )
+
+    def test_full_catalog_match_makes_no_network_calls(self):
+        proc = _make_processor(use_repo=True)
+        repo = proc.collection_repository
+        repo.get_cards_for_price_update.return_value = [(1, "Opt", "0,10", None)]
+        repo.refresh_prices_from_catalog.return_value = {"matched_ids": [1], "updated": 0, "history_rows": 0}
+
+        with patch.object(proc, "update_prices_data_repo") as mock_network:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_from_catalog()
+
+        mock_network.assert_not_called()
+        proc.card_fetcher.search_cards_bulk.assert_not_called()
+
+
+class TestIncrementalPriceRefresh(unittest.TestCase):
+    """An incremental refresh takes stale cards in priority order and stops at its budgets."""
+
+    def test_incremental_asks_repository_for_stale_cards(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.incremental_prices = True
+        proc.config.user_id = 7
+        proc.config.processing.price_max_age_hours = 12
+        proc._cards_for_price_update()
+        proc.collection_repository.get_cards_for_price_update.assert_called_once_with(user_id=7, max_age_hours=12)
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_incremental_keeps_priority_order_and_marks_unchanged(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.incremental_prices = True
+        proc.config.resume_after_id = 5
+        checkpoints = []
+        proc.checkpoint_callback = checkpoints.append
+        cards = [(9, "Card I", "1,00", None), (2, "Card B", "", None)]
+        with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "1.00"}}) as mock_fetch:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+        self.assertEqual(mock_fetch.call_args_list, [call("Card I"), call("Card B")])
+        proc.collection_repository.bulk_update_prices.assert_called_once_with([(2, "1,00")])
+        proc.collection_repository.mark_prices_checked.assert_called_once_with([9])
+        self.assertEqual(checkpoints, [])
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_request_budget_stops_handing_out_batches(self):
+        from deckdex.card_fetcher import CardFetcher
+
+        proc = _make_processor(use_repo=True)
+        proc.config.incremental_prices = True
+        proc.config.processing.price_request_budget = 1
+        size = CardFetcher.COLLECTION_BATCH_SIZE
+        cards = [(i, f"Card {i}", "", None) for i in range(1, 2 * size + 1)]
+
+        def resolve(card_names, scryfall_ids=None):
+            proc._run_metrics().count("requests")
+            return [{"prices": {"eur": "1.00"}} for _ in card_names]
+
+        with patch.object(proc, "_fetch_card_data_bulk", side_effect=resolve) as mock_resolve:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+        self.assertEqual(mock_resolve.call_count, 1)
+        self.assertEqual(proc.price_budget_stop, "requests")
+        # Only the batch that was looked up is written
+        proc.collection_repository.bulk_update_prices.assert_called_once()
+
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_request_budget_holds_with_batches_in_flight(self):
+        """Batches queued ahead of the budget running out are dropped by their workers."""
+        from deckdex.card_fetcher import CardFetcher
+
+        proc = _make_processor(use_repo=True)
+        proc.config.incremental_prices = True
+        proc.config.processing.max_workers = 4
+        proc.config.processing.price_request_budget = 2
+        size = CardFetcher.COLLECTION_BATCH_SIZE
+        cards = [(i, f"Card {i}", "", None) for i in range(1, 8 * size + 1)]
+        started = threading.Barrier(2, timeout=5)
+
+        def resolve(card_names, scryfall_ids=None):
+            started.wait()  # both budgeted batches are in flight before either counts its request
+            proc._run_metrics().count("requests")
+            return [{"prices": {"eur": "1.00"}} for _ in card_names]
+
+        with patch.object(proc, "_fetch_card_data_bulk", side_effect=resolve) as mock_resolve:
+            with contextlib.redirect_stdout(io.StringIO()):
+                proc.update_prices_data_repo(cards)
+        self.assertEqual(mock_resolve.call_count, 2)
+        self.assertEqual(proc.price_budget_stop, "requests")
+
+    def test_request_budget_counts_this_runs_requests_only(self):
+        from deckdex.magic_card_processor import PriceBudget
+        from deckdex.metrics import RunMetrics
+
+        metrics = RunMetrics()
+        metrics.count("requests", 50)  # an earlier phase of the run
+        budget = PriceBudget(metrics, request_budget=2)
+        self.assertIsNone(budget.check())
+        metrics.count("requests", 2)
+        self.assertEqual(budget.check(), "requests")
+
+    def test_budgets_ignored_for_full_refresh(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.processing.price_time_budget = 0.001
+        proc.config.processing.price_request_budget = 1
+        self.assertIsNone(proc._price_budget())
+        self.assertEqual(list(proc._price_batch_starts(6, 2, proc._price_budget())), [0, 2, 4])
+
+    def test_time_budget_stops_incremental_refresh(self):
+        proc = _make_processor(use_repo=True)
+        proc.config.incremental_prices = True
+        proc.config.processing.price_time_budget = 5
+        with patch("deckdex.magic_card_processor.time.monotonic", side_effect=[0, 1, 6]):
+            budget = proc._price_budget()
+            self.assertEqual(list(proc._price_batch_starts(6, 2, budget)), [0])
+        self.assertEqual(budget.stop, "time")
 
 
 # ---------------------------------------------------------------------------
@@ -311,59 +562,93 @@ class TestProcessorServiceUpdatePricesAsync(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(service.status, "error")
         self.assertEqual(result.get("status"), "error")
 
+    def test_cancelled_and_success_results_share_one_shape(self):
+        from backend.api.services.processor_service import ProcessorService
 
-# ---------------------------------------------------------------------------
-# Task 3 (new) — ProgressCapture unit tests
-# ---------------------------------------------------------------------------
-
+        proc = _make_processor(use_repo=True)
+        proc.not_found_cards = [f"Card {i}" for i in range(30)]
+        proc.price_budget_stop = "requests"
+        proc._run_metrics()
 
-class TestProgressCaptureCallback(unittest.TestCase):
-    """Unit tests for ProgressCapture write() and callback firing logic."""
+        success = ProcessorService._run_result(proc, "success")
+        cancelled = ProcessorService._run_result(proc, "cancelled")
 
-    def test_tqdm_pattern_match_fires_callback(self):
-        """A valid tqdm-formatted string triggers the callback with (current, total, percentage)."""
-        from backend.api.services.processor_service import ProgressCapture
+        self.assertEqual(cancelled.pop("message"), "Job cancelled by user")
+        self.assertEqual({**success, "status": "cancelled"}, cancelled)
+        self.assertEqual(len(success["not_found_cards"]), 20)
+        self.assertEqual(success["budget_stop"], "requests")
+        self.assertNotIn("catalog", success)
 
-        mock_callback = MagicMock()
-        capture = ProgressCapture(io.StringIO(), mock_callback)
-        capture.write("  45%|#####     | 45/100 [00:05<00:06]")
 
-        self.assertEqual(mock_callback.call_count, 1)
-        args = mock_callback.call_args[0]
-        self.assertEqual(args[0], 45)  # current
-        self.assertEqual(args[1], 100)  # total
-        self.assertEqual(args[2], 45.0)  # percentage
+# ---------------------------------------------------------------------------
+# Task 3 (new) — progress sink and cancellation token
+# ---------------------------------------------------------------------------
 
-    def test_flush_notification_does_not_fire_callback(self):
-        """A flush/write-notification string that does not match the tqdm regex does not fire the callback."""
-        from backend.api.services.processor_service import ProgressCapture
 
-        mock_callback = MagicMock()
-        capture = ProgressCapture(io.StringIO(), mock_callback)
-        capture.write("\nWrite #1 (40 cards): 12 updates")
+class TestProcessorProgressSink(unittest.TestCase):
+    """The processor reports typed events to its sink and stops when its token is cancelled."""
 
-        self.assertEqual(mock_callback.call_count, 0)
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_events_carry_phase_counts_and_errors(self):
+        from deckdex.progress import ProgressSink
+
+        proc = _make_processor(use_repo=True)
+        proc.progress_sink = MagicMock(spec=ProgressSink)
+        cards = [(1, "Card A", "", None), (2, "Card B", "", None)]
+        with patch.object(proc, "_fetch_card_data", return_value=None):
+            proc.error_count = 0
+            proc.update_prices_data_repo(cards)
+
+        events = [c.args[0] for c in proc.progress_sink.on_progress.call_args_list]
+        self.assertEqual(events[0].current, 0)
+        final = events[-1]
+        self.assertTrue(final.done)
+        self.assertEqual((final.phase, final.current, final.total), ("verify_prices", 2, 2))
+        self.assertEqual(final.percentage, 100.0)
 
-    def test_cancel_event_set_raises_on_write(self):
-        """When the cancel_event is set, write() raises JobCancelledException."""
-        from backend.api.services.processor_service import JobCancelledException, ProgressCapture
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_cancelled_token_stops_before_next_batch(self):
+        from deckdex.card_fetcher import CardFetcher
+        from deckdex.progress import CancelToken, JobCancelled, ProgressSink
+
+        proc = _make_processor(use_repo=True)
+        proc.progress_sink = ProgressSink()
+        proc.cancel_token = CancelToken()
+        size = CardFetcher.COLLECTION_BATCH_SIZE
+        cards = [(i, f"Card {i}", "", None) for i in range(1, 3 * size + 1)]
+
+        def resolve(card_names, scryfall_ids=None):
+            proc.cancel_token.cancel()
+            return [{"prices": {"eur": "1.00"}} for _ in card_names]
+
+        with patch.object(proc, "_fetch_card_data_bulk", side_effect=resolve) as mock_resolve:
+            with self.assertRaises(JobCancelled):
+                proc.update_prices_data_repo(cards)
+        # At most the batches already in flight finish; the third is never handed out
+        self.assertLess(mock_resolve.call_count, 3)
+        self.assertLess(len(proc.collection_repository.bulk_update_prices.call_args_list), 3)
 
-        cancel_event = threading.Event()
-        cancel_event.set()
-        mock_callback = MagicMock()
-        capture = ProgressCapture(io.StringIO(), mock_callback, cancel_event=cancel_event)
+    @patch.dict(os.environ, {"TQDM_DISABLE": "1"})
+    def test_status_lines_go_to_sink_not_stdout(self):
+        from deckdex.progress import ProgressSink
 
-        with self.assertRaises(JobCancelledException):
-            capture.write("any text")
+        proc = _make_processor(use_repo=True)
+        proc.progress_sink = MagicMock(spec=ProgressSink)
+        out = io.StringIO()
+        with patch.object(proc, "_fetch_card_data", return_value={"prices": {"eur": "2.00"}}):
+            with contextlib.redirect_stdout(out):
+                proc.update_prices_data_repo([(1, "Card A", "", None)])
+        self.assertEqual(out.getvalue(), "")
+        self.assertIn("1 prices updated", proc.progress_sink.message.call_args[0][0])
 
 
 # ---------------------------------------------------------------------------
-# Task 4 (new) — ProcessorService._on_tqdm_progress unit tests
+# Task 4 (new) — ProcessorService._on_progress unit tests
 # ---------------------------------------------------------------------------
 
 
 class TestProcessorServiceProgressEvents(unittest.IsolatedAsyncioTestCase):
-    """Unit tests for ProcessorService._on_tqdm_progress state mutations and scheduling."""
+    """Unit tests for ProcessorService._on_progress state mutations and scheduling."""
 
     def _make_service(self):
         from backend.api.services.processor_service import ProcessorService
@@ -382,41 +667,51 @@ class TestProcessorServiceProgressEvents(unittest.IsolatedAsyncioTestCase):
         service._loop = None
         return service
 
-    def test_on_tqdm_progress_updates_progress_data(self):
-        """_on_tqdm_progress mutates progress_data correctly when not cancelled and no loop set."""
+    def test_on_progress_updates_progress_data(self):
+        """_on_progress mutates progress_data correctly when not cancelled and no loop set."""
+        from deckdex.progress import ProgressEvent
+
         service = self._make_service()
         # No loop set — only state mutation is exercised, no coroutine is scheduled
         service._loop = None
-        service._on_tqdm_progress(30, 100, 30.0)
+        service._on_progress(ProgressEvent("verify_prices", 30, 100, errors=2, elapsed=10.0))
 
         self.assertEqual(service.progress_data["current"], 30)
         self.assertEqual(service.progress_data["total"], 100)
         self.assertEqual(service.progress_data["percentage"], 30.0)
+        self.assertEqual(service.progress_data["phase"], "verify_prices")
+        self.assertEqual(service.progress_data["error_count"], 2)
+        self.assertEqual(service.progress_data["rate"], 3.0)
+        self.assertEqual(service.progress_data["errors"], [])
+
+    def test_on_progress_skipped_when_cancelled(self):
+        """_on_progress returns early without updating state when the cancel flag is set."""
+        from deckdex.progress import ProgressEvent
 
-    def test_on_tqdm_progress_skipped_when_cancelled(self):
-        """_on_tqdm_progress returns early without updating state when the cancel flag is set."""
         service = self._make_service()
         service._cancel_flag.set()
-        service._on_tqdm_progress(50, 100, 50.0)
+        service._on_progress(ProgressEvent("verify_prices", 50, 100))
 
         # progress_data must remain at initial values (early return before mutation)
         self.assertEqual(service.progress_data["current"], 0)
         self.assertEqual(service.progress_data["total"], 0)
         self.assertEqual(service.progress_data["percentage"], 0.0)
 
-    async def test_on_tqdm_progress_schedules_coroutine_when_loop_set(self):
-        """When _loop is set, _on_tqdm_progress schedules a 'progress' event via the callback."""
+    async def test_on_progress_schedules_coroutine_when_loop_set(self):
+        """When _loop is set, _on_progress schedules a 'progress' event via the callback."""
+        from deckdex.progress import ProgressEvent
+
         service = self._make_service()
         loop = asyncio.get_event_loop()
         service._loop = loop
         service.progress_callback = AsyncMock()
 
-        # _on_tqdm_progress uses run_coroutine_threadsafe which is designed for cross-thread use.
+        # _on_progress uses run_coroutine_threadsafe which is designed for cross-thread use.
         # Call it from a background thread so the Future is correctly enqueued onto the running loop.
         done = threading.Event()
 
         def call_from_thread():
-            service._on_tqdm_progress(50, 100, 50.0)
+            service._on_progress(ProgressEvent("verify_prices", 50, 100))
             done.set()
 
         t = threading.Thread(target=call_from_thread)
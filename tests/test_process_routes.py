@@ -3,7 +3,7 @@ Tests for card ownership validation in single-card price update endpoint.
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
@@ -43,3 +43,34 @@ class TestSingleCardPriceUpdateOwnership(unittest.TestCase):
         response = self.client.post("/api/prices/update/42")
 
         mock_repo.get_card_by_id.assert_called_once_with(42, user_id=1)
+
+
+class TestPriceUpdateSource(unittest.TestCase):
+    def setUp(self):
+        app.dependency_overrides[get_current_user_id] = lambda: 1
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.pop(get_current_user_id, None)
+
+    def test_rejects_unknown_source(self):
+        response = self.client.post("/api/prices/update", json={"source": "cardmarket"})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("backend.api.routes.process.ProcessorService")
+    def test_catalog_source_is_passed_to_service(self, mock_service_class):
+        service = mock_service_class.return_value
+        service.job_id = "job-catalog"
+        service.status = "pending"
+        service.update_prices_async = AsyncMock(return_value={"status": "success"})
+
+        with (
+            patch.dict("backend.api.routes.process._active_jobs", clear=True),
+            patch("deckdex.config_loader.load_config", return_value=MagicMock()),
+        ):
+            response = self.client.post("/api/prices/update", json={"source": "catalog"})
+
+        self.assertEqual(response.status_code, 200)
+        service.update_prices_async.assert_awaited_once_with(price_source="catalog", incremental=False)
+        self.assertEqual(mock_service_class.call_args.kwargs["user_id"], 1)
@@ -0,0 +1,79 @@
+"""Tests for the processor progress events, sinks and cancellation token."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from deckdex.progress import CallbackSink, CancelToken, JobCancelled, PhaseProgress, ProgressEvent, TqdmSink
+
+
+class TestProgressEvent(unittest.TestCase):
+    def test_percentage_and_rate(self):
+        event = ProgressEvent("process_cards", current=25, total=200, elapsed=5.0)
+        self.assertEqual(event.percentage, 12.5)
+        self.assertEqual(event.rate, 5.0)
+        self.assertEqual(event.as_dict()["percentage"], 12.5)
+
+    def test_empty_phase_is_complete(self):
+        event = ProgressEvent("verify_prices", current=0, total=0)
+        self.assertEqual(event.percentage, 100.0)
+        self.assertEqual(event.rate, 0.0)
+
+
+class TestPhaseProgress(unittest.TestCase):
+    def test_updates_are_throttled_but_final_event_is_sent(self):
+        events = []
+        progress = PhaseProgress(CallbackSink(events.append), "process_cards", 30, min_interval=60)
+        progress.start()
+        for _ in range(3):
+            progress.advance(10)
+        progress.close()
+
+        self.assertEqual([(e.current, e.done) for e in events], [(0, False), (30, True)])
+
+    def test_errors_are_read_when_emitting(self):
+        events = []
+        errors = [0]
+        progress = PhaseProgress(CallbackSink(events.append), "verify_prices", 2, errors=lambda: errors[0])
+        errors[0] = 2
+        progress.close()
+        self.assertEqual(events[0].errors, 2)
+
+    def test_cancel_stops_advance_and_guard(self):
+        token = CancelToken()
+        progress = PhaseProgress(CallbackSink(lambda event: None), "verify_prices", 10, cancel_token=token)
+        items = progress.guard(range(3))
+        self.assertEqual(next(items), 0)
+        token.cancel()
+        with self.assertRaises(JobCancelled):
+            next(items)
+        with self.assertRaises(JobCancelled):
+            progress.advance(1)
+
+    def test_token_can_wrap_an_existing_event(self):
+        import threading
+
+        event = threading.Event()
+        token = CancelToken(event)
+        event.set()
+        self.assertTrue(token.cancelled)
+
+
+class TestTqdmSink(unittest.TestCase):
+    def test_one_bar_per_phase_closed_when_done(self):
+        bar = MagicMock(n=0)
+        with patch("deckdex.progress.tqdm", return_value=bar) as mock_tqdm:
+            sink = TqdmSink()
+            sink.on_progress(ProgressEvent("verify_prices", 0, 10))
+            bar.n = 0
+            sink.on_progress(ProgressEvent("verify_prices", 4, 10, errors=1))
+            bar.n = 4
+            sink.on_progress(ProgressEvent("verify_prices", 10, 10, done=True))
+
+        mock_tqdm.assert_called_once_with(total=10, desc="Verifying prices", unit="cards")
+        self.assertEqual([c.args[0] for c in bar.update.call_args_list], [0, 4, 6])
+        bar.set_postfix_str.assert_any_call("not found: 1", refresh=False)
+        bar.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
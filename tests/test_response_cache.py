@@ -0,0 +1,128 @@
+"""Tests for the persistent Scryfall response cache and its use in CardFetcher."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from deckdex.card_fetcher import CardFetcher
+from deckdex.config import OpenAIConfig, ScryfallConfig
+from deckdex.response_cache import SQLiteResponseCache, cache_key
+from deckdex.scryfall_transport import reset_transport
+
+
+def _response(body, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.headers = headers or {}
+    return response
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_query_order_and_host_case_are_normalized(self):
+        a = cache_key("GET", "https://API.scryfall.com/cards/search?q=opt&unique=prints")
+        b = cache_key("get", "https://api.scryfall.com/cards/search?unique=prints&q=opt")
+        self.assertEqual(a, b)
+
+    def test_post_body_is_part_of_the_key(self):
+        url = "https://api.scryfall.com/cards/collection"
+        a = cache_key("POST", url, {"identifiers": [{"name": "Opt"}]})
+        b = cache_key("POST", url, {"identifiers": [{"name": "Shock"}]})
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, cache_key("POST", url, {"identifiers": [{"name": "Opt"}]}))
+
+
+class TestSQLiteResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.sqlite")
+        self.now = 1000.0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache(self, max_bytes=1024 * 1024):
+        return SQLiteResponseCache(self.path, max_bytes=max_bytes, clock=lambda: self.now)
+
+    def test_put_get_roundtrip_survives_reopen(self):
+        cache = self._cache()
+        cache.put("k", {"name": "Opt"}, ttl=60, etag='"abc"')
+        cache.close()
+
+        entry = self._cache().get("k")
+        self.assertEqual(entry.body, {"name": "Opt"})
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertEqual(entry.expires_at, 1060.0)
+
+    def test_touch_extends_freshness(self):
+        cache = self._cache()
+        cache.put("k", {"name": "Opt"}, ttl=10)
+        self.now = 2000.0
+        cache.touch("k", ttl=10)
+        self.assertEqual(cache.get("k").expires_at, 2010.0)
+
+    def test_evicts_least_recently_used_past_max_bytes(self):
+        body = {"blob": "x" * 100}
+        cache = self._cache(max_bytes=350)
+        for i, key in enumerate(["a", "b", "c"]):
+            self.now = 1000.0 + i
+            cache.put(key, body, ttl=60)
+        self.now = 1010.0
+        cache.get("a")  # "b" is now the least recently used
+        self.now = 1011.0
+        cache.put("d", body, ttl=60)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("d"))
+        self.assertLessEqual(cache.total_bytes, 350)
+
+
+class TestCardFetcherResponseCache(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = ScryfallConfig(cache_path=os.path.join(self.tmp.name, "scryfall.sqlite"))
+        self.fetcher = CardFetcher(self.config, OpenAIConfig())
+        self.url = f"{CardFetcher.BASE_URL}/cards/named?exact=Opt"
+
+    def tearDown(self):
+        self.fetcher._cache.close()
+        reset_transport()
+        self.tmp.cleanup()
+
+    def test_fresh_entry_skips_network(self):
+        with patch.object(self.fetcher._transport, "get", return_value=_response({"name": "Opt"})) as mock_get:
+            self.assertEqual(self.fetcher._make_request(self.url), {"name": "Opt"})
+            self.assertEqual(self.fetcher._make_request(self.url), {"name": "Opt"})
+        mock_get.assert_called_once()
+
+    def test_expired_entry_revalidates_with_etag(self):
+        self.fetcher.cache_price_ttl = 0
+        first = _response({"name": "Opt"}, headers={"ETag": '"v1"'})
+        not_modified = _response(None, status_code=304)
+        with patch.object(self.fetcher._transport, "get", side_effect=[first, not_modified]) as mock_get:
+            self.fetcher._make_request(self.url)
+            self.assertEqual(self.fetcher._make_request(self.url), {"name": "Opt"})
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_bulk_collection_responses_are_cached(self):
+        body = {"data": [{"name": "Opt"}], "not_found": []}
+        with patch.object(self.fetcher._transport, "post", return_value=_response(body)) as mock_post:
+            self.fetcher.search_cards_bulk(["Opt"])
+            self.fetcher.search_cards_bulk(["Opt"])
+        mock_post.assert_called_once()
+
+    def test_ttl_by_endpoint(self):
+        self.assertEqual(self.fetcher._cache_ttl(self.url), self.config.cache_price_ttl)
+        self.assertEqual(
+            self.fetcher._cache_ttl(f"{CardFetcher.BASE_URL}/cards/autocomplete?q=op"), self.config.cache_oracle_ttl
+        )
+
+    def test_cache_disabled_by_default(self):
+        self.assertIsNone(CardFetcher(ScryfallConfig(), OpenAIConfig())._cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for the local Scryfall stand-in used by offline benchmarks."""
+
+import unittest
+
+import requests
+
+from deckdex.card_fetcher import CardFetcher
+from deckdex.config import OpenAIConfig, ScryfallConfig
+from deckdex.scryfall_standin import CardStore, ScryfallStandin, StandinOptions, synthetic_cards
+from deckdex.scryfall_transport import reset_transport
+
+
+class TestCardStore(unittest.TestCase):
+    def setUp(self):
+        self.cards = synthetic_cards(50, seed=1)
+        self.store = CardStore(self.cards)
+
+    def test_synthetic_cards_have_unique_names_and_prices(self):
+        self.assertEqual(len({c["name"] for c in self.cards}), 50)
+        self.assertTrue(all(c["prices"]["eur"] for c in self.cards))
+
+    def test_search_supports_phrase_and_regex_terms(self):
+        name = self.cards[0]["name"]
+        self.assertEqual(self.store.search(f'!"{name}"'), [self.cards[0]])
+        words = name.split()
+        self.assertIn(self.cards[0], self.store.search(" ".join(f"/{w}/i" for w in words)))
+
+    def test_collection_splits_found_and_not_found(self):
+        card = self.cards[3]
+        found, not_found = self.store.collection(
+            [{"id": card["id"]}, {"set": "syn", "collector_number": "5"}, {"name": "Nope"}]
+        )
+        self.assertEqual([c["name"] for c in found], [card["name"], self.cards[4]["name"]])
+        self.assertEqual(not_found, [{"name": "Nope"}])
+
+
+class TestStandinWithCardFetcher(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+        self.cards = synthetic_cards(200, seed=2)
+
+    def tearDown(self):
+        reset_transport()
+
+    def _fetcher(self, standin):
+        config = ScryfallConfig(base_url=standin.base_url, requests_per_second=0, retry_delay=0)
+        return CardFetcher(config, OpenAIConfig())
+
+    def test_search_card_and_bulk_lookup(self):
+        with ScryfallStandin(CardStore(self.cards)) as standin:
+            fetcher = self._fetcher(standin)
+            name = self.cards[10]["name"]
+            self.assertEqual(fetcher.search_card(name.upper())["id"], self.cards[10]["id"])
+            names = [c["name"] for c in self.cards[:80]] + ["Does Not Exist"]
+            result = fetcher.search_cards_bulk(names, fallback=False)
+
+        self.assertEqual([r["name"] for r in result[:80]], names[:80])
+        self.assertIsNone(result[-1])
+        self.assertEqual(standin.requests["/cards/collection"], 2)
+
+    def test_injected_rate_limits_are_retried(self):
+        options = StandinOptions(rate_limit_ratio=0.5, seed=3)
+        with ScryfallStandin(CardStore(self.cards), options) as standin:
+            fetcher = self._fetcher(standin)
+            fetcher.max_retries = 20
+            for card in self.cards[:5]:
+                self.assertEqual(fetcher.search_card(card["name"])["id"], card["id"])
+        self.assertGreater(standin.statuses[429], 0)
+
+    def test_bulk_data_download(self):
+        with ScryfallStandin(CardStore(self.cards[:3])) as standin:
+            meta = requests.get(f"{standin.base_url}/bulk-data/default-cards", timeout=5).json()
+            cards = requests.get(meta["download_uri"], timeout=5).json()
+        self.assertEqual([c["id"] for c in cards], [c["id"] for c in self.cards[:3]])
+
+    def test_base_url_validation(self):
+        with self.assertRaises(ValueError):
+            ScryfallConfig(base_url="api.scryfall.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
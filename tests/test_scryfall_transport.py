@@ -0,0 +1,313 @@
+"""Tests for the shared Scryfall transport: token bucket pacing and pooled session reuse."""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from deckdex.card_fetcher import CardFetcher
+from deckdex.config import OpenAIConfig, ScryfallConfig
+from deckdex.rate_limiter import AdaptiveController, TokenBucket, parse_retry_after, retry_delay
+from deckdex.scryfall_transport import ScryfallTransport, get_transport, reset_transport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_first_request_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate=10, capacity=1, clock=FakeClock())
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_queued_requests_are_spaced_at_rate(self):
+        bucket = TokenBucket(rate=10, capacity=1, clock=FakeClock())
+        waits = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(waits[0], 0.0)
+        self.assertAlmostEqual(waits[1], 0.1)
+        self.assertAlmostEqual(waits[2], 0.2)
+        self.assertAlmostEqual(waits[3], 0.3)
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 0.2
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertGreater(bucket.reserve(), 0.0)
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket(rate=0, clock=FakeClock())
+        self.assertEqual([bucket.reserve() for _ in range(50)], [0.0] * 50)
+
+    def test_acquire_sleeps_for_reserved_wait(self):
+        sleeps = []
+        bucket = TokenBucket(rate=5, capacity=1, clock=FakeClock(), sleep=sleeps.append)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(len(sleeps), 1)
+        self.assertAlmostEqual(sleeps[0], 0.2)
+
+    def test_concurrent_reservations_never_share_a_slot(self):
+        bucket = TokenBucket(rate=100, capacity=1, clock=FakeClock())
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(25):
+                w = bucket.reserve()
+                with lock:
+                    waits.append(round(w, 6))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(waits), 200)
+        self.assertEqual(len(set(waits)), 200)
+
+
+class TestScryfallTransport(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+
+    def tearDown(self):
+        reset_transport()
+
+    def test_request_draws_token_and_uses_session(self):
+        session = MagicMock()
+        limiter = MagicMock()
+        transport = ScryfallTransport(ScryfallConfig(timeout=7.0), session=session, limiter=limiter)
+
+        transport.get("https://api.scryfall.com/cards/named?exact=X")
+
+        limiter.acquire.assert_called_once()
+        session.request.assert_called_once_with("GET", "https://api.scryfall.com/cards/named?exact=X", timeout=7.0)
+
+    def test_request_reports_wait_and_latency_to_run_metrics(self):
+        from deckdex.metrics import RunMetrics
+
+        session = MagicMock()
+        session.request.return_value = MagicMock(status_code=200, headers={})
+        transport = ScryfallTransport(ScryfallConfig(adaptive=True, requests_per_second=0), session=session)
+        metrics = RunMetrics()
+
+        transport.get("https://api.scryfall.com/cards/named?exact=X", metrics=metrics)
+
+        self.assertNotIn("metrics", session.request.call_args.kwargs)
+        data = metrics.as_dict()
+        self.assertEqual(data["fetch_latency"]["count"], 1)
+        self.assertEqual(data["phases"]["rate_limit_wait"]["calls"], 1)
+
+    def test_session_pool_sized_from_config(self):
+        transport = ScryfallTransport(ScryfallConfig(pool_size=16))
+        adapter = transport.session.get_adapter("https://api.scryfall.com")
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertIn("User-Agent", transport.session.headers)
+
+    def test_get_transport_is_process_wide(self):
+        first = get_transport(ScryfallConfig())
+        second = get_transport(ScryfallConfig(requests_per_second=5.0, burst=2))
+        self.assertIs(first, second)
+        self.assertEqual(second.limiter.rate, 5.0)
+        self.assertEqual(second.limiter.capacity, 2.0)
+
+    def test_card_fetchers_share_one_transport(self):
+        a = CardFetcher(ScryfallConfig(), OpenAIConfig())
+        b = CardFetcher(ScryfallConfig(), OpenAIConfig())
+        self.assertIs(a._transport, b._transport)
+
+    def test_make_request_goes_through_transport(self):
+        fetcher = CardFetcher(ScryfallConfig(), OpenAIConfig())
+        response = MagicMock()
+        response.json.return_value = {"name": "Opt"}
+        with patch.object(fetcher._transport, "get", return_value=response) as mock_get:
+            self.assertEqual(fetcher._make_request("https://api.scryfall.com/cards/named?exact=Opt"), {"name": "Opt"})
+        mock_get.assert_called_once()
+
+
+class TestAdaptiveController(unittest.TestCase):
+    def _controller(self, clock, **kwargs):
+        bucket = TokenBucket(rate=10, capacity=1, clock=clock)
+        options = dict(min_rate=1, max_rate=20, max_concurrency=8, initial_concurrency=4, clock=clock)
+        options.update(kwargs)
+        return AdaptiveController(bucket, **options), bucket
+
+    def test_normal_latency_grows_concurrency_and_rate(self):
+        controller, bucket = self._controller(FakeClock())
+        for _ in range(20):
+            controller.observe(0.1, 200)
+        self.assertGreater(controller.concurrency, 4)
+        self.assertGreater(controller.rate, 10)
+        self.assertEqual(bucket.rate, controller.rate)
+
+    def test_growth_stops_at_ceilings(self):
+        controller, _bucket = self._controller(FakeClock())
+        for _ in range(2000):
+            controller.observe(0.1, 200)
+        self.assertEqual(controller.concurrency, 8)
+        self.assertEqual(controller.rate, 20)
+
+    def test_throttling_halves_once_per_interval(self):
+        clock = FakeClock()
+        controller, bucket = self._controller(clock)
+        for _ in range(5):
+            controller.observe(0.1, 429)
+        self.assertEqual((controller.concurrency, controller.rate, bucket.rate), (2, 5, 5))
+        self.assertEqual(controller.throttled, 5)
+
+        clock.now = 2.0
+        controller.observe(None, None)  # network error
+        self.assertEqual((controller.concurrency, controller.rate), (1, 2.5))
+
+    def test_rising_latency_backs_off(self):
+        controller, _bucket = self._controller(FakeClock())
+        controller.observe(0.1, 200)
+        for _ in range(10):
+            controller.observe(1.0, 200)
+        self.assertLess(controller.rate, 10)
+        self.assertEqual(controller.decreases, 1)
+
+    def test_latency_baselines_are_per_host(self):
+        controller, _bucket = self._controller(FakeClock())
+        controller.observe(0.05, 200, host="api.scryfall.com")
+        for _ in range(10):
+            controller.observe(0.5, 200, host="cards.scryfall.io")
+        self.assertEqual(controller.decreases, 0)
+
+    def test_retry_after_pauses_new_requests(self):
+        clock = FakeClock()
+        controller, _bucket = self._controller(clock)
+        controller.observe(0.1, 429, retry_after=3.0)
+        with controller._cond:
+            self.assertAlmostEqual(controller._try_enter(), 3.0)
+        clock.now = 3.5
+        with controller._cond:
+            self.assertEqual(controller._try_enter(), 0.0)
+
+    def test_slots_are_capped_at_the_concurrency_limit(self):
+        controller, _bucket = self._controller(FakeClock(), initial_concurrency=2)
+        controller.enter()
+        controller.enter()
+        with controller._cond:
+            self.assertGreater(controller._try_enter(), 0)
+        controller.exit()
+        with controller.slot():
+            self.assertEqual(controller.in_flight, 2)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertAlmostEqual(parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", clock=lambda: 10.0), 20.0)
+
+    def test_retry_delay_honours_retry_after(self):
+        error = MagicMock()
+        error.response.headers = {"Retry-After": "5"}
+        self.assertEqual(retry_delay(0.5, 0, error), 5.0)
+        self.assertEqual(retry_delay(0.5, 2, ValueError()), 2.0)
+
+    def test_adaptive_transport_reports_outcomes(self):
+        session = MagicMock()
+        session.request.return_value.status_code = 429
+        session.request.return_value.headers = {"Retry-After": "1"}
+        transport = ScryfallTransport(ScryfallConfig(adaptive=True), session=session)
+
+        transport.get("https://api.scryfall.com/cards/named?exact=X")
+
+        self.assertEqual(transport.controller.throttled, 1)
+        self.assertEqual(transport.controller.in_flight, 0)
+        self.assertLess(transport.limiter.rate, 10.0)
+
+    def test_configure_keeps_learnt_rate(self):
+        first = get_transport(ScryfallConfig(adaptive=True))
+        first.controller.observe(0.1, 429)
+        learnt = first.limiter.rate
+        get_transport(ScryfallConfig(adaptive=True))
+        self.assertEqual(first.limiter.rate, learnt)
+        reset_transport()
+
+
+class TestAdaptiveLimits(unittest.TestCase):
+    def setUp(self):
+        reset_transport()
+
+    def tearDown(self):
+        reset_transport()
+
+    def test_requests_per_second_caps_adaptive_rate(self):
+        config = ScryfallConfig(adaptive=True, requests_per_second=5.0, adaptive_max_rps=20.0)
+        self.assertEqual(config.adaptive_rate_bounds, (1.0, 5.0))
+        transport = get_transport(config)
+        for _ in range(500):
+            transport.controller.observe(0.1, 200)
+        self.assertEqual(transport.limiter.rate, 5.0)
+        self.assertEqual(ScryfallConfig(requests_per_second=0).adaptive_rate_bounds, (1.0, 20.0))
+
+    def test_configure_applies_new_ceiling_and_burst_under_adaptive(self):
+        transport = get_transport(ScryfallConfig(adaptive=True))
+        get_transport(ScryfallConfig(adaptive=True, requests_per_second=4.0, burst=3))
+        self.assertEqual(transport.controller.max_rate, 4.0)
+        self.assertLessEqual(transport.limiter.rate, 4.0)
+        self.assertEqual(transport.limiter.capacity, 3.0)
+
+    def test_openai_batches_capped_at_max_workers(self):
+        from deckdex.config import OpenAIConfig, ProcessingConfig, ProcessorConfig
+        from deckdex.magic_card_processor import MagicCardProcessor
+
+        proc = MagicCardProcessor.__new__(MagicCardProcessor)
+        proc.config = ProcessorConfig(
+            processing=ProcessingConfig(max_workers=2),
+            scryfall=ScryfallConfig(adaptive=True, max_concurrency=16),
+            openai=OpenAIConfig(enabled=True),
+        )
+        self.assertEqual(proc._fetch_workers(), 16)
+
+        lock = threading.Lock()
+        active, peak = [0], [0]
+        release = threading.Event()
+
+        def analyze(cards):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            release.wait(1)
+            with lock:
+                active[0] -= 1
+            return [("s", "t")] * len(cards)
+
+        proc.card_fetcher = MagicMock()
+        proc.card_fetcher.analyze_cards.side_effect = analyze
+        threads = [threading.Thread(target=proc._analyze_cards, args=([{"name": "X"}],)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        threading.Timer(0.2, release.set).start()
+        for t in threads:
+            t.join()
+        self.assertEqual(peak[0], 2)
+
+
+class TestScryfallConfigRateLimit(unittest.TestCase):
+    def test_defaults(self):
+        cfg = ScryfallConfig()
+        self.assertEqual(cfg.requests_per_second, 10.0)
+        self.assertEqual(cfg.burst, 1)
+        self.assertEqual(cfg.pool_size, 10)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            ScryfallConfig(requests_per_second=-1)
+        with self.assertRaises(ValueError):
+            ScryfallConfig(burst=0)
+        with self.assertRaises(ValueError):
+            ScryfallConfig(pool_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
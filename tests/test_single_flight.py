@@ -0,0 +1,116 @@
+"""Tests for single-flight coalescing of concurrent identical lookups."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from deckdex import card_fetcher
+from deckdex.card_fetcher import CardFetcher
+from deckdex.config import OpenAIConfig, ScryfallConfig
+from deckdex.single_flight import SingleFlight
+
+
+def _wait_for_followers(flights, baseline, count):
+    deadline = time.monotonic() + 5
+    while flights.shared < baseline + count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_callers_share_one_execution(self):
+        flights = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return {"name": "Opt"}
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(flights.do, "opt", slow) for _ in range(5)]
+            _wait_for_followers(flights, 0, 4)
+            release.set()
+            results = [f.result() for f in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(flights.in_flight(), 0)
+
+    def test_errors_are_shared_and_not_remembered(self):
+        flights = SingleFlight()
+        with self.assertRaises(ValueError):
+            flights.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        self.assertEqual(flights.do("k", lambda: 42), 42)
+        self.assertEqual(flights.executed, 2)
+
+    def test_different_keys_run_independently(self):
+        flights = SingleFlight()
+        self.assertEqual([flights.do(k, lambda k=k: k * 2) for k in (1, 2)], [2, 4])
+        self.assertEqual(flights.shared, 0)
+
+
+class TestCardFetcherCoalescing(unittest.TestCase):
+    def test_duplicate_concurrent_requests_make_one_http_call(self):
+        fetcher = CardFetcher(ScryfallConfig(), OpenAIConfig())
+        release = threading.Event()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"name": "Opt"}
+
+        def get(url, **kwargs):
+            release.wait(5)
+            return response
+
+        url = f"{CardFetcher.BASE_URL}/cards/named?exact=Opt"
+        baseline = card_fetcher._inflight.shared
+        with patch.object(fetcher._transport, "get", side_effect=get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(fetcher._make_request, url) for _ in range(4)]
+                _wait_for_followers(card_fetcher._inflight, baseline, 3)
+                release.set()
+                results = [f.result() for f in futures]
+
+        self.assertEqual(results, [{"name": "Opt"}] * 4)
+        mock_get.assert_called_once()
+
+
+class TestCardImageCoalescing(unittest.TestCase):
+    def test_concurrent_requests_for_same_name_download_once(self):
+        from backend.api.services import card_image_service
+
+        repo = MagicMock()
+        repo.get_card_by_id.side_effect = lambda card_id: {"id": card_id, "name": "Opt", "scryfall_id": None}
+        settings_repo = MagicMock()
+        settings_repo.get_external_apis_settings.return_value = {"scryfall_enabled": True}
+        store = MagicMock()
+        store.get.return_value = None
+        release = threading.Event()
+        baseline = card_image_service._image_flights.shared
+
+        def fetch(name, image_store):
+            release.wait(5)
+            return "sid-opt", b"img", "image/jpeg"
+
+        with (
+            patch("backend.api.dependencies.get_collection_repo", return_value=repo),
+            patch("backend.api.dependencies.get_user_settings_repo", return_value=settings_repo),
+            patch.object(card_image_service, "_fetch_scryfall_image", side_effect=fetch) as mock_fetch,
+        ):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = [
+                    pool.submit(card_image_service.get_card_image, card_id, image_store=store, user_id=1)
+                    for card_id in (1, 2, 3)
+                ]
+                _wait_for_followers(card_image_service._image_flights, baseline, 2)
+                release.set()
+                results = [f.result() for f in futures]
+
+        self.assertEqual(results, [(b"img", "image/jpeg")] * 3)
+        mock_fetch.assert_called_once()
+        self.assertEqual(repo.update_card_scryfall_id.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()